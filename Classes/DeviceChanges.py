@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DeviceChanges.py
+
+    Description: NwkIds of the ListOfDevices entries updated since the last DeviceList flush.
+
+    Entries are marked by the helpers updating ListOfDevices (message received, attribute stored, heartbeat
+    visit, device created or removed ...). The flush persists only the marked entries, and the generation
+    tells the web server when its cached REST responses are out of date.
+"""
+
+import threading
+
+
+class DeviceChanges:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._updated = set()
+        self._all = False  # Any entry may have been updated ( REST call )
+        self.generation = 0  # Bumped on each update
+
+    def updated(self, NwkId):
+        with self._lock:
+            self._updated.add(NwkId)
+            self.generation += 1
+
+    def all_updated(self):
+        with self._lock:
+            self._all = True
+            self.generation += 1
+
+    def take(self):
+        """ return and clear the NwkIds updated since the last call, None if any entry may have been updated """
+        with self._lock:
+            updated = None if self._all else self._updated
+            self._updated = set()
+            self._all = False
+            return updated
+
+    def statistics(self):
+        with self._lock:
+            return {"Generation": self.generation, "Pending": "All" if self._all else len(self._updated)}
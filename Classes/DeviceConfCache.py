@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DeviceConfCache.py
+
+    Description: Compiled cache of the DeviceConf ( Conf/DeviceConf.txt + Conf/Certified/<brand>/<model>.json ).
+                 - the cache is a single pickle file holding a format version, the signature of the
+                   configuration files and one pickled blob per model
+                 - the signature is made of the name, mtime and size of each file and directory, so any change
+                   in Conf/ (new model, edited file, removed brand) triggers a full reload of the json files
+                 - LazyDeviceConf only unpickles a model definition the first time it is accessed, so the
+                   models not present in the network never get expanded in memory
+"""
+
+import os
+import pickle
+
+CACHE_VERSION = 1
+SKIPPED_FILES = ("README.md", ".PRECIOUS")
+
+
+def deviceconf_signature(pluginConfig):
+    """ tuple of ( relative name, mtime_ns, size ) of DeviceConf.txt and the Certified tree """
+    signature = []
+    filename = os.path.join(pluginConfig, "DeviceConf.txt")
+    if os.path.isfile(filename):
+        stat = os.stat(filename)
+        signature.append(("DeviceConf.txt", stat.st_mtime_ns, stat.st_size))
+
+    model_certified = os.path.join(pluginConfig, "Certified")
+    if not os.path.isdir(model_certified):
+        return tuple(signature)
+
+    for brand in sorted(os.scandir(model_certified), key=lambda x: x.name):
+        if brand.name in SKIPPED_FILES or not brand.is_dir():
+            continue
+        stat = brand.stat()
+        signature.append((brand.name, stat.st_mtime_ns, 0))
+        for model in sorted(os.scandir(brand.path), key=lambda x: x.name):
+            if model.name in SKIPPED_FILES or not model.is_file():
+                continue
+            stat = model.stat()
+            signature.append((brand.name + "/" + model.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def load_compiled_deviceconf(filename, signature):
+    """ return a LazyDeviceConf if the cache exists and matches the signature, otherwise None """
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with open(filename, "rb") as handle:
+            compiled = pickle.load(handle)
+    except Exception:
+        return None
+    if (
+        not isinstance(compiled, dict)
+        or compiled.get("Version") != CACHE_VERSION
+        or compiled.get("Signature") != signature
+    ):
+        return None
+    return LazyDeviceConf.from_blobs(compiled["Models"])
+
+
+def store_compiled_deviceconf(filename, signature, DeviceConf):
+    """ write the compiled cache (atomically, the plugin may be killed during the write) """
+    compiled = {
+        "Version": CACHE_VERSION,
+        "Signature": signature,
+        "Models": {model: pickle.dumps(DeviceConf[model], protocol=pickle.HIGHEST_PROTOCOL) for model in DeviceConf},
+    }
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as handle:
+        pickle.dump(compiled, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_filename, filename)
+
+
+class _CompiledModel:
+    __slots__ = ("blob",)
+
+    def __init__(self, blob):
+        self.blob = blob
+
+
+class LazyDeviceConf(dict):
+    """
+    dict of model name -> definition, where the definitions are unpickled on first access.
+    `model in DeviceConf`, len() and the keys do not expand anything.
+    """
+
+    @classmethod
+    def from_blobs(cls, blobs):
+        conf = cls()
+        for model, blob in blobs.items():
+            dict.__setitem__(conf, model, _CompiledModel(blob))
+        return conf
+
+    def __getitem__(self, model):
+        value = dict.__getitem__(self, model)
+        if isinstance(value, _CompiledModel):
+            value = pickle.loads(value.blob)
+            dict.__setitem__(self, model, value)
+        return value
+
+    def __iter__(self):
+        # Overloaded so dict(), update() and ** go through __getitem__
+        return iter(self.keys())
+
+    def get(self, model, default=None):
+        return self[model] if model in self else default
+
+    def setdefault(self, model, default=None):
+        if model not in self:
+            dict.__setitem__(self, model, default)
+        return self[model]
+
+    def pop(self, model, *default):
+        if model not in self:
+            return dict.pop(self, model, *default)
+        value = self[model]
+        del self[model]
+        return value
+
+    def values(self):
+        return [self[model] for model in self.keys()]
+
+    def items(self):
+        return [(model, self[model]) for model in self.keys()]
+
+    def copy(self):
+        return dict(self.items())
+
+    def loaded(self):
+        """ number of model definitions expanded so far """
+        return sum(1 for value in dict.values(self) if not isinstance(value, _CompiledModel))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DeviceRecord.py
+
+    Description: Compact record of a ListOfDevices entry, behind the usual dict API.
+
+    Most of the size of an entry is not the values, but the thousands of small strings used as keys and values
+    ("0000", "0006", "Attributes List" ...) of the nested Ep / ReadAttributes / ConfigureReporting dicts, each one
+    being a separate object when loaded from the DeviceList. DeviceRecord interns them when the record is
+    loaded, so they are shared by all devices.
+
+    - DeviceRecord is a dict subclass without instance __dict__ ( __slots__ ), and without any override of the
+      read path, so the accesses are as fast as before.
+    - Stamp is a DeviceStamp, where 'time' is a float, 'MsgType' an int, and 'Time' is formatted from 'time'
+      only when it is read (timeStamped is called for each message). Both are converted once, at the first read
+      after the stamp, so str() of a record not stamped since its previous str() is done by the C code.
+
+    All keys stay in the dict storage, so len(), 'in', json.dump(), str() (persistence), dict(x) and the
+    comparisons give the same result as with the historical plain dict. Only C code reading the dict storage
+    directly (Domoticz API) must be given plain_dict(record).
+"""
+
+import sys
+import time
+from collections.abc import ItemsView, ValuesView
+
+INTERN_MAX_LENGTH = 32  # Longer strings are names, values ... rarely shared between devices
+
+_DERIVED = object()  # DeviceStamp 'Time' to be formatted from 'time'
+
+
+def compact(value):
+    """ value with its dict keys and short strings interned, recursively """
+    if type(value) is str:
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    if type(value) is dict:
+        return {compact(key): compact(item) for key, item in value.items()}
+    if type(value) is list:
+        return [compact(item) for item in value]
+    return value
+
+
+def plain_dict(value):
+    """ value with the records replaced by plain dict, recursively """
+    if isinstance(value, (DeviceRecord, DeviceStamp)):
+        return {key: plain_dict(item) for key, item in value.items()}
+    return value
+
+
+class DeviceStamp(dict):
+    """ Stamp of a device. All keys are in the dict storage, 'Time' and 'MsgType' are converted when read """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self)
+        self.update(*args, **kwargs)
+
+    @staticmethod
+    def _view(self, key, value):
+        if key == "Time" and value is _DERIVED:
+            time_ = dict.get(self, "time")
+            if not isinstance(time_, (int, float)):
+                return ""
+            value = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time_))
+            dict.__setitem__(self, "Time", value)
+            return value
+        if key == "MsgType" and type(value) is int:
+            value = "%4x" % value
+            dict.__setitem__(self, "MsgType", value)
+            return value
+        return value
+
+    def stamp(self, now, MsgType):
+        """ timeStamped() for a record: 'Time' is not formatted until it is read """
+        dict.__setitem__(self, "time", now)
+        dict.__setitem__(self, "Time", _DERIVED)
+        dict.__setitem__(self, "MsgType", MsgType)
+
+    def __getitem__(self, key):
+        return self._view(self, key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Overridden, so dict(stamp) and {**stamp} go through __getitem__
+        return dict.__iter__(self)
+
+    def __repr__(self):
+        # str() of the DeviceRecord ( persistence ): Time and MsgType converted, then the repr of the dict storage
+        if dict.get(self, "Time") is _DERIVED:
+            if self._view(self, "Time", _DERIVED) == "":
+                return repr(dict(self.items()))
+        if type(dict.get(self, "MsgType")) is int:
+            self._view(self, "MsgType", dict.__getitem__(self, "MsgType"))
+        return dict.__repr__(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.items()) == (dict(other.items()) if isinstance(other, DeviceStamp) else other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce_ex__(self, protocol):
+        # copy, deepcopy and pickle
+        return (self.__class__, (dict(self.items()),))
+
+    def get(self, key, default=None):
+        if not dict.__contains__(self, key):
+            return default
+        return self[key]
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if not dict.__contains__(self, key):
+            return dict.pop(self, key, *default)
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, self._view(self, key, value)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):
+        return self.__class__(self)
+
+
+class DeviceRecord(dict):
+    """ ListOfDevices entry """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self)
+        for key, value in dict(*args, **kwargs).items():
+            self.load(key, value)
+
+    def load(self, attribute, value):
+        """ set an attribute loaded from the DeviceList, with its strings interned """
+        if attribute == "Stamp" and type(value) is dict:
+            value = DeviceStamp(value)
+        dict.__setitem__(self, compact(attribute), compact(value))
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __reduce_ex__(self, protocol):
+        return (self.__class__, (dict(self),))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DevicesIndex.py
+
+    Description: Index of the Domoticz Devices (widgets), to avoid scanning all units on each
+                 incoming message.
+                 - DeviceID (IEEE) -> list of units
+                 - Widget ID (Devices[x].ID) -> unit
+
+    The index is rebuilt when it has been invalidated (widget creation or removal), or when the number
+    of units has changed behind our back. Each hit is checked against Devices before being returned.
+    A Widget ID still unknown after a rebuild is remembered until the index is invalidated or the number of
+    units changes, so that a stale Widget ID (ClusterType of a removed widget) doesn't trigger a rebuild on
+    each message.
+"""
+
+
+class DevicesIndex:
+    def __init__(self):
+        self._units_by_deviceid = {}
+        self._unit_by_widgetid = {}
+        self._unknown_widgetids = set()  # Widget IDs not in Devices at the last rebuild
+        self._nb_units = None  # Number of units when the index has been built, None when invalidated
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self._nb_units = None
+        self._unknown_widgetids = set()
+
+    def rebuild(self, Devices):
+        units_by_deviceid = {}
+        unit_by_widgetid = {}
+        for unit in Devices:
+            units_by_deviceid.setdefault(Devices[unit].DeviceID, []).append(unit)
+            unit_by_widgetid[Devices[unit].ID] = unit
+        self._units_by_deviceid = units_by_deviceid
+        self._unit_by_widgetid = unit_by_widgetid
+        self._nb_units = len(Devices)
+        self.rebuilds += 1
+
+    def _check_index(self, Devices):
+        if self._nb_units != len(Devices):
+            self._unknown_widgetids = set()
+            self.rebuild(Devices)
+            return True
+        return False
+
+    def units_for_deviceid(self, Devices, DeviceID):
+        """ return the tuple of units having DeviceID """
+        rebuilt = self._check_index(Devices)
+        units = self._units_by_deviceid.get(DeviceID, ())
+        for unit in units:
+            if unit not in Devices or Devices[unit].DeviceID != DeviceID:
+                if rebuilt:
+                    break
+                # Out of date, a widget has been replaced with the same number of units
+                self.rebuild(Devices)
+                return tuple(self._units_by_deviceid.get(DeviceID, ()))
+        return tuple(units)
+
+    def unit_for_widgetid(self, Devices, WidgetId):
+        """ return the unit of the widget ID, or None if not found """
+        WidgetId = int(WidgetId)
+        rebuilt = self._check_index(Devices)
+        unit = self._unit_by_widgetid.get(WidgetId)
+        if unit is not None and unit in Devices and Devices[unit].ID == WidgetId:
+            return unit
+        if unit is None and WidgetId in self._unknown_widgetids:
+            return None
+        if not rebuilt:
+            # Out of date or unknown widget, let's give a chance with a fresh index
+            self.rebuild(Devices)
+            unit = self._unit_by_widgetid.get(WidgetId)
+            if unit is not None:
+                return unit
+        self._unknown_widgetids.add(WidgetId)
+        return None
+
+    def statistics(self):
+        return {
+            "Units": self._nb_units or 0,
+            "DeviceIDs": len(self._units_by_deviceid),
+            "UnknownWidgetIDs": len(self._unknown_widgetids),
+            "Rebuilds": self.rebuilds,
+        }
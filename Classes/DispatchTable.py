@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DispatchTable.py
+
+    Description: Dispatch table of the inbound decoders, keyed by an integer ( ZiGate message type, Cluster Id ).
+                 - the table is built once at import of the decoding module
+                 - register() lets a manufacturer module add or override a decoder without touching the core
+                   decoding module
+                 - each entry counts its calls, to find out which decoders are worth profiling
+"""
+
+from types import MappingProxyType
+
+
+class DispatchTable:
+    def __init__(self, name, decoders):
+        self.name = name
+        self._decoders = {int(key): func for key, func in decoders.items()}
+        self.decoders = MappingProxyType(self._decoders)  # Read only view
+        self._calls = dict.fromkeys(self._decoders, 0)
+        self.not_found = 0
+
+    def register(self, key, func, override=False):
+        """ add a decoder for key. An existing decoder is only replaced with override=True """
+        key = int(key)
+        if key in self._decoders and self._decoders[key] is not func and not override:
+            raise KeyError("%s: decoder for 0x%04x already registered (%s)" % (self.name, key, self._decoders[key].__name__))
+        self._decoders[key] = func
+        self._calls.setdefault(key, 0)
+
+    def unregister(self, key):
+        self._decoders.pop(int(key), None)
+
+    def lookup(self, key):
+        """ return the decoder for key and count the call, None if there is no decoder """
+        func = self._decoders.get(key)
+        if func is None:
+            self.not_found += 1
+            return None
+        self._calls[key] += 1
+        return func
+
+    def reset_counters(self):
+        self._calls = dict.fromkeys(self._decoders, 0)
+        self.not_found = 0
+
+    def statistics(self):
+        return {
+            "Calls": {
+                "%04x" % key: {"Decoder": self._decoders[key].__name__, "Calls": calls}
+                for key, calls in sorted(self._calls.items(), key=lambda x: x[1], reverse=True)
+                if calls and key in self._decoders
+            },
+            "Registered": len(self._decoders),
+            "NotFound": self.not_found,
+        }
@@ -11,10 +11,11 @@
 """
 
 import sqlite3
+import threading
 import Domoticz
 import os.path
 from base64 import b64decode
-from time import time
+from urllib.parse import quote
 from datetime import datetime
 from Classes.LoggingManagement import LoggingManagement
 
@@ -225,6 +226,9 @@ class DomoticzDB_Hardware:
 
 
 class DomoticzDB_DeviceStatus:
+    # AddjValue / AddjValue2 of all the Devices of the Hardware, loaded with one query on a read-only connection kept
+    # open, then refreshed every CACHE_TIMEOUT by a background thread. The retreive* methods only read the cache.
+
     def __init__(self, database, pluginconf, hardwareID, log):
         self.database = database
         self.dbConn = None
@@ -234,11 +238,19 @@ class DomoticzDB_DeviceStatus:
         self.pluginconf = pluginconf
         self.log = log
 
-        self.AdjValue = {"Baro": {}, "TimeOutMotion": {}, "Temp": {}}
+        self.AdjValue = {}  # Device.ID -> ( AddjValue, AddjValue2 )
+        self.refresh_thread = None
+        self._dbLock = threading.Lock()
+        self._stopRefresh = threading.Event()
+
         # Check if we have access to the database, if not Error and return
         if not os.path.isfile(database):
             return
 
+        self.load_adjustments()
+        self.refresh_thread = threading.Thread(name="DomoticzDB_%s" % self.HardwareID, target=self._refresh_thread)
+        self.refresh_thread.start()
+
     def logging(self, logType, message):
         self.log.logging("DZDB", logType, message)
 
@@ -249,172 +261,88 @@ class DomoticzDB_DeviceStatus:
             Domoticz.Error("DB_DeviceStatus - Not existing DB %s" % self.database)
             return
 
-        self.logging("Debug", "DB_DeviceStatus - Opening %s" % self.database)
-        self.dbConn = sqlite3.connect(self.database)
-        self.logging("Debug", "-----> dbConn: %s" % str(self.dbConn))
+        self.logging("Debug", "DB_DeviceStatus - Opening %s (read-only)" % self.database)
+        self.dbConn = sqlite3.connect(
+            "file:%s?mode=ro" % quote(os.path.abspath(self.database)), uri=True, check_same_thread=False
+        )
         self.dbCursor = self.dbConn.cursor()
-        self.logging("Debug", "-----> dbCursor: %s" % str(self.dbCursor))
 
     def closeDB(self):
 
-        if self.dbConn is not None:
-            self.logging("Debug", "DB_DeviceStatus - Closing %s" % self.database)
-            self.dbConn.close()
-        self.dbConn = None
-        self.dbCursor = None
+        self._stopRefresh.set()
+        if self.refresh_thread is not None and self.refresh_thread is not threading.current_thread():
+            self.refresh_thread.join()
+        self.refresh_thread = None
 
-    def retreiveAddjValue_baro(self, ID):
+        with self._dbLock:
+            if self.dbConn is not None:
+                self.logging("Debug", "DB_DeviceStatus - Closing %s" % self.database)
+                self.dbConn.close()
+            self.dbConn = None
+            self.dbCursor = None
+
+    def load_adjustments(self):
         """
-        Retreive the AddjValue of Device.ID
+        (Re)load the AddjValue/AddjValue2 of all Devices of the Hardware. Return the number of Devices changed
         """
-
-        if ID not in self.AdjValue["Baro"]:
-            self.logging("Debug", "Init Baro cache")
-            self.AdjValue["Baro"][ID] = {}
-            self.AdjValue["Baro"][ID]["Value"] = None
-            self.AdjValue["Baro"][ID]["Stamp"] = 0
-
-        self.logging(
-            "Debug",
-            "Baro - Value: %s, Stamp: %s, Today: %s"
-            % (self.AdjValue["Baro"][ID]["Value"], self.AdjValue["Baro"][ID]["Stamp"], int(time())),
-        )
-        # if self.AdjValue['Baro'][ID]['Value'] is not None and (int(time()) < self.AdjValue['Baro'][ID]['Stamp'] + CACHE_TIMEOUT):
-        if self.AdjValue["Baro"][ID]["Value"] is not None:
-            self.logging("Debug", "Return from Baro cache %s" % self.AdjValue["Baro"][ID]["Value"])
-            return self.AdjValue["Baro"][ID]["Value"]
-
-        # We need to look to DB
-        if self.dbCursor is None:
-            self._openDB()
-            try:
-                self.logging("Debug", "DB AddjValue2 access for %s" % ID)
+        try:
+            with self._dbLock:
+                if self.dbCursor is None:
+                    self._openDB()
                 self.dbCursor.execute(
-                    "SELECT AddjValue2 FROM DeviceStatus WHERE ID = '%s' and HardwareID = '%s'" % (ID, self.HardwareID)
+                    "SELECT ID, AddjValue, AddjValue2 FROM DeviceStatus WHERE HardwareID = ?", (self.HardwareID,)
                 )
-                value = self.dbCursor.fetchone()
-                self.logging("Debug", "--> Value: %s" % value)
-                if value is None:
-                    self.AdjValue["Baro"][ID]["Value"] = 0
-                    self.AdjValue["Baro"][ID]["Stamp"] = int(time())
-                    self.closeDB()
-                    return 0
-                self.AdjValue["Baro"][ID]["Value"] = value[0]
-                self.AdjValue["Baro"][ID]["Stamp"] = int(time())
-                self.closeDB()
-                return value[0]
-            except sqlite3.Error as e:
-                Domoticz.Error("retreiveAddjValue_baro - Database error: %s" % e)
-                self.closeDB()
-                return 0
+                rows = self.dbCursor.fetchall()
 
-            except Exception as e:
-                Domoticz.Error("retreiveAddjValue_baro - Exception: %s" % e)
-                self.closeDB()
-                return 0
+        except sqlite3.Error as e:
+            Domoticz.Error("load_adjustments - Database error: %s" % e)
+            with self._dbLock:
+                if self.dbConn is not None:
+                    self.dbConn.close()
+                self.dbConn = None
+                self.dbCursor = None
+            return 0
 
-            Domoticz.Error(
-                "retreiveAddjValue_baro - Unexpected exception for ID: %s HardwareID: %s" % (ID, self.HardwareID)
-            )
-            self.closeDB()
+        except Exception as e:
+            Domoticz.Error("load_adjustments - Exception: %s" % e)
             return 0
 
-    def retreiveTimeOut_Motion(self, ID):
+        # Update in place, entry by entry, so the readers never see a partial cache
+        changed = 0
+        loaded = set()
+        for ID, AddjValue, AddjValue2 in rows:
+            loaded.add(ID)
+            adjustment = (AddjValue or 0, AddjValue2 or 0)
+            if self.AdjValue.get(ID) != adjustment:
+                self.AdjValue[ID] = adjustment
+                changed += 1
+        for ID in [x for x in self.AdjValue if x not in loaded]:
+            del self.AdjValue[ID]
+            changed += 1
+        self.logging("Debug", "load_adjustments - %s Devices, %s changed" % (len(rows), changed))
+        return changed
+
+    def _refresh_thread(self):
+        while not self._stopRefresh.wait(CACHE_TIMEOUT):
+            self.load_adjustments()
+
+    def retreiveAddjValue_baro(self, ID):
         """
-        Retreive the TmeeOut Motion value of Device.ID
+        Retreive the AddjValue2 of Device.ID
         """
+        adjustment = self.AdjValue.get(ID)
+        return adjustment[1] if adjustment else 0
 
-        if ID not in self.AdjValue["TimeOutMotion"]:
-            self.logging("Debug", "Init Timeoud cache")
-            self.AdjValue["TimeOutMotion"][ID] = {}
-            self.AdjValue["TimeOutMotion"][ID]["Value"] = None
-            self.AdjValue["TimeOutMotion"][ID]["Stamp"] = 0
-
-        # if self.AdjValue['TimeOutMotion'][ID]['Value'] is not None  and ( int(time()) < self.AdjValue['TimeOutMotion'][ID]['Stamp'] + CACHE_TIMEOUT):
-        if self.AdjValue["TimeOutMotion"][ID]["Value"] is not None:
-            self.logging("Debug", "Return from Timeout cache %s" % self.AdjValue["TimeOutMotion"][ID]["Value"])
-            return self.AdjValue["TimeOutMotion"][ID]["Value"]
-
-        if self.dbCursor is None:
-            self._openDB()
-            try:
-                self.logging("Debug", "DB access AddjValue for %s" % ID)
-                self.dbCursor.execute(
-                    "SELECT AddjValue FROM DeviceStatus WHERE ID = '%s' and HardwareID = '%s'" % (ID, self.HardwareID)
-                )
-                value = self.dbCursor.fetchone()
-                self.logging("Debug", "--> Value: %s" % value)
-                if value is None:
-                    self.closeDB()
-                    return 0
-                self.AdjValue["TimeOutMotion"][ID]["Value"] = value[0]
-                self.AdjValue["TimeOutMotion"][ID]["Stamp"] = int(time())
-                self.closeDB()
-                return value[0]
-
-            except sqlite3.Error as e:
-                Domoticz.Error("retreiveTimeOut_Motion - Database error: %s" % e)
-                self.logging("Debug", "retreiveTimeOut_Motion for ID: %s HardwareID: %s" % (ID, self.HardwareID))
-                self.closeDB()
-                return 0
-
-            except Exception as e:
-                Domoticz.Error("retreiveTimeOut_Motion - Exception: %s" % e)
-                self.logging("Debug", "retreiveTimeOut_Motion for ID: %s HardwareID: %s" % (ID, self.HardwareID))
-                self.closeDB()
-                return 0
-
-            Domoticz.Error(
-                "retreiveTimeOut_Motion - Unexpected exception for ID: %s HardwareID: %s" % (ID, self.HardwareID)
-            )
-            self.closeDB()
-            return 0
+    def retreiveTimeOut_Motion(self, ID):
+        """
+        Retreive the TimeOut Motion value (AddjValue) of Device.ID
+        """
+        adjustment = self.AdjValue.get(ID)
+        return adjustment[0] if adjustment else 0
 
     def retreiveAddjValue_temp(self, ID):
         """
         Retreive the AddjValue of Device.ID
         """
-
-        if ID not in self.AdjValue["Temp"]:
-            self.AdjValue["Temp"][ID] = {}
-            self.AdjValue["Temp"][ID]["Value"] = None
-            self.AdjValue["Temp"][ID]["Stamp"] = 0
-
-        # if self.AdjValue['Temp'][ID]['Value'] is not None and ( int(time()) < self.AdjValue['Temp'][ID]['Stamp'] + CACHE_TIMEOUT):
-        if self.AdjValue["Temp"][ID]["Value"] is not None:
-            self.logging("Debug", "Return from Temp cache %s" % self.AdjValue["Temp"][ID]["Value"])
-            return self.AdjValue["Temp"][ID]["Value"]
-
-        if self.dbCursor is None:
-            self._openDB()
-            try:
-                self.logging("Debug", "DB access AddjValue for %s" % ID)
-                self.dbCursor.execute(
-                    "SELECT AddjValue FROM DeviceStatus WHERE ID = '%s' and HardwareID = '%s'" % (ID, self.HardwareID)
-                )
-                value = self.dbCursor.fetchone()
-                self.logging("Debug", "--> Value: %s" % value)
-                if value is None:
-                    self.closeDB()
-                    return 0
-
-                self.AdjValue["Temp"][ID]["Value"] = value[0]
-                self.AdjValue["Temp"][ID]["Stamp"] = int(time())
-                self.closeDB()
-                return value[0]
-
-            except sqlite3.Error as e:
-                Domoticz.Error("retreiveAddjValue_temp - Database error: %s" % e)
-                self.closeDB()
-                return 0
-
-            except Exception as e:
-                Domoticz.Error("retreiveAddjValue_temp - Exception: %s" % e)
-                self.closeDB()
-                return 0
-
-            Domoticz.Error(
-                "retreiveAddjValue_temp - Unexpected exception for ID: %s HardwareID: %s" % (ID, self.HardwareID)
-            )
-            self.closeDB()
-            return 0
+        adjustment = self.AdjValue.get(ID)
+        return adjustment[0] if adjustment else 0
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: EnergyReportStore.py
+
+    Description: Network Energy reports, in memory and indexed by timestamp / root / router.
+
+    The report file ( NetworkEnergy-v3-xx.json ) is a JSON line per report: { timestamp: [ { "_NwkId": root,
+    "MeshRouters": [ entry, ... ] }, ... ] }. It is read once, then the reports are served from memory.
+
+    - During a scan, each router result is appended to the file as soon as it is received, as a line with the
+      timestamp of the scan and this single entry. Lines with the same timestamp are merged when the file is read,
+      so the results of an interrupted scan are not lost.
+    - At the end of the scan, the file is rewritten with one line per report ( the historical format ), keeping the
+      last max_reports reports.
+"""
+
+import json
+import os
+import os.path
+import threading
+
+
+class EnergyReportStore:
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.RLock()
+        self._reports = None  # timestamp -> { root: { nwkid: entry } }, oldest first. Loaded at first access
+        self.current = None  # timestamp of the scan in progress
+
+        # Instrumentation
+        self.file_loads = 0
+        self.appends = 0
+        self.rewrites = 0
+
+    def _load(self):
+        if self._reports is not None:
+            return
+        self._reports = {}
+        if not os.path.isfile(self.filename):
+            return
+        self.file_loads += 1
+        with open(self.filename, "rt") as handle:
+            for line in handle:
+                if line[0] != "{":
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Last line of an interrupted write
+                    continue
+                for timestamp, routers in entry.items():
+                    self._merge(timestamp, routers)
+
+    def _merge(self, timestamp, routers):
+        report = self._reports.setdefault(timestamp, {})
+        for router in routers:
+            meshrouters = report.setdefault(router["_NwkId"], {})
+            for entry in router["MeshRouters"]:
+                meshrouters[entry["_NwkId"]] = entry
+
+    @staticmethod
+    def _routers(report):
+        return [{"_NwkId": root, "MeshRouters": list(report[root].values())} for root in report]
+
+    def _writable(self):
+        return os.path.isdir(os.path.dirname(self.filename) or ".")
+
+    def _append(self, line):
+        if not self._writable():
+            return False
+        with open(self.filename, "a") as handle:
+            handle.write(line)
+        return True
+
+    def _rewrite(self):
+        if not self._writable():
+            return False
+        self.rewrites += 1
+        lines = ["\n" + json.dumps({timestamp: self._routers(report)}) for timestamp, report in self._reports.items()]
+        _tmpfile = self.filename + ".tmp"
+        with open(_tmpfile, "w") as handle:
+            handle.writelines(lines)
+            handle.write("\n")
+        os.replace(_tmpfile, self.filename)
+        return True
+
+    def timestamps(self):
+        with self._lock:
+            self._load()
+            return list(self._reports)
+
+    def latest(self):
+        """ timestamp of the last report ( the scan in progress if any ), None if there is none """
+        with self._lock:
+            self._load()
+            return next(reversed(list(self._reports)), None)
+
+    def report(self, timestamp):
+        """ report in the file format, None if unknown """
+        with self._lock:
+            self._load()
+            if timestamp not in self._reports:
+                return None
+            return self._routers(self._reports[timestamp])
+
+    def mesh_routers(self, timestamp, root="0000"):
+        """ entries of root in the report, None if unknown """
+        with self._lock:
+            self._load()
+            if timestamp not in self._reports or root not in self._reports[timestamp]:
+                return None
+            return list(self._reports[timestamp][root].values())
+
+    def begin(self, timestamp):
+        """ start the report of a new scan """
+        with self._lock:
+            self._load()
+            self.current = str(timestamp)
+            if self._reports.pop(self.current, None) is not None:
+                # Same second as the previous scan, its lines must not be merged with the new results
+                self._rewrite()
+            self._reports[self.current] = {}
+
+    def record(self, root, entry):
+        """ store the result of a router for the scan in progress, and append it to the file """
+        with self._lock:
+            if self.current is None:
+                return False
+            self._merge(self.current, [{"_NwkId": root, "MeshRouters": [entry]}])
+            self.appends += 1
+            return self._append("\n" + json.dumps({self.current: [{"_NwkId": root, "MeshRouters": [entry]}]}))
+
+    def end(self, routers, max_reports):
+        """ replace the report of the scan in progress by routers ( file format ), and rewrite the file """
+        with self._lock:
+            if self.current is None:
+                return False
+            self._reports[self.current] = {}
+            self._merge(self.current, routers)
+            self.current = None
+            for timestamp in list(self._reports)[: max(0, len(self._reports) - max(1, max_reports))]:
+                del self._reports[timestamp]
+            return self._rewrite()
+
+    def delete(self, timestamp):
+        with self._lock:
+            self._load()
+            if timestamp not in self._reports:
+                return False
+            del self._reports[timestamp]
+            if timestamp == self.current:
+                self.current = None
+            self._rewrite()
+            return True
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "Reports": len(self._reports) if self._reports is not None else None,
+                "ScanInProgress": self.current,
+                "FileLoads": self.file_loads,
+                "Appends": self.appends,
+                "Rewrites": self.rewrites,
+            }
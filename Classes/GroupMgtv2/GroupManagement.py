@@ -119,6 +119,7 @@ class GroupsManagement(object):
         self.ListOfDevices = ListOfDevices  # Point to the Global ListOfDevices
         self.IEEE2NWK = IEEE2NWK  # Point to the List of IEEE to NWKID
         self.DeviceConf = DeviceConf
+        self.heartbeatScheduler = None  # Set by the plugin, to wake up devices after a group command
         self.ListOfGroups = {}  # Data structutre to store all groups
         self.log = log
         self.GroupListFileName = None  # Filename of Group cashing file
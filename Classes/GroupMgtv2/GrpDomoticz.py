@@ -10,7 +10,7 @@ import Domoticz
 from Classes.GroupMgtv2.GrpCommands import (set_hue_saturation,
                                             set_kelvin_color, set_rgb_color)
 from Classes.GroupMgtv2.GrpDatabase import update_due_to_nwk_id_change
-from Modules.tools import Hex_Format
+from Modules.tools import Hex_Format, reset_heartbeat
 from Modules.zclCommands import (zcl_group_level_move_to_level,
                                  zcl_group_onoff_off_noeffect,
                                  zcl_group_onoff_off_witheffect,
@@ -784,7 +784,7 @@ def resetDevicesHearttBeat(self, GrpId):
         if NwkId in self.ListOfDevices:
             # Force Read Attribute consideration in the next hearbeat
             if "Heartbeat" in self.ListOfDevices[NwkId]:
-                self.ListOfDevices[NwkId]["Heartbeat"] = "0"
+                reset_heartbeat(self, NwkId)
 
             # Reset Health status of corresponding device if any in Not Reachable
             if "Health" in self.ListOfDevices[NwkId] and self.ListOfDevices[NwkId]["Health"] == "Not Reachable":
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: HeartbeatScheduler.py
+
+    Description: Due time scheduler for the periodic per device work done in the heartbeat
+                 (ReadAttributes, Ping ...).
+
+    Each (task, NwkId) registers its next due time in a heap. At each heartbeat tick, only the entries
+    which are due are popped and flagged as ready, so checking if a device has some work to do is O(1)
+    instead of re-evaluating all Endpoints x Clusters timers.
+
+    An entry never scheduled is always due. An entry can be linked to a token (the data structure the due
+    time has been computed from); if the token is replaced or removed (reset of the data structure), the entry
+    is due.
+
+    Devices are visited by the heartbeat only when they have something to do: after each visit, the heartbeat
+    tells in how many ticks the device must be visited again (wake), and start_tick() returns the devices to be
+    visited at this tick. The Heartbeat counter of a device is derived from the tick of its last visit, and a
+    counter reset since then ( "Heartbeat" set to "0" ) is detected when the device is visited.
+"""
+
+import heapq
+import threading
+
+
+class HeartbeatScheduler:
+    def __init__(self):
+        self._heap = []  # (due time, task, key)
+        self._due = {}  # (task, key) -> (due time, token)
+        self._ready = set()  # (task, key) popped from the heap, waiting to be processed
+        self._visits = {}  # tick -> keys to be visited at that tick
+        self._next_visit = {}  # key -> tick of the next visit
+        self._heartbeat = {}  # key -> (tick, Heartbeat counter) of the last visit
+        self._lock = threading.Lock()  # wake() is called by the commands, from any thread
+
+        # Instrumentation
+        self.ticks = 0
+        self.tick_executed = {}  # Task executed during the last tick
+        self.tick_skipped = 0  # Not due checks during the last tick
+        self.tick_popped = 0  # Entries popped from the heap during the last tick
+        self.tick_visits = 0  # Keys visited during the last tick
+        self.total_executed = {}
+        self.max_executed_per_tick = 0
+
+    def schedule(self, task, key, due, token=None):
+        self._due[(task, key)] = (due, token)
+        self._ready.discard((task, key))
+        heapq.heappush(self._heap, (due, task, key))
+
+    def forget(self, key):
+        # Remove all entries of a key ( device removed or re-joined ). The heap entries will be dropped when popped.
+        for entry in [x for x in list(self._due) if x[1] == key]:
+            self._due.pop(entry, None)
+            self._ready.discard(entry)
+        with self._lock:
+            self._cancel_visit(key)
+        self._heartbeat.pop(key, None)
+
+    def wake(self, key, ticks=1):
+        """ visit key in ticks ticks at the latest """
+        with self._lock:
+            tick = self.ticks + max(1, ticks)
+            if self._next_visit.get(key, tick + 1) <= tick:
+                return
+            self._cancel_visit(key)
+            self._next_visit[key] = tick
+            self._visits.setdefault(tick, set()).add(key)
+
+    def _cancel_visit(self, key):
+        tick = self._next_visit.pop(key, None)
+        if tick is not None:
+            self._visits[tick].discard(key)
+
+    def start_tick(self, now, alive_keys, sweep=False):
+        """
+        pop all due entries, and return the keys to be visited at this tick: the ones woken for this tick and the
+        ones with a due entry. alive_keys is the container of keys still existing. With sweep, the alive keys
+        without a visit planned ( new ones ) are visited too.
+        """
+        self.ticks += 1
+        self.tick_executed = {}
+        self.tick_skipped = self.tick_popped = 0
+        with self._lock:
+            visits = self._visits.pop(self.ticks, set())
+            for key in visits:
+                del self._next_visit[key]
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, task, key = heapq.heappop(heap)
+            entry = (task, key)
+            if entry not in self._due or self._due[entry][0] != due:
+                # Rescheduled or forgotten since
+                continue
+            if key not in alive_keys:
+                del self._due[entry]
+                continue
+            self._ready.add(entry)
+            self.tick_popped += 1
+            visits.add(key)
+        if sweep:
+            visits.update(key for key in alive_keys if key not in self._next_visit)
+        for key in [x for x in visits if x not in alive_keys]:
+            visits.discard(key)
+            self.forget(key)
+        self.tick_visits = len(visits)
+        return visits
+
+    def heartbeat(self, key, value):
+        """ Heartbeat counter of key at this tick, value being the one stored in the device """
+        value = int(value)
+        last = self._heartbeat.get(key)
+        if last is None or last[1] != value:
+            # First visit, or counter reset since the last visit
+            return value + 1
+        return value + self.ticks - last[0]
+
+    def visited(self, key, value, ticks):
+        """ value is the Heartbeat counter stored in the device, to be visited again in ticks ticks """
+        self._heartbeat[key] = (self.ticks, int(value))
+        self.wake(key, ticks)
+
+    def end_tick(self):
+        nb_executed = sum(self.tick_executed.values())
+        if nb_executed > self.max_executed_per_tick:
+            self.max_executed_per_tick = nb_executed
+
+    def is_due(self, task, key, token=None):
+        if self.next_due(task, key, token) is None:
+            return True
+        self.tick_skipped += 1
+        return False
+
+    def next_due(self, task, key, token=None):
+        """ due time of the entry, None if it is due """
+        entry = (task, key)
+        due = self._due.get(entry)
+        if entry in self._ready or due is None or due[1] is not token:
+            return None
+        return due[0]
+
+    def executed(self, task):
+        self.tick_executed[task] = self.tick_executed.get(task, 0) + 1
+        self.total_executed[task] = self.total_executed.get(task, 0) + 1
+
+    def pending(self):
+        return len(self._due)
+
+    def statistics(self):
+        return {
+            "Ticks": self.ticks,
+            "Scheduled": len(self._due),
+            "Ready": len(self._ready),
+            "Planned": len(self._next_visit),
+            "LastTickVisits": self.tick_visits,
+            "LastTickPopped": self.tick_popped,
+            "LastTickExecuted": dict(self.tick_executed),
+            "LastTickSkipped": self.tick_skipped,
+            "MaxExecutedPerTick": self.max_executed_per_tick,
+            "TotalExecuted": dict(self.total_executed),
+        }
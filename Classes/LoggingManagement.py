@@ -14,6 +14,7 @@
 import Domoticz
 import json
 from datetime import datetime
+import itertools
 import threading
 import time
 from queue import Queue, PriorityQueue
@@ -37,6 +38,9 @@ class LoggingManagement:
         self.logging_queue = None
         self.logging_thread = None
         self._startTime = int(time.time())
+        self._sequence = itertools.count()  # tie-breaker for records with the same timestamp in the PriorityQueue
+        self.suppressed_records = 0  # Debug records dropped at the call site (debug flag off or nwkid not matched)
+        self.emitted_records = 0  # records sent to the logging thread
 
         start_logging_thread(self)
 
@@ -134,7 +138,7 @@ class LoggingManagement:
             return
 
         if self.logging_queue:
-            self.logging_queue.put([str(time.time()), "QUIT"])
+            self.logging_queue.put((time.time(), next(self._sequence), None))
         if self.logging_thread:
             self.logging_thread.join()
         del self.logging_thread
@@ -167,18 +171,48 @@ class LoggingManagement:
         self.LogErrorHistory.clear()
         self._newError = False
 
+    def is_debug_enabled(self, module, nwkid=None):
+        # Check at the call site if a Debug record for this module (and nwkid) will be logged
+        pluginConfModule = "debug" + module
+        if pluginConfModule not in self.pluginconf.pluginConf:
+            # Unknown module, let the logging thread report it
+            return True
+        if not self.pluginconf.pluginConf[pluginConfModule]:
+            return False
+        if nwkid:
+            _debugMatchId = self.pluginconf.pluginConf["debugMatchId"].lower().split(",")
+            return "ffff" in _debugMatchId or nwkid.lower() in _debugMatchId or nwkid.lower() == "ffff"
+        return True
+
+    def debug(self, module, message, *args, nwkid=None, context=None):
+        # Debug logging with %-style arguments. The message is formatted only if the record is going to be logged
+        if not self.is_debug_enabled(module, nwkid):
+            self.suppressed_records += 1
+            return
+        if args:
+            message = message % args
+        self.logging(module, "Debug", message, nwkid, context)
+
+    def logging_statistics(self):
+        return {"Suppressed": self.suppressed_records, "Emitted": self.emitted_records}
+
     def logging(self, module, logType, message, nwkid=None, context=None):
+        if logType == "Debug" and not self.is_debug_enabled(module, nwkid):
+            self.suppressed_records += 1
+            return
+
         if self.logging_thread and self.logging_queue:
-            logging_tupple = [
-                str(time.time()),
-                str(threading.current_thread().name),
-                str(module),
-                str(logType),
-                str(message),
-                str(nwkid),
-                str(context),
-            ]
-            self.logging_queue.put(logging_tupple)
+            if isinstance(context, dict):
+                # Snapshot of the context, it might be updated by the caller after the call
+                context = dict(context)
+            self.emitted_records += 1
+            self.logging_queue.put(
+                (
+                    time.time(),
+                    next(self._sequence),
+                    (threading.current_thread().name, module, logType, message, nwkid, context),
+                )
+            )
         else:
             Domoticz.Log("%s" % message)
 
@@ -323,7 +357,7 @@ def loggingWriteErrorHistory(self):
     jsonLogHistory = self.pluginconf.pluginConf["pluginLogs"] + "/" + "Zigate_log_error_history.json"
     with open(jsonLogHistory, "w", encoding="utf-8") as json_file:
         try:
-            json.dump(dict(self.LogErrorHistory), json_file)
+            json.dump(dict(self.LogErrorHistory), json_file, default=str)
             json_file.write("\n")
         except Exception as e:
             Domoticz.Error("Hops ! Unable to write LogErrorHistory error: %s log: %s" % (e, self.LogErrorHistory))
@@ -348,41 +382,23 @@ def logging_thread(self):
     while self.running:
         # We loop until self.running is set to False,
         # which indicate plugin shutdown
-        data = None
-        logging_tupple = self.logging_queue.get()
-        if len(logging_tupple) == 2:
-            timing, command = logging_tupple
-            if command == "QUIT":
-                Domoticz.Log("logging_thread Exit requested")
-                break
-        elif len(logging_tupple) == 7:
-            (
-                timing,
-                thread_name,
-                module,
-                logType,
-                message,
-                nwkid,
-                context,
-            ) = logging_tupple
-            try:
-                context = eval(context)
-            except:
-                Domoticz.Error("Something went wrong and catch: context: %s" % str(context))
-                Domoticz.Error("logging_thread unexpected tupple %s" % (str(logging_tupple)))
-                return
-            if logType == "Error":
-                loggingError(self, thread_name, module, message, nwkid, context)
-            elif logType == "Debug":
-                pluginConfModule = "debug" + str(module)
-                if pluginConfModule in self.pluginconf.pluginConf:
-                    if self.pluginconf.pluginConf[pluginConfModule]:
-                        _logginfilter(self, thread_name, message, nwkid)
-                else:
-                    Domoticz.Error("%s debug module unknown %s" % (pluginConfModule, module))
-                    _loggingDebug(self, thread_name, message)
+        timing, sequence, record = self.logging_queue.get()
+        if record is None:
+            Domoticz.Log("logging_thread Exit requested")
+            break
+
+        thread_name, module, logType, message, nwkid, context = record
+        message = str(message)
+        if logType == "Error":
+            loggingError(self, thread_name, module, message, nwkid, context)
+        elif logType == "Debug":
+            pluginConfModule = "debug" + str(module)
+            if pluginConfModule in self.pluginconf.pluginConf:
+                if self.pluginconf.pluginConf[pluginConfModule]:
+                    _logginfilter(self, thread_name, message, nwkid)
             else:
-                loggingDirector(self, thread_name, logType, message)
+                Domoticz.Error("%s debug module unknown %s" % (pluginConfModule, module))
+                _loggingDebug(self, thread_name, message)
         else:
-            Domoticz.Error("logging_thread unexpected tupple %s" % (str(logging_tupple)))
+            loggingDirector(self, thread_name, logType, message)
     Domoticz.Log("logging_thread - ended")
@@ -18,19 +18,30 @@
 #                                          'ScanRequired2' /* A scan is required to get more entries */
 #                             ['Channels'][ Num ] /* Energy Level by Channel for corresponding nwkid
 # 
+#     Scan
+#         Up to networkEnergyWindow Mgmt_NWK_Update_req are in flight ( self.nwkidInQueue ), one per target at most
+#         as the responses are correlated by their source. The next request is sent as soon as a response is received,
+#         and do_scan ( heartbeat ) only handles the time outs and the end of the scan.
+#         Firmware before 3.1a doesn't give the source of 0x804A, so there is only one request at a time until a
+#         response with the source has been received.
+#         Each result is stored in self.reports ( EnergyReportStore ) when received.
+#
 
 
 
-import json
-import os.path
+from collections import deque
+from threading import RLock
 from time import time
 
 import Domoticz
+from Classes.EnergyReportStore import EnergyReportStore
 from Modules.basicOutputs import maskChannel
 from Modules.zdpCommands import zdp_management_network_update_request
+from Modules.zigateConsts import MAX_LOAD_ZIGATE
 
 CHANNELS = ["11", "12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26"]
 DURATION = 0x03
+ENERGY_TIMEOUT = 15  # Seconds to wait for a 0x804A ( 16 channels are scanned during 138ms each )
 
 
 class NetworkEnergy:
@@ -45,8 +56,20 @@ class NetworkEnergy:
 
         self.EnergyLevel = None
         self.ScanInProgress = False
-        self.nwkidInQueue = []
-        self.ticks = 0
+        self.nwkidInQueue = {}  # target -> ( root, time of the request )
+        self.toBeScanned = deque()  # ( root, target )
+        self.SourceInResponse = False  # Firmware 3.1a and above give the source of 0x804A
+        self._lock = RLock()  # NwkScanResponse is called by the forwarder thread, do_scan by the heartbeat
+        self.reports = EnergyReportStore(
+            self.pluginconf.pluginConf["pluginReports"] + "NetworkEnergy-v3-" + "%02d" % self.HardwareID + ".json"
+        )
+
+        # Instrumentation
+        self.scan_start = None
+        self.scan_duration = None
+        self.requests = 0
+        self.responses = 0
+        self.timeouts = 0
 
     def logging(self, logType, message):
         self.log.logging("NetworkEnergy", logType, message)
@@ -122,6 +145,7 @@ class NetworkEnergy:
         self.EnergyLevel[root][nwkid]["Channels"] = {}
         for i in channels:
             self.EnergyLevel[root][nwkid]["Channels"][i] = None
+        self.toBeScanned.append((root, nwkid))
 
     def prettyPrintNwkEnrgy(self):
 
@@ -144,101 +168,135 @@ class NetworkEnergy:
         mask = maskChannel(self, channels)
         #datas = target + "%08.x" % (mask) + "%02.x" % (scanDuration) + "%02.x" % (scanCount) + "00" + root
 
-        if len(self.nwkidInQueue) == 0:
-            self.logging(
-                "Debug",
-                "NwkScanReq - request a scan on channels %s for duration %s an count %s"
-                % (channels, scanDuration, scanCount),
-            )
-            #self.logging("Debug", "NwkScan - %s %s" % ("004A", datas))
-            self.nwkidInQueue.append((root, target))
-            zdp_management_network_update_request(self, target , "%08.x" %mask , "%02.x" %scanDuration , "%02.x" % (scanCount) , "00", root)
-            #sendZigateCmd(self, "004A", datas)
-            self.EnergyLevel[root][target]["Status"] = "WaitResponse"
-            self.ticks = 0
+        self.logging(
+            "Debug",
+            "NwkScanReq - request a scan on channels %s for duration %s an count %s"
+            % (channels, scanDuration, scanCount),
+        )
+        #self.logging("Debug", "NwkScan - %s %s" % ("004A", datas))
+        self.nwkidInQueue[target] = (root, time())
+        self.requests += 1
+        zdp_management_network_update_request(self, target , "%08.x" %mask , "%02.x" %scanDuration , "%02.x" % (scanCount) , "00", root)
+        #sendZigateCmd(self, "004A", datas)
+        self.EnergyLevel[root][target]["Status"] = "WaitResponse"
 
     def start_scan(self, root=None, target=None, channels=None):
 
         self.logging("Debug", "start_scan")
-        if self.ScanInProgress:
-            Domoticz.Log("a Scan is already in progress")
-            return
-        self.ScanInProgress = True
-
-        if channels is None:
-            # All channels
-            channels = CHANNELS
-        if root == target == "0000":
-            # We will do a full cross-scan
-            self._initNwkEnrgy(root, target, channels)
-
-        elif root is None and target is None:
-            # Default
-            # Target will be all Routers with Zigate
-            self._initNwkEnrgy(None, "0000", channels)
-
-        self._next_scan()
+        with self._lock:
+            if self.ScanInProgress:
+                Domoticz.Log("a Scan is already in progress")
+                return
+            self.ScanInProgress = True
+            self.nwkidInQueue = {}
+            self.toBeScanned.clear()
+
+            if channels is None:
+                # All channels
+                channels = CHANNELS
+            if root == target == "0000":
+                # We will do a full cross-scan
+                self._initNwkEnrgy(root, target, channels)
+
+            elif root is None and target is None:
+                # Default
+                # Target will be all Routers with Zigate
+                self._initNwkEnrgy(None, "0000", channels)
+
+            self.scan_start = time()
+            self.scan_duration = None
+            self.reports.begin(int(self.scan_start))
+            self._next_scan()
 
     def do_scan(self, root=None, target=None, channels=None):
 
-        if self.ScanInProgress:
-            self._next_scan()
+        with self._lock:
+            if self.ScanInProgress:
+                self._check_timeouts()
+                self._next_scan()
+                if not self.nwkidInQueue and not self.toBeScanned:
+                    self.finish_scan()
+
+    def _check_timeouts(self):
+
+        now = time()
+        for target, (root, sent) in list(self.nwkidInQueue.items()):
+            if now - sent < ENERGY_TIMEOUT:
+                continue
+            self.logging("Debug", "--> _check_timeouts - %s <-> %s --> TimedOut" % (root, target))
+            del self.nwkidInQueue[target]
+            self.timeouts += 1
+            if self.EnergyLevel[root][target]["Status"] == "WaitResponse":
+                self.EnergyLevel[root][target]["Status"] = "TimedOut"
+
+    def scan_window(self):
+        if not self.SourceInResponse:
+            return 1
+        return max(1, self.pluginconf.pluginConf["networkEnergyWindow"])
 
     def _next_scan(self):
 
-        self.logging("Debug", "_next_scan")
-        self.ticks += 1
-        allRootCompleted = True
-        self.logging("Debug", "_next_scan - To be scan: %s" % list(self.EnergyLevel))
-        for r in self.EnergyLevel:
-            waitResponse = False
-            breakfromabove = False
-            self.logging("Debug", "_next_scan - %s against %s" % (r, list(self.EnergyLevel[r])))
-            for i in self.EnergyLevel[r]:
-                self.logging("Debug", "--> _next_scan - %s <-> %s %s" % (r, i, self.EnergyLevel[r][i]["Status"]))
-                if self.EnergyLevel[r][i]["Status"] == "Completed":
-                    continue
-                elif self.EnergyLevel[r][i]["Status"] == "TimedOut":
-                    continue
-                elif self.EnergyLevel[r][i]["Status"] == "WaitResponse":
-                    waitResponse = True
-                    allRootCompleted = False
-                    if self.ticks > 2:
-                        self.logging(
-                            "Debug",
-                            "--> _next_scan - %s <-> %s %s --> TimedOut" % (r, i, self.EnergyLevel[r][i]["Status"]),
-                        )
-                        self.EnergyLevel[r][i]["Status"] = "TimedOut"
-                        if len(self.nwkidInQueue) > 0:
-                            root, entry = self.nwkidInQueue.pop()
-                            if r != root and i != entry:
-                                Domoticz.Error("Mismatch %s versus %s" % (i, entry))
-                    continue
-                elif self.EnergyLevel[r][i]["Status"] == "ScanRequired":
-                    _channels = []
-                    for c in self.EnergyLevel[r][i]["Channels"]:
-                        _channels.append(c)
-                    self.NwkScanReq(r, i, _channels)
-                    breakfromabove = True
-                    allRootCompleted = False
-                    break
+        # Send the next requests, up to the window, and at most one per target
+        self.logging("Debug", "_next_scan - To be scan: %s In flight: %s" % (len(self.toBeScanned), list(self.nwkidInQueue)))
+        busy = 0
+        while self.toBeScanned and len(self.nwkidInQueue) < self.scan_window() and busy < len(self.toBeScanned):
+            r, i = self.toBeScanned.popleft()
+            if i in self.nwkidInQueue:
+                # Already scanned for another root, will be for the next one
+                self.toBeScanned.append((r, i))
+                busy += 1
+                continue
+            if self.EnergyLevel[r][i]["Status"] != "ScanRequired":
+                continue
+            self.NwkScanReq(r, i, list(self.EnergyLevel[r][i]["Channels"]))
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "ScanInProgress": self.ScanInProgress,
+                "Window": self.scan_window(),
+                "InFlight": len(self.nwkidInQueue),
+                "ToBeScanned": len(self.toBeScanned),
+                "Requests": self.requests,
+                "Responses": self.responses,
+                "TimedOut": self.timeouts,
+                "ScanDuration": self.scan_duration,
+                "Reports": self.reports.statistics(),
+            }
+
+    def _report_entry(self, r, nwkid):
+        # Entry of nwkid in the report of r, None if the device is unknown
+        if nwkid not in self.ListOfDevices:
+            return None
+        entry = {}
+        entry["_NwkId"] = nwkid
+        if "ZDeviceName" in self.ListOfDevices[nwkid]:
+            if self.ListOfDevices[nwkid]["ZDeviceName"] != {}:
+                entry["ZDeviceName"] = self.ListOfDevices[nwkid]["ZDeviceName"]
             else:
-                if not waitResponse:
-                    continue
-            if breakfromabove:
-                break
+                entry["ZDeviceName"] = nwkid
+        entry["Channels"] = []
+        if self.EnergyLevel[r][nwkid]["Status"] != "Completed":
+            entry["Tx"] = 0
+            entry["Failure"] = 0
+            for c in CHANNELS:
+                entry["Channels"].append({"Channel": c, "Level": 0})
         else:
-            if allRootCompleted:
-                self.finish_scan()
+            entry["Tx"] = self.EnergyLevel[r][nwkid]["Tx"]
+            entry["Failure"] = self.EnergyLevel[r][nwkid]["Failure"]
+            for c in self.EnergyLevel[r][nwkid]["Channels"]:
+                if c not in CHANNELS:
+                    continue
+                entry["Channels"].append({"Channel": c, "Level": self.EnergyLevel[r][nwkid]["Channels"][c]})
+        return entry
 
     def finish_scan(self):
 
         self.logging("Debug", "Finish_scan")
         self.ScanInProgress = False
+        self.scan_duration = round(time() - self.scan_start, 1) if self.scan_start else None
 
-        stamp = int(time())
-        storeEnergy = {}
-        storeEnergy[stamp] = []
+        storeEnergy = []
         for r in self.EnergyLevel:
             Domoticz.Status("Network Energy Level Report: %s" % r)
             Domoticz.Status("-----------------------------------------------")
@@ -250,81 +308,24 @@ class NetworkEnergy:
             router["_NwkId"] = r
             router["MeshRouters"] = []
             for nwkid in self.EnergyLevel[r]:
-                entry = {}
-                entry["_NwkId"] = nwkid
-                if nwkid not in self.ListOfDevices:
+                entry = self._report_entry(r, nwkid)
+                if entry is None:
                     continue
-                if "ZDeviceName" in self.ListOfDevices[nwkid]:
-                    if self.ListOfDevices[nwkid]["ZDeviceName"] != {}:
-                        entry["ZDeviceName"] = self.ListOfDevices[nwkid]["ZDeviceName"]
-                    else:
-                        entry["ZDeviceName"] = nwkid
-                if self.EnergyLevel[r][nwkid]["Status"] != "Completed":
-                    entry["Tx"] = 0
-                    entry["Failure"] = 0
-                    entry["Channels"] = []
-                    toprint = "%6s <- %5s %6s %8s" % (
-                        r,
-                        nwkid,
-                        self.EnergyLevel[r][nwkid]["Tx"],
-                        self.EnergyLevel[r][nwkid]["Failure"],
-                    )
-                    for c in CHANNELS:
-                        channels = {}
-                        channels["Channel"] = c
-                        channels["Level"] = 0
-                        entry["Channels"].append(channels)
-                        toprint += " %4s" % 0
-                else:
-                    entry["Tx"] = self.EnergyLevel[r][nwkid]["Tx"]
-                    entry["Failure"] = self.EnergyLevel[r][nwkid]["Failure"]
-                    entry["Channels"] = []
-
-                    toprint = "%6s <- %5s %6s %8s" % (
-                        r,
-                        nwkid,
-                        self.EnergyLevel[r][nwkid]["Tx"],
-                        self.EnergyLevel[r][nwkid]["Failure"],
-                    )
-                    for c in self.EnergyLevel[r][nwkid]["Channels"]:
-                        channels = {}
-                        if c not in CHANNELS:
-                            continue
-                        channels["Channel"] = c
-                        channels["Level"] = self.EnergyLevel[r][nwkid]["Channels"][c]
-                        entry["Channels"].append(channels)
-                        toprint += " %4s" % self.EnergyLevel[r][nwkid]["Channels"][c]
+                toprint = "%6s <- %5s %6s %8s" % (
+                    r,
+                    nwkid,
+                    self.EnergyLevel[r][nwkid]["Tx"],
+                    self.EnergyLevel[r][nwkid]["Failure"],
+                )
+                for channels in entry["Channels"]:
+                    toprint += " %4s" % channels["Level"]
                 router["MeshRouters"].append(entry)
                 Domoticz.Status(toprint)
-            storeEnergy[stamp].append(router)
+            storeEnergy.append(router)
 
         self.logging("Debug", "Network Energly Level Report: %s" % storeEnergy)
 
-        _filename = (
-            self.pluginconf.pluginConf["pluginReports"] + "NetworkEnergy-v3-" + "%02d" % self.HardwareID + ".json"
-        )
-        if os.path.isdir(self.pluginconf.pluginConf["pluginReports"]):
-
-            nbentries = 0
-            if os.path.isfile(_filename):
-                with open(_filename, "r") as fin:
-                    data = fin.read().splitlines(True)
-                    nbentries = len(data)
-
-            with open(_filename, "w") as fout:
-                # we need to short the list by todayNumReports - todayNumReports - 1
-                maxNumReports = self.pluginconf.pluginConf["numTopologyReports"]
-                start = 0
-                if nbentries >= maxNumReports:
-                    start = (nbentries - maxNumReports) + 1
-                self.logging("Debug", "Rpt max: %s , New Start: %s, Len:%s " % (maxNumReports, start, nbentries))
-
-                if nbentries != 0:
-                    fout.write("\n")
-                    fout.writelines(data[start:])
-                fout.write("\n")
-                json.dump(storeEnergy, fout)
-        else:
+        if not self.reports.end(storeEnergy, self.pluginconf.pluginConf["numEnergyReports"]):
             Domoticz.Error(
                 "Unable to get access to directory %s, please check PluginConf.txt"
                 % (self.pluginconf.pluginConf["pluginReports"])
@@ -332,6 +333,14 @@ class NetworkEnergy:
 
     def NwkScanResponse(self, MsgData):
 
+        with self._lock:
+            self._NwkScanResponse(MsgData)
+            if self.ScanInProgress and self.ZigateComm.loadTransmit() <= MAX_LOAD_ZIGATE:
+                # Do not wait for the heartbeat to send the next requests
+                self._next_scan()
+
+    def _NwkScanResponse(self, MsgData):
+
         self.logging("Debug", "NwkScanResponse >%s<" % MsgData)
 
         MsgSrc = None
@@ -371,34 +380,35 @@ class NetworkEnergy:
             26: 0x04000000,
         }
 
-        if MsgDataStatus != "00":
-            Domoticz.Error("NwkScanResponse - Status: %s with Data: %s" % (MsgDataStatus, MsgData))
-            return
-
-        if len(self.nwkidInQueue) == 0 and MsgSrc:
-            # self.logging( 'Log', "NwkScanResponse - Empty Queue, Receive infos from %s" %MsgSrc)
-            return
-
         if len(self.nwkidInQueue) == 0:
-            # self.logging( 'Log', "NwkScanResponse - Empty Queue ")
+            # self.logging( 'Log', "NwkScanResponse - Empty Queue, Receive infos from %s" %MsgSrc)
             return
 
-        if len(self.nwkidInQueue) > 0 and MsgSrc:
-            root, entry = self.nwkidInQueue.pop()
-            self.logging("Debug", "NwkScanResponse - Root: %s, Entry: %s, MsgSrc: %s" % (root, entry, MsgSrc))
-            if entry != MsgSrc:
+        if MsgSrc:
+            self.SourceInResponse = True
+            if MsgSrc not in self.nwkidInQueue:
                 Domoticz.Log(
-                    "NwkScanResponse - Unexpected message >%s< from %s, expecting %s" % (MsgData, MsgSrc, entry)
+                    "NwkScanResponse - Unexpected message >%s< from %s, expecting %s" % (MsgData, MsgSrc, list(self.nwkidInQueue))
                 )
+                return
+            entry = MsgSrc
+            root, _ = self.nwkidInQueue.pop(entry)
+            self.logging("Debug", "NwkScanResponse - Root: %s, Entry: %s, MsgSrc: %s" % (root, entry, MsgSrc))
 
-        elif len(self.nwkidInQueue) > 0:
-            root, entry = self.nwkidInQueue.pop()
+        elif len(self.nwkidInQueue) == 1:
+            entry, (root, _) = self.nwkidInQueue.popitem()
             self.logging("Debug", "NwkScanResponse - Root: %s, Entry: %s" % (root, entry))
 
         else:
             self.logging("Log", "NwkScanResponse - Unexpected: len: %s, MsgSrc: %s" % (len(self.nwkidInQueue), MsgSrc))
             return
 
+        self.responses += 1
+        if MsgDataStatus != "00":
+            Domoticz.Error("NwkScanResponse - Status: %s with Data: %s" % (MsgDataStatus, MsgData))
+            self.EnergyLevel[root][entry]["Status"] = "TimedOut"
+            return
+
         channelList = []
         for channel in CHANNELS:
             if int(MsgScannedChannel, 16) & CHANNELS[channel]:
@@ -427,3 +437,7 @@ class NetworkEnergy:
                 )
 
         self.EnergyLevel[root][entry]["Status"] = "Completed"
+
+        report_entry = self._report_entry(root, entry)
+        if report_entry is not None:
+            self.reports.record(root, report_entry)
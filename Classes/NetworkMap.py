@@ -22,18 +22,29 @@
 #                                ['Neighbours'][ nwkid ]
 #                                                       [attributes]
 #
+#    Scan
+#        Up to networkMapWindow routers are requested at the same time ( self.LQIreqInProgress ). The next
+#        requests ( next page of a Neighbour table, or a newly found router ) are sent as soon as a response is
+#        received. The heartbeat ( continue_scan ) only handles the time outs, retries and the end of the scan.
+#        Firmware before 3.1a doesn't give the source of a response, so there is only one request at a time
+#        until a response with the source has been received.
+#        Neighbours is updated as the responses are received, and can be queried with snapshot() during the scan.
+#
 
 
 from datetime import datetime
 import time
 import os.path
 import json
+import threading
 
 import Domoticz
 
 from Classes.AdminWidgets import AdminWidgets
 from Classes.LoggingManagement import LoggingManagement
+from Modules.zigateConsts import MAX_LOAD_ZIGATE
 
+LQI_TIMEOUT = 10  # Seconds to wait for a response to a Mgmt_Lqi_req, before a retry
 
 class NetworkMap:
     def __init__(self, PluginConf, ZigateComm, ListOfDevices, Devices, HardwareID, log):
@@ -45,9 +56,17 @@ class NetworkMap:
         self.log = log
 
         self._NetworkMapPhase = 0
-        self.LQIreqInProgress = []
-        self.LQIticks = 0
+        self.LQIreqInProgress = {}  # nwkid -> time of the request
         self.Neighbours = {}  # Table of Neighbours
+        self.SourceInResponse = False  # Firmware 3.1a and above give the source of 0x804E
+        self._lock = threading.RLock()  # LQIresp is called by the forwarder thread, continue_scan by the heartbeat
+
+        # Instrumentation
+        self.scan_start = None
+        self.scan_duration = None
+        self.requests = 0
+        self.responses = 0
+        self.timeouts = 0
 
     def logging(self, logType, message):
         self.log.logging("NetworkMap", logType, message)
@@ -56,50 +75,37 @@ class NetworkMap:
         return self._NetworkMapPhase
 
     def LQIresp(self, MsgData):
-        LQIresp_decoding(self, MsgData)
+        with self._lock:
+            LQIresp_decoding(self, MsgData)
+            if self._NetworkMapPhase == 2 and self.ZigateComm.loadTransmit() < MAX_LOAD_ZIGATE:
+                # Do not wait for the heartbeat to send the next requests
+                fill_window(self)
 
     def start_scan(self):
 
-        if len(self.Neighbours) != 0:
-            self.logging("Debug", "start_scan - initialize data")
-            del self.Neighbours
-            self.Neighbours = {}
+        with self._lock:
+            if len(self.Neighbours) != 0:
+                self.logging("Debug", "start_scan - initialize data")
+                del self.Neighbours
+                self.Neighbours = {}
+            self.LQIreqInProgress = {}
+            self.scan_start = time.time()
+            self.scan_duration = None
 
-        _initNeighbours(self)
-        # Start on Zigate Controler
+            _initNeighbours(self)
+            # Start on Zigate Controler
 
-        prettyPrintNeighbours(self)
-        self._NetworkMapPhase = 2
-        LQIreq(self)
+            prettyPrintNeighbours(self)
+            self._NetworkMapPhase = 2
+            fill_window(self)
 
     def continue_scan(self):
 
-        self.logging("Debug", "len(self.LQIreqInProgress) - %s" % (len(self.LQIreqInProgress)))
-
-        prettyPrintNeighbours(self)
-        if len(self.LQIreqInProgress) > 0 and self.LQIticks < 2:
-            self.logging("Debug", "continue_scan - Command pending")
-            self.LQIticks += 1
-            return
-
-        if len(self.LQIreqInProgress) > 0 and self.LQIticks >= 2:
-            entry = self.LQIreqInProgress.pop()
-            self.logging("Debug", "Commdand pending Timeout: %s" % entry)
-            if self.Neighbours[entry]["Status"] == "WaitResponse":
-                self.Neighbours[entry]["Status"] = "ScanRequired2"
-                self.logging("Debug", "LQI:continue_scan - Try one more for %s" % entry)
-            elif self.Neighbours[entry]["Status"] == "WaitResponse2":
-                self.Neighbours[entry]["Status"] = "TimedOut"
-                self.logging("Debug", "LQI:continue_scan - TimedOut for %s" % entry)
-
-            self.LQIticks = 0
-            self.logging("Debug", "continue_scan - %s" % (len(self.LQIreqInProgress)))
+        with self._lock:
+            _continue_scan(self)
 
-        # We reach here because:
-        # self.LQIreqInProgress == 0
-        # self.LQIreqInProgress  0 and LQItick >= 2
-
-        waitResponse = False
+    def progress(self):
+        """ percentage of the Neighbour table entries received """
         progress = current_process = max_process = avg_size = 0
         for entry in list(self.Neighbours):
             if self.Neighbours[entry]["TableMaxSize"] > 0:
@@ -116,37 +122,101 @@ class NetworkMap:
             )
         if max_process > 0:
             progress = int((current_process / max_process) * 100)
-        self.logging("Log", "Network Topology progress: %s %%" % progress)
+        return progress
+
+    def snapshot(self):
+        """ copy of the Neighbours tables received so far, in the format of the NetworkTopology report """
+        with self._lock:
+            return {
+                nwkid: {
+                    "Status": self.Neighbours[nwkid]["Status"],
+                    "TableMaxSize": self.Neighbours[nwkid]["TableMaxSize"],
+                    "TableCurSize": self.Neighbours[nwkid]["TableCurSize"],
+                    "Neighbours": {x: dict(y) for x, y in self.Neighbours[nwkid]["Neighbours"].items()},
+                }
+                for nwkid in self.Neighbours
+            }
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "Phase": self._NetworkMapPhase,
+                "Progress": self.progress() if self._NetworkMapPhase else None,
+                "Window": scan_window(self),
+                "InFlight": len(self.LQIreqInProgress),
+                "Routers": len(self.Neighbours),
+                "Requests": self.requests,
+                "Responses": self.responses,
+                "TimedOut": self.timeouts,
+                "ScanDuration": self.scan_duration,
+            }
+
+
+def _continue_scan(self):
+
+    self.logging("Debug", "len(self.LQIreqInProgress) - %s" % (len(self.LQIreqInProgress)))
 
-        for entry in list(self.Neighbours):
-            if entry not in self.ListOfDevices:
-                self.logging("Log", "LQIreq - device %s not found removing from the device to be scaned" % entry)
-                # Most likely this device as been removed, or change it Short Id
-                del self.Neighbours[entry]
-                continue
+    prettyPrintNeighbours(self)
+    now = time.time()
+    for entry, sent in list(self.LQIreqInProgress.items()):
+        if now - sent < LQI_TIMEOUT:
+            continue
+        del self.LQIreqInProgress[entry]
+        self.timeouts += 1
+        self.logging("Debug", "Commdand pending Timeout: %s" % entry)
+        lqi_request_failed(self, entry)
+
+    self.logging("Log", "Network Topology progress: %s %%" % self.progress())
 
-            if self.Neighbours[entry]["Status"] == "Completed":
-                continue
+    for entry in list(self.Neighbours):
+        if entry not in self.ListOfDevices:
+            self.logging("Log", "LQIreq - device %s not found removing from the device to be scaned" % entry)
+            # Most likely this device as been removed, or change it Short Id
+            del self.Neighbours[entry]
+            self.LQIreqInProgress.pop(entry, None)
 
-            if self.Neighbours[entry]["Status"] in ("TimedOut", "NotReachable"):
-                continue
+    fill_window(self)
+
+    if self.LQIreqInProgress:
+        self.logging("Debug", "continue_scan - %s Command pending" % len(self.LQIreqInProgress))
+        return
+
+    # We have been through all list of devices and not action triggered
+    self.logging("Debug", "continue_scan - scan completed, all Neighbour tables received.")
+    self.scan_duration = round(time.time() - self.scan_start, 1) if self.scan_start else None
+    finish_scan(self)
+    self._NetworkMapPhase = 0
 
-            if self.Neighbours[entry]["Status"] in ("WaitResponse", "WaitResponse2"):
-                if len(self.LQIreqInProgress) > 0:
-                    waitResponse = True
-                else:
-                    self.Neighbours[entry]["Status"] = "TimedOut"
-                continue
 
-            elif self.Neighbours[entry]["Status"] in ("ScanRequired", "ScanRequired2"):
-                LQIreq(self, entry)
-                return
+def scan_window(self):
+    if not self.SourceInResponse:
+        return 1
+    return max(1, self.pluginconf.pluginConf["networkMapWindow"])
 
-        # We have been through all list of devices and not action triggered
-        if not waitResponse:
-            self.logging("Debug", "continue_scan - scan completed, all Neighbour tables received.")
-            finish_scan(self)
-            self._NetworkMapPhase = 0
+
+def fill_window(self):
+    # Send the requests to the routers to be scanned, up to the window
+    for entry in list(self.Neighbours):
+        if len(self.LQIreqInProgress) >= scan_window(self):
+            return
+        if entry in self.LQIreqInProgress or entry not in self.Neighbours:
+            continue
+        if self.Neighbours[entry]["Status"] in ("WaitResponse", "WaitResponse2"):
+            # Lost request, with no response expected anymore
+            self.Neighbours[entry]["Status"] = "TimedOut"
+        elif self.Neighbours[entry]["Status"] in ("ScanRequired", "ScanRequired2"):
+            LQIreq(self, entry)
+
+
+def lqi_request_failed(self, entry):
+    if entry not in self.Neighbours:
+        return
+    if self.Neighbours[entry]["Status"] == "WaitResponse":
+        self.Neighbours[entry]["Status"] = "ScanRequired2"
+        self.logging("Debug", "LQI:continue_scan - Try one more for %s" % entry)
+    elif self.Neighbours[entry]["Status"] == "WaitResponse2":
+        self.Neighbours[entry]["Status"] = "TimedOut"
+        self.logging("Debug", "LQI:continue_scan - TimedOut for %s" % entry)
 
 
 def _initNeighbours(self):
@@ -389,7 +459,6 @@ def LQIreq(self, nwkid="0000"):
     # u8StartIndex is the Neighbour table index of the first entry to be included in the response to this request
     index = self.Neighbours[nwkid]["TableCurSize"]
 
-    self.LQIreqInProgress.append(nwkid)
     datas = "%s%02X" % (nwkid, index)
 
     self.logging("Debug", "LQIreq - from: %s start at index: %s" % (nwkid, index))
@@ -408,6 +477,8 @@ def LQIreq(self, nwkid="0000"):
         self.Neighbours[nwkid]["Status"] = "NotReachable"
         return
 
+    self.LQIreqInProgress[nwkid] = time.time()
+    self.requests += 1
     self.logging("Debug", "004E %s" % datas)
     self.ZigateComm.sendData("004E", datas)
 
@@ -417,9 +488,6 @@ def LQIresp_decoding(self, MsgData):
     self.logging("Debug", "804E - %s" % (MsgData))
 
     NwkIdSource = None
-    if len(self.LQIreqInProgress) > 0:
-        NwkIdSource = self.LQIreqInProgress.pop()
-
     SQN = MsgData[0:2]
     Status = MsgData[2:4]
     NeighbourTableEntries = int(MsgData[4:6], 16)
@@ -432,17 +500,26 @@ def LQIresp_decoding(self, MsgData):
     if len(MsgData) == (10 + 42 * NeighbourTableListCount + 4):
         # Firmware 3.1a and aboce
         NwkIdSource = MsgData[10 + 42 * NeighbourTableListCount : len(MsgData)]
+        self.SourceInResponse = True
+    elif len(self.LQIreqInProgress) == 1:
+        # Without the source, only one request is sent at a time
+        NwkIdSource = next(iter(self.LQIreqInProgress))
     self.logging("Debug", "LQIresp - MsgSrc: %s" % NwkIdSource)
 
     if NwkIdSource is None:
         return
 
+    self.responses += 1
+    self.LQIreqInProgress.pop(NwkIdSource, None)
+
     if Status != "00":
         self.logging(
             "Debug",
             "LQI:LQIresp - Status: %s for %s Sqn:%s (raw data: %s)"
             % (Status, MsgData[len(MsgData) - 4 : len(MsgData)], SQN, MsgData),
         )
+        # Retry now, instead of waiting for the time out
+        lqi_request_failed(self, NwkIdSource)
         return
 
     if len(ListOfEntries) // 42 != NeighbourTableListCount:
@@ -187,6 +187,14 @@ SETTINGS = {
                 "hidden": False,
                 "Advanced": False,
             },
+            "networkMapWindow": {
+                "type": "int",
+                "default": 4,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
             "numEnergyReports": {
                 "type": "int",
                 "default": 4,
@@ -195,6 +203,14 @@ SETTINGS = {
                 "hidden": False,
                 "Advanced": False,
             },
+            "networkEnergyWindow": {
+                "type": "int",
+                "default": 3,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
             "enableGzip": {
                 "type": "bool",
                 "default": 1,
@@ -249,6 +265,14 @@ SETTINGS = {
                 "hidden": False,
                 "Advanced": True,
             },
+            "deviceTouchWindow": {
+                "type": "int",
+                "default": 10,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
             "forcePollingAfterAction": {
                 "type": "bool",
                 "default": 1,
@@ -578,6 +602,62 @@ SETTINGS = {
                 "hidden": True,
                 "Advanced": True,
             },
+            "writerWindowSize": {
+                "type": "int",
+                "default": 1,
+                "current": None,
+                "restart": 1,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "writerCommandTimeOut": {
+                "type": "int",
+                "default": 8,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "writerCommandRetry": {
+                "type": "int",
+                "default": 0,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "writerAdaptiveRate": {
+                "type": "bool",
+                "default": 1,
+                "current": None,
+                "restart": 1,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "eventDrivenIO": {
+                "type": "bool",
+                "default": 0,
+                "current": None,
+                "restart": 1,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "forwarderBatchSize": {
+                "type": "int",
+                "default": 32,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "forwarderCoalescing": {
+                "type": "bool",
+                "default": 1,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
         },
     },
     # Plugin Directories
@@ -1206,6 +1286,14 @@ SETTINGS = {
                 "hidden": False,
                 "Advanced": True,
             },
+            "rawDecodedMessages": {
+                "type": "bool",
+                "default": 0,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
             "nPDUaPDUThreshold": {
                 "type": "bool",
                 "default": 0,
@@ -1270,6 +1358,22 @@ SETTINGS = {
                 "hidden": False,
                 "Advanced": True,
             },
+            "journalDeviceList": {
+                "type": "bool",
+                "default": 1,
+                "current": None,
+                "restart": 0,
+                "hidden": False,
+                "Advanced": True,
+            },
+            "compiledDeviceConf": {
+                "type": "bool",
+                "default": 1,
+                "current": None,
+                "restart": 1,
+                "hidden": False,
+                "Advanced": True,
+            },
             "XiaomiLeave": {
                 "type": "bool",
                 "default": 0,
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: ResetScheduler.py
+
+    Description: Deadlines of the widgets to be reset (Motion, Vibration, push buttons).
+
+    When such a widget is updated, its reset deadline is recorded in a heap. At each heartbeat only the
+    expired entries are popped, instead of decoding the LastUpdate of every unit.
+
+    A widget updated again before its deadline is rescheduled; the previous heap entry is dropped when popped.
+"""
+
+import heapq
+
+
+class ResetScheduler:
+    def __init__(self):
+        self._heap = []  # (deadline, unit)
+        self._deadlines = {}  # unit -> (deadline, WidgetId, NwkId, WidgetType, timeout)
+        self.seeded = False  # Widgets already On at startup have been registered
+
+        # Instrumentation
+        self.scheduled = 0
+        self.fired = 0
+        self.last_fired = 0
+
+    def schedule(self, unit, deadline, WidgetId, NwkId, WidgetType, timeout):
+        self._deadlines[unit] = (deadline, WidgetId, NwkId, WidgetType, timeout)
+        heapq.heappush(self._heap, (deadline, unit))
+        self.scheduled += 1
+        if len(self._heap) > 4 * len(self._deadlines) + 64:
+            # Too many stale entries ( sensors re-triggered before their deadline )
+            self._heap = [(x[0], unit) for unit, x in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def forget(self, unit):
+        # The heap entry will be dropped when popped
+        self._deadlines.pop(unit, None)
+
+    def pop_expired(self, now):
+        """ return the list of (unit, deadline, WidgetId, NwkId, WidgetType, timeout) whose deadline is expired """
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, unit = heapq.heappop(heap)
+            entry = self._deadlines.get(unit)
+            if entry is None or entry[0] != deadline:
+                # Rescheduled or forgotten since
+                continue
+            del self._deadlines[unit]
+            expired.append((unit,) + entry)
+        self.last_fired = len(expired)
+        self.fired += len(expired)
+        return expired
+
+    def pending(self):
+        return len(self._deadlines)
+
+    def statistics(self):
+        return {
+            "Pending": len(self._deadlines),
+            "HeapSize": len(self._heap),
+            "Scheduled": self.scheduled,
+            "Fired": self.fired,
+            "LastTickFired": self.last_fired,
+        }
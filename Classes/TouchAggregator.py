@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: TouchAggregator.py
+
+    Description: Coalescing of the last seen (Touch) and battery level updates of the Domoticz widgets.
+
+    A device reporting several attributes per second used to touch all its widgets for each message (and
+    even twice per attribute report). Requests are now recorded per device, and the widgets of a device are
+    flushed at most once per window: at once if the previous flush is older than the window, otherwise at
+    the next heartbeat after the window is elapsed.
+
+    Counters give the Domoticz calls done, and the ones which would have been done without coalescing.
+"""
+
+import threading
+
+
+class TouchAggregator:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # NwkId -> {"Touch": bool, "Battery": level or None}
+        self._last_flush = {}  # NwkId -> time of the last flush, within the window
+
+        # Instrumentation
+        self.requests = 0
+        self.flushes = 0
+        self.calls = 0  # Domoticz calls done
+        self.uncoalesced_calls = 0  # Domoticz calls which would have been done for each request
+
+    def record(self, NwkId, now, window, nb_calls, BatteryLvl=None):
+        """ record a request (Touch, or Battery if BatteryLvl is given). Return True if it must be flushed now """
+        with self._lock:
+            self.requests += 1
+            self.uncoalesced_calls += nb_calls
+            entry = self._pending.setdefault(NwkId, {"Touch": False, "Battery": None})
+            if BatteryLvl is None:
+                entry["Touch"] = True
+            else:
+                entry["Battery"] = BatteryLvl
+            return now - self._last_flush.get(NwkId, 0) >= window
+
+    def take(self, NwkId, now):
+        """ return and clear the pending requests of NwkId, None if there is nothing to flush """
+        with self._lock:
+            entry = self._pending.pop(NwkId, None)
+            if entry is not None:
+                self._last_flush[NwkId] = now
+                self.flushes += 1
+            return entry
+
+    def flushed(self, nb_calls):
+        with self._lock:
+            self.calls += nb_calls
+
+    def due(self, now, window):
+        """ return the devices with pending requests whose window is elapsed """
+        with self._lock:
+            for NwkId in [x for x, last in self._last_flush.items() if now - last >= window]:
+                del self._last_flush[NwkId]
+            return [x for x in self._pending if x not in self._last_flush]
+
+    def pending(self):
+        return len(self._pending)
+
+    def statistics(self):
+        return {
+            "Requests": self.requests,
+            "Flushes": self.flushes,
+            "Pending": len(self._pending),
+            "DomoticzCalls": self.calls,
+            "AvoidedCalls": max(0, self.uncoalesced_calls - self.calls),
+        }
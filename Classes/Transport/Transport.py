@@ -4,7 +4,7 @@
 # Author: zaraki673 & pipiche38
 #
 
-import json
+import itertools
 import queue
 import threading
 import time
@@ -13,11 +13,16 @@ from threading import Semaphore
 
 import Domoticz
 from Classes.Transport.forwarderThread import start_forwarder_thread
+from Classes.Transport.frameDecoder import ZiGateFrameDecoder
+from Classes.Transport.outboundCommand import (PRIORITY_HIGH,
+                                               PRIORITY_NORMAL,
+                                               OutboundCommand)
+from Classes.Transport.rateControl import RateController
 from Classes.Transport.readDecoder import decode_and_split_message
 from Classes.Transport.readerThread import (open_zigate_and_start_reader,
                                             shutdown_reader_thread)
 from Classes.Transport.sqnMgmt import (sqn_generate_new_internal_sqn,
-                                       sqn_init_stack)
+                                       sqn_init_stack, sqn_statistics)
 from Classes.Transport.tools import (initialize_command_protocol_parameters,
                                      stop_waiting_on_queues,
                                      waiting_for_end_thread)
@@ -59,7 +64,7 @@ class ZigateTransport(object):
         # Communication/Transport link attributes
         self.hardwareid = hardwareid
         self._connection = None  # connection handle
-        self._ReqRcv = bytearray()  # on going receive buffer
+        self._frame_decoder = ZiGateFrameDecoder()  # on going receive buffer
         self._last_raw_message = bytearray()
         self._transp = None  # Transport mode USB or Wifi
         self._serialPort = None  # serial port in case of USB
@@ -71,26 +76,40 @@ class ZigateTransport(object):
         self.apdu = None
         self.npdu = None
 
-        # Semaphore to manage when to send a commande to ZiGate
-        self.semaphore_gate = Semaphore(value=MAX_SIMULTANEOUS_ZIGATE_COMMANDS)
+        # Semaphore to manage when to send a commande to ZiGate.
+        # max_in_flight is the number of commands which can wait for their 0x8000 at the same time
+        self.max_in_flight = max(MAX_SIMULTANEOUS_ZIGATE_COMMANDS, self.pluginconf.pluginConf["writerWindowSize"])
+        self.semaphore_gate = Semaphore(value=self.max_in_flight)
+        self.window_condition = threading.Condition()  # Signalled by release_command() when a command leaves the window
+
+        # Pace of the commands sent to ZiGate
+        self.rate_control = RateController(adaptive=bool(self.pluginconf.pluginConf["writerAdaptiveRate"]))
+        self.statistics.set_rate_control(self.rate_control)
 
         # Running flag for Thread. Switch to False to stop the Threads
         self.running = True
 
         # Management of Commands sent to ZiGate
         self.ListOfCommands = {}
+        self.awaiting_8000 = {}  # command -> isqn sent and waiting for their 0x8000
 
         # Last NwkId with a ACk failure
         self.last_nwkid_failure = None
 
         # Writer
 
-        self.writer_list_in_queue = []
-        self.writer_queue = PriorityQueue()
+        self.writer_list_in_queue = {}  # (cmd, datas) -> OutboundCommand waiting in the writer_queue
+        self.writer_queue = PriorityQueue()  # ( priority sqn, insertion order, OutboundCommand )
+        self.writer_queue_order = itertools.count(1)
+        self.writer_queue_depth = {PRIORITY_HIGH: 0, PRIORITY_NORMAL: 0}
+        self.writer_lock = threading.Lock()  # writer_list_in_queue and writer_queue_depth, updated by several threads
+        self.writer_dedup_hits = 0
+        self.writer_cancelled = 0
         self.writer_thread = None
         self.prioriy_sqn = 0
         self.tcp_send_queue = Queue()  # We use a Queue as socket is not thread-safe in python
         self.serial_send_queue = Queue()  # We use a Queue as Serial is not thread-safe in python
+        self.io_wakeup = None  # Wake-up channel of the event driven Read/Write thread (eventDrivenIO)
 
         # Reader
         self.reader_thread = None
@@ -137,7 +156,7 @@ class ZigateTransport(object):
         return self.forwarder_queue.qsize()
 
     def get_writer_queue(self):
-        return self.forwarder_queue.qsize()
+        return self.writer_queue.qsize()
 
     def update_ZiGate_HW_Version(self, version):
         self.ZiGateHWVersion = version
@@ -160,22 +179,30 @@ class ZigateTransport(object):
         # We receive a send Message command from above ( plugin ),
         # send it to the sending queue
 
-        if (cmd, datas) in self.writer_list_in_queue:
+        with self.writer_lock:
+            duplicate = (cmd, datas) in self.writer_list_in_queue
+            if duplicate:
+                self.writer_dedup_hits += 1
+            else:
+                InternalSqn = sqn_generate_new_internal_sqn(self)
+                command = OutboundCommand(
+                    cmd,
+                    datas,
+                    ackIsDisabled,
+                    waitForResponseIn,
+                    InternalSqn,
+                    NwkId,
+                    time.time(),
+                    PRIORITY_HIGH if highpriority else PRIORITY_NORMAL,
+                )
+                self.writer_list_in_queue[command.key] = command
+                self.writer_queue_depth[command.priority] += 1
+
+        if duplicate:
             if self.pluginconf.pluginConf["debugzigateCmd"]:
                 self.logging_transport("Log", "sendData - Warning %s/%s already in queue this command is dropped" % (cmd, datas))
             return None
-        self.writer_list_in_queue.append((cmd, datas))
-
-        InternalSqn = sqn_generate_new_internal_sqn(self)
-        message = {
-            "cmd": cmd,
-            "datas": datas,
-            "ackIsDisabled": ackIsDisabled,
-            "waitForResponseIn": waitForResponseIn,
-            "InternalSqn": InternalSqn,
-            "NwkId": NwkId,
-            "TimeStamp": time.time(),
-        }
+
         try:
             if self.writer_queue.qsize() == 0:
                 # Queue is empty, we reset the priority_sqn number to 0
@@ -184,12 +211,12 @@ class ZigateTransport(object):
                 self.logging_transport(
                     "Debug",
                     "Hih Priority command Hsqn: %s Cmd: %s Data: %s i_sqn: %s"
-                    % (self.prioriy_sqn, message["cmd"], message["datas"], message["InternalSqn"]),
+                    % (self.prioriy_sqn, command.cmd, command.datas, command.InternalSqn),
                 )
-                self.writer_queue.put((self.prioriy_sqn, str(json.dumps(message))))
+                self.writer_queue.put((self.prioriy_sqn, next(self.writer_queue_order), command))
                 self.prioriy_sqn += 1
             else:
-                self.writer_queue.put((InternalSqn, str(json.dumps(message))))
+                self.writer_queue.put((InternalSqn, next(self.writer_queue_order), command))
 
         except queue.Full:
             self.logging_transport("Error", "sendData - writer_queue Full")
@@ -199,6 +226,35 @@ class ZigateTransport(object):
 
         return InternalSqn
 
+    def cancel_command(self, cmd, datas):
+        # Drop a command still waiting in the writer queue. Return True if it was found
+        with self.writer_lock:
+            command = self.writer_list_in_queue.pop((cmd, datas), None)
+            if command is None:
+                return False
+            command.cancelled = True
+            self.writer_cancelled += 1
+            return True
+
+    def cancel_commands(self, NwkId):
+        # Drop all commands to NwkId still waiting in the writer queue. Return the number of commands dropped
+        to_be_cancelled = [command.key for command in list(self.writer_list_in_queue.values()) if command.NwkId == NwkId]
+        return sum(1 for key in to_be_cancelled if self.cancel_command(*key))
+
+    def sqn_statistics(self):
+        statistics = sqn_statistics(self)
+        statistics["Awaiting8000"] = sum(len(pending) for pending in self.awaiting_8000.values())
+        return statistics
+
+    def writer_queue_statistics(self):
+        with self.writer_lock:
+            return {
+                "Depth": dict(self.writer_queue_depth),
+                "Pending": len(self.writer_list_in_queue),
+                "DedupHits": self.writer_dedup_hits,
+                "Cancelled": self.writer_cancelled,
+            }
+
     def on_message(self, data):
         # Message sent via Domoticz .
         decode_and_split_message(self, data)
@@ -310,6 +366,7 @@ class ZigateTransport(object):
             "writeQueue": str(self.writer_queue.queue),
             "forwardQueue": str(self.forwarder_queue.queue),
             "SemaphoreValue": self.semaphore_gate._value,
+            "MaxInFlight": self.max_in_flight,
             "ForwardedQueueCurrentSize": self.get_forwarder_queue(),
             "WriterQueueCurrentSize": self.get_writer_queue(),
         }
@@ -326,13 +383,13 @@ class ZigateTransport(object):
 
         if "TransportErrorLevel" in self.pluginconf.pluginConf and self.pluginconf.pluginConf["TransportErrorLevel"]:
             context["Sqn Management"] = {
-                "sqn_ZCL": self.sqn_zcl,
-                "sqn_ZDP": self.sqn_zdp,
-                "sqn_APS": self.sqn_aps,
+                "sqn_ZCL": str(self.sqn_zcl),
+                "sqn_ZDP": str(self.sqn_zdp),
+                "sqn_APS": str(self.sqn_aps),
                 "current_SQN": self.current_sqn,
             }
             context["inMessage"] = {
-                "ReqRcv": str(self._ReqRcv),
+                "ReqRcv": str(self._frame_decoder.pending()),
             }
         context["Thread"] = {
             "byPassDzCommunication": self.pluginconf.pluginConf["byPassDzConnection"],
@@ -11,8 +11,7 @@ from Classes.Transport.tools import (CMD_WITH_RESPONSE,
                                      get_response_from_command,
                                      is_nwkid_available, print_listofcommands,
                                      release_command)
-from Modules.zigateConsts import (MAX_SIMULTANEOUS_ZIGATE_COMMANDS,
-                                  ZIGATE_COMMANDS)
+from Modules.zigateConsts import ZIGATE_COMMANDS
 
 
 def decode8011_31c(self, msgtype, decoded_frame):
@@ -27,7 +26,7 @@ def decode8011_31c(self, msgtype, decoded_frame):
         # No command send, this is a async message, just release
         return
 
-    if self.semaphore_gate._value == MAX_SIMULTANEOUS_ZIGATE_COMMANDS:
+    if self.semaphore_gate._value == self.max_in_flight:
         return
 
     isqn = sqn_get_internal_sqn_from_app_sqn(self, MsgSQN, TYPE_APP_ZCL)
@@ -67,6 +67,7 @@ def decode8000(self, decoded_frame):
         return None
 
     report_timing_8000(self, isqn)
+    self.rate_control.ack_status(Status)
 
     if Status != "00":
         self.statistics._ackKO += 1
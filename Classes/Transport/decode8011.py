@@ -50,6 +50,7 @@ def decode8011(self, decoded_frame):
 
     self.ListOfCommands[isqn]["Status"] = "8011"
     report_timing_8011(self, isqn)
+    self.rate_control.ack_status(MsgStatus)
     print_listofcommands(self, isqn)
 
     release_command(self, isqn)
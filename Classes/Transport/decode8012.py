@@ -67,6 +67,7 @@ def decode8012_8702(self, decoded_frame):
     self.ListOfCommands[isqn]["Status"] = MsgType
 
     report_timing_8012(self, isqn)
+    self.rate_control.ack_status(MsgStatus)
     print_listofcommands(self, isqn)
 
     # if MsgType == '8702':
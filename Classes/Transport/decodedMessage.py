@@ -0,0 +1,63 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: DecodedMessage
+
+    Description: Inbound message already decoded by the Transport from a 0x8002 (raw APS data indication).
+                 The plugin handlers consume the fields directly, instead of parsing a ZiGate frame rebuilt
+                 from them. Records are the attribute records in the decode_attribute_records() format:
+                 ( idx, AttrID, Status, DataType, Size, Data, Value ), hex strings with the Data big endian, and
+                 the Value decoded from the received bytes ( or None ).
+
+    The equivalent ZiGate frame is only built (once) when a consumer needs it ( frame property ), for the
+    message types without a structured handler.
+"""
+
+
+class DecodedMessage:
+    __slots__ = ("MsgType", "Sqn", "SrcNwkId", "SrcEp", "ClusterId", "LQI", "Records", "_frame")
+
+    def __init__(self, MsgType, Sqn, SrcNwkId, SrcEp, ClusterId, LQI, Records):
+        self.MsgType = MsgType  # int, the ZiGate message type the plugin would have received
+        self.Sqn = Sqn
+        self.SrcNwkId = SrcNwkId
+        self.SrcEp = SrcEp
+        self.ClusterId = ClusterId
+        self.LQI = LQI
+        self.Records = Records
+        self._frame = None
+
+    @property
+    def frame(self):
+        # Compatibility: ZiGate frame, as the firmware would have sent it
+        if self._frame is None:
+            self._frame = build_frame_from_records(self)
+        return self._frame
+
+    def __repr__(self):
+        # Used by the logging of the forwarder, must not build the frame
+        return "DecodedMessage(%04x, %s/%s, %s, %s records)" % (
+            self.MsgType,
+            self.SrcNwkId,
+            self.SrcEp,
+            self.ClusterId,
+            len(self.Records),
+        )
+
+
+def build_frame_from_records(message):
+    buildPayload = message.Sqn + message.SrcNwkId + message.SrcEp + message.ClusterId
+    for _, Attribute, Status, DType, lenData, value, _ in message.Records:
+        buildPayload += Attribute + Status + DType + lenData + value
+
+    newFrame = "01"  # 0:2
+    newFrame += "%04x" % message.MsgType  # 2:6   MsgType
+    newFrame += "%4x" % len(buildPayload)  # 6:10  Length
+    newFrame += "ff"  # 10:12 CRC
+    newFrame += buildPayload
+    newFrame += message.LQI  # LQI
+    newFrame += "03"
+    return newFrame
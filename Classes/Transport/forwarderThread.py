@@ -7,9 +7,17 @@
 import Domoticz
 
 import queue
+import time
 from threading import Thread
+from Classes.Transport.decodedMessage import DecodedMessage
 from Classes.Transport.tools import handle_thread_error
 from Classes.Transport.instrumentation import time_spent_forwarder
+from Modules.zclDecoder import split_attribute_records
+
+# Clusters with measurements, where only the last report of an attribute matters.
+# Event like clusters (On/Off, Multistate, Analog Input as used by the Xiaomi Magic Cube rotation, IAS Zone,
+# Occupancy, ...) must not be coalesced.
+COALESCING_CLUSTERS = {"0001", "0400", "0402", "0403", "0405", "040d", "042a", "0702", "0b04"}
 
 
 def start_forwarder_thread(self):
@@ -26,36 +34,105 @@ def forwarder_thread(self):
 
     while self.running:
         message = None
-        # Sending messages ( only 1 at a time )
+        # Sending messages, by batch of what is waiting in the queue ( up to forwarderBatchSize )
         try:
             self.logging_forwarded("Debug", "Waiting for next message")
             message = self.forwarder_queue.get()
             if message == "STOP":
                 break
 
-            forward_message(self, message)
+            batch = [message]
+            stop = drain_forwarder_queue(self, batch)
+            forward_batch(self, batch)
+            if stop:
+                break
 
         except queue.Empty:
             # Empty Queue, timeout.
             pass
 
         except Exception as e:
-            context = {
-                "Error code": "TRANS-FWD-01",
-                "Error": str(e),
-                "Message": message,
-            }
-            self.logging_forwarded("Error", "forwarder_thread - Error while receiving a ZiGate command", _context=context)
-
-            handle_thread_error(self, e, 0, 0, message)
+            forwarder_error(self, e, message)
 
     self.logging_forwarded("Status", "ZigateTransport: thread_processing_and_sending Thread stop.")
 
 
+def drain_forwarder_queue(self, batch):
+    # Complete the batch with the messages already waiting. Return True if the STOP message has been received
+    batch_size = self.pluginconf.pluginConf["forwarderBatchSize"]
+    while len(batch) < batch_size:
+        try:
+            message = self.forwarder_queue.get_nowait()
+        except queue.Empty:
+            return False
+        if message == "STOP":
+            return True
+        batch.append(message)
+    return False
+
+
+def forward_batch(self, batch):
+
+    nb_frames = len(batch)
+    if nb_frames > 1 and self.pluginconf.pluginConf["forwarderCoalescing"]:
+        batch = coalesce_reports(batch)
+    self.statistics.add_forwarder_batch(nb_frames, nb_frames - len(batch))
+
+    self.logging_forwarded("Debug", "Receive %s messages to forward (%s coalesced)" % (len(batch), nb_frames - len(batch)))
+    for timestamp, message in batch:
+        if self.pluginconf.pluginConf["ZiGateReactTime"]:
+            self.statistics.add_histogram_timing("ForwarderQueue", int(1000 * (time.time() - timestamp)))
+        try:
+            forward_message(self, message)
+        except Exception as e:
+            forwarder_error(self, e, message)
+    self.logging_forwarded("Debug", "messages forwarded!!!!")
+
+
 @time_spent_forwarder()
 def forward_message(self, message):
 
-    self.logging_forwarded("Debug", "Receive a message to forward: %s" % (str(message)))
     self.statistics._data += 1
     self.F_out(message)
-    self.logging_forwarded("Debug", "message forwarded!!!!")
+
+
+def forwarder_error(self, e, message):
+    context = {
+        "Error code": "TRANS-FWD-01",
+        "Error": str(e),
+        "Message": message,
+    }
+    self.logging_forwarded("Error", "forwarder_thread - Error while receiving a ZiGate command", _context=context)
+
+    handle_thread_error(self, e, 0, 0, message)
+
+
+def coalesce_reports(batch):
+    # Keep only the last report of the same attributes of a device/endpoint/cluster, the order is preserved
+    seen = set()
+    kept = []
+    for timestamp, message in reversed(batch):
+        key = coalescing_key(message)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append((timestamp, message))
+    kept.reverse()
+    return kept
+
+
+def coalescing_key(message):
+    # ( NwkId, Ep, Cluster, Attributes ) of a 0x8102 attribute report on a measurement cluster, otherwise None
+    if isinstance(message, DecodedMessage):
+        if message.MsgType != 0x8102 or message.ClusterId not in COALESCING_CLUSTERS:
+            return None
+        return (message.SrcNwkId, message.SrcEp, message.ClusterId, tuple(record[1] for record in message.Records))
+
+    if not isinstance(message, str) or message[2:6] != "8102":
+        return None
+    MsgData = message[12 : len(message) - 4]
+    MsgClusterId = MsgData[8:12]
+    if MsgClusterId not in COALESCING_CLUSTERS:
+        return None
+    return (MsgData[2:6], MsgData[6:8], MsgClusterId, tuple(record[1] for record in split_attribute_records(MsgData)))
@@ -0,0 +1,175 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Module: frameDecoder
+
+    Description: ZiGate framing engine.
+
+    Incoming bytes are accumulated in a compacting ring buffer. Frames boundaries (0x01 / 0x03)
+    are located with bytearray.find(), the frame is accessed through a memoryview (no copy),
+    then unescaped and check-summed in bulk.
+"""
+
+import struct
+from functools import reduce
+from operator import xor
+
+FRAME_START = 0x01
+FRAME_ESCAPE = 0x02
+FRAME_END = 0x03
+
+FRAME_OK = 0
+FRAME_TOO_SHORT = 1
+FRAME_LENGTH_ERROR = 2
+FRAME_CRC_ERROR = 3
+
+DEFAULT_BUFFER_SIZE = 4096
+
+_HEADER = struct.Struct(">BHHB")
+
+
+class ZiGateFrameDecoder:
+    """Accumulate raw bytes from the ZiGate and return complete escaped frames"""
+
+    __slots__ = ("_buffer", "_view", "_start", "_end", "dropped_bytes")
+
+    def __init__(self, size=DEFAULT_BUFFER_SIZE):
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # first unread byte
+        self._end = 0  # first free byte
+        self.dropped_bytes = 0  # bytes discarded because they were not part of a frame
+
+    def __len__(self):
+        return self._end - self._start
+
+    def reset(self):
+        self._start = self._end = 0
+
+    def pending(self):
+        """ return a copy of the not yet processed bytes (for error reporting only) """
+        return bytes(self._view[self._start : self._end])
+
+    def feed(self, data):
+        if not data:
+            return
+        size = len(data)
+        if self._end + size > len(self._buffer):
+            self._make_room(size)
+        self._view[self._end : self._end + size] = data
+        self._end += size
+
+    def _make_room(self, size):
+        unread = self._end - self._start
+        if unread + size > len(self._buffer):
+            # Buffer too small, grow it.
+            new_size = len(self._buffer)
+            while unread + size > new_size:
+                new_size *= 2
+            new_buffer = bytearray(new_size)
+            new_buffer[:unread] = self._view[self._start : self._end]
+            self._buffer = new_buffer
+            self._view = memoryview(self._buffer)
+        elif unread:
+            # Compact: move unread bytes at the beginning of the buffer
+            self._view[:unread] = self._view[self._start : self._end]
+        self._start = 0
+        self._end = unread
+
+    def next_frame(self):
+        """
+        return a memoryview on the next complete (still escaped) frame, including 0x01 and 0x03,
+        or None if no complete frame is available.
+        The view is valid until the next call to feed()
+        """
+        buffer = self._buffer
+        while self._start < self._end:
+            zero3_position = buffer.find(b"\x03", self._start, self._end)
+            if zero3_position == -1:
+                if buffer.find(b"\x01", self._start, self._end) == -1:
+                    # Nothing which looks like a frame, drop it.
+                    self.dropped_bytes += self._end - self._start
+                    self.reset()
+                return None
+
+            frame_start = buffer.rfind(b"\x01", self._start, zero3_position)
+            if frame_start == -1:
+                # 0x03 without 0x01, drop everything up to the 0x03 included
+                self.dropped_bytes += zero3_position + 1 - self._start
+                self._start = zero3_position + 1
+                continue
+
+            self.dropped_bytes += frame_start - self._start
+            self._start = zero3_position + 1
+            frame = self._view[frame_start : zero3_position + 1]
+            if self._start == self._end:
+                self._start = self._end = 0
+            return frame
+        return None
+
+    def frames(self):
+        """ generator of unescaped frames """
+        while True:
+            frame = self.next_frame()
+            if frame is None:
+                return
+            yield unescape_frame(frame)
+
+
+# Escaped sequences (0x02, B ^ 0x10) and their decoded byte B. The sequence decoding to 0x02 must be
+# the last one, otherwise the produced 0x02 could be taken as a new escape byte.
+_ESCAPED_SEQUENCES = tuple(
+    (bytes((FRAME_ESCAPE, byte ^ 0x10)), bytes((byte,))) for byte in list(range(0x00, 0x02)) + list(range(0x03, 0x10)) + [0x02]
+)
+# Below this number of escape bytes, it is cheaper to unescape in place than to run the 16 replace() passes
+_INPLACE_UNESCAPE_MAX = 4
+
+
+def unescape_frame(frame):
+    """
+    Decode a ZiGate escaped frame. Each byte B between 0x00 and 0x0f is transmitted as 0x02, B ^ 0x10
+    Return bytes, or None if the frame is empty
+    """
+    if not frame:
+        return None
+    raw = bytes(frame)
+    nb_escapes = raw.count(b"\x02")
+    if nb_escapes == 0:
+        return raw
+
+    if nb_escapes > _INPLACE_UNESCAPE_MAX:
+        for escaped, byte in _ESCAPED_SEQUENCES:
+            raw = raw.replace(escaped, byte)
+        return raw
+
+    decoded = bytearray(raw)
+    position = decoded.find(FRAME_ESCAPE)
+    while position != -1:
+        del decoded[position]
+        if position < len(decoded):
+            decoded[position] ^= 0x10
+        position = decoded.find(FRAME_ESCAPE, position + 1)
+    return bytes(decoded)
+
+
+def frame_checksum(BinMsg):
+    # The checksum is computed on MsgType, Length and Payload (including the trailing RSSI/LQI byte)
+    return reduce(xor, BinMsg[6:-1], reduce(xor, BinMsg[1:5]))
+
+
+def check_frame(BinMsg):
+    """ return (status, MsgType, Length, ReceivedChecksum) """
+    if BinMsg is None or len(BinMsg) <= 6:
+        return (FRAME_TOO_SHORT, None, None, None)
+
+    _, MsgType, Length, ReceivedChecksum = _HEADER.unpack_from(BinMsg, 0)
+    if Length + 7 != len(BinMsg):
+        return (FRAME_LENGTH_ERROR, MsgType, Length, ReceivedChecksum)
+
+    # XOR over MsgType, Length, Checksum and Payload is 0 when the Checksum is correct
+    if reduce(xor, BinMsg[1:-1]):
+        return (FRAME_CRC_ERROR, MsgType, Length, ReceivedChecksum)
+    return (FRAME_OK, MsgType, Length, ReceivedChecksum)
@@ -65,7 +65,7 @@ def process_frame(self, decoded_frame):
                 release_command(self, x)
         # This could be also linked to a Reboot of the ZiGate firmware. In such case, it might be important to release Semaphore
 
-        self.forwarder_queue.put(decoded_frame)
+        forward_frame(self, decoded_frame)
         return
 
     if MsgType in CMD_PDM_ON_HOST:
@@ -88,7 +88,7 @@ def process_frame(self, decoded_frame):
 
     if MsgType == "8000":  # Command Ack
         decode8000(self, decoded_frame)
-        self.forwarder_queue.put(decoded_frame)
+        forward_frame(self, decoded_frame)
         return
 
     if MsgType in ("8012", "8702"):  # Transmission Akc for no-ack commands
@@ -99,7 +99,7 @@ def process_frame(self, decoded_frame):
     if MsgType == "8011":  # Command Ack (from target device)
         if self.firmware_with_aps_sqn:
             decode8011(self, decoded_frame)
-        self.forwarder_queue.put(decoded_frame)
+        forward_frame(self, decoded_frame)
         return
 
     if MsgType == "8701":
@@ -110,7 +110,7 @@ def process_frame(self, decoded_frame):
     if MsgType == "8002" and MsgData:
         # Data indication
         self.statistics._data += 1
-        self.forwarder_queue.put(decode8002_and_process(self, decoded_frame))
+        forward_frame(self, decode8002_and_process(self, decoded_frame))
         return
 
     if ( self.pluginconf.pluginConf["ZiGateInRawMode"] and MsgType 
@@ -126,12 +126,17 @@ def process_frame(self, decoded_frame):
     if self.firmware_compatibility_mode and MsgType in ("8102", "8100", "8110"):
         self.statistics._data += 1
         decode8011_31c(self, MsgType, decoded_frame)
-        self.forwarder_queue.put(decoded_frame)
+        forward_frame(self, decoded_frame)
         return
 
     # Forward the message to plugin for further processing
     self.statistics._data += 1
-    self.forwarder_queue.put(decoded_frame)
+    forward_frame(self, decoded_frame)
+
+
+def forward_frame(self, message):
+    # The reception time is kept to measure the waiting time in the forwarder queue
+    self.forwarder_queue.put((time.time(), message))
 
 
 # Extended Error Code:
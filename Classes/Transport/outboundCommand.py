@@ -0,0 +1,55 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: OutboundCommand
+
+    Description: Command waiting in the writer queue, from sendData() to the writer thread.
+                 The record itself goes through the PriorityQueue (no serialization). A record can be cancelled
+                 while waiting, the writer thread then drops it.
+"""
+
+PRIORITY_HIGH = "High"
+PRIORITY_NORMAL = "Normal"
+
+
+class OutboundCommand:
+    __slots__ = (
+        "cmd",
+        "datas",
+        "ackIsDisabled",
+        "waitForResponseIn",
+        "InternalSqn",
+        "NwkId",
+        "TimeStamp",
+        "priority",
+        "cancelled",
+    )
+
+    def __init__(self, cmd, datas, ackIsDisabled, waitForResponseIn, InternalSqn, NwkId, TimeStamp, priority=PRIORITY_NORMAL):
+        self.cmd = cmd
+        self.datas = datas
+        self.ackIsDisabled = ackIsDisabled
+        self.waitForResponseIn = waitForResponseIn
+        self.InternalSqn = InternalSqn
+        self.NwkId = NwkId
+        self.TimeStamp = TimeStamp
+        self.priority = priority
+        self.cancelled = False
+
+    @property
+    def key(self):
+        # Two commands with the same key are duplicates
+        return (self.cmd, self.datas)
+
+    def __repr__(self):
+        return "OutboundCommand(%s, %s, i_sqn: %s, NwkId: %s, %s%s)" % (
+            self.cmd,
+            self.datas,
+            self.InternalSqn,
+            self.NwkId,
+            self.priority,
+            ", cancelled" if self.cancelled else "",
+        )
@@ -0,0 +1,121 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: RateController
+
+    Description: Pace of the commands sent to ZiGate. AIMD (additive increase / multiplicative decrease) on the rate,
+                 the delay between 2 commands being 1 / rate:
+                 - each success (0x8000 status 00, 0x8011/0x8012 confirm) increases the rate by the profile step
+                 - a congestion (0x8000 Busy or resource error, nPDU/aPDU above threshold, command time out)
+                   multiplies it by CONGESTION_FACTOR, at most once per round trip: the signals received until a
+                   command sent after the decrease could have been answered ( CONGESTION_RTT ) are the same
+                   congestion, caused by the commands sent at the previous rate
+                 The delay stays within the bounds of the firmware profile. The initial delay of each profile is the
+                 historical fixed sleep of limit_throuput, which is kept when the controller is not adaptive.
+"""
+
+import threading
+import time
+
+# Firmware profile -> ( min delay, initial delay, max delay in seconds, additive increase of the rate in cmd/s )
+RATE_PROFILES = {
+    "31a": (0.250, 0.500, 2.000, 0.05),  # Flow control only on 0x8000
+    "31d": (0.150, 0.350, 2.000, 0.10),  # No 0x8012
+    "nosqn": (0.500, 1.000, 3.000, 0.02),
+    "31e": (0.020, 0.100, 2.000, 0.50),
+}
+DEFAULT_PROFILE = "31e"
+
+CONGESTION_FACTOR = 0.5
+CONGESTION_RTT = 0.1  # seconds, command to 0x8000 / 0x8011 turn around ( about 70 ms on an USB ZiGate )
+
+# 0x8000 statuses telling that ZiGate is running out of resources: Busy and the ZPS resource errors
+CONGESTION_STATUS = {"04", "80", "81", "82", "83", "84", "85", "86", "8a", "8b"}
+
+# nPDU / aPDU levels above which ZiGate is considered as overloaded
+MAX_NPDU = 7
+MAX_APDU = 2
+
+
+class RateController:
+    def __init__(self, adaptive=True, profile=DEFAULT_PROFILE):
+        self._lock = threading.Lock()
+        self.adaptive = adaptive
+        self._last_sent = 0
+        self._successes = 0
+        self._congestions = {}
+        self._decreases = 0
+        self._epoch_start = 0  # Time of the 1st command sent since the last decrease, None if none yet
+        self.set_profile(profile)
+
+    def set_profile(self, profile):
+        with self._lock:
+            self.profile = profile
+            self._min, self._delay, self._max, self._step = RATE_PROFILES[profile]
+
+    @property
+    def delay(self):
+        return self._delay
+
+    def rate(self):
+        """ commands per second allowed by the current delay """
+        return round(1 / self._delay, 2)
+
+    def success(self):
+        with self._lock:
+            self._successes += 1
+            if self.adaptive:
+                self._delay = max(self._min, 1 / (1 / self._delay + self._step))
+
+    def congestion(self, reason, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._congestions[reason] = self._congestions.get(reason, 0) + 1
+            if not self.adaptive or self._epoch_start is None or now - self._epoch_start < CONGESTION_RTT:
+                # Same congestion as the last decrease
+                return
+            self._delay = min(self._max, self._delay / CONGESTION_FACTOR)
+            self._decreases += 1
+            self._epoch_start = None
+
+    def command_sent(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._last_sent = now
+            if self._epoch_start is None:
+                self._epoch_start = now
+
+    def ack_status(self, status):
+        """ feed with a 0x8000 / 0x8011 / 0x8012 status ( hex string ) """
+        if status == "00":
+            self.success()
+        elif status.lower() in CONGESTION_STATUS:
+            self.congestion("Status%s" % status)
+
+    def pdu_overloaded(self, npdu, apdu):
+        """ True if the nPDU / aPDU reported by ZiGate are above the thresholds """
+        return (npdu is not None and npdu > MAX_NPDU) or (apdu is not None and apdu > MAX_APDU)
+
+    def wait_next_slot(self):
+        """ sleep until the delay since the previous command is elapsed """
+        now = time.monotonic()
+        wait = self._last_sent + self._delay - now
+        if wait > 0:
+            time.sleep(wait)
+            now += wait
+        self.command_sent(now)
+        return max(wait, 0)
+
+    def statistics(self):
+        return {
+            "Profile": self.profile,
+            "Adaptive": self.adaptive,
+            "Delay": round(1000 * self._delay, 1),
+            "Rate": self.rate(),
+            "Successes": self._successes,
+            "Congestions": dict(self._congestions),
+            "Decreases": self._decreases,
+        }
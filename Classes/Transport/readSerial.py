@@ -35,7 +35,7 @@ def reconnect(self):
     while self.running:
         try:
             if self._connection:
-                self.self._connection.close()
+                self._connection.close()
             if open_serial(self):
                 return
         except serial.SerialException:
@@ -135,10 +135,15 @@ def serial_read_from_zigate(self):
     data = None
     try:
         while self._connection.in_waiting:
+            if self.pluginconf.pluginConf["ZiGateReactTime"]:
+                # Start
+                self.reading_thread_timing = 1000 * time.time()
             data = self._connection.read(self._connection.in_waiting)
             self.logging_serial("Debug", "Receiving: %s" %str(data))
             if data:
                 decode_and_split_message(self, data)
+            if self.pluginconf.pluginConf["ZiGateReactTime"]:
+                self.statistics.add_histogram_timing("ReadChunk", int(1000 * time.time() - self.reading_thread_timing))
         self.logging_serial("Debug", "serial_read_from_zigate - read data: %s" %data)
         return True
 
@@ -14,6 +14,8 @@ from Classes.Transport.readSerial import (open_serial,
                                           serial_reset_line_in,
                                           serial_reset_line_out)
 from Classes.Transport.readwriteTcp import open_tcpip, tcpip_read_from_zigate
+from Classes.Transport.selectorIO import (is_selector_io_possible,
+                                          selector_read_write_from_zigate)
 
 
 def open_zigate_and_start_reader(self, zigate_mode):
@@ -38,17 +40,32 @@ def open_zigate_and_start_reader(self, zigate_mode):
 def start_serial_reader_thread(self):
     self.logging_reader("Debug", "start_serial_reader_thread")
     if self.reader_thread is None:
-        self.reader_thread = Thread(name="ZiGateSerial_%s" % self.hardwareid, target=serial_read_write_from_zigate, args=(self,))
+        if is_event_driven_io(self):
+            self.reader_thread = Thread(name="ZiGateSerial_%s" % self.hardwareid, target=selector_read_write_from_zigate, args=(self, "serial"))
+        else:
+            self.reader_thread = Thread(name="ZiGateSerial_%s" % self.hardwareid, target=serial_read_write_from_zigate, args=(self,))
         self.reader_thread.start()
 
 
 def start_tcpip_reader_thread(self):
     self.logging_reader("Debug", "start_tcpip_reader_thread")
     if self.reader_thread is None:
-        self.reader_thread = Thread(name="ZiGateTCPIP_%s" % self.hardwareid, target=tcpip_read_from_zigate, args=(self,))
+        if is_event_driven_io(self):
+            self.reader_thread = Thread(name="ZiGateTCPIP_%s" % self.hardwareid, target=selector_read_write_from_zigate, args=(self, "tcpip"))
+        else:
+            self.reader_thread = Thread(name="ZiGateTCPIP_%s" % self.hardwareid, target=tcpip_read_from_zigate, args=(self,))
         self.reader_thread.start()
 
 
+def is_event_driven_io(self):
+    if not self.pluginconf.pluginConf["eventDrivenIO"]:
+        return False
+    if not is_selector_io_possible(self):
+        self.logging_reader("Error", "Event driven I/O not available on this platform, fallback to polling mode")
+        return False
+    return True
+
+
 def shutdown_reader_thread(self):
     self.logging_reader("Debug", "shutdown_reader_thread %s" % self.running)
 
@@ -98,6 +98,8 @@ def tcpip_read_from_zigate(self):
                 self.logging_tcpip("Debug", "Receiving: %s" %str(data))
                 if data:
                     decode_and_split_message(self, data)
+                if self.pluginconf.pluginConf["ZiGateReactTime"]:
+                    self.statistics.add_histogram_timing("ReadChunk", int(1000 * time.time() - self.reading_thread_timing))
 
             except Exception as e:
                 self.logging_tcpip(
@@ -0,0 +1,198 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Module: selectorIO
+
+    Description: Event driven Read/Write loop with the ZiGate (Serial or TCP/IP).
+
+    Instead of polling every 50ms, the thread is blocked in a selector until either the ZiGate
+    connection is readable, or a frame has been queued by the writer thread (wake-up socket).
+    All pending frames are written in one pass.
+
+    Enabled with the PluginConf parameter 'eventDrivenIO'.
+"""
+
+import os
+import selectors
+import socket
+import time
+
+from Classes.Transport.readDecoder import decode_and_split_message
+from Classes.Transport.readSerial import (check_hw_flow_control, reconnect,
+                                          serial_reset_line_in)
+from Classes.Transport.readwriteTcp import tcp_re_connect
+from Classes.Transport.tools import handle_thread_error, stop_waiting_on_queues
+
+SELECT_TIMEOUT = 1.0  # Max time in the selector, to check the running flag
+TCP_READ_SIZE = 4096
+
+
+class IOWakeUp:
+    """ Wake-up channel, used by the writer thread to unblock the selector when a frame is queued """
+
+    def __init__(self):
+        self._reader, self._writer = socket.socketpair()
+        self._reader.setblocking(False)
+        self._writer.setblocking(False)
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def notify(self):
+        try:
+            self._writer.send(b"\x00")
+        except (BlockingIOError, OSError):
+            # Socket buffer full, the loop is already notified
+            pass
+
+    def clear(self):
+        try:
+            while self._reader.recv(1024):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self):
+        self._reader.close()
+        self._writer.close()
+
+
+def is_selector_io_possible(self):
+    # Serial ports can be used in a selector on Posix systems only
+    if self._transp in ("Wifi", "V2-Wifi"):
+        return True
+    return os.name == "posix"
+
+
+def selector_read_write_from_zigate(self, zigate_mode):
+
+    if zigate_mode == "serial":
+        re_connect = reconnect
+    else:
+        re_connect = tcp_re_connect
+
+    send_queue = self.serial_send_queue if zigate_mode == "serial" else self.tcp_send_queue
+    self.io_wakeup = IOWakeUp()
+    selector = selectors.DefaultSelector()
+    selector.register(self.io_wakeup, selectors.EVENT_READ, "wakeup")
+    registered_connection = None
+
+    self.logging_reader("Status", "ZigateTransport: selector_read_write_from_zigate Thread start (%s)." % zigate_mode)
+    if zigate_mode == "serial" and self._connection:
+        serial_reset_line_in(self)
+    while self.running:
+        if self._connection is None:
+            if not re_connect(self) and zigate_mode == "tcpip":
+                break
+            continue
+
+        if registered_connection is not self._connection:
+            registered_connection = register_connection(self, selector, registered_connection)
+            if registered_connection is None:
+                re_connect(self)
+                continue
+
+        try:
+            # If frames are already waiting, we do not wait in the selector
+            events = selector.select(timeout=0 if send_queue.qsize() else SELECT_TIMEOUT)
+            for key, _ in events:
+                if key.data == "zigate":
+                    selector_read_from_zigate(self, zigate_mode)
+                else:
+                    self.io_wakeup.clear()
+
+            if zigate_mode == "serial":
+                check_hw_flow_control(self)
+
+            selector_write_to_zigate(self, zigate_mode, send_queue)
+
+        except (OSError, ValueError) as e:
+            if not self.running:
+                # Connection closed by the shutdown
+                break
+            self.logging_reader("Error", "selector_read_write_from_zigate - Connection error %s on %s" % (e, self._connection))
+            unregister_connection(selector, registered_connection)
+            registered_connection = None
+            if not re_connect(self) and zigate_mode == "tcpip":
+                break
+            if zigate_mode == "serial" and self._connection:
+                # Drop what is left of the frames received before the line error
+                serial_reset_line_in(self)
+
+        except Exception as e:
+            self.logging_reader("Error", "selector_read_write_from_zigate - Error: %s" % e)
+            handle_thread_error(self, e, 0, 0, None)
+
+    unregister_connection(selector, registered_connection)
+    selector.close()
+    self.io_wakeup.close()
+    self.io_wakeup = None
+    stop_waiting_on_queues(self)
+    self.logging_reader("Status", "ZigateTransport: selector_read_write_from_zigate Thread stop.")
+
+
+def register_connection(self, selector, previous_connection):
+    unregister_connection(selector, previous_connection)
+    try:
+        selector.register(self._connection, selectors.EVENT_READ, "zigate")
+    except (OSError, ValueError) as e:
+        self.logging_reader("Error", "register_connection - unable to register %s: %s" % (self._connection, e))
+        return None
+    return self._connection
+
+
+def unregister_connection(selector, connection):
+    if connection is None:
+        return
+    try:
+        selector.unregister(connection)
+    except (KeyError, OSError, ValueError):
+        pass
+
+
+def selector_read_from_zigate(self, zigate_mode):
+    if self.pluginconf.pluginConf["ZiGateReactTime"]:
+        # Start
+        self.reading_thread_timing = 1000 * time.time()
+
+    if zigate_mode == "serial":
+        # in_waiting can be 0 if the select has been woken up by a line event
+        data = self._connection.read(max(1, self._connection.in_waiting))
+    else:
+        data = self._connection.recv(TCP_READ_SIZE)
+        if not data:
+            raise OSError("connection closed by peer")
+
+    self.logging_reader("Debug", "Receiving: %s" % str(data))
+    decode_and_split_message(self, data)
+    if self.pluginconf.pluginConf["ZiGateReactTime"]:
+        self.statistics.add_histogram_timing("ReadChunk", int(1000 * time.time() - self.reading_thread_timing))
+
+
+def selector_write_to_zigate(self, zigate_mode, send_queue):
+    # Drain all pending frames in one pass
+    nb_frames = 0
+    while send_queue.qsize() > 0:
+        encode_data = send_queue.get()
+        self.logging_reader("Debug", "Sending: %s" % str(encode_data))
+        if zigate_mode == "serial":
+            nb_write = self._connection.write(encode_data)
+        else:
+            self._connection.sendall(encode_data)
+            nb_write = len(encode_data)
+
+        if nb_write != len(encode_data):
+            context = {
+                "Error code": "TRANS-SELECTOR-01",
+                "EncodedData": str(encode_data),
+                "Connection": str(self._connection),
+                "NbWrite": nb_write,
+            }
+            self.logging_reader("Error", "selector_write_to_zigate", _context=context)
+        nb_frames += 1
+
+    if nb_frames and zigate_mode == "serial":
+        self._connection.flush()
@@ -9,11 +9,11 @@
     Module: sqnMgmt
 
     Description: generate and handle the list of internal SQN
-    
+                 The external SQN (ZCL, ZDP, APS) -> internal SQN maps are SqnCorrelation stores: an entry expires
+                 SQN_TTL seconds after it has been set.
 """
-import Domoticz
-import time
 import sys
+import time
 
 # from itertools import filterfalse
 
@@ -24,11 +24,42 @@ TYPE_APP_ZIGATE = 0
 TYPE_APP_ZCL = 2
 TYPE_APP_ZDP = 3
 
+SQN_TTL = 120  # Seconds during which a response can be correlated to its command
+
+
+class SqnCorrelation(dict):
+    # external SQN -> ( internal SQN, expiry ). The external SQN being 1 byte, the store never holds more than 256
+    # entries, and an expired entry is only ignored, until it is replaced
+
+    def __init__(self, ttl=SQN_TTL):
+        super().__init__()
+        self._ttl = ttl
+        self.expired = 0
+
+    def add(self, e_sqn, i_sqn, now=None):
+        self[e_sqn] = (i_sqn, (now or time.monotonic()) + self._ttl)
+
+    def get_isqn(self, e_sqn):
+        entry = self.get(e_sqn)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            self.expired += 1
+            return None
+        return entry[0]
+
+    def size(self):
+        now = time.monotonic()
+        return sum(1 for _, expiry in list(self.values()) if expiry >= now)
+
+    def __repr__(self):
+        return str({e_sqn: i_sqn for e_sqn, (i_sqn, _) in list(self.items())})
+
 
 def sqn_init_stack(self):
-    self.sqn_zcl = {}
-    self.sqn_zdp = {}
-    self.sqn_aps = {}
+    self.sqn_zcl = SqnCorrelation()
+    self.sqn_zdp = SqnCorrelation()
+    self.sqn_aps = SqnCorrelation()
     self.current_sqn = 0
 
 
@@ -51,30 +82,32 @@ def sqn_add_external_sqn(
 
     if sqnAPP_type == TYPE_APP_ZIGATE:
         return
-    self.sqn_aps[e_sqnAPS] = i_sqn
+    now = time.monotonic()
+    self.sqn_aps.add(e_sqnAPS, i_sqn, now)
 
     if sqnAPP_type == TYPE_APP_ZCL:
-        self.sqn_zcl[e_sqnAPP] = i_sqn
+        self.sqn_zcl.add(e_sqnAPP, i_sqn, now)
     elif sqnAPP_type == TYPE_APP_ZDP:
-        self.sqn_zdp[e_sqnAPP] = i_sqn
+        self.sqn_zdp.add(e_sqnAPP, i_sqn, now)
 
     # self.logging_proto(  'Debug',"sqnMgmt add_external_sqn i_sqn:%s e_sqnAPP:%s sqnAPP_type:%s e_sqnAPS:%s" %(i_sqn, e_sqnAPP,sqnAPP_type ,e_sqnAPS))
 
 
 def sqn_get_internal_sqn_from_aps_sqn(self, e_sqn):
-    if e_sqn in self.sqn_aps:
-        return self.sqn_aps[e_sqn]
-    return None
+    return self.sqn_aps.get_isqn(e_sqn)
 
 
 def sqn_get_internal_sqn_from_app_sqn(self, e_sqn, sqnAPP_type):
-    if sqnAPP_type == TYPE_APP_ZIGATE:
-        return None
-
     if sqnAPP_type == TYPE_APP_ZCL:
-        if e_sqn in self.sqn_zcl:
-            return self.sqn_zcl[e_sqn]
-    elif sqnAPP_type == TYPE_APP_ZDP:
-        if e_sqn in self.sqn_zdp:
-            return self.sqn_zdp[e_sqn]
+        return self.sqn_zcl.get_isqn(e_sqn)
+    if sqnAPP_type == TYPE_APP_ZDP:
+        return self.sqn_zdp.get_isqn(e_sqn)
     return None
+
+
+def sqn_statistics(self):
+    stores = {"ZCL": self.sqn_zcl, "ZDP": self.sqn_zdp, "APS": self.sqn_aps}
+    return {
+        "Size": {name: store.size() for name, store in stores.items()},
+        "Expired": sum(store.expired for store in stores.values()),
+    }
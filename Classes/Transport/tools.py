@@ -4,45 +4,50 @@
 # Author: pipiche38
 #
 
-from Modules.zigateConsts import ZIGATE_COMMANDS, ZIGATE_RESPONSES, MAX_SIMULTANEOUS_ZIGATE_COMMANDS
+import time
 
-STANDALONE_MESSAGE = []
+from Modules.zigateConsts import ZIGATE_COMMANDS, ZIGATE_RESPONSES
+
+# Sets, as initialize_command_protocol_parameters() is called at each Transport start
+STANDALONE_MESSAGE = set()
 PDM_COMMANDS = ("8300", "8200", "8201", "8204", "8205", "8206", "8207", "8208")
-CMD_PDM_ON_HOST = []
-CMD_ONLY_STATUS = []
-CMD_WITH_ACK = []
+CMD_PDM_ON_HOST = set()
+CMD_ONLY_STATUS = set()
+CMD_WITH_ACK = set()
 CMD_NWK_2NDBytes = {}
 CMD_WITH_RESPONSE = {}
-RESPONSE_SQN = []
+RESPONSE_TO_COMMAND = {}  # Reverse of CMD_WITH_RESPONSE: response MsgType -> command
+RESPONSE_SQN = set()
 
 
 def initialize_command_protocol_parameters():
     for x in ZIGATE_RESPONSES:
-        STANDALONE_MESSAGE.append(x)
+        STANDALONE_MESSAGE.add(x)
 
     for x in ZIGATE_COMMANDS:
         if ZIGATE_COMMANDS[x]["NwkId 2nd Bytes"]:
             CMD_NWK_2NDBytes[x] = x
 
         if ZIGATE_COMMANDS[x]["Ack"]:
-            CMD_WITH_ACK.append(x)
+            CMD_WITH_ACK.add(x)
 
         if ZIGATE_COMMANDS[x]["SQN"]:
-            RESPONSE_SQN.append(x)
+            RESPONSE_SQN.add(x)
 
         if len(ZIGATE_COMMANDS[x]["Sequence"]) == 0:
-            CMD_PDM_ON_HOST.append(x)
+            CMD_PDM_ON_HOST.add(x)
 
         elif len(ZIGATE_COMMANDS[x]["Sequence"]) == 1:
-            CMD_ONLY_STATUS.append(x)
+            CMD_ONLY_STATUS.add(x)
 
         elif len(ZIGATE_COMMANDS[x]["Sequence"]) == 2:
             CMD_WITH_RESPONSE[x] = ZIGATE_COMMANDS[x]["Sequence"][1]
+            RESPONSE_TO_COMMAND.setdefault(ZIGATE_COMMANDS[x]["Sequence"][1], x)
 
 
 def stop_waiting_on_queues(self):
     if self.writer_queue:
-        self.writer_queue.put((0, "STOP"))  # Stop Writer
+        self.writer_queue.put((0, 0, "STOP"))  # Stop Writer
 
     if self.forwarder_queue:
         self.forwarder_queue.put(("STOP"))  # Stop Forwarded
@@ -53,6 +58,8 @@ def waiting_for_end_thread(self):
     # Release Semaphore
     self.logging_transport("Log", "waiting_for_end_thread - release semaphore")
     self.semaphore_gate.release()
+    with self.window_condition:
+        self.window_condition.notify_all()
 
     if self.reader_thread and self.pluginconf.pluginConf["byPassDzConnection"] and not self.force_dz_communication:
         self.logging_transport("Log", "waiting_for_end_thread - wait for readThread")
@@ -107,6 +114,8 @@ def update_xPDU(self, npdu, apdu):
     self.apdu = int(apdu, 16)
     self.statistics._MaxaPdu = max(self.statistics._MaxaPdu, int(apdu, 16))
     self.statistics._MaxnPdu = max(self.statistics._MaxnPdu, int(npdu, 16))
+    if self.rate_control.pdu_overloaded(self.npdu, self.apdu):
+        self.rate_control.congestion("PDU")
 
 
 def release_command(self, isqn):
@@ -114,13 +123,21 @@ def release_command(self, isqn):
     # Release Semaphore
     if isqn is not None and isqn in self.ListOfCommands:
         self.logging_proto("Debug", "==== Removing isqn: %s from %s" % (isqn, self.ListOfCommands.keys()))
+        if self.pluginconf.pluginConf["ZiGateReactTime"] and "TimeStamp" in self.ListOfCommands[isqn]:
+            self.statistics.add_histogram_timing(
+                "CommandCycle", int(1000 * (time.time() - self.ListOfCommands[isqn]["TimeStamp"]))
+            )
+        remove_awaiting_8000(self, isqn, self.ListOfCommands[isqn]["cmd"])
         del self.ListOfCommands[isqn]
+        self.statistics.add_command_completed()
 
     self.logging_proto(
         "Debug", "============= - Release semaphore %s (%s)" % (self.semaphore_gate._value, len(self.ListOfCommands))
     )
-    if self.semaphore_gate._value < MAX_SIMULTANEOUS_ZIGATE_COMMANDS:
+    if self.semaphore_gate._value < self.max_in_flight:
         self.semaphore_gate.release()
+    with self.window_condition:
+        self.window_condition.notify()
     self.logging_proto(
         "Debug",
         "============= - Semaphore released !! %s writerQueueSize: %s"
@@ -128,25 +145,49 @@ def release_command(self, isqn):
     )
 
 
+def add_awaiting_8000(self, isqn, cmd):
+    # Index of the commands sent, waiting for their 0x8000: command (int) -> { isqn: None } in sending order.
+    # Only needed when several commands are in flight
+    if self.max_in_flight > 1:
+        self.awaiting_8000.setdefault(int(cmd, 16), {})[isqn] = None
+
+
+def remove_awaiting_8000(self, isqn, cmd):
+    if self.max_in_flight > 1:
+        self.awaiting_8000.get(int(cmd, 16), {}).pop(isqn, None)
+
+
 def get_isqn_from_ListOfCommands(self, PacketType):
-    for x in list(self.ListOfCommands):
-        if self.ListOfCommands[x]["Status"] == "SENT":
-            self.logging_proto(
-                "Debug",
-                "get_isqn_from_ListOfCommands - Found isqn: %s with Sem: %s" % (x, self.ListOfCommands[x]["Semaphore"]),
-            )
-            self.ListOfCommands[x]["Status"] = "8000"
-            return x
+    # ZiGate process the commands in sequence, so the 0x8000 is for the oldest command sent (ListOfCommands is ordered
+    # by insertion). When several commands are in flight, it is the oldest one matching the PacketType; if there is
+    # none, the 0x8000 cannot be correlated and None is returned
+    if self.max_in_flight > 1:
+        pending = self.awaiting_8000.get(int(PacketType, 16))
+        while pending:
+            x = next(iter(pending))
+            del pending[x]
+            if x in self.ListOfCommands and self.ListOfCommands[x]["Status"] == "SENT":
+                return command_8000_received(self, x)
+        return None
 
+    for x in list(self.ListOfCommands):
+        if x in self.ListOfCommands and self.ListOfCommands[x]["Status"] == "SENT":
+            return command_8000_received(self, x)
     return None
 
 
+def command_8000_received(self, isqn):
+    self.logging_proto(
+        "Debug",
+        "get_isqn_from_ListOfCommands - Found isqn: %s with Sem: %s" % (isqn, self.ListOfCommands[isqn]["Semaphore"]),
+    )
+    self.ListOfCommands[isqn]["Status"] = "8000"
+    return isqn
+
+
 def get_command_from_msgtype(command):
-    # Return the MsgType expected for a given command
-    for x in CMD_WITH_RESPONSE:
-        if CMD_WITH_RESPONSE[x] == int(command, 16):
-            return x
-    return None
+    # Return the command waiting for the MsgType command
+    return RESPONSE_TO_COMMAND.get(int(command, 16))
 
 
 def get_response_from_command(command):
@@ -5,7 +5,6 @@
 #
 
 
-import json
 import queue
 import select
 import socket
@@ -13,10 +12,14 @@ import time
 from threading import Thread
 
 import Domoticz
-from Classes.Transport.tools import handle_thread_error, release_command
+from Classes.Transport.outboundCommand import OutboundCommand
+from Classes.Transport.tools import (add_awaiting_8000, handle_thread_error,
+                                     release_command)
 from Modules.tools import is_hex
 from Modules.zigateConsts import ZIGATE_MAX_BUFFER_SIZE
 
+WINDOW_CHECK_PERIOD = 0.25  # Period at which the in-flight commands are checked for time out
+
 
 def start_writer_thread(self):
 
@@ -47,74 +50,66 @@ def writer_thread(self):
                     "ZigateTransport: writer_thread Thread checking #nPDU: %s and #aPDU: %s." % (self.npdu, self.apdu),
                 )
 
-                if self.apdu > 2:
-                    self.logging_writer("Log", "ZigateTransport: writer_thread Thread aPDU: %s retry later." % self.apdu)
-                    time.sleep(0.25)
-                    continue
-                if self.npdu > 7:
-                    self.logging_writer("Log", "ZigateTransport: writer_thread Thread nPDU: %s retry later." % self.npdu)
-                    time.sleep(0.25)
+                if self.rate_control.pdu_overloaded(self.npdu, self.apdu):
+                    self.logging_writer(
+                        "Log",
+                        "ZigateTransport: writer_thread Thread nPDU: %s aPDU: %s retry in %s ms."
+                        % (self.npdu, self.apdu, int(1000 * self.rate_control.delay)),
+                    )
+                    time.sleep(self.rate_control.delay)
                     continue
 
-            entry = self.writer_queue.get()
-            _isqn, command_str = entry
-            if command_str == "STOP":
+            _isqn, _, command = self.writer_queue.get()
+            if command == "STOP":
                 break
 
-            command = json.loads(command_str)
-            if _isqn != command["InternalSqn"]:
+            if not isinstance(command, OutboundCommand):
+                self.logging_writer("Error", "Hops ... Don't known what to do with that %s" % command)
+                continue
+
+            if _isqn != command.InternalSqn:
                 self.logging_writer(
                     "Debug",
-                    "Hih Priority command HIsqn: %s Cmd: %s Data: %s i_sqn: %s"
-                    % (_isqn, command["cmd"], command["datas"], command["InternalSqn"]),
+                    "Hih Priority command HIsqn: %s Cmd: %s Data: %s i_sqn: %s" % (_isqn, command.cmd, command.datas, command.InternalSqn),
                 )
 
-            # self.logging_writer( 'Debug', "New command received:  %s" %(command))
-            if (
-                isinstance(command, dict)
-                and "cmd" in command
-                and "datas" in command
-                and "ackIsDisabled" in command
-                and "waitForResponseIn" in command
-                and "InternalSqn" in command
-            ):
-                if (command["cmd"], command["datas"]) in self.writer_list_in_queue:
-                    self.logging_writer("Debug", "removing %s/%s from list_in_queue" % (command["cmd"], command["datas"]))
-                    self.writer_list_in_queue.remove((command["cmd"], command["datas"]))
+            with self.writer_lock:
+                self.writer_queue_depth[command.priority] -= 1
+                pending = self.writer_list_in_queue.pop(command.key, None)
+                if pending is not None and pending is not command:
+                    # This one was cancelled, and the same command queued again since
+                    self.writer_list_in_queue[command.key] = pending
+            if pending is command:
+                self.logging_writer("Debug", "removing %s/%s from list_in_queue" % (command.cmd, command.datas))
 
-                if self.writer_queue.qsize() > self.statistics._MaxLoad:
-                    self.statistics._MaxLoad = self.writer_queue.qsize()
+            if command.cancelled:
+                self.logging_writer("Debug", "Drop cancelled command %s" % command)
+                continue
 
-                # if 'NwkId' in command:
-                #    Domoticz.Log("Command on %s" %command['NwkId'])
+            if self.writer_queue.qsize() > self.statistics._MaxLoad:
+                self.statistics._MaxLoad = self.writer_queue.qsize()
 
-                # if self.last_nwkid_failure and 'NwkId' in command and command['NwkId'] == self.last_nwkid_failure:
-                #    self.logging_writer( 'Log', "removing %s/%s from list_in_queue as it failed previously" %( command['cmd'], command['datas'] ))
-                #    # Looks like the command is still for the Nwkid which has failed. Drop
-                #    continue
+            self.last_nwkid_failure = None
 
-                self.last_nwkid_failure = None
-
-                wait_for_semaphore(self, command)
-
-                send_ok = thread_sendData(
-                    self,
-                    command["cmd"],
-                    command["datas"],
-                    command["ackIsDisabled"],
-                    command["waitForResponseIn"],
-                    command["InternalSqn"],
-                )
-                self.logging_writer("Debug", "Command sent!!!! %s send_ok: %s" % (command, send_ok))
-                if send_ok in ("PortClosed", "SocketClosed"):
-                    # Exit
-                    break
-
-                # Command sent, if needed wait in order to reduce throughput and load on ZiGate
-                limit_throuput(self, command)
+            if not wait_for_semaphore(self, command):
+                # Transport is shutting down
+                break
 
-            else:
-                self.logging_writer("Error", "Hops ... Don't known what to do with that %s" % command)
+            # Regulate the throughput and the load on ZiGate
+            limit_throuput(self, command)
+
+            send_ok = thread_sendData(
+                self,
+                command.cmd,
+                command.datas,
+                command.ackIsDisabled,
+                command.waitForResponseIn,
+                command.InternalSqn,
+            )
+            self.logging_writer("Debug", "Command sent!!!! %s send_ok: %s" % (command, send_ok))
+            if send_ok in ("PortClosed", "SocketClosed"):
+                # Exit
+                break
 
         except queue.Empty:
             # Empty Queue, timeout.
@@ -132,28 +127,36 @@ def limit_throuput(self, command):
     # It is important for non 31e firmware, as we don't have all elements to regulate the flow
     #
     # It takes on an USB ZiGate around 70ms for a full turn around time between the commande sent and the 0x8011 received
+    # The delay between 2 commands is given by the RateController, within the bounds of the firmware profile.
 
-    if self.firmware_compatibility_mode:
-        # We are in firmware 31a where we control the flow is only on 0x8000
-        # Throught put of 2 messages per seconds
-        self.logging_writer("Debug", "Firmware 31a limit_throuput regulate to 500")
-        time.sleep(0.500)
+    profile = firmware_rate_profile(self)
+    if self.rate_control.profile != profile:
+        self.logging_writer("Debug", "limit_throuput switch to firmware profile %s" % profile)
+        self.rate_control.set_profile(profile)
 
-    elif not self.firmware_with_8012:
-        # Firmware is not 31e
-        # Throught put of 4 messages per seconds
-        self.logging_writer("Debug", "Firmware 31d limit_throuput regulate to 300")
-        time.sleep(0.350)
+    waited = self.rate_control.wait_next_slot()
+    self.logging_writer(
+        "Debug", "limit_throuput waited %s ms (delay %s ms)" % (int(1000 * waited), int(1000 * self.rate_control.delay))
+    )
 
-    elif self.firmware_nosqn:
-        time.sleep(1.0)
 
-    else:
-        self.logging_writer("Debug", "Firmware 31e limit_throuput regulate to 100")
-        time.sleep(0.100)
+def firmware_rate_profile(self):
+    if self.firmware_compatibility_mode:
+        # We are in firmware 31a where we control the flow is only on 0x8000
+        return "31a"
+    if not self.firmware_with_8012:
+        # Firmware is not 31e
+        return "31d"
+    if self.firmware_nosqn:
+        return "nosqn"
+    return "31e"
 
 
 def wait_for_semaphore(self, command):
+    if self.max_in_flight > 1 or self.pluginconf.pluginConf["writerCommandRetry"]:
+        # Pipelined mode, several commands can wait for their 0x8000
+        return wait_for_window_slot(self, command)
+
     if self.force_dz_communication or self.pluginconf.pluginConf["writerTimeOut"]:
         self.logging_writer("Debug", "Waiting for a write slot . Semaphore %s TimeOut of 8s" % (self.semaphore_gate._value))
         timeout_cmd = 4.0 if self.firmware_compatibility_mode else 8.0
@@ -176,6 +179,71 @@ def wait_for_semaphore(self, command):
 
     if self.pluginconf.pluginConf["writerTimeOut"] and not block_status:
         semaphore_timeout(self, command)
+    return self.running
+
+
+def wait_for_window_slot(self, command):
+    # release_command() signals window_condition as soon as a command leaves the window.
+    # The wait timeout is only there to check the in-flight commands for time out.
+    self.logging_writer("Debug", "Waiting for a slot in the window. Semaphore %s In flight: %s" % (self.semaphore_gate._value, len(self.ListOfCommands)))
+    with self.window_condition:
+        while self.running:
+            check_commands_timeout(self)
+            # The semaphore is taken only within in_flight_limit(), which is 1 for firmware not able to handle several commands at a time
+            if len(self.ListOfCommands) < in_flight_limit(self) and self.semaphore_gate.acquire(blocking=False):
+                return True
+            self.window_condition.wait(timeout=WINDOW_CHECK_PERIOD)
+    return False
+
+
+def in_flight_limit(self):
+    # Firmware 31a and firmware without SQN can handle only 1 command at a time
+    if self.firmware_compatibility_mode or self.firmware_nosqn:
+        return 1
+    return self.max_in_flight
+
+
+def command_timeout(self):
+    return 4.0 if self.firmware_compatibility_mode else float(self.pluginconf.pluginConf["writerCommandTimeOut"])
+
+
+def check_commands_timeout(self):
+    # Per command time out. Commands without 0x8000 are retried (up to writerCommandRetry), the others are released
+    timeout = command_timeout(self)
+    now = time.time()
+    for isqn in list(self.ListOfCommands):
+        command = self.ListOfCommands.get(isqn)
+        if command is None or now < command["TimeStamp"] + timeout:
+            continue
+
+        if command["Status"] == "SENT" and command.get("Retry", 0) < self.pluginconf.pluginConf["writerCommandRetry"]:
+            retry_command(self, isqn, command)
+            continue
+
+        if command["Status"] == "SENT":
+            self.statistics._TOstatus += 1
+            self.rate_control.congestion("TimeOut")
+        else:
+            self.statistics._TOdata += 1
+
+        if not self.force_dz_communication and self.pluginconf.pluginConf["showTimeOutMsg"]:
+            context = {
+                "Error code": "TRANS-WINDOW-01",
+                "IsqnToRemove": isqn,
+                "Command": dict(command),
+                "TimeOut": timeout,
+                "InFlight": len(self.ListOfCommands),
+            }
+            self.logging_writer("Error", "writerThread Timeout ", _context=context)
+        release_command(self, isqn)
+
+
+def retry_command(self, isqn, command):
+    command["Retry"] = command.get("Retry", 0) + 1
+    command["TimeStamp"] = time.time()
+    self.statistics._reTx += 1
+    self.logging_writer("Log", "Retry (%s) command [%s] %s %s" % (command["Retry"], isqn, command["cmd"], command["datas"]))
+    write_to_zigate(self, self._connection, bytes.fromhex(encode_message(command["cmd"], command["datas"])))
 
 
 def thread_sendData(self, cmd, datas, ackIsDisabled, waitForResponseIn, isqn):
@@ -205,6 +273,7 @@ def thread_sendData(self, cmd, datas, ackIsDisabled, waitForResponseIn, isqn):
         "TimeStamp": time.time(),
         "Semaphore": self.semaphore_gate._value,
     }
+    add_awaiting_8000(self, isqn, cmd)
     self.statistics._sent += 1
     if self.pluginconf.pluginConf["debugzigateCmd"]:
         self.logging_writer("Log", "_sendData to ZiGate NOW  - [%s] %s %s" % (isqn, cmd, datas))
@@ -304,9 +373,12 @@ def native_write_to_zigate(self, serialConnection, encoded_data):
         "V2-Wifi",
     ):
         self.tcp_send_queue.put(encoded_data)
-        return True
+    else:
+        self.serial_send_queue.put(encoded_data)
 
-    self.serial_send_queue.put(encoded_data)
+    if self.io_wakeup:
+        # Event driven I/O, wake up the Read/Write thread
+        self.io_wakeup.notify()
     return True
 
 
@@ -314,7 +386,7 @@ def semaphore_timeout(self, current_command):
     # Semaphore has been Release due to Timeout
     # In that case we should release the pending command in ListOfCommands
     if len(self.ListOfCommands) == 2:
-        if list(self.ListOfCommands.keys())[0] == current_command["InternalSqn"]:
+        if list(self.ListOfCommands.keys())[0] == current_command.InternalSqn:
             # We remove element [1]
             isqn_to_be_removed = list(self.ListOfCommands.keys())[1]
         else:
@@ -324,7 +396,7 @@ def semaphore_timeout(self, current_command):
         context = {
             "Error code": "TRANS-SEMAPHORE-01",
             "ListofCmds": dict.copy(self.ListOfCommands),
-            "IsqnCurrent": current_command["InternalSqn"],
+            "IsqnCurrent": current_command.InternalSqn,
             "IsqnToRemove": isqn_to_be_removed,
         }
         if not self.force_dz_communication and self.pluginconf.pluginConf["showTimeOutMsg"]:
@@ -336,11 +408,11 @@ def semaphore_timeout(self, current_command):
     context = {
         "Error code": "TRANS-SEMAPHORE-02",
         "ListofCmds": dict.copy(self.ListOfCommands),
-        "IsqnCurrent": current_command["InternalSqn"],
+        "IsqnCurrent": current_command.InternalSqn,
         "IsqnToRemove": [],
     }
     for x in list(self.ListOfCommands):
-        if x == current_command["InternalSqn"]:
+        if x == current_command.InternalSqn:
             # On going command, this one is the one accepted via the Timeout
             continue
         if time.time() + 8 >= self.ListOfCommands[x]["TimeStamp"]:
@@ -6,7 +6,9 @@
 
 import Domoticz
 import struct 
+from Classes.Transport.decodedMessage import DecodedMessage, build_frame_from_records
 from Modules.tools import retreive_cmd_payload_from_8002
+from Modules.zclDecoder import decode_attribute_bytes
 from Modules.zigateConsts import ADDRESS_MODE, SIZE_DATA_TYPE
 
 
@@ -26,6 +28,8 @@ def zcl_decoders( self, SrcNwkId, SrcEndPoint, ClusterId, Payload , frame):
         return buildframe_read_attribute_request(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, ManufacturerCode, Data)
 
     if Command == "01":  # Read Attribute response
+        if self.pluginconf.pluginConf["rawDecodedMessages"]:
+            return decoded_message(0x8100, frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, decode_read_attribute_response(frame, ClusterId, Data, True, True))
         return buildframe_read_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data)
 
     if Command == "02":  # Write Attributes
@@ -41,6 +45,8 @@ def zcl_decoders( self, SrcNwkId, SrcEndPoint, ClusterId, Payload , frame):
         return buildframe_configure_reporting_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data)
 
     if Command == "0a":  # Report attributes
+        if self.pluginconf.pluginConf["rawDecodedMessages"]:
+            return decoded_message(0x8102, frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, decode_report_attributes(frame, SrcNwkId, SrcEndPoint, ClusterId, Data, True))
         return buildframe_report_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data)
     
     if Command == "0b":  #
@@ -67,6 +73,12 @@ def zcl_decoders( self, SrcNwkId, SrcEndPoint, ClusterId, Payload , frame):
     return frame
 
 
+def decoded_message(MsgType, frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Records):
+    # Structured message handed over to the plugin, or the original 0x8002 frame if the payload can't be decoded
+    if Records is None:
+        return frame
+    return DecodedMessage(MsgType, Sqn, SrcNwkId, SrcEndPoint, ClusterId, frame[len(frame) - 4 : len(frame) - 2], Records)
+
 
 def buildframe_discover_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data):
     
@@ -219,13 +231,44 @@ def decode_endian_data(data, datatype):
     return data
 
 
+# Data types decoded from the bytes of the little endian value, with the size of the value
+ENDIAN_DECODED_TYPES = {"10": 1, "18": 1, "20": 1, "28": 1, "30": 1, "19": 2, "21": 2, "29": 2, "31": 2, "23": 4, "2b": 4, "39": 4}
+
+
+def decode_endian_value(data, datatype):
+    # Value of the little endian data, as decodeAttribute() gives it from decode_endian_data(). None when the
+    # value must be left to decodeAttribute()
+    size = ENDIAN_DECODED_TYPES.get(datatype)
+    if size is None or len(data) != 2 * size:
+        return None
+    try:
+        value = bytes.fromhex(data)[::-1]
+    except ValueError:
+        return None
+    if size == 4 and value[0] & 0x80:
+        # decode_endian_data() formats these values as negative
+        return None
+    return decode_attribute_bytes(int(datatype, 16), value)
+
+
 def buildframe_read_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data):
 
-    nbAttribute = 0
+    Records = decode_read_attribute_response(frame, ClusterId, Data)
+    if Records is None:
+        return frame
+    return build_frame_from_records(DecodedMessage(0x8100, Sqn, SrcNwkId, SrcEndPoint, ClusterId, frame[len(frame) - 4 : len(frame) - 2], Records))
+
+
+def decode_read_attribute_response(frame, ClusterId, Data, decode_values=False, drop_padding=False):
+    # Return the attribute records ( idx, Attribute, Status, DType, lenData, value, decoded value ), or None if Data
+    # can't be decoded. The decoded values are None unless decode_values.
+    # With drop_padding, the records are the ones Decode8100 gets from the 0x8100 frame: a last status record
+    # following a status record is dropped, as split_attribute_records() does
+
+    Records = []
     idx = 0
-    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
+    idx_out = 12  # idx in the 0x8100 MsgData
     while idx < len(Data):
-        nbAttribute += 1
         Attribute = "%04x" % struct.unpack("H", struct.pack(">H", int(Data[idx : idx + 4], 16)))[0]
         idx += 4
         Status = Data[idx : idx + 2]
@@ -253,31 +296,40 @@ def buildframe_read_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, Cluste
                     "buildframe_read_attribute_response - ClusterId: %s Attribute: %s Data: %s"
                     % (ClusterId, Attribute, Data)
                 )
-                return frame
+                return None
 
             data = Data[idx : idx + size]
             idx += size
             value = decode_endian_data(data, DType)
-            lenData = "%04x" % (size // 2)
-            buildPayload += Attribute + Status + DType + lenData + value
+            idx_out += 12 + size
+            Records.append((idx_out, Attribute, Status, DType, "%04x" % (size // 2), value, decode_endian_value(data, DType) if decode_values else None))
         else:
             # Status != 0x00
-            buildPayload += Attribute + Status
-
-    newFrame = "01"  # 0:2
-    newFrame += "8100"  # 2:6   MsgType
-    newFrame += "%4x" % len(buildPayload)  # 6:10  Length
-    newFrame += "ff"  # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4 : len(frame) - 2]  # LQI
-    newFrame += "03"
-    return newFrame
+            idx_out += 6
+            if drop_padding and len(Data) - idx == 6 and Data[idx + 4 : idx + 6] != "00":
+                # If the frame is coming from firmware we get only one attribute at a time, with some dummy datas
+                idx += 6
+                idx_out += 6
+            Records.append((idx_out, Attribute, Status, "", "", "", None))
+    return Records
 
 
 def buildframe_report_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data):
-    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
+
+    Records = decode_report_attributes(frame, SrcNwkId, SrcEndPoint, ClusterId, Data)
+    if Records is None:
+        return frame
+    return build_frame_from_records(DecodedMessage(0x8102, Sqn, SrcNwkId, SrcEndPoint, ClusterId, frame[len(frame) - 4 : len(frame) - 2], Records))
+
+
+def decode_report_attributes(frame, SrcNwkId, SrcEndPoint, ClusterId, Data, decode_values=False):
+    # Return the attribute records ( idx, Attribute, "00", DType, lenData, value, decoded value ), or None if Data
+    # can't be decoded. The decoded values are None unless decode_values
+
+    Records = []
     nbAttribute = 0
     idx = 0
+    idx_out = 12  # idx in the 0x8102 MsgData
     while idx < len(Data):
         nbAttribute += 1
         Attribute = "%04x" % struct.unpack("H", struct.pack(">H", int(Data[idx : idx + 4], 16)))[0]
@@ -302,7 +354,7 @@ def buildframe_report_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, Clus
                 "buildframe_report_attribute_response %s/%s Cluster: %s nbAttribute: %s Attribute: %s DType: %s idx: %s frame: %s"
                 % (SrcNwkId, SrcEndPoint, ClusterId, nbAttribute, Attribute, DType, idx, frame)
             )
-            return frame
+            return None
 
         else:
             Domoticz.Error(
@@ -313,22 +365,14 @@ def buildframe_report_attribute_response(frame, Sqn, SrcNwkId, SrcEndPoint, Clus
                 "buildframe_report_attribute_response - NwkId: %s ClusterId: %s Attribute: %s Frame: %s"
                 % (SrcNwkId, ClusterId, Attribute, frame)
             )
-            return frame
+            return None
 
         data = Data[idx : idx + size]
         idx += size
         value = decode_endian_data(data, DType)
-        lenData = "%04x" % (size // 2)
-        buildPayload += Attribute + "00" + DType + lenData + value
-
-    newFrame = "01"  # 0:2
-    newFrame += "8102"  # 2:6   MsgType
-    newFrame += "%4x" % len(buildPayload)  # 6:10  Length
-    newFrame += "ff"  # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4 : len(frame) - 2]  # LQI
-    newFrame += "03"
-    return newFrame
+        idx_out += 12 + size
+        Records.append((idx_out, Attribute, "00", DType, "%04x" % (size // 2), value, decode_endian_value(data, DType) if decode_values else None))
+    return Records
 
 
 def buildframe_configure_reporting_response(frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data):
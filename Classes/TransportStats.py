@@ -6,14 +6,81 @@
 
 import Domoticz
 import json
+from bisect import bisect_left
+from collections import deque
 from time import time
 
+CMD_RATE_WINDOW = 60  # Number of seconds used to compute the effective commands per second
+MAX_TREND_STAT_TABLE = 120
+
+# Upper bounds (ms) of the latency histogram buckets. An extra bucket collects everything above the last bound
+LATENCY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+# Stages timed when ZiGateReactTime is enabled
+HISTOGRAMS = (
+    "RoundTrip8000",  # command sent -> 0x8000
+    "RoundTrip8011",  # command sent -> 0x8011
+    "RoundTrip8012",  # command sent -> 0x8012
+    "CommandCycle",  # command sent -> released (last expected ack received)
+    "ReadChunk",  # read and decoding of the bytes received, in the reader thread
+    "ProcFrame",  # process_frame in the reader thread
+    "ForwarderQueue",  # waiting time in the forwarder queue
+    "Forwarder",  # processing by the plugin (F_out)
+)
+
+
+class LatencyHistogram:
+    # Fixed buckets histogram, the memory footprint doesn't depend on the number of samples
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self._bounds = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._cumul = 0
+        self._max = 0
+
+    def add(self, timing):
+        self._counts[bisect_left(self._bounds, timing)] += 1
+        self._count += 1
+        self._cumul += timing
+        if timing > self._max:
+            self._max = timing
+
+    def count(self):
+        return self._count
+
+    def percentile(self, ratio):
+        """ return the upper bound of the bucket where the ratio of samples is reached (max for the last bucket) """
+        if self._count == 0:
+            return 0
+        rank = ratio * self._count
+        cumul = 0
+        for idx, nb in enumerate(self._counts):
+            cumul += nb
+            if cumul >= rank:
+                return min(self._bounds[idx], self._max) if idx < len(self._bounds) else self._max
+        return self._max
+
+    def to_dict(self):
+        buckets = {"<=%s" % bound: nb for bound, nb in zip(self._bounds, self._counts)}
+        buckets[">%s" % self._bounds[-1]] = self._counts[-1]
+        return {
+            "Count": self._count,
+            "Avg": round(self._cumul / self._count, 1) if self._count else 0,
+            "Max": self._max,
+            "P50": self.percentile(0.50),
+            "P95": self.percentile(0.95),
+            "P99": self.percentile(0.99),
+            "Buckets": buckets,
+        }
+
 
 class TransportStatistics:
     def __init__(self, pluginconf):
         self._pdmLoads = 0  # count the number of PDM Loads ( should be 1 max)
         self._crcErrors = 0  # count of crc errors
         self._frameErrors = 0  # count of frames error
+        self._droppedBytes = 0  # count of received bytes which were not part of a frame
         self._APSFailure = 0  # Count APS Failure
         self._APSAck = 0  # Firmware 3.1b 0x8011 status 00
         self._APSNck = 0  # Firmware 3.1b 0x8011 status not 00
@@ -40,8 +107,17 @@ class TransportStatistics:
         self._max_reading_thread_timing = (
             self._cumul_reading_thread_timing
         ) = self._cnt_reading_thread_timing = self._average_reading_thread_timing = 0
+        self._completedCommands = 0  # count commands fully processed (released from the in-flight window)
+        self._cmdRateBuckets = [0] * CMD_RATE_WINDOW  # commands completed per second over the last CMD_RATE_WINDOW seconds
+        self._cmdRateLastSecond = int(time())
         self._start = int(time())
-        self.TrendStats = []
+        self.TrendStats = deque(maxlen=MAX_TREND_STAT_TABLE)
+        self._histograms = {name: LatencyHistogram() for name in HISTOGRAMS}
+        self._rateControl = None  # RateController of the writer, set by the Transport
+        self._fwdBatches = 0  # number of wake-ups of the forwarder
+        self._fwdFrames = 0  # frames taken from the forwarder queue
+        self._fwdCoalesced = 0  # frames dropped as a newer report of the same attributes was in the same batch
+        self._fwdMaxBatch = 0
         self.pluginconf = pluginconf
 
     # Statistics methods
@@ -54,7 +130,35 @@ class TransportStatistics:
     def get_pdm_loaded(self):
         return self._pdmLoads
 
+    def add_histogram_timing(self, name, timing):
+        self._histograms[name].add(timing)
+
+    def histograms(self):
+        return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+
+    def add_forwarder_batch(self, nb_frames, nb_coalesced):
+        self._fwdBatches += 1
+        self._fwdFrames += nb_frames
+        self._fwdCoalesced += nb_coalesced
+        self._fwdMaxBatch = max(self._fwdMaxBatch, nb_frames)
+
+    def forwarder(self):
+        return {
+            "Batches": self._fwdBatches,
+            "Frames": self._fwdFrames,
+            "Coalesced": self._fwdCoalesced,
+            "MaxBatch": self._fwdMaxBatch,
+            "AvgBatch": round(self._fwdFrames / self._fwdBatches, 1) if self._fwdBatches else 0,
+        }
+
+    def set_rate_control(self, rate_control):
+        self._rateControl = rate_control
+
+    def rate_control(self):
+        return self._rateControl.statistics() if self._rateControl else {}
+
     def add_timing_thread(self, timing):
+        self._histograms["ProcFrame"].add(timing)
         self._cumul_reading_thread_timing += timing
         self._cnt_reading_thread_timing += 1
         self._average_reading_thread_timing = int((self._cumul_reading_thread_timing / self._cnt_reading_thread_timing))
@@ -67,6 +171,7 @@ class TransportStatistics:
 
     def add_timing8000(self, timing):
 
+        self._histograms["RoundTrip8000"].add(timing)
         self._cumulTiming8000 += timing
         self._cntTiming8000 += 1
         self._averageTiming8000 = int((self._cumulTiming8000 / self._cntTiming8000))
@@ -79,6 +184,7 @@ class TransportStatistics:
 
     def add_timing8011(self, timing):
 
+        self._histograms["RoundTrip8011"].add(timing)
         self._cumulTiming8011 += timing
         self._cntTiming8011 += 1
         self._averageTiming8011 = int((self._cumulTiming8011 / self._cntTiming8011))
@@ -91,6 +197,7 @@ class TransportStatistics:
 
     def add_timing8012(self, timing):
 
+        self._histograms["RoundTrip8012"].add(timing)
         self._cumulTiming8012 += timing
         self._cntTiming8012 += 1
         self._averageTiming8012 = int((self._cumulTiming8012 / self._cntTiming8012))
@@ -103,6 +210,7 @@ class TransportStatistics:
 
     def add_rxTiming(self, timing):
 
+        self._histograms["Forwarder"].add(timing)
         self._cumulRxProcess += timing
         self._cntRxProcess += 1
         self._averageRxProcess = int((self._cumulRxProcess / self._cntRxProcess))
@@ -113,15 +221,30 @@ class TransportStatistics:
                 % (self._maxRxProcesses, self._averageRxProcess)
             )
 
-    def addPointforTrendStats(self, TimeStamp):
+    def add_command_completed(self):
+        self._completedCommands += 1
+        self._roll_cmd_rate_buckets()
+        self._cmdRateBuckets[self._cmdRateLastSecond % CMD_RATE_WINDOW] += 1
+
+    def _roll_cmd_rate_buckets(self):
+        now = int(time())
+        if now == self._cmdRateLastSecond:
+            return
+        for second in range(self._cmdRateLastSecond + 1, min(now, self._cmdRateLastSecond + CMD_RATE_WINDOW) + 1):
+            self._cmdRateBuckets[second % CMD_RATE_WINDOW] = 0
+        self._cmdRateLastSecond = now
 
-        MAX_TREND_STAT_TABLE = 120
+    def commands_per_second(self):
+        " return the effective number of commands completed per second over the last CMD_RATE_WINDOW seconds"
+        self._roll_cmd_rate_buckets()
+        window = min(CMD_RATE_WINDOW, max(1, int(time()) - self._start))
+        return round(sum(self._cmdRateBuckets) / window, 2)
+
+    def addPointforTrendStats(self, TimeStamp):
 
         uptime = int(time() - self._start)
         Rxps = round(self._received / uptime, 2)
         Txps = round(self._sent / uptime, 2)
-        if len(self.TrendStats) >= MAX_TREND_STAT_TABLE:
-            del self.TrendStats[0]
         self.TrendStats.append({"_TS": TimeStamp, "Rxps": Rxps, "Txps": Txps, "Load": self._Load})
 
     def reTx(self):
@@ -136,6 +259,10 @@ class TransportStatistics:
         " return the number of frame errors"
         return self._frameErrors
 
+    def droppedBytes(self):
+        " return the number of received bytes which were not part of a frame"
+        return self._droppedBytes
+
     def sent(self):
         " return he number of sent messages"
         return self._sent
@@ -187,11 +314,23 @@ class TransportStatistics:
         Domoticz.Status("ZiGate processing time on Rx")
         Domoticz.Status("   Max              : %s sec" % (self._maxRxProcesses))
         Domoticz.Status("   Average          : %s sec" % (self._averageRxProcess))
+        Domoticz.Status("Latencies")
+        for name, histogram in self._histograms.items():
+            if histogram.count():
+                Domoticz.Status(
+                    "   %-17s: p50 %s ms p95 %s ms p99 %s ms (%s samples)"
+                    % (name, histogram.percentile(0.50), histogram.percentile(0.95), histogram.percentile(0.99), histogram.count())
+                )
         Domoticz.Status("Sent:")
         Domoticz.Status("   TX commands      : %s" % (self.sent()))
+        Domoticz.Status("   Completed cmds   : %s (%s cmd/s)" % (self._completedCommands, self.commands_per_second()))
         Domoticz.Status("   Max Load (Queue) : %s " % (self._MaxLoad))
         Domoticz.Status("   Max aPDU (Queue) : %s " % (self._MaxaPdu))
         Domoticz.Status("   Max nPDU (Queue) : %s " % (self._MaxnPdu))
+        if self._rateControl:
+            Domoticz.Status(
+                "   Rate control     : %s cmd/s (delay %s ms)" % (self._rateControl.rate(), int(1000 * self._rateControl.delay))
+            )
         Domoticz.Status(
             "   TX failed        : %s (%s" % (self.ackKOReceived(), round((self.ackKOReceived() / self.sent()) * 10, 2))
             + "%)"
@@ -226,8 +365,11 @@ class TransportStatistics:
             % (self.frameErrors(), round((self.frameErrors() / self.received()) * 100, 2))
             + "%)"
         )
+        Domoticz.Status("   RX dropped bytes : %s" % (self.droppedBytes()))
         Domoticz.Status("   RX clusters      : %s" % (self.clusterOK()))
         Domoticz.Status("   RX clusters KO   : %s" % (self.clusterKO()))
+        if self._fwdCoalesced:
+            Domoticz.Status("   RX coalesced     : %s" % (self._fwdCoalesced))
         t0 = self.starttime()
         t1 = int(time())
         _days = 0
@@ -248,6 +390,7 @@ class TransportStatistics:
         stats = {timing: {}}
         stats[timing]["crcErrors"] = self._crcErrors
         stats[timing]["frameErrors"] = self._frameErrors
+        stats[timing]["droppedBytes"] = self._droppedBytes
         stats[timing]["sent"] = self._sent
         stats[timing]["received"] = self._received
         stats[timing]["APS Ack"] = self._APSAck
@@ -261,6 +404,11 @@ class TransportStatistics:
         stats[timing]["clusterKO"] = self._clusterKO
         stats[timing]["reTx"] = self._reTx
         stats[timing]["MaxLoad"] = self._MaxLoad
+        stats[timing]["completedCommands"] = self._completedCommands
+        stats[timing]["cmdPerSecond"] = self.commands_per_second()
+        stats[timing]["histograms"] = self.histograms()
+        stats[timing]["rateControl"] = self.rate_control()
+        stats[timing]["forwarder"] = self.forwarder()
         stats[timing]["start"] = self._start
         stats[timing]["stop"] = timing
 
@@ -6,19 +6,21 @@
 
 import json
 import mimetypes
-import os
-import os.path
 from time import time
 
 import Domoticz
 from Classes.DomoticzDB import DomoticzDB_Preferences
+from Classes.EnergyReportStore import EnergyReportStore
 from Classes.LoggingManagement import LoggingManagement
 from Classes.PluginConf import SETTINGS
 from Classes.WebServer.headerResponse import prepResponseMessage, setupHeadersResponse
+from Classes.WebServer.responseCache import ResponseCache
 from Modules.actuators import actuators
 from Modules.basicOutputs import ZigatePermitToJoin, initiate_change_channel, setExtendedPANID, start_Zigate, zigateBlueLed 
 from Modules.enki import enki_set_poweron_after_offon
+from Modules.input import INPUT_DECODERS, MESSAGE_DECODERS
 from Modules.philips import philips_set_poweron_after_offon
+from Modules.readClusters import CLUSTER_DECODERS
 from Modules.tools import is_hex
 from Modules.zigateConsts import CERTIFICATION_CODE, ZCL_CLUSTERS_LIST, ZIGATE_COMMANDS
 from Modules.sendZigateCommand import (raw_APS_request, send_zigatecmd_raw,
@@ -116,6 +118,13 @@ class WebServer(object):
         self.pluginParameters = PluginParameters
         self.networkmap = None
         self.networkenergy = None
+        self.energyReports = None
+        self.devicesIndex = None
+        self.heartbeatScheduler = None
+        self.resetScheduler = None
+        self.deviceTouches = None
+        self.deviceChanges = None
+        self.responseCache = ResponseCache()
 
         self.permitTojoin = permitTojoin
 
@@ -148,6 +157,28 @@ class WebServer(object):
     def update_networkmap(self, networkmap):
         self.networkmap = networkmap
 
+    def update_devicesIndex(self, devicesIndex):
+        self.devicesIndex = devicesIndex
+
+    def update_heartbeatScheduler(self, heartbeatScheduler):
+        self.heartbeatScheduler = heartbeatScheduler
+
+    def update_resetScheduler(self, resetScheduler):
+        self.resetScheduler = resetScheduler
+
+    def update_deviceTouches(self, deviceTouches):
+        self.deviceTouches = deviceTouches
+
+    def update_deviceChanges(self, deviceChanges):
+        self.deviceChanges = deviceChanges
+
+    def invalidate_cache(self):
+        self.responseCache.invalidate()
+
+    def cache_generation(self):
+        # The cached REST responses are built from ListOfDevices and the settings
+        return (self.responseCache.generation, self.deviceChanges.generation if self.deviceChanges else 0)
+
     def add_element_to_devices_in_pairing_mode( self, nwkid):
         if nwkid not in self.DevicesInPairingMode:
             self.DevicesInPairingMode.append( nwkid )
@@ -263,56 +294,32 @@ class WebServer(object):
             _response["Data"] = json.dumps(self.pluginParameters, sort_keys=True)
         return _response
 
+    def energy_reports(self):
+        # Reports of the Network Energy scans, kept in memory by NetworkEnergy
+        if self.networkenergy:
+            return self.networkenergy.reports
+        if self.energyReports is None:
+            self.energyReports = EnergyReportStore(
+                self.pluginconf.pluginConf["pluginReports"] + "NetworkEnergy-v3-" + "%02d" % self.hardwareID + ".json"
+            )
+        return self.energyReports
+
     def rest_nwk_stat(self, verb, data, parameters):
 
         _response = prepResponseMessage(self, setupHeadersResponse())
         _response["Headers"]["Content-Type"] = "application/json; charset=utf-8"
-        _filename = self.pluginconf.pluginConf["pluginReports"] + "NetworkEnergy-v3-" + "%02d" % self.hardwareID + ".json"
-
-        _timestamps_lst = []  # Just the list of Timestamps
-        _scan = {}
-        if os.path.isfile(_filename):
-            self.logging("Debug", "Opening file: %s" % _filename)
-            with open(_filename, "rt") as handle:
-                for line in handle:
-                    if line[0] != "{" and line[-1] != "}":
-                        continue
-
-                    entry = json.loads(line)
-                    for _ts in entry:
-                        _timestamps_lst.append(_ts)
-                        _scan[_ts] = entry[_ts]
+        reports = self.energy_reports()
 
         if verb == "DELETE":
             if len(parameters) == 0:
                 # os.remove( _filename )
-                action = {"Name": "File-Removed", "FileName": _filename}
+                action = {"Name": "File-Removed", "FileName": reports.filename}
                 _response["Data"] = json.dumps(action, sort_keys=True)
 
             elif len(parameters) == 1:
                 timestamp = parameters[0]
-                if timestamp in _timestamps_lst:
-                    self.logging("Debug", "Removing Report: %s from %s records" % (timestamp, len(_timestamps_lst)))
-                    with open(_filename, "r+") as handle:
-                        d = handle.readlines()
-                        handle.seek(0)
-                        for line in d:
-                            if not (line[0] == "{" or line[-1] == "}"):
-                                handle.write(line)
-                                continue
-
-                            entry = json.loads(line)
-                            entry_ts = entry.keys()
-                            if len(entry_ts) == 1:
-                                if timestamp in entry_ts:
-                                    self.logging("Debug", "--------> Skiping %s" % timestamp)
-                                    continue
-
-                            else:
-                                continue
-                            handle.write(line)
-                        handle.truncate()
-
+                if reports.delete(timestamp):
+                    self.logging("Debug", "Removing Report: %s" % timestamp)
                     action = {"Name": "Report %s removed" % timestamp}
                     _response["Data"] = json.dumps(action, sort_keys=True)
                 else:
@@ -321,17 +328,13 @@ class WebServer(object):
 
         elif verb == "GET":
             if len(parameters) == 0:
-                _response["Data"] = json.dumps(_timestamps_lst, sort_keys=True)
+                _response["Data"] = json.dumps(reports.timestamps(), sort_keys=True)
 
             elif len(parameters) == 1:
-                timestamp = parameters[0]
-                if timestamp in _scan:
-                    for r in _scan[timestamp]:
-                        self.logging("Debug", "report: %s" % r)
-                        if r["_NwkId"] == "0000":
-                            _response["Data"] = json.dumps(r["MeshRouters"], sort_keys=True)
-                else:
-                    _response["Data"] = json.dumps([], sort_keys=True)
+                # A timestamp, or latest for the last scan ( results received so far, if it is in progress )
+                timestamp = reports.latest() if parameters[0] == "latest" else parameters[0]
+                meshRouters = reports.mesh_routers(timestamp, "0000")
+                _response["Data"] = json.dumps(meshRouters if meshRouters is not None else [], sort_keys=True)
 
         return _response
 
@@ -388,9 +391,11 @@ class WebServer(object):
 
             Statistics["MaxTimeSpentInForwarder"] = self.statistics._maxRxProcesses
             Statistics["AvgTimeSpentInForwarder"] = self.statistics._averageRxProcess
+            Statistics["Histograms"] = self.statistics.histograms()
 
             Statistics["CRC"] = self.statistics._crcErrors
             Statistics["FrameErrors"] = self.statistics._frameErrors
+            Statistics["DroppedBytes"] = self.statistics._droppedBytes
             Statistics["Sent"] = self.statistics._sent
             Statistics["Received"] = self.statistics._received
             Statistics["Cluster"] = self.statistics._clusterOK
@@ -401,12 +406,19 @@ class WebServer(object):
             Statistics["CurrentLoad"] = self.ZigateComm.loadTransmit()
             Statistics["MaxLoad"] = self.statistics._MaxLoad
             Statistics["StartTime"] = self.statistics._start
+            Statistics["InFlightWindow"] = self.ZigateComm.max_in_flight
+            Statistics["CommandsCompleted"] = self.statistics._completedCommands
+            Statistics["CmdPerSecond"] = self.statistics.commands_per_second()
+            Statistics["RateControl"] = self.statistics.rate_control()
 
             Statistics["MaxApdu"] = self.statistics._MaxaPdu
             Statistics["MaxNpdu"] = self.statistics._MaxnPdu
 
             Statistics["ForwardedQueueCurrentSize"] = self.ZigateComm.get_forwarder_queue()
             Statistics["WriterQueueCurrentSize"] = self.ZigateComm.get_writer_queue()
+            Statistics["WriterQueue"] = self.ZigateComm.writer_queue_statistics()
+            Statistics["Forwarder"] = self.statistics.forwarder()
+            Statistics["SqnMaps"] = self.ZigateComm.sqn_statistics()
             
             _nbitems = len(self.statistics.TrendStats)
             minTS = 0
@@ -439,6 +451,25 @@ class WebServer(object):
 
         # LogErrorHistory . Hardcode on the UI side
         Statistics["Error"] = self.log.is_new_error()
+        Statistics["Logging"] = self.log.logging_statistics()
+        if self.heartbeatScheduler:
+            Statistics["Scheduler"] = self.heartbeatScheduler.statistics()
+        if self.resetScheduler:
+            Statistics["ResetScheduler"] = self.resetScheduler.statistics()
+        if self.deviceTouches:
+            Statistics["DeviceTouches"] = self.deviceTouches.statistics()
+        if self.deviceChanges:
+            Statistics["DeviceChanges"] = self.deviceChanges.statistics()
+        if self.networkmap:
+            Statistics["NetworkMap"] = self.networkmap.statistics()
+        if self.networkenergy:
+            Statistics["NetworkEnergy"] = self.networkenergy.statistics()
+        Statistics["WebCache"] = self.responseCache.statistics()
+        Statistics["Decoders"] = {
+            "Input": INPUT_DECODERS.statistics(),
+            "Messages": MESSAGE_DECODERS.statistics(),
+            "Clusters": CLUSTER_DECODERS.statistics(),
+        }
         _response = prepResponseMessage(self, setupHeadersResponse())
         _response["Headers"]["Content-Type"] = "application/json; charset=utf-8"
         if verb == "GET":
@@ -839,6 +870,8 @@ class WebServer(object):
                                     "Updating Param to %s for IEEE: %s NWKID: %s" % (self.ListOfDevices[dev]["Param"], self.ListOfDevices[dev]["IEEE"], dev),
                                 )
                                 self.ListOfDevices[dev]["CheckParam"] = True
+                                if self.heartbeatScheduler:
+                                    self.heartbeatScheduler.wake(dev)
                 else:
                     Domoticz.Error("wrong data received: %s" % data)
 
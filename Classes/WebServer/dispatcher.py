@@ -8,6 +8,7 @@ import json
 
 import Domoticz
 from Classes.WebServer.headerResponse import prepResponseMessage, setupHeadersResponse
+from Classes.WebServer.tools import is_not_modified
 
 # from Classes.WebServer.rest_Bindings import rest_bindLSTcluster, rest_bindLSTdevice, rest_binding, rest_unbinding
 # from Classes.WebServer.rest_Topology import rest_netTopologie, rest_req_topologie
@@ -22,11 +23,11 @@ from Classes.WebServer.headerResponse import prepResponseMessage, setupHeadersRe
 # from Classes.WebServer.rest_Provisioning import rest_new_hrdwr, rest_rcv_nw_hrdwr, rest_full_reprovisionning
 
 
-def do_rest(self, Connection, verb, data, version, command, parameters):
+def do_rest(self, Connection, verb, data, version, command, parameters, Headers=None):
 
     REST_COMMANDS = {
-        "bind-lst-cluster": {"Name": "bind-lst-cluster", "Verbs": {"GET"}, "function": self.rest_bindLSTcluster},
-        "bind-lst-device": {"Name": "bind-lst-device", "Verbs": {"GET"}, "function": self.rest_bindLSTdevice},
+        "bind-lst-cluster": {"Name": "bind-lst-cluster", "Verbs": {"GET"}, "function": self.rest_bindLSTcluster, "Cache": True},
+        "bind-lst-device": {"Name": "bind-lst-device", "Verbs": {"GET"}, "function": self.rest_bindLSTdevice, "Cache": True},
         "binding": {"Name": "binding", "Verbs": {"PUT"}, "function": self.rest_binding},
         "binding-table-req": {"Name": "binding", "Verbs": {"GET"}, "function": self.rest_binding_table_req},
         "binding-table-disp": {"Name": "binding", "Verbs": {"GET"}, "function": self.rest_binding_table_disp},
@@ -47,7 +48,7 @@ def do_rest(self, Connection, verb, data, version, command, parameters):
             "Verbs": {"GET"},
             "function": self.rest_logErrorHistoryClear,
         },
-        "dev-cap": {"Name": "dev-cap", "Verbs": {"GET"}, "function": self.rest_dev_capabilities},
+        "dev-cap": {"Name": "dev-cap", "Verbs": {"GET"}, "function": self.rest_dev_capabilities, "Cache": True},
         "dev-command": {"Name": "dev-command", "Verbs": {"PUT"}, "function": self.rest_dev_command},
         "device": {"Name": "device", "Verbs": {"GET"}, "function": self.rest_Device},
         "domoticz-env": {"Name": "domoticz-env", "Verbs": {"GET"}, "function": self.rest_domoticz_env},
@@ -85,19 +86,20 @@ def do_rest(self, Connection, verb, data, version, command, parameters):
             "Verbs": {"PUT"},
             "function": self.rest_scan_devices_for_group,
         },
-        "setting-debug": {"Name": "setting", "Verbs": {"GET", "PUT"}, "function": self.rest_Settings_with_debug},
-        "setting": {"Name": "setting", "Verbs": {"GET", "PUT"}, "function": self.rest_Settings_wo_debug},
+        "setting-debug": {"Name": "setting", "Verbs": {"GET", "PUT"}, "function": self.rest_Settings_with_debug, "Cache": True},
+        "setting": {"Name": "setting", "Verbs": {"GET", "PUT"}, "function": self.rest_Settings_wo_debug, "Cache": True},
         "sw-reset-zigate": {"Name": "sw-reset-zigate", "Verbs": {"GET"}, "function": self.rest_reset_zigate},
         "topologie": {"Name": "topologie", "Verbs": {"GET", "DELETE"}, "function": self.rest_netTopologie},
         "unbinding": {"Name": "unbinding", "Verbs": {"PUT"}, "function": self.rest_unbinding},
         "unbinding-group": {"Name": "unbinding-group", "Verbs": {"PUT"}, "function": self.rest_group_unbinding},
-        "zdevice-name": {"Name": "zdevice-name", "Verbs": {"GET", "PUT", "DELETE"}, "function": self.rest_zDevice_name},
-        "zdevice-raw": {"Name": "zdevice-raw", "Verbs": {"GET", "PUT"}, "function": self.rest_zDevice_raw},
-        "zdevice": {"Name": "zdevice", "Verbs": {"GET", "DELETE"}, "function": self.rest_zDevice},
+        "zdevice-name": {"Name": "zdevice-name", "Verbs": {"GET", "PUT", "DELETE"}, "function": self.rest_zDevice_name, "Cache": True},
+        "zdevice-raw": {"Name": "zdevice-raw", "Verbs": {"GET", "PUT"}, "function": self.rest_zDevice_raw, "Cache": True},
+        "zdevice": {"Name": "zdevice", "Verbs": {"GET", "DELETE"}, "function": self.rest_zDevice, "Cache": True},
         "zgroup-list-available-device": {
             "Name": "zgroup-list-available-device",
             "Verbs": {"GET"},
             "function": self.rest_zGroup_lst_avlble_dev,
+            "Cache": True,
         },
         "zgroup": {"Name": "device", "Verbs": {"GET", "PUT"}, "function": self.rest_zGroup},
         "zigate-erase-PDM": {"Name": "zigate-erase-PDM", "Verbs": {"GET"}, "function": self.rest_zigate_erase_PDM},
@@ -108,6 +110,7 @@ def do_rest(self, Connection, verb, data, version, command, parameters):
     self.logging("Debug", "do_rest - Verb: %s, Command: %s, Param: %s" % (verb, command, parameters))
 
     HTTPresponse = {}
+    cacheEntry = None
 
     if command in REST_COMMANDS and verb in REST_COMMANDS[command]["Verbs"]:
         HTTPresponse = setupHeadersResponse()
@@ -131,6 +134,9 @@ def do_rest(self, Connection, verb, data, version, command, parameters):
             _response["Data"] = json.dumps(_data)
             HTTPresponse = _response
 
+        elif version == "1" and REST_COMMANDS[command]["function"] and is_cacheable(self, verb, REST_COMMANDS[command]):
+            HTTPresponse, cacheEntry = cached_rest_response(self, REST_COMMANDS[command]["function"], verb, data, command, parameters)
+
         elif version == "1" and REST_COMMANDS[command]["function"]:
             HTTPresponse = REST_COMMANDS[command]["function"](verb, data, parameters)
 
@@ -145,8 +151,52 @@ def do_rest(self, Connection, verb, data, version, command, parameters):
         HTTPresponse["Data"] = "Unknown REST command: %s" % command
         HTTPresponse["Headers"]["Content-Type"] = "text/plain; charset=utf-8"
 
+    if verb != "GET" and self.responseCache:
+        # Settings or devices may have been updated
+        self.responseCache.invalidate()
+        if self.deviceChanges:
+            self.deviceChanges.all_updated()
+
+    if cacheEntry and is_not_modified(Headers, cacheEntry):
+        self.responseCache.not_modified += 1
+        HTTPresponse = {"Status": "304 Not Modified", "Headers": dict(cacheEntry.headers)}
+
     self.logging("Debug", "==> sending HTTPresponse: %s to %s" % (HTTPresponse, Connection))
-    self.sendResponse(Connection, HTTPresponse)
+    AcceptEncoding = Headers.get("Accept-Encoding") if (Headers and cacheEntry) else None
+    self.sendResponse(Connection, HTTPresponse, AcceptEncoding=AcceptEncoding, CacheEntry=cacheEntry)
+
+
+def is_cacheable(self, verb, rest_command):
+    return (
+        verb == "GET"
+        and rest_command.get("Cache", False)
+        and self.pluginconf.pluginConf["enableCache"]
+        and self.responseCache is not None
+    )
+
+
+def cached_rest_response(self, function, verb, data, command, parameters):
+    # Return the REST response and its CacheEntry, the payload is only rebuilt if the generation has changed
+    key = (command, tuple(parameters))
+    generation = self.cache_generation()
+    cacheEntry = self.responseCache.get_rest(key, generation)
+    if cacheEntry is None:
+        HTTPresponse = function(verb, data, parameters)
+        if (
+            not HTTPresponse
+            or HTTPresponse.get("Status") != "200 OK"
+            or not isinstance(HTTPresponse.get("Data"), (str, bytes))
+        ):
+            return HTTPresponse, None
+
+        # The browser must revalidate with the ETag, but can keep the response
+        HTTPresponse["Headers"]["Cache-Control"] = "no-cache"
+        HTTPresponse["Headers"].pop("Pragma", None)
+        HTTPresponse["Headers"].pop("Expires", None)
+        cacheEntry = self.responseCache.store_rest(key, generation, HTTPresponse)
+        cacheEntry.headers["ETag"] = cacheEntry.etag
+
+    return {"Status": "200 OK", "Headers": dict(cacheEntry.headers), "Data": cacheEntry.data}, cacheEntry
 
 
 def do_nothing(self, verb, data, parameters):
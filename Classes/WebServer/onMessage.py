@@ -13,7 +13,7 @@ from urllib.parse import urlparse
 import Domoticz
 from Classes.WebServer.headerResponse import (prepResponseMessage,
                                               setupHeadersResponse)
-from Classes.WebServer.tools import MAX_KB_TO_SEND, DumpHTTPResponseToLog
+from Classes.WebServer.tools import MAX_KB_TO_SEND, DumpHTTPResponseToLog, is_not_modified
 
 
 def onMessage(self, Connection, Data):
@@ -62,7 +62,9 @@ def onMessage(self, Connection, Data):
         )
         if parsed_query[0] == "rest-zigate" and parsed_query[1] == "1":
             # API Version 1
-            self.do_rest(Connection, Data["Verb"], Data["Data"], parsed_query[1], parsed_query[2], parsed_query[3:])
+            self.do_rest(
+                Connection, Data["Verb"], Data["Data"], parsed_query[1], parsed_query[2], parsed_query[3:], Headers=Data["Headers"]
+            )
         else:
             Domoticz.Error("Unknown API  %s" % parsed_query)
             headerCode = "400 Bad Request"
@@ -72,7 +74,8 @@ def onMessage(self, Connection, Data):
     # Finaly we simply has to serve a File.
     webFilename = self.homedirectory + "www" + Data["URL"]
     self.logging("Debug", "webFilename: %s" % webFilename)
-    if not os.path.isfile(webFilename):
+    useCache = self.pluginconf.pluginConf["enableCache"] and self.responseCache is not None
+    if not (useCache and self.responseCache.has_static(webFilename)) and not os.path.isfile(webFilename):
         webFilename = self.homedirectory + "www" + "/index.html"
         self.logging("Debug", "Redirecting to /index.html")
 
@@ -91,7 +94,17 @@ def onMessage(self, Connection, Data):
         _response["Headers"]["Cache-Control"] = "private"
 
     self.logging("Debug", "Opening: %s" % webFilename)
-    currentVersionOnServer = os.path.getmtime(webFilename)
+    cacheEntry = None
+    if useCache:
+        cacheEntry = self.responseCache.get_static(webFilename)
+        if cacheEntry is None:
+            webFilename = self.homedirectory + "www" + "/index.html"
+            self.logging("Debug", "Redirecting to /index.html")
+            cacheEntry = self.responseCache.get_static(webFilename)
+        currentVersionOnServer = cacheEntry.mtime
+        _response["Headers"]["ETag"] = cacheEntry.etag
+    else:
+        currentVersionOnServer = os.path.getmtime(webFilename)
     _lastmodified = strftime("%a, %d %m %y %H:%M:%S GMT", gmtime(currentVersionOnServer))
 
     # Check Referrrer
@@ -101,6 +114,13 @@ def onMessage(self, Connection, Data):
 
     # Can we use Cache if exists
     if self.pluginconf.pluginConf["enableCache"]:
+        if cacheEntry and is_not_modified(Data["Headers"], cacheEntry):
+            self.logging("Debug", "User Caching - file: %s ETag: %s" % (webFilename, cacheEntry.etag))
+            self.responseCache.not_modified += 1
+            _response["Status"] = "304 Not Modified"
+            self.sendResponse(Connection, _response)
+            return _response
+
         if "If-Modified-Since" in Data["Headers"]:
             lastVersionInCache = Data["Headers"]["If-Modified-Since"]
             self.logging("Debug", "InCache: %s versus Current: %s" % (lastVersionInCache, _lastmodified))
@@ -148,8 +168,11 @@ def onMessage(self, Connection, Data):
             Connection.Disconnect()
     else:
         _response["Headers"]["Last-Modified"] = _lastmodified
-        with open(webFilename, mode="rb") as webFile:
-            _response["Data"] = webFile.read()
+        if cacheEntry:
+            _response["Data"] = cacheEntry.data
+        else:
+            with open(webFilename, mode="rb") as webFile:
+                _response["Data"] = webFile.read()
 
         _contentType, _contentEncoding = mimetypes.guess_type(Data["URL"])
 
@@ -161,6 +184,8 @@ def onMessage(self, Connection, Data):
         _response["Status"] = "200 OK"
 
         if "Accept-Encoding" in Data["Headers"]:
-            self.sendResponse(Connection, _response, AcceptEncoding=Data["Headers"]["Accept-Encoding"])
+            self.sendResponse(
+                Connection, _response, AcceptEncoding=Data["Headers"]["Accept-Encoding"], CacheEntry=cacheEntry
+            )
         else:
             self.sendResponse(Connection, _response)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Class: ResponseCache
+
+    Description: Cache of the web server responses.
+                 - static files from www/ are kept in memory with their compressed variants, and re-checked
+                   on disk at most every STATIC_CHECK_PERIOD seconds. A file removed since is evicted.
+                 - REST payloads are kept as long as the change generation they were built for is current.
+                   The generation is bumped by the REST calls updating settings or devices and when a widget
+                   is removed, and combined by WebServer.cache_generation() with the DeviceChanges generation
+                   ( bumped at each update of a ListOfDevices entry ).
+
+    Each entry has a strong ETag, so a browser presenting it in If-None-Match gets a 304.
+"""
+
+import os
+import zlib
+from time import time
+
+STATIC_CHECK_PERIOD = 60  # Seconds between 2 checks of a static file on disk
+
+
+class CacheEntry:
+    __slots__ = ("key", "etag", "data", "encoded", "headers", "checked", "mtime")
+
+    def __init__(self, key, data, etag, headers=None, mtime=None):
+        self.key = key
+        self.data = data
+        self.etag = etag
+        self.encoded = {}  # Content-Encoding -> compressed data
+        self.headers = headers or {}
+        self.checked = time()
+        self.mtime = mtime
+
+
+class ResponseCache:
+    def __init__(self):
+        self.generation = 0
+        self._static = {}
+        self._rest = {}  # key -> (generation, CacheEntry)
+
+        # Statistics
+        self.hits = self.misses = self.not_modified = self.compressions = 0
+
+    def invalidate(self):
+        # Something has changed (ListOfDevices, settings ...), REST payloads must be rebuilt.
+        self.generation += 1
+
+    def clear(self):
+        self._static = {}
+        self._rest = {}
+        self.invalidate()
+
+    # Static files
+    def has_static(self, filename):
+        return filename in self._static
+
+    def get_static(self, filename):
+        """ return the CacheEntry of filename, (re)loading it from disk if needed, None if it can't be read """
+        entry = self._static.get(filename)
+        now = time()
+        if entry is not None and now < entry.checked + STATIC_CHECK_PERIOD:
+            self.hits += 1
+            return entry
+
+        try:
+            stat = os.stat(filename)
+            if entry is not None and entry.mtime == stat.st_mtime and len(entry.data) == stat.st_size:
+                entry.checked = now
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            with open(filename, mode="rb") as webFile:
+                data = webFile.read()
+        except OSError:
+            # Removed from disk since it has been cached
+            self._static.pop(filename, None)
+            return None
+        entry = CacheEntry(filename, data, '"%x-%x"' % (int(stat.st_mtime * 1000), stat.st_size), mtime=stat.st_mtime)
+        self._static[filename] = entry
+        return entry
+
+    # REST payloads
+    def get_rest(self, key, generation):
+        """ return the CacheEntry if it has been built for the generation, otherwise None """
+        cached = self._rest.get(key)
+        if cached is not None and cached[0] == generation:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        return None
+
+    def store_rest(self, key, generation, Response):
+        data = Response["Data"]
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        entry = CacheEntry(key, data, '"%x-%x"' % (zlib.crc32(data), len(data)), headers=dict(Response["Headers"]))
+        self._rest[key] = (generation, entry)
+        return entry
+
+    def statistics(self):
+        return {
+            "Generation": self.generation,
+            "StaticEntries": len(self._static),
+            "RestEntries": len(self._rest),
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "NotModified": self.not_modified,
+            "Compressions": self.compressions,
+        }
@@ -40,6 +40,12 @@ def rest_netTopologie(self, verb, data, parameters):
     _filename = self.pluginconf.pluginConf["pluginReports"] + "NetworkTopology-v3-" + "%02d" % self.hardwareID + ".json"
     self.logging("Debug", "Filename: %s" % _filename)
 
+    if verb == "GET" and parameters == ["scan"]:
+        # Relations found so far by the scan in progress ( or the last one )
+        _topo = extract_report(self, self.networkmap.snapshot()) if self.networkmap else []
+        _response["Data"] = json.dumps(_topo, sort_keys=True)
+        return _response
+
     if not os.path.isfile(_filename):
         _response["Data"] = json.dumps({}, sort_keys=True)
         return _response
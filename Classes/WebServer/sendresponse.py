@@ -19,7 +19,7 @@ except Exception as Err:
 from Classes.WebServer.tools import MAX_KB_TO_SEND, DumpHTTPResponseToLog
 
 
-def sendResponse(self, Connection, Response, AcceptEncoding=None):
+def sendResponse(self, Connection, Response, AcceptEncoding=None, CacheEntry=None):
 
     if "Data" not in Response:
         DumpHTTPResponseToLog(Response)
@@ -49,18 +49,15 @@ def sendResponse(self, Connection, Response, AcceptEncoding=None):
         )
         if len(Response["Data"]) > MAX_KB_TO_SEND:
             orig_size = len(Response["Data"])
+            encoding = None
             if allowdeflate and AcceptEncoding.find("deflate") != -1:
-                self.logging("Debug", "Compressing - deflate")
-                zlib_compress = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 2)
-                deflated = zlib_compress.compress(Response["Data"])
-                deflated += zlib_compress.flush()
-                Response["Headers"]["Content-Encoding"] = "deflate"
-                Response["Data"] = deflated
-
+                encoding = "deflate"
             elif allowgzip and AcceptEncoding.find("gzip") != -1:
-                self.logging("Debug", "Compressing - gzip")
-                Response["Data"] = gzip.compress(Response["Data"])
-                Response["Headers"]["Content-Encoding"] = "gzip"
+                encoding = "gzip"
+
+            if encoding:
+                Response["Data"] = compressed_data(self, Response["Data"], encoding, CacheEntry)
+                Response["Headers"]["Content-Encoding"] = encoding
 
             self.logging(
                 "Debug",
@@ -112,3 +109,24 @@ def sendResponse(self, Connection, Response, AcceptEncoding=None):
         Connection.Send(Response)
         if not self.pluginconf.pluginConf["enableKeepalive"]:
             Connection.Disconnect()
+
+
+def compressed_data(self, data, encoding, CacheEntry=None):
+    # Compression is done once per cached entry and encoding
+    if CacheEntry is not None and encoding in CacheEntry.encoded:
+        return CacheEntry.encoded[encoding]
+
+    if encoding == "deflate":
+        self.logging("Debug", "Compressing - deflate")
+        zlib_compress = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 2)
+        compressed = zlib_compress.compress(data)
+        compressed += zlib_compress.flush()
+    else:
+        self.logging("Debug", "Compressing - gzip")
+        compressed = gzip.compress(data)
+
+    if CacheEntry is not None:
+        CacheEntry.encoded[encoding] = compressed
+        if self.responseCache:
+            self.responseCache.compressions += 1
+    return compressed
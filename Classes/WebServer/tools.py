@@ -14,6 +14,11 @@ def keepConnectionAlive(self):
     self.heartbeats += 1
 
 
+def is_not_modified(Headers, CacheEntry):
+    # The browser already has this version of the response
+    return Headers is not None and Headers.get("If-None-Match") == CacheEntry.etag
+
+
 def DumpHTTPResponseToLog(httpDict):
 
     if not DEBUG_HTTP:
@@ -29,6 +29,7 @@ from Modules.schneider_wiser import (schneider_EHZBRTS_thermoMode,
                                      schneider_set_contract,
                                      schneider_temp_Setcurrent)
 from Modules.thermostats import thermostat_Mode, thermostat_Setpoint
+from Modules.tools import reset_heartbeat
 from Modules.tuya import (tuya_curtain_lvl, tuya_curtain_openclose,
                           tuya_dimmer_dimmer, tuya_dimmer_onoff,
                           tuya_energy_onoff, tuya_garage_door_action,
@@ -251,11 +252,11 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             #sendZigateCmd(self, "0083", "02" + NWKID + ZIGATE_EP + EPout + "02")
 
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
     if Command == "Off":  # Manage the Off command.
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
         self.log.logging(
             "Command",
@@ -301,7 +302,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 0, "Off", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "LivoloSWR":
@@ -309,14 +310,14 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 0, "Off", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "DoorLock":
             # Widget Doorlock seems to work in the oposit
             cluster0101_unlock_door(self, NWKID)
             UpdateDevice_v2(self, Devices, Unit, 0, "Closed", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType in ("ThermoMode", "ACMode", "ThermoMode_3"):
@@ -341,7 +342,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             )
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == ("ThermoMode_2", ):
@@ -374,7 +375,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             schneider_EHZBRTS_thermoMode(self, NWKID, 0)
             UpdateDevice_v2(self, Devices, Unit, 0, "Off", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType in ("ACMode_2", "FanControl"):
@@ -489,11 +490,11 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 0, "Off", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
     if Command == "On":  # Manage the On command.
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
         self.log.logging(
             "Command",
             "Debug",
@@ -543,20 +544,20 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             livolo_OnOff(self, NWKID, EPout, "Left", "On")
             UpdateDevice_v2(self, Devices, Unit, 1, "On", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "LivoloSWR":
             livolo_OnOff(self, NWKID, EPout, "Right", "On")
             UpdateDevice_v2(self, Devices, Unit, 1, "On", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "DoorLock":
             cluster0101_lock_door(self, NWKID)
             UpdateDevice_v2(self, Devices, Unit, 1, "Open", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
-            self.ListOfDevices[NWKID]["Heartbeat"] = 0
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "LvlControl" and _model_name == "TS0601-dimmer":
@@ -616,7 +617,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 1, "On", BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
     if Command == "Set Level":
         # Level is normally an integer but may be a floating point number if the Unit is linked to a thermostat device
@@ -646,7 +647,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 0, str(Level), BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "TempSetCurrent":
@@ -666,7 +667,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 0, str(Level), BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev)
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "ThermoModeEHZBRTS":
@@ -677,7 +678,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             )
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "HACTMODE":
@@ -712,7 +713,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                 Domoticz.Error("Unknown mode %s for HACTMODE for device %s" % (Level, NWKID))
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "LegranCableMode":
@@ -727,7 +728,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(
                 self, Devices, Unit, int(Level), Level, BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev
             )
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "ContractPower":
@@ -773,7 +774,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                     )
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "FIP":
@@ -839,7 +840,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                     )
 
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType in ("ThermoMode_3", ): 
@@ -864,7 +865,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                     self, Devices, Unit, int(Level) // 10, Level, BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev
                 )
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
 
@@ -889,7 +890,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                     self, Devices, Unit, int(Level) // 10, Level, BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev
                 )
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "ACMode":
@@ -917,7 +918,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
                     self, Devices, Unit, int(Level) // 10, Level, BatteryLevel, SignalLevel, ForceUpdate_=forceUpdateDev
                 )
             # Let's force a refresh of Attribute in the next Heartbeat
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
             return
 
         if DeviceType == "ThermoMode_2":
@@ -979,7 +980,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
 
             if Level in FAN_MODE:
                 change_fan_mode(self, NWKID, EPout, FAN_MODE[Level])
-            self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+            reset_heartbeat(self, NWKID)
 
         if DeviceType == "ACSwing":
             if Level == 10:
@@ -1172,7 +1173,7 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             UpdateDevice_v2(self, Devices, Unit, 1, str(Level), BatteryLevel, SignalLevel)
 
         # Let's force a refresh of Attribute in the next Heartbeat
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
     if Command == "Set Color":
 
@@ -1190,6 +1191,6 @@ def mgtCommand(self, Devices, Unit, Command, Level, Color):
             NWKID,
         )
         actuator_setcolor(self, NWKID, EPout, Level, Color)
-        self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+        reset_heartbeat(self, NWKID)
 
         UpdateDevice_v2(self, Devices, Unit, 1, str(Level), BatteryLevel, SignalLevel, str(Color))
@@ -10,15 +10,20 @@
 
 """
 
+import ast
 import json
 import os.path
+import pickle
 import time
 from typing import Dict
 
 import Domoticz
 
 import Modules.tools
-from Modules.manufacturer_code import check_and_update_manufcode
+from Classes.DeviceConfCache import (deviceconf_signature, load_compiled_deviceconf,
+                                     store_compiled_deviceconf)
+from Classes.DeviceRecord import DeviceRecord, plain_dict
+from Modules.manufacturer_code import update_manufcode
 
 ZIGATE_ATTRIBUTES = {
     "Version",
@@ -94,6 +99,9 @@ BUILD_ATTRIBUTES = (
     "DelayBindingAtPairing"
 )
 
+# Journal record of a removed entry
+JOURNAL_REMOVED = "REMOVED"
+
 MANUFACTURER_ATTRIBUTES = ("Legrand", "Schneider", "Lumi", "LUMI", "CASA.IA", "Tuya", "ZLinky")
 
 
@@ -138,6 +146,7 @@ def LoadDeviceList(self):
     # Let's check if we have a .json version. If so, we will be using it, otherwise
     # we fall back to the old fashion .txt
     jsonFormatDB = True
+    t_phase = time.time()
 
     # This can be enabled only with Domoticz version 2021.1 build 1395 and above, otherwise big memory leak
 
@@ -178,8 +187,13 @@ def LoadDeviceList(self):
 
     # Keep the Size of the DeviceList in order to check changes
     self.DeviceListSize = os.path.getsize(_DeviceListFileName)
+    t_phase = startup_phase_timing(self, "DeviceList load", t_phase)
 
+    # Single pass on all devices for the consistency checks and fixes
     for addr in self.ListOfDevices:
+        update_manufcode(self, addr)
+        update_ForceAckCommands(self, addr)
+
         # Fixing mistake done in the code.
         fixing_consumption_lumi(self, addr)
 
@@ -216,6 +230,7 @@ def LoadDeviceList(self):
         self.pluginconf.write_Settings()
 
     load_new_param_definition(self)
+    startup_phase_timing(self, "DeviceList checks", t_phase)
     self.log.logging("Database", "Status", "%s Entries loaded from %s" % (len(self.ListOfDevices), _DeviceListFileName))
 
     if Modules.tools.is_domoticz_db_available(self) and self.pluginconf.pluginConf["useDomoticzDatabase"]:
@@ -246,39 +261,90 @@ def LoadDeviceList(self):
 
 def loadTxtDatabase(self, dbName):
     res = "Success"
+    DeviceList_entries = _read_DeviceList_txt(self, dbName)
+    nb = 0
+    for key, val in DeviceList_entries.items():
+        # if key in  ( 'ffff', '0000'): continue
+        if key in ("ffff"):
+            continue
+        dlVal = _parse_DeviceList_entry(val)
+        if not isinstance(dlVal, dict):
+            Domoticz.Error("LoadDeviceList failed on %s" % val)
+            continue
+        self.log.logging("Database", "Debug2", "LoadDeviceList - " + str(key) + " => dlVal " + str(dlVal), key)
+        if not dlVal.get("Version"):
+            if key == "0000":  # Bug fixed in later version
+                continue
+            Domoticz.Error("LoadDeviceList - entry " + key + " not loaded - not Version 3 - " + str(dlVal))
+            res = "Failed"
+            continue
+        if dlVal["Version"] != "3":
+            Domoticz.Error("LoadDeviceList - entry " + key + " not loaded - not Version 3 - " + str(dlVal))
+            res = "Failed"
+            continue
+        else:
+            nb += 1
+            CheckDeviceList(self, key, dlVal)
+    return res
+
+
+def _parse_DeviceList_entry(val):
+    # The entries are Python literals (repr of a dict), there is no need (nor reason) to evaluate code
+    try:
+        return ast.literal_eval(val.strip())
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+def _read_DeviceList_line(line):
+    (key, val) = line.split(":", 1)
+    key = key.replace(" ", "")
+    key = key.replace("'", "")
+    return key, val.rstrip("\n")
+
+
+def _read_DeviceList_txt(self, dbName):
+    # Read the DeviceList snapshot, then replay the journal of changes written since the snapshot.
+    # Return an ordered dict of { NwkId: entry as a string }
+    DeviceList_entries = {}
     with open(dbName, "r") as myfile2:
         self.log.logging("Database", "Debug", "Open : " + dbName)
-        nb = 0
         for line in myfile2:
             if not line.strip():
                 # Empty line
                 continue
-            (key, val) = line.split(":", 1)
-            key = key.replace(" ", "")
-            key = key.replace("'", "")
-            # if key in  ( 'ffff', '0000'): continue
-            if key in ("ffff"):
+            key, val = _read_DeviceList_line(line)
+            if key in DeviceList_entries:
+                self.log.logging("Database", "Error", "LoadDeviceList - entry %s found twice, ignoring the last one" % key)
                 continue
-            try:
-                dlVal = eval(val)
-            except (SyntaxError, NameError, TypeError, ZeroDivisionError):
-                Domoticz.Error("LoadDeviceList failed on %s" % val)
-                continue
-            self.log.logging("Database", "Debug2", "LoadDeviceList - " + str(key) + " => dlVal " + str(dlVal), key)
-            if not dlVal.get("Version"):
-                if key == "0000":  # Bug fixed in later version
-                    continue
-                Domoticz.Error("LoadDeviceList - entry " + key + " not loaded - not Version 3 - " + str(dlVal))
-                res = "Failed"
-                continue
-            if dlVal["Version"] != "3":
-                Domoticz.Error("LoadDeviceList - entry " + key + " not loaded - not Version 3 - " + str(dlVal))
-                res = "Failed"
+            DeviceList_entries[key] = val
+
+    journalFileName = _DeviceList_journal_filename(dbName)
+    if not os.path.isfile(journalFileName):
+        return DeviceList_entries
+
+    nb_records = 0
+    with open(journalFileName, "r") as journal:
+        self.log.logging("Database", "Debug", "Open : " + journalFileName)
+        for line in journal:
+            if not line.endswith("\n"):
+                # Incomplete record, the plugin has been stopped while writing
+                self.log.logging("Database", "Error", "LoadDeviceList - incomplete journal record ignored")
+                break
+            if not line.strip():
                 continue
+            key, val = _read_DeviceList_line(line)
+            if val.strip() == JOURNAL_REMOVED:
+                DeviceList_entries.pop(key, None)
             else:
-                nb += 1
-                CheckDeviceList(self, key, val)
-    return res
+                DeviceList_entries[key] = val
+            nb_records += 1
+    self.log.logging("Database", "Log", "LoadDeviceList - %s journal records replayed from %s" % (nb_records, journalFileName))
+
+    # Compact the journal into the snapshot, so the backup versions are complete
+    _write_atomic(dbName, "".join(key + " :" + val + "\n" for key, val in DeviceList_entries.items()))
+    os.remove(journalFileName)
+    return DeviceList_entries
 
 
 def loadJsonDatabase(self, dbName):
@@ -289,9 +355,9 @@ def loadJsonDatabase(self, dbName):
             _listOfDevices = json.load(handle)
         except json.decoder.JSONDecodeError as e:
             res = "Failed"
-            Domoticz.Error("loadJsonDatabase poorly-formed %s, not JSON: %s" % (self.pluginConf["filename"], e))
+            Domoticz.Error("loadJsonDatabase poorly-formed %s, not JSON: %s" % (dbName, e))
     for key in _listOfDevices:
-        CheckDeviceList(self, key, str(_listOfDevices[key]))
+        CheckDeviceList(self, key, _listOfDevices[key])
     return res
 
 
@@ -337,7 +403,7 @@ def is_domoticz_recent(self, dz_timestamp, device_list_txt_filename):
     return False
 
 
-def WriteDeviceList(self, count):
+def WriteDeviceList(self, count, compact=False):
     if self.HBcount < count:
         self.HBcount = self.HBcount + 1
         return
@@ -349,49 +415,192 @@ def WriteDeviceList(self, count):
         )
         return
 
+    if not self.pluginconf.pluginConf["journalDeviceList"]:
+        if self.pluginconf.pluginConf["expJsonDatabase"]:
+            _write_DeviceList_json(self)
+        _write_DeviceList_txt(self)
+        if Modules.tools.is_domoticz_db_available(self) and self.pluginconf.pluginConf["useDomoticzDatabase"]:
+            # We need to patch None as 'None'
+            if _write_DeviceList_Domoticz(self) is None:
+                # An error occured. Probably Dz.Configuration() is not available.
+                _write_DeviceList_txt(self)
+        self.HBcount = 0
+        return
+
+    # Only the entries marked as updated are read again. At the first flush and at compaction all entries are
+    # read, which also catches an update done without marking the entry.
+    full = compact or not self.DeviceListPersisted
+    updated_entries, removed_entries = _DeviceList_all_changes(self) if full else _DeviceList_changes(self)
+    self.HBcount = 0
+    if not updated_entries and not removed_entries:
+        if compact and self.DeviceListJournalSize:
+            # Nothing new, but the journal has to be merged into the snapshot
+            _write_DeviceList_txt(self)
+            return
+        self.log.logging("Database", "Debug", "WriteDeviceList - nothing has changed since last flush")
+        return
+
+    self.log.logging(
+        "Database",
+        "Debug",
+        "WriteDeviceList - %s updated and %s removed entries" % (len(updated_entries), len(removed_entries)),
+    )
     if self.pluginconf.pluginConf["expJsonDatabase"]:
-        _write_DeviceList_json(self)
+        if full:
+            _write_DeviceList_json(self)
+        else:
+            _write_DeviceList_json(self, updated_entries, removed_entries)
 
-    _write_DeviceList_txt(self)
+    if full:
+        _write_DeviceList_txt(self)
+    else:
+        _write_DeviceList_journal(self, updated_entries, removed_entries)
 
     if Modules.tools.is_domoticz_db_available(self) and self.pluginconf.pluginConf["useDomoticzDatabase"]:
         # We need to patch None as 'None'
-        if _write_DeviceList_Domoticz(self) is None:
+        if _write_DeviceList_Domoticz(self, self.DeviceListPersisted) is None:
             # An error occured. Probably Dz.Configuration() is not available.
             _write_DeviceList_txt(self)
 
-    self.HBcount = 0
+
+def _DeviceList_changes(self):
+    # str() only the entries marked as updated since the last flush, and compare them with what has been persisted.
+    # DeviceListPersisted is updated, and the updated entries and the removed NwkIds are returned.
+    marked = self.deviceChanges.take()
+    if marked is None:
+        return _DeviceList_all_changes(self)
+
+    updated_entries = []
+    removed_entries = []
+    for key in marked:
+        record = self.ListOfDevices.get(key)
+        if record is not None:
+            entry = str(record)
+            if self.DeviceListPersisted.get(key) != entry:
+                self.DeviceListPersisted[key] = entry
+                updated_entries.append(key)
+        elif key in self.DeviceListPersisted:
+            del self.DeviceListPersisted[key]
+            removed_entries.append(key)
+    return updated_entries, removed_entries
+
+
+def _DeviceList_all_changes(self):
+    # Same as _DeviceList_changes(), for all entries
+    self.deviceChanges.take()
+    DeviceList_entries = {key: str(self.ListOfDevices[key]) for key in list(self.ListOfDevices)}
+    updated_entries = [key for key in DeviceList_entries if self.DeviceListPersisted.get(key) != DeviceList_entries[key]]
+    removed_entries = [key for key in self.DeviceListPersisted if key not in DeviceList_entries]
+    self.DeviceListPersisted = DeviceList_entries
+    return updated_entries, removed_entries
+
+
+def _DeviceList_journal_filename(DeviceListFileName):
+    return DeviceListFileName[:-3] + "journal"
+
+
+def _write_atomic(filename, content):
+    # Write in a temporary file and then rename, so we never end up with a truncated file
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wt") as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_filename, filename)
+
+
+def _write_DeviceList_journal(self, updated_entries, removed_entries):
+    # Append only the changed entries to the journal. The journal is compacted into the DeviceList snapshot
+    # at the first flush, when it becomes larger than the snapshot, and at plugin stop.
+    _DeviceListFileName = self.pluginconf.pluginConf["pluginData"] + self.DeviceListName
+    journalFileName = _DeviceList_journal_filename(_DeviceListFileName)
+
+    records = "".join("%s : %s\n" % (key, JOURNAL_REMOVED) for key in removed_entries)
+    records += "".join("%s : %s\n" % (key, self.DeviceListPersisted[key]) for key in updated_entries)
+
+    if not os.path.isfile(_DeviceListFileName) or self.DeviceListJournalSize + len(records) > self.DeviceListSize:
+        _write_DeviceList_txt(self)
+        return
+
+    try:
+        with open(journalFileName, "at") as journal:
+            journal.write(records)
+    except IOError:
+        Domoticz.Error("Error while writing plugin Database journal %s" % journalFileName)
+        _write_DeviceList_txt(self)
+        return
+
+    self.DeviceListJournalSize += len(records)
+    self.log.logging(
+        "Database", "Debug", "WriteDeviceList - %s bytes appended to %s" % (len(records), journalFileName)
+    )
 
 
 def _write_DeviceList_txt(self):
-    # Write in classic format ( .txt )
+    # Write in classic format ( .txt ), from the entries of the last flush
     _DeviceListFileName = self.pluginconf.pluginConf["pluginData"] + self.DeviceListName
+    if not self.pluginconf.pluginConf["journalDeviceList"]:
+        self.DeviceListPersisted = {key: str(self.ListOfDevices[key]) for key in list(self.ListOfDevices)}
     try:
-        self.log.logging("Database", "Debug", "Write " + _DeviceListFileName + " = " + str(self.ListOfDevices))
-        with open(_DeviceListFileName, "wt") as file:
-            for key in self.ListOfDevices:
-                try:
-                    file.write(key + " : " + str(self.ListOfDevices[key]) + "\n")
-                except IOError:
-                    Domoticz.Error("Error while writing to plugin Database %s" % _DeviceListFileName)
+        self.log.debug("Database", "Write %s = %s", _DeviceListFileName, self.ListOfDevices)
+        content = "".join(key + " : " + entry + "\n" for key, entry in self.DeviceListPersisted.items())
+        _write_atomic(_DeviceListFileName, content)
+        journalFileName = _DeviceList_journal_filename(_DeviceListFileName)
+        if os.path.isfile(journalFileName):
+            os.remove(journalFileName)
+        self.DeviceListJournalSize = 0
+        self.DeviceListSize = len(content)
         self.log.logging("Database", "Debug", "WriteDeviceList - flush Plugin db to %s" % _DeviceListFileName)
-    except IOError:
+    except (IOError, OSError):
         Domoticz.Error("Error while Writing plugin Database %s" % _DeviceListFileName)
+        # Everything will be written again at the next flush
+        self.DeviceListPersisted = {}
 
 
-def _write_DeviceList_json(self):
+def _DeviceList_json_entry(record):
+    # JSON of an entry, as nested in the DeviceList JSON document
+    return json.dumps(record, sort_keys=True, indent=2).replace("\n", "\n  ")
+
+
+def _write_DeviceList_json(self, updated_entries=None, removed_entries=()):
+    # The JSON of each entry is kept, so only the updated entries are encoded again. All entries are encoded when
+    # updated_entries is None.
     _DeviceListFileName = self.pluginconf.pluginConf["pluginData"] + self.DeviceListName[:-3] + "json"
-    self.log.logging("Database", "Debug", "Write " + _DeviceListFileName + " = " + str(self.ListOfDevices))
-    with open(_DeviceListFileName, "wt") as file:
-        json.dump(self.ListOfDevices, file, sort_keys=True, indent=2)
+    self.log.debug("Database", "Write %s = %s", _DeviceListFileName, self.ListOfDevices)
+    if updated_entries is None:
+        self.DeviceListJson = {key: _DeviceList_json_entry(self.ListOfDevices[key]) for key in list(self.ListOfDevices)}
+    else:
+        for key in removed_entries:
+            self.DeviceListJson.pop(key, None)
+        for key in updated_entries:
+            if key in self.ListOfDevices:
+                self.DeviceListJson[key] = _DeviceList_json_entry(self.ListOfDevices[key])
+
+    # Same document as json.dump(self.ListOfDevices, file, sort_keys=True, indent=2)
+    if self.DeviceListJson:
+        content = "{\n%s\n}" % ",\n".join(
+            "  %s: %s" % (json.dumps(key), self.DeviceListJson[key]) for key in sorted(self.DeviceListJson)
+        )
+    else:
+        content = "{}"
+    _write_atomic(_DeviceListFileName, content)
     self.log.logging("Database", "Debug", "WriteDeviceList - flush Plugin db to %s" % _DeviceListFileName)
 
 
-def _write_DeviceList_Domoticz(self):
-    ListOfDevices_for_save = self.ListOfDevices.copy()
+def DeviceList_Domoticz_item(self, DeviceList_entries=None):
+    # Records hold native values, Domoticz must be given their historical representation. The configuration item
+    # is the str() of ListOfDevices, which is built from the str() of each entry when they are given.
+    if DeviceList_entries is None:
+        return {key: plain_dict(value) for key, value in self.ListOfDevices.items()}
+    return "{%s}" % ", ".join("%r: %s" % (key, entry) for key, entry in DeviceList_entries.items())
+
+
+def _write_DeviceList_Domoticz(self, DeviceList_entries=None):
     self.log.logging("Database", "Log", "WriteDeviceList - flush Plugin db to %s" % "Domoticz")
     return Modules.tools.setConfigItem(
-        Key="ListOfDevices", Attribute="Devices", Value={"TimeStamp": time.time(), "Devices": ListOfDevices_for_save}
+        Key="ListOfDevices",
+        Attribute="Devices",
+        Value={"TimeStamp": time.time(), "Devices": DeviceList_Domoticz_item(self, DeviceList_entries)},
     )
 
 
@@ -404,13 +613,13 @@ def importDeviceConf(self):
         with open(self.pluginconf.pluginConf["pluginConfig"] + "DeviceConf.txt", "r") as myfile:
             tmpread += myfile.read().replace("\n", "")
             try:
-                self.DeviceConf = eval(tmpread)
-            except (SyntaxError, NameError, TypeError, ZeroDivisionError):
+                self.DeviceConf = ast.literal_eval(tmpread)
+            except (SyntaxError, ValueError, TypeError):
                 Domoticz.Error(
                     "Error while loading %s in line : %s"
                     % (self.pluginconf.pluginConf["pluginConfig"] + "DeviceConf.txt", tmpread)
                 )
-                return
+                return False
 
     # Remove comments
     for iterDevType in list(self.DeviceConf):
@@ -421,6 +630,11 @@ def importDeviceConf(self):
     #    Domoticz.Log("%s - %s" %(iterDevType, self.DeviceConf[iterDevType]))
 
     self.log.logging("Database", "Status", "DeviceConf loaded - %s confs loaded" %len(self.DeviceConf))
+    return True
+
+
+def _compiled_DeviceConf_filename(self):
+    return self.pluginconf.pluginConf["pluginData"] + "DeviceConf-compiled.pck"
 
 
 def importDeviceConfV2(self):
@@ -428,8 +642,16 @@ def importDeviceConfV2(self):
     from os import listdir
     from os.path import isdir, isfile, join
 
+    if self.pluginconf.pluginConf["compiledDeviceConf"]:
+        signature = deviceconf_signature(self.pluginconf.pluginConf["pluginConfig"])
+        DeviceConf = load_compiled_deviceconf(_compiled_DeviceConf_filename(self), signature)
+        if DeviceConf is not None:
+            self.DeviceConf = DeviceConf
+            self.log.logging("Database", "Status", "DeviceConf loaded from compiled cache - %s confs loaded" %len(self.DeviceConf))
+            return
+
     # Read DeviceConf for backward compatibility
-    importDeviceConf(self)
+    load_errors = not importDeviceConf(self)
 
     model_certified = self.pluginconf.pluginConf["pluginConfig"] + "Certified"
 
@@ -454,9 +676,11 @@ def importDeviceConfV2(self):
                         model_definition = json.load(handle)
                     except ValueError as e:
                         Domoticz.Error("--> JSON ConfFile: %s load failed with error: %s" % (str(filename), str(e)))
+                        load_errors = True
                         continue
                     except Exception as e:
                         Domoticz.Error("--> JSON ConfFile: %s load general error: %s" % (str(filename), str(e)))
+                        load_errors = True
                         continue
 
                 try:
@@ -475,10 +699,18 @@ def importDeviceConfV2(self):
                         )
                 except:
                     Domoticz.Error("--> Unexpected error when loading a configuration file")
+                    load_errors = True
 
     self.log.logging("Database", "Debug", "--> Config loaded: %s" % self.DeviceConf.keys())
     self.log.logging("Database", "Status", "DeviceConf loaded - %s confs loaded" %len(self.DeviceConf))
 
+    # Do not compile a configuration with errors, they must be reported at each start until fixed
+    if self.pluginconf.pluginConf["compiledDeviceConf"] and not load_errors:
+        try:
+            store_compiled_deviceconf(_compiled_DeviceConf_filename(self), signature, self.DeviceConf)
+        except (OSError, pickle.PicklingError) as e:
+            self.log.logging("Database", "Error", "Unable to write the compiled DeviceConf: %s" % e)
+
 
 def checkDevices2LOD(self, Devices):
 
@@ -563,15 +795,15 @@ def saveZigateNetworkData(self, nkwdata):
         Domoticz.Error("Error while writing Zigate Network Details%s" % json_filename)
 
 
-def CheckDeviceList(self, key, val):
+def CheckDeviceList(self, key, DeviceListVal):
     """
-    This function is call during DeviceList load
+    This function is call during DeviceList load, with the entry already parsed.
+    The checks which depend on the DeviceConf are done once all entries are loaded (see LoadDeviceList)
     """
 
     self.log.logging("Database", "Debug", "CheckDeviceList - Address search : " + str(key), key)
-    self.log.logging("Database", "Debug2", "CheckDeviceList - with value : " + str(val), key)
+    self.log.logging("Database", "Debug2", "CheckDeviceList - with value : " + str(DeviceListVal), key)
 
-    DeviceListVal = eval(val)
     # Do not load Devices in State == 'unknown' or 'left'
     if "Status" in DeviceListVal and DeviceListVal["Status"] in (
         "UNKNOW",
@@ -588,11 +820,11 @@ def CheckDeviceList(self, key, val):
 
     if Modules.tools.DeviceExist(self, key, DeviceListVal.get("IEEE", "")):
         # Do not load Devices
-        self.log.logging("Database", "Error", "Not Loading %s as no existing IEEE: %s" % (key, str(val)))
+        self.log.logging("Database", "Error", "Not Loading %s as no existing IEEE: %s" % (key, str(DeviceListVal)))
         return
 
     if key == "0000":
-        self.ListOfDevices[key] = {}
+        self.ListOfDevices[key] = DeviceRecord()
         self.ListOfDevices[key]["Status"] = ""
     else:
         Modules.tools.initDeviceInList(self, key)
@@ -624,7 +856,8 @@ def CheckDeviceList(self, key, val):
             # self.log.logging( "Database", 'Debug', "--> Attributes not existing: %s" %attribute)
             continue
 
-        self.ListOfDevices[key][attribute] = DeviceListVal[attribute]
+        # Loaded with its strings interned, see DeviceRecord
+        self.ListOfDevices[key].load(attribute, DeviceListVal[attribute])
 
         # Patching unitialize Model to empty
         if attribute == "Model" and self.ListOfDevices[key][attribute] == {}:
@@ -659,27 +892,30 @@ def CheckDeviceList(self, key, val):
                 key,
             )
 
-    check_and_update_manufcode(self)
-    check_and_update_ForceAckCommands(self)
 
+def update_ForceAckCommands(self, x):
 
-def check_and_update_ForceAckCommands(self):
+    if "Model" not in self.ListOfDevices[x]:
+        return
+    if self.ListOfDevices[x]["Model"] in ("", {}):
+        return
+    model = self.ListOfDevices[x]["Model"]
 
-    for x in self.ListOfDevices:
-        if "Model" not in self.ListOfDevices[x]:
-            continue
-        if self.ListOfDevices[x]["Model"] in ("", {}):
-            continue
-        model = self.ListOfDevices[x]["Model"]
+    if model not in self.DeviceConf:
+        return
 
-        if model not in self.DeviceConf:
-            continue
+    if "ForceAckCommands" not in self.DeviceConf[model]:
+        self.ListOfDevices[x]["ForceAckCommands"] = []
+        return
+    Domoticz.Log(" Set: %s for device %s " % (self.DeviceConf[model]["ForceAckCommands"], x))
+    self.ListOfDevices[x]["ForceAckCommands"] = list(self.DeviceConf[model]["ForceAckCommands"])
 
-        if "ForceAckCommands" not in self.DeviceConf[model]:
-            self.ListOfDevices[x]["ForceAckCommands"] = []
-            continue
-        Domoticz.Log(" Set: %s for device %s " % (self.DeviceConf[model]["ForceAckCommands"], x))
-        self.ListOfDevices[x]["ForceAckCommands"] = list(self.DeviceConf[model]["ForceAckCommands"])
+
+def startup_phase_timing(self, phase, t_start):
+    # Record the duration (ms) of a startup phase, and return the start time of the next one
+    t_end = time.time()
+    self.StartupTimings[phase] = int(1000 * (t_end - t_start))
+    return t_end
 
 
 def fixing_consumption_lumi(self, key):
@@ -144,6 +144,9 @@ def device_annoucementv2(self, Devices, MsgData, MsgLQI):
         if "WriteAttributes" in self.ListOfDevices[NwkId]:
             del self.ListOfDevices[NwkId]["WriteAttributes"]
         self.ListOfDevices[NwkId]["Status"] = "inDB"
+        # ReadAttributes and Ping are due at once
+        self.heartbeatScheduler.forget(NwkId)
+        self.heartbeatScheduler.wake(NwkId)
 
     if "ZDeviceName" in self.ListOfDevices[NwkId] and self.ListOfDevices[NwkId]["ZDeviceName"] not in ("", {}):
         message = "Device Annoucement: %s NwkId: %s Ieee: %s MacCap: %s" % (
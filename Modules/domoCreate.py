@@ -215,6 +215,7 @@ def createDomoticzWidget(
         myDev = Domoticz.Device(DeviceID=ieee, Name=widgetName, Unit=unit, Type=Type_, Subtype=Subtype_)
 
     myDev.Create()
+    self.devicesIndex.invalidate()
     ID = myDev.ID
     if myDev.ID == -1:
         self.ListOfDevices[nwkid]["Status"] = "failDB"
@@ -709,6 +710,7 @@ def CreateDomoDevice(self, Devices, NWKID):
                     Options=Options,
                 )
                 myDev.Create()
+                self.devicesIndex.invalidate()
                 ID = myDev.ID
                 if myDev.ID == -1:
                     self.ListOfDevices[NWKID]["Status"] = "failDB"
@@ -727,6 +729,7 @@ def CreateDomoDevice(self, Devices, NWKID):
                     Switchtype=0,
                 )
                 myDev.Create()
+                self.devicesIndex.invalidate()
                 ID = myDev.ID
                 if myDev.ID == -1:
                     Domoticz.Error("Domoticz widget creation failed. %s" % (str(myDev)))
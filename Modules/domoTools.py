@@ -13,7 +13,7 @@ import time
 
 import Domoticz
 
-from Modules.tools import lookupForIEEE
+from Modules.tools import device_updated, lookupForIEEE
 from Modules.widgets import SWITCH_LVL_MATRIX
 from Modules.zigateConsts import THERMOSTAT_MODE_2_LEVEL
 
@@ -165,22 +165,54 @@ def WidgetForDeviceId(self, NwkId, DeviceId):
     return WidgetType
 
 
-def ResetDevice(self, Devices, ClusterType, HbCount):
-    #
-    # Reset all Devices from the ClusterType Motion after 30s
-    #
+def reset_timeout(self, NwkId, WidgetType):
+    """ return the reset timeout of a widget, 0 if the widget is not to be reset """
 
-    now = time.time()
-    TimedOutMotion = self.pluginconf.pluginConf["resetMotiondelay"]
-    TimedOutSwitchButton = self.pluginconf.pluginConf["resetSwitchSelectorPushButton"]
+    if WidgetType in ("Motion", "Vibration"):
+        param = "resetMotiondelay"
+    elif WidgetType in SWITCH_LVL_MATRIX and SWITCH_LVL_MATRIX[WidgetType].get("ForceUpdate"):
+        param = "resetSwitchSelectorPushButton"
+    else:
+        return 0
+
+    if NwkId in self.ListOfDevices and "Param" in self.ListOfDevices[NwkId] and param in self.ListOfDevices[NwkId]["Param"]:
+        return self.ListOfDevices[NwkId]["Param"][param]
+    return self.pluginconf.pluginConf[param]
+
+
+def schedule_reset(self, Devices, NwkId, unit, WidgetType, lastupdate=None):
+    """ record the reset deadline of a Motion, Vibration or push button widget which is being updated """
+
+    TimedOut = reset_timeout(self, NwkId, WidgetType)
+    if not TimedOut:
+        return
+    if lastupdate is None:
+        lastupdate = time.time()
+    self.resetScheduler.schedule(unit, lastupdate + TimedOut, Devices[unit].ID, NwkId, WidgetType, TimedOut)
+
+
+def seed_reset_scheduler(self, Devices):
+    # Register the widgets which are On at startup, from their Domoticz LastUpdate
     for unit in list(Devices):
-        if unit not in Devices:
+        if unit not in Devices or Devices[unit].nValue == 0:
             continue
         Ieee = Devices[unit].DeviceID
         if Ieee not in self.IEEE2NWK:
             # Unknown !
             continue
 
+        # Look for the corresponding Widget
+        NWKID = self.IEEE2NWK[Ieee]
+        if NWKID not in self.ListOfDevices:
+            # If the NwkId is not found, it may have switch, let's check
+            ieee_retreived_from_nwkid = lookupForIEEE(self, NWKID, True)
+            if ieee_retreived_from_nwkid is None or Ieee != ieee_retreived_from_nwkid:
+                continue
+
+        WidgetType = WidgetForDeviceId(self, NWKID, Devices[unit].ID)
+        if WidgetType == "" or not reset_timeout(self, NWKID, WidgetType):
+            continue
+
         LUpdate = Devices[unit].LastUpdate
         try:
             LUpdate = time.mktime(time.strptime(LUpdate, "%Y-%m-%d %H:%M:%S"))
@@ -191,49 +223,42 @@ def ResetDevice(self, Devices, ClusterType, HbCount):
                 "Something wrong to decode Domoticz LastUpdate %s for Unit: %s Ieee: %s" % (LUpdate, unit, Ieee),
             )
             continue
+        schedule_reset(self, Devices, NWKID, unit, WidgetType, LUpdate)
 
-        # Look for the corresponding Widget
-        NWKID = self.IEEE2NWK[Ieee]
-        if NWKID not in self.ListOfDevices:
-            # If the NwkId is not found, it may have switch, let's check
-            ieee_retreived_from_nwkid = lookupForIEEE(self, NWKID, True)
-            if ieee_retreived_from_nwkid is None or Ieee != ieee_retreived_from_nwkid:
-                # self.log.logging( "Widget", "Error", "ResetDevice inconsistency %s/%s not in plugin db: %s, Ieee: %s" %(
-                #     NWKID, Ieee, self.ListOfDevices.keys(), str(self.IEEE2NWK) ), NWKID)
-                continue
 
-        if "Param" in self.ListOfDevices[NWKID]:
-            if "resetMotiondelay" in self.ListOfDevices[NWKID]["Param"]:
-                TimedOutMotion = self.ListOfDevices[NWKID]["Param"]["resetMotiondelay"]
-            if "resetSwitchSelectorPushButton" in self.ListOfDevices[NWKID]["Param"]:
-                TimedOutSwitchButton = self.ListOfDevices[NWKID]["Param"]["resetSwitchSelectorPushButton"]
+def ResetDevice(self, Devices, ClusterType, HbCount):
+    #
+    # Reset the Motion, Vibration and push button widgets whose deadline ( resetMotiondelay,
+    # resetSwitchSelectorPushButton ) is expired. Deadlines are recorded by MajDomoDevice.
+    #
+
+    if not self.resetScheduler.seeded:
+        seed_reset_scheduler(self, Devices)
+        self.resetScheduler.seeded = True
 
-        ID = Devices[unit].ID
-        WidgetType = ""
-        WidgetType = WidgetForDeviceId(self, NWKID, ID)
-        if WidgetType == "":
+    now = time.time()
+    for unit, deadline, WidgetId, NWKID, WidgetType, TimedOut in self.resetScheduler.pop_expired(now):
+        if unit not in Devices or Devices[unit].ID != WidgetId or NWKID not in self.ListOfDevices:
+            # Widget or device removed since
             continue
 
         SignalLevel, BatteryLvl = RetreiveSignalLvlBattery(self, NWKID)
-
-        if TimedOutMotion and WidgetType in ("Motion", "Vibration"):
-            resetMotion(self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate, TimedOutMotion)
-
-        elif TimedOutSwitchButton and WidgetType in SWITCH_LVL_MATRIX:
-            if "ForceUpdate" in SWITCH_LVL_MATRIX[WidgetType]:
-                if SWITCH_LVL_MATRIX[WidgetType]["ForceUpdate"]:
-                    resetSwitchSelectorPushButton(
-                        self,
-                        Devices,
-                        NWKID,
-                        WidgetType,
-                        unit,
-                        SignalLevel,
-                        BatteryLvl,
-                        now,
-                        LUpdate,
-                        TimedOutSwitchButton,
-                    )
+        LUpdate = deadline - TimedOut
+        if WidgetType in ("Motion", "Vibration"):
+            resetMotion(self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate, TimedOut)
+        else:
+            resetSwitchSelectorPushButton(
+                self,
+                Devices,
+                NWKID,
+                WidgetType,
+                unit,
+                SignalLevel,
+                BatteryLvl,
+                now,
+                LUpdate,
+                TimedOut,
+            )
 
 
 def resetMotion(self, Devices, NwkId, WidgetType, unit, SignalLevel, BatteryLvl, now, lastupdate, TimedOut):
@@ -241,8 +266,6 @@ def resetMotion(self, Devices, NwkId, WidgetType, unit, SignalLevel, BatteryLvl,
         # Nothing to Reset
         return
     if self.domoticzdb_DeviceStatus:
-        from Classes.DomoticzDB import DomoticzDB_DeviceStatus
-
         # Let's check if we have a Device TimeOut specified by end user
         if self.domoticzdb_DeviceStatus.retreiveTimeOut_Motion(Devices[unit].ID) > 0:
             return
@@ -349,6 +372,11 @@ def UpdateDevice_v2(self, Devices, Unit, nValue, sValue, BatteryLvl, SignalLvl,
                 TimedOut=0,
             )
 
+        NwkId = self.IEEE2NWK[Devices[Unit].DeviceID]
+        if int(nValue) != 0 and NwkId in self.ListOfDevices:
+            # Motion, Vibration and push buttons set On are reset to Off by ResetDevice once their deadline is expired
+            schedule_reset(self, Devices, NwkId, Unit, WidgetForDeviceId(self, NwkId, Devices[Unit].ID))
+
         if self.pluginconf.pluginConf["logDeviceUpdate"]:
             Domoticz.Log("UpdateDevice - (%15s) %s:%s" % (Devices[Unit].Name, nValue, sValue))
         self.log.logging(
@@ -382,8 +410,39 @@ def Update_Battery_Device(
         return
     ieee = self.ListOfDevices[NwkId]["IEEE"]
 
-    for device_unit in Devices:
-        if Devices[device_unit].DeviceID != ieee:
+    units = self.devicesIndex.units_for_deviceid(Devices, ieee)
+    nb_updates = sum(1 for x in units if Devices[x].BatteryLevel != int(BatteryLvl))
+    if self.deviceTouches.record(NwkId, time.time(), self.pluginconf.pluginConf["deviceTouchWindow"], nb_updates, BatteryLvl):
+        flush_device_touches(self, Devices, NwkId)
+
+
+def flush_device_touches(self, Devices, NwkId=None):
+    """
+    Apply the last seen and battery level updates recorded by lastSeenUpdate and Update_Battery_Device,
+    for NwkId, or for all devices whose deviceTouchWindow is elapsed.
+    """
+
+    now = time.time()
+    if NwkId is None:
+        for x in self.deviceTouches.due(now, self.pluginconf.pluginConf["deviceTouchWindow"]):
+            flush_device_touches(self, Devices, x)
+        return
+
+    pending = self.deviceTouches.take(NwkId, now)
+    if pending is None or NwkId not in self.ListOfDevices or "IEEE" not in self.ListOfDevices[NwkId]:
+        return
+
+    nb_calls = 0
+    for device_unit in self.devicesIndex.units_for_deviceid(Devices, self.ListOfDevices[NwkId]["IEEE"]):
+        if pending["Touch"]:
+            if Devices[device_unit].TimedOut:
+                timedOutDevice(self, Devices, Unit=device_unit, MarkTimedOut=0)
+            else:
+                device_touch(self, Devices, device_unit)
+            nb_calls += 1
+
+        BatteryLvl = pending["Battery"]
+        if BatteryLvl is None:
             continue
         self.log.logging(
             "Widget",
@@ -404,6 +463,8 @@ def Update_Battery_Device(
             BatteryLevel=int(BatteryLvl),
             SuppressTriggers=True,
         )
+        nb_calls += 1
+    self.deviceTouches.flushed(nb_calls)
 
 
 def timedOutDevice(self, Devices, Unit=None, NwkId=None, MarkTimedOut=True):
@@ -424,9 +485,7 @@ def timedOutDevice(self, Devices, Unit=None, NwkId=None, MarkTimedOut=True):
             return
         _IEEE = self.ListOfDevices[NwkId]["IEEE"]
         self.ListOfDevices[NwkId]["Health"] = "TimedOut" if MarkTimedOut else "Live"
-        for x in list(Devices):
-            if Devices[x].DeviceID != _IEEE:
-                continue
+        for x in self.devicesIndex.units_for_deviceid(Devices, _IEEE):
             if Devices[x].TimedOut:
                 if MarkTimedOut:
                     continue
@@ -525,6 +584,7 @@ def lastSeenUpdate(self, Devices, Unit=None, NwkId=None):
         # self.log.logging( "Widget", "Debug", "Update LastSeen for device %s" %NwkId, NwkId)
 
         self.ListOfDevices[NwkId]["Stamp"]["LastSeen"] = int(time.time())
+        device_updated(self, NwkId)
         _IEEE = self.ListOfDevices[NwkId]["IEEE"]
         if not self.VersionNewFashion and (
             self.DomoticzMajor < 4 or (self.DomoticzMajor == 4 and self.DomoticzMinor < 10547)
@@ -537,12 +597,10 @@ def lastSeenUpdate(self, Devices, Unit=None, NwkId=None):
                 NwkId,
             )
             return
-        for x in list(Devices):
-            if x in Devices and Devices[x].DeviceID == _IEEE:
-                if Devices[x].TimedOut:
-                    timedOutDevice(self, Devices, Unit=x, MarkTimedOut=0)
-                else:
-                    device_touch( self, Devices, x)
+        # Widgets are touched at most once per deviceTouchWindow
+        units = self.devicesIndex.units_for_deviceid(Devices, _IEEE)
+        if self.deviceTouches.record(NwkId, time.time(), self.pluginconf.pluginConf["deviceTouchWindow"], len(units)):
+            flush_device_touches(self, Devices, NwkId)
 
 
 def is_meter_widget( self, Devices, unit):
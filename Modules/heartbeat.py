@@ -37,8 +37,9 @@ from Modules.readAttributes import (READ_ATTRIBUTES_REQUEST,
                                     ping_device_with_read_attribute,
                                     ping_tuya_device)
 from Modules.schneider_wiser import schneiderRenforceent
-from Modules.tools import (ReArrangeMacCapaBasedOnModel, getListOfEpForCluster,
-                           is_hex, is_time_to_perform_work, mainPoweredDevice,
+from Modules.tools import (ReArrangeMacCapaBasedOnModel, device_updated,
+                           getListOfEpForCluster, is_hex,
+                           is_time_to_perform_work, mainPoweredDevice,
                            removeNwkInList)
 from Modules.zdpCommands import zdp_node_descriptor_request
 from Modules.zigateConsts import HEARTBEAT, MAX_LOAD_ZIGATE
@@ -56,6 +57,9 @@ LEGRAND_FEATURES = 300 // HEARTBEAT
 SCHNEIDER_FEATURES = 300 // HEARTBEAT
 NETWORK_TOPO_START = 900 // HEARTBEAT
 NETWORK_ENRG_START = 1800 // HEARTBEAT
+SCHEDULER_MAX_DELAY = 3600  # Max delay before re-evaluating a scheduled task
+SCHEDULER_MAX_TICKS = SCHEDULER_MAX_DELAY // HEARTBEAT  # Max delay between 2 visits of a device
+HEALTH_TIMEOUT = 21200  # Device flagged as not seen after that time without messages
 
 
 def attributeDiscovery(self, NwkId):
@@ -184,21 +188,22 @@ def check_delay_binding( self, NwkId, model ):
 
         
     
-def pollingManufSpecificDevices(self, NwkId, HB):
+FUNC_MANUF = {
+    "ZLinkyPolling": ReadAttributeRequest_0702_ZLinky_TIC,
+    "PollingCusterff66": ReadAttributeRequest_ff66,
+    "OnOffPollingFreq": ManufSpecOnOffPolling,
+    "PowerPollingFreq": ReadAttributeRequest_0b04_050b_0505_0508,
+    "AC201Polling": pollingCasaia,
+    "TuyaPing": ping_tuya_device,
+    "BatteryPollingFreq": ReadAttributeRequest_0001,
+    "DanfossRoomFreq": danfoss_room_sensor_polling,
+    "TempPollingFreq": ReadAttributeRequest_0402,
+    "HumiPollingFreq": ReadAttributeRequest_0405,
+    "BattPollingFreq": ReadAttributeRequest_0001,
+}
+
 
-    FUNC_MANUF = {
-        "ZLinkyPolling": ReadAttributeRequest_0702_ZLinky_TIC,
-        "PollingCusterff66": ReadAttributeRequest_ff66,
-        "OnOffPollingFreq": ManufSpecOnOffPolling,
-        "PowerPollingFreq": ReadAttributeRequest_0b04_050b_0505_0508,
-        "AC201Polling": pollingCasaia,
-        "TuyaPing": ping_tuya_device,
-        "BatteryPollingFreq": ReadAttributeRequest_0001,
-        "DanfossRoomFreq": danfoss_room_sensor_polling,
-        "TempPollingFreq": ReadAttributeRequest_0402,
-        "HumiPollingFreq": ReadAttributeRequest_0405,
-        "BattPollingFreq": ReadAttributeRequest_0001,
-    }
+def pollingManufSpecificDevices(self, NwkId, HB):
 
     if "Param" not in self.ListOfDevices[NwkId]:
         return False
@@ -286,7 +291,7 @@ def checkHealth(self, NwkId):
 
     if (
         int(time.time())
-        > (self.ListOfDevices[NwkId]["Stamp"]["LastSeen"] + 21200)
+        > (self.ListOfDevices[NwkId]["Stamp"]["LastSeen"] + HEALTH_TIMEOUT)
         and self.ListOfDevices[NwkId]["Health"] == "Live"
     ):
         if "ZDeviceName" in self.ListOfDevices[NwkId]:
@@ -396,6 +401,10 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
     if not mainPowerFlag:
         return
 
+    if not self.heartbeatScheduler.is_due("Ping", NwkId):
+        return
+    self.heartbeatScheduler.executed("Ping")
+
     if (
         "Param" in self.ListOfDevices[NwkId]
         and "TuyaPing" in self.ListOfDevices[NwkId]["Param"]
@@ -411,6 +420,7 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
             ),
             NwkId,
         )
+        self.heartbeatScheduler.schedule("Ping", NwkId, int(time.time()) + SCHEDULER_MAX_DELAY)
         return
 
     if (
@@ -428,6 +438,7 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
             ),
             NwkId,
         )
+        self.heartbeatScheduler.schedule("Ping", NwkId, int(time.time()) + SCHEDULER_MAX_DELAY)
         return
 
     now = int(time.time())
@@ -438,6 +449,9 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
     ):
         # If we have received a message since less than 1 hours, then no ping to be done !
         self.log.logging("Heartbeat", "Debug", "------> %s no need to ping as we received a message recently " % (NwkId,), NwkId)
+        self.heartbeatScheduler.schedule(
+            "Ping", NwkId, self.ListOfDevices[NwkId]["Stamp"]["time"] + self.pluginconf.pluginConf["pingDevicesFeq"]
+        )
         return
 
     if not health:
@@ -450,8 +464,14 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
     lastPing = self.ListOfDevices[NwkId]["Stamp"]["LastPing"]
     lastSeen = self.ListOfDevices[NwkId]["Stamp"]["LastSeen"]
 
-    if checkHealthFlag and now > (lastPing + 60) and self.ZigateComm.loadTransmit() == 0:
-        submitPing(self, NwkId)
+    if checkHealthFlag and now <= (lastPing + 60):
+        self.heartbeatScheduler.schedule("Ping", NwkId, lastPing + 61)
+        return
+
+    if checkHealthFlag:
+        if self.ZigateComm.loadTransmit() == 0:
+            submitPing(self, NwkId)
+            self.heartbeatScheduler.schedule("Ping", NwkId, now + 61)
         return
 
     self.log.logging(
@@ -462,11 +482,11 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
         NwkId,
     )
 
-    if (
-        (now > (lastPing + self.pluginconf.pluginConf["pingDevicesFeq"]))
-        and (now > (lastSeen + self.pluginconf.pluginConf["pingDevicesFeq"]))
-        and self.ZigateComm.loadTransmit() == 0
-    ):
+    if now <= (max(lastPing, lastSeen) + self.pluginconf.pluginConf["pingDevicesFeq"]):
+        self.heartbeatScheduler.schedule("Ping", NwkId, max(lastPing, lastSeen) + self.pluginconf.pluginConf["pingDevicesFeq"] + 1)
+        return
+
+    if self.ZigateComm.loadTransmit() == 0:
 
         self.log.logging(
             "Heartbeat",
@@ -477,6 +497,7 @@ def pingDevices(self, NwkId, health, checkHealthFlag, mainPowerFlag):
         )
 
         submitPing(self, NwkId)
+        self.heartbeatScheduler.schedule("Ping", NwkId, now + self.pluginconf.pluginConf["pingDevicesFeq"] + 1)
 
 
 def submitPing(self, NwkId):
@@ -569,68 +590,16 @@ def processKnownDevices(self, Devices, NWKID):
 
     # Do we need to force ReadAttribute at plugin startup ?
     # If yes, best is probably to have ResetReadAttribute to 1
-    if _doReadAttribute:
+    if _doReadAttribute and self.heartbeatScheduler.is_due(
+        "ReadAttributes", NWKID, self.ListOfDevices[NWKID].get("ReadAttributes")
+    ):
         self.log.logging(
             "Heartbeat",
             "Debug",
             "processKnownDevices -  %s intHB: %s _mainPowered: %s doReadAttr: %s" % (NWKID, intHB, _mainPowered, _doReadAttribute),
             NWKID,
         )
-
-        # Read Attributes if enabled
-        now = int(time.time())  # Will be used to trigger ReadAttributes
-        for tmpEp in self.ListOfDevices[NWKID]["Ep"]:
-            if tmpEp == "ClusterType":
-                continue
-
-            for Cluster in READ_ATTRIBUTES_REQUEST:
-                if Cluster in ("Type", "ClusterType", "ColorMode"):
-                    continue
-                if Cluster not in self.ListOfDevices[NWKID]["Ep"][tmpEp]:
-                    continue
-
-                if "Model" in self.ListOfDevices[NWKID]:
-                    if (
-                        self.ListOfDevices[NWKID]["Model"] == "lumi.ctrl_neutral1" and tmpEp != "02"
-                    ):  # All Eps other than '02' are blacklisted
-                        continue
-                    if self.ListOfDevices[NWKID]["Model"] == "lumi.ctrl_neutral2" and tmpEp not in ("02", "03"):
-                        continue
-
-                if self.busy or self.ZigateComm.loadTransmit() > MAX_LOAD_ZIGATE:
-                    self.log.logging(
-                        "Heartbeat",
-                        "Debug",
-                        "--  -  %s skip ReadAttribute for now ... system too busy (%s/%s)"
-                        % (NWKID, self.busy, self.ZigateComm.loadTransmit()),
-                        NWKID,
-                    )
-                    rescheduleAction = True
-                    continue  # Do not break, so we can keep all clusters on the same states
-
-                func = READ_ATTRIBUTES_REQUEST[Cluster][0]
-                # For now it is a hack, but later we might put all parameters
-                if READ_ATTRIBUTES_REQUEST[Cluster][1] in self.pluginconf.pluginConf:
-                    timing = self.pluginconf.pluginConf[READ_ATTRIBUTES_REQUEST[Cluster][1]]
-                else:
-                    Domoticz.Error(
-                        "processKnownDevices - missing timing attribute for Cluster: %s - %s"
-                        % (Cluster, READ_ATTRIBUTES_REQUEST[Cluster][1])
-                    )
-                    continue
-
-                # Let's check the timing
-                if not is_time_to_perform_work(self, "ReadAttributes", NWKID, tmpEp, Cluster, now, timing):
-                    continue
-
-                self.log.logging(
-                    "Heartbeat",
-                    "Debug",
-                    "-- -  %s/%s and time to request ReadAttribute for %s" % (NWKID, tmpEp, Cluster),
-                    NWKID,
-                )
-
-                func(self, NWKID)
+        rescheduleAction = processReadAttributes(self, NWKID) or rescheduleAction
 
     if ( self.pluginconf.pluginConf["RoutingTableRequestFeq"] and not self.busy and self.ZigateComm.loadTransmit() < 3 and (intHB % ( self.pluginconf.pluginConf["RoutingTableRequestFeq"] // HEARTBEAT) == 0)):
         mgmt_rtg(self, NWKID, "RoutingTable")
@@ -686,13 +655,163 @@ def processKnownDevices(self, Devices, NWKID):
     return
 
 
+def processReadAttributes(self, NWKID):
+    # Request the ReadAttributes which are due, and schedule the next check at the earliest cluster due time
+    self.heartbeatScheduler.executed("ReadAttributes")
+    rescheduleAction = False
+    next_due = None
+    # Read Attributes if enabled
+    now = int(time.time())  # Will be used to trigger ReadAttributes
+    for tmpEp in self.ListOfDevices[NWKID]["Ep"]:
+        if tmpEp == "ClusterType":
+            continue
+
+        for Cluster in READ_ATTRIBUTES_REQUEST:
+            if Cluster in ("Type", "ClusterType", "ColorMode"):
+                continue
+            if Cluster not in self.ListOfDevices[NWKID]["Ep"][tmpEp]:
+                continue
+
+            if "Model" in self.ListOfDevices[NWKID]:
+                if (
+                    self.ListOfDevices[NWKID]["Model"] == "lumi.ctrl_neutral1" and tmpEp != "02"
+                ):  # All Eps other than '02' are blacklisted
+                    continue
+                if self.ListOfDevices[NWKID]["Model"] == "lumi.ctrl_neutral2" and tmpEp not in ("02", "03"):
+                    continue
+
+            if self.busy or self.ZigateComm.loadTransmit() > MAX_LOAD_ZIGATE:
+                self.log.logging(
+                    "Heartbeat",
+                    "Debug",
+                    "--  -  %s skip ReadAttribute for now ... system too busy (%s/%s)"
+                    % (NWKID, self.busy, self.ZigateComm.loadTransmit()),
+                    NWKID,
+                )
+                rescheduleAction = True
+                continue  # Do not break, so we can keep all clusters on the same states
+
+            func = READ_ATTRIBUTES_REQUEST[Cluster][0]
+            # For now it is a hack, but later we might put all parameters
+            if READ_ATTRIBUTES_REQUEST[Cluster][1] in self.pluginconf.pluginConf:
+                timing = self.pluginconf.pluginConf[READ_ATTRIBUTES_REQUEST[Cluster][1]]
+            else:
+                Domoticz.Error(
+                    "processKnownDevices - missing timing attribute for Cluster: %s - %s"
+                    % (Cluster, READ_ATTRIBUTES_REQUEST[Cluster][1])
+                )
+                continue
+
+            # Let's check the timing
+            if not is_time_to_perform_work(self, "ReadAttributes", NWKID, tmpEp, Cluster, now, timing):
+                next_due = earliest_due(next_due, read_attribute_timestamp(self, NWKID, tmpEp, Cluster) + timing)
+                continue
+
+            self.log.logging(
+                "Heartbeat",
+                "Debug",
+                "-- -  %s/%s and time to request ReadAttribute for %s" % (NWKID, tmpEp, Cluster),
+                NWKID,
+            )
+
+            func(self, NWKID)
+            self.heartbeatScheduler.executed("ReadAttributeRequest")
+            next_due = earliest_due(next_due, read_attribute_timestamp(self, NWKID, tmpEp, Cluster) + timing)
+
+    if rescheduleAction:
+        # Zigate was busy, check at the next ReadAttribute cycle
+        next_due = now
+    # Never wait longer than SCHEDULER_MAX_DELAY, in case Endpoints or timing parameters have changed
+    next_due = earliest_due(next_due, now + SCHEDULER_MAX_DELAY)
+    self.heartbeatScheduler.schedule("ReadAttributes", NWKID, next_due, self.ListOfDevices[NWKID].get("ReadAttributes"))
+    return rescheduleAction
+
+
+def earliest_due(next_due, due):
+    return due if next_due is None else min(next_due, due)
+
+
+def read_attribute_timestamp(self, NwkId, Ep, Cluster):
+    try:
+        return self.ListOfDevices[NwkId]["ReadAttributes"]["Ep"][Ep][Cluster]["TimeStamp"]
+    except (KeyError, TypeError):
+        return 0
+
+
+def next_visit(self, NWKID, intHB):
+    # Number of ticks before the next visit of a device: the first tick where one of the processKnownDevices()
+    # conditions is met. A visit before is harmless, as all conditions are checked again.
+    device = self.ListOfDevices[NWKID]
+    if device.get("Status") in ("Leave", "UNKNOW", "erasePDM"):
+        return SCHEDULER_MAX_TICKS
+    if device.get("Status") != "inDB":
+        # Left and devices being provisioned are processed at each heartbeat
+        return 1
+    if int(device["Heartbeat"]) != intHB:
+        # Rescheduled, or reset during the visit
+        return 1
+    if self.CommiSSionning or device.get("Health") == "Not Reachable":
+        return 1
+
+    now = int(time.time())
+    ticks = [SCHEDULER_MAX_TICKS]
+    if device.get("Health") == "Live":
+        ticks.append(ticks_until(device["Stamp"].get("LastSeen", 0) + HEALTH_TIMEOUT + 1, now))
+    if device.get("CheckParam"):
+        ticks.append(max(1, 120 // HEARTBEAT + 1 - intHB))
+
+    _mainPowered = mainPoweredDevice(self, NWKID)
+    if self.pluginconf.pluginConf["pingDevices"] and _mainPowered:
+        ticks.append(ticks_until(self.heartbeatScheduler.next_due("Ping", NWKID), now))
+
+    model = device.get("Model", "")
+    enabledEndDevicePolling = model in self.DeviceConf and self.DeviceConf[model].get("PollingEnabled")
+    if not _mainPowered and not enabledEndDevicePolling:
+        return min(ticks)
+
+    for param in device.get("Param", {}):
+        if param in FUNC_MANUF and device["Param"][param] // HEARTBEAT:
+            ticks.append(ticks_to_multiple(intHB, device["Param"][param] // HEARTBEAT))
+
+    if self.pluginconf.pluginConf["enableReadAttributes"] or self.pluginconf.pluginConf["resetReadAttributes"]:
+        ticks_ra = ticks_until(self.heartbeatScheduler.next_due("ReadAttributes", NWKID, device.get("ReadAttributes")), now)
+        ticks.append(ticks_ra + (-(intHB + ticks_ra)) % READATTRIBUTE_FEQ)
+
+    for feq in ("RoutingTableRequestFeq", "BindingTableRequestFeq"):
+        if self.pluginconf.pluginConf[feq] // HEARTBEAT:
+            ticks.append(ticks_to_multiple(intHB, self.pluginconf.pluginConf[feq] // HEARTBEAT))
+
+    if self.pluginconf.pluginConf["reenforcementWiser"]:
+        ticks.append(ticks_to_multiple(self.HeartbeatCount, self.pluginconf.pluginConf["reenforcementWiser"]))
+
+    if not enabledEndDevicePolling:
+        # Attribute Discovery and Node Descriptor
+        ticks.append(ticks_to_multiple(intHB, 1800))
+
+    return min(ticks)
+
+
+def ticks_until(due, now):
+    # Ticks before time due, None being now
+    if due is None or due <= now:
+        return 1
+    return -(-(due - now) // HEARTBEAT)
+
+
+def ticks_to_multiple(counter, period):
+    return period - (counter % period)
+
+
 def processListOfDevices(self, Devices):
     # Let's check if we do not have a command in TimeOut
 
     # self.ZigateComm.checkTOwaitFor()
     entriesToBeRemoved = []
+    # Only the devices with some work to do at this tick are visited, see next_visit()
+    sweep = (self.heartbeatScheduler.ticks % SCHEDULER_MAX_TICKS) == 0
+    visits = self.heartbeatScheduler.start_tick(int(time.time()), self.ListOfDevices, sweep)
 
-    for NWKID in list(self.ListOfDevices.keys()):
+    for NWKID in visits:
         if NWKID in ("ffff", "0000"):
             continue
 
@@ -709,7 +828,8 @@ def processListOfDevices(self, Devices):
             RIA = 0
             self.ListOfDevices[NWKID]["RIA"] = "0"
 
-        self.ListOfDevices[NWKID]["Heartbeat"] = str(int(self.ListOfDevices[NWKID]["Heartbeat"]) + 1)
+        intHB = self.heartbeatScheduler.heartbeat(NWKID, self.ListOfDevices[NWKID]["Heartbeat"])
+        self.ListOfDevices[NWKID]["Heartbeat"] = str(intHB)
 
         if status == "failDB":
             entriesToBeRemoved.append(NWKID)
@@ -782,12 +902,31 @@ def processListOfDevices(self, Devices):
         elif status not in ("inDB", "UNKNOW", "erasePDM"):
             # Discovery process 0x004d -> 0x0042 -> 0x8042 -> 0w0045 -> 0x8045 -> 0x0043 -> 0x8043
             processNotinDBDevices(self, Devices, NWKID, status, RIA)
-    # end for key in ListOfDevices
+
+        # The visit updates at least the Heartbeat counter of the device
+        device_updated(self, NWKID)
+        if NWKID in self.ListOfDevices:
+            self.heartbeatScheduler.visited(NWKID, self.ListOfDevices[NWKID]["Heartbeat"], next_visit(self, NWKID, intHB))
+        else:
+            self.heartbeatScheduler.forget(NWKID)
+    # end for key in visits
 
     for iterDevToBeRemoved in entriesToBeRemoved:
         if "IEEE" in self.ListOfDevices[iterDevToBeRemoved]:
             del self.ListOfDevices[iterDevToBeRemoved]["IEEE"]
         del self.ListOfDevices[iterDevToBeRemoved]
+        device_updated(self, iterDevToBeRemoved)
+        self.heartbeatScheduler.forget(iterDevToBeRemoved)
+
+    self.heartbeatScheduler.end_tick()
+    self.log.debug(
+        "Heartbeat",
+        "processListOfDevices - scheduler visits: %s popped: %s executed: %s skipped: %s",
+        self.heartbeatScheduler.tick_visits,
+        self.heartbeatScheduler.tick_popped,
+        self.heartbeatScheduler.tick_executed,
+        self.heartbeatScheduler.tick_skipped,
+    )
 
     if self.CommiSSionning or self.busy:
         self.log.logging(
@@ -16,6 +16,8 @@ import time
 from datetime import datetime
 
 import Domoticz
+from Classes.DispatchTable import DispatchTable
+from Classes.Transport.decodedMessage import DecodedMessage
 from Classes.Transport.sqnMgmt import (
     TYPE_APP_ZCL,
     TYPE_APP_ZDP,
@@ -59,6 +61,7 @@ from Modules.tools import (
     ReArrangeMacCapaBasedOnModel,
     checkAndStoreAttributeValue,
     decodeMacCapa,
+    device_updated,
     extract_info_from_8085,
     get_isqn_datastruct,
     get_list_isqn_attr_datastruct,
@@ -67,6 +70,7 @@ from Modules.tools import (
     loggingMessages,
     lookupForIEEE,
     mainPoweredDevice,
+    reset_heartbeat,
     retreive_cmd_payload_from_8002,
     set_request_phase_datastruct,
     set_status_datastruct,
@@ -74,6 +78,7 @@ from Modules.tools import (
     updLQI,
     updSQN,
 )
+from Modules.zclDecoder import decode_attribute_records
 from Modules.zigate import initLODZigate, receiveZigateEpDescriptor, receiveZigateEpList
 from Modules.zigateConsts import (
     ADDRESS_MODE,
@@ -86,70 +91,16 @@ from Modules.zigateConsts import (
 
 def ZigateRead(self, Devices, Data):
 
-    DECODERS = {
-        "004d": Decode004D,
-        "0100": Decode0100,
-        "0110": Decode0110,
-        "0302": Decode0302,
-        "0400": Decode0400,
-        "8000": Decode8000_v2,
-        "8002": Decode8002,
-        "8003": Decode8003,
-        "8004": Decode8004,
-        "8005": Decode8005,
-        "8006": Decode8006,
-        "8007": Decode8007,
-        "8008": Decode8008,
-        "8009": Decode8009,
-        "8010": Decode8010,
-        # "8011": Decode8011,
-        "8014": Decode8014,
-        "8015": Decode8015,
-        "8017": Decode8017,
-        "8024": Decode8024,
-        "8028": Decode8028,
-        "802b": Decode802B,
-        "802c": Decode802C,
-        "8030": Decode8030,
-        "8031": Decode8031,
-        "8034": Decode8034,
-        "8040": Decode8040,
-        "8041": Decode8041,
-        "8042": Decode8042,
-        "8043": Decode8043,
-        "8044": Decode8044,
-        "8045": Decode8045,
-        "8046": Decode8046,
-        "8047": Decode8047,
-        "8048": Decode8048,
-        "8049": Decode8049,
-        "804a": Decode804A,
-        "804b": Decode804B,
-        "804e": Decode804E,
-        "8060": Decode8060,
-        "8061": Decode8061,
-        "8062": Decode8062,
-        "8063": Decode8063,
-        "8085": Decode8085,
-        "8095": Decode8095,
-        "80a6": Decode80A6,
-        "80a7": Decode80A7,
-        "8100": Decode8100,
-        "8101": Decode8101,
-        "8102": Decode8102,
-        "8110": Decode8110,
-        "8120": Decode8120,
-        "8122": Decode8122,
-        "8139": Decode8140,
-        "8140": Decode8140,
-        "8401": Decode8401,
-        "8501": Decode8501,
-        "8503": Decode8503,
-        "8701": Decode8701,
-        "8806": Decode8806,
-        "8807": Decode8807,
-        "7000": Decode7000,
-    }
+    if isinstance(Data, DecodedMessage):
+        # Already decoded by the Transport (0x8002)
+        _decoding = MESSAGE_DECODERS.lookup(Data.MsgType)
+        if _decoding is not None:
+            self.Ping["Nb Ticks"] = 0
+            _decoding(self, Devices, Data)
+            return
+        # No structured handler, fallback on the equivalent ZiGate frame
+        Data = Data.frame
+
     # Not used
     # NOT_IMPLEMENTED = ("00d1", "8029", "80a0", "80a1", "80a2", "80a3", "80a4")
 
@@ -173,7 +124,6 @@ def ZigateRead(self, Devices, Data):
 
     self.Ping["Nb Ticks"] = 0  # We receive a valid packet
     MsgType = Data[2:6]
-    MsgType = MsgType.lower()
     MsgLength = Data[6:10]
     MsgCRC = Data[10:12]
 
@@ -185,22 +135,21 @@ def ZigateRead(self, Devices, Data):
         MsgData = ""
         MsgLQI = "00"
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "ZigateRead - MsgType: %s, MsgLength: %s, MsgCRC: %s, Data: %s, LQI: %s"
-        % (MsgType, MsgLength, MsgCRC, MsgData, int(MsgLQI, 16)),
+        "ZigateRead - MsgType: %s, MsgLength: %s, MsgCRC: %s, Data: %s, LQI: %s",
+        MsgType,
+        MsgLength,
+        MsgCRC,
+        MsgData,
+        int(MsgLQI, 16),
     )
 
-    if MsgType in DECODERS:
-        _decoding = DECODERS[MsgType]
+    _decoding = INPUT_DECODERS.lookup(int(MsgType, 16))
+    if _decoding is not None:
         _decoding(self, Devices, MsgData, MsgLQI)
         return
 
-    if MsgType == "8011":
-        Decode8011(self, Devices, MsgData, MsgLQI)
-        return
-
     Domoticz.Error("ZigateRead - Decoder not found for %s" % (MsgType))
 
 
@@ -223,10 +172,12 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
         "Manufacturer Name" in self.ListOfDevices[MsgSrcAddr]
         and self.ListOfDevices[MsgSrcAddr]["Manufacturer Name"] == "LIVOLO"
     ):
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode0100 - (Livolo) Read Attribute Request %s/%s Data %s" % (MsgSrcAddr, MsgSrcEp, MsgData),
+            "Decode0100 - (Livolo) Read Attribute Request %s/%s Data %s",
+            MsgSrcAddr,
+            MsgSrcEp,
+            MsgData,
         )
         livolo_read_attribute_request(self, Devices, MsgSrcAddr, MsgSrcEp, MsgData[30:32])
         return
@@ -238,21 +189,18 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
     MsgManufCode = MsgData[18:22]
     nbAttribute = MsgData[22:24]
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s"
-        % (
-            MsgSqn,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgDstEp,
-            MsgClusterId,
-            MsgDirection,
-            MsgManufSpec,
-            MsgManufCode,
-            nbAttribute,
-        ),
+        "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s",
+        MsgSqn,
+        MsgSrcAddr,
+        MsgSrcEp,
+        MsgDstEp,
+        MsgClusterId,
+        MsgDirection,
+        MsgManufSpec,
+        MsgManufCode,
+        nbAttribute,
     )
 
     updSQN(self, MsgSrcAddr, MsgSqn)
@@ -269,11 +217,13 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
         Attribute = MsgData[idx : idx + 4]
         if MsgClusterId == "000a":
             # Cluster TimeServer
-            self.log.logging(
+            self.log.debug(
                 "Input",
-                "Debug",
-                "Decode0100 - Received Time Server Cluster %s/%s Idx: %s  Attribute: %s"
-                % (MsgSrcAddr, MsgSrcEp, idx, Attribute),
+                "Decode0100 - Received Time Server Cluster %s/%s Idx: %s  Attribute: %s",
+                MsgSrcAddr,
+                MsgSrcEp,
+                idx,
+                Attribute,
             )
             timeserver_read_attribute_request(
                 self,
@@ -291,21 +241,18 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
         ):
             # Cluster Thermostat for Wiser
             wiser_read_attribute_request(self, MsgSrcAddr, MsgSrcEp, MsgSqn, MsgClusterId, Attribute)
-            self.log.logging(
+            self.log.debug(
                 "Schneider",
-                "Debug",
-                "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s"
-                % (
-                    MsgSqn,
-                    MsgSrcAddr,
-                    MsgSrcEp,
-                    MsgDstEp,
-                    MsgClusterId,
-                    MsgDirection,
-                    MsgManufSpec,
-                    MsgManufCode,
-                    nbAttribute,
-                ),
+                "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s",
+                MsgSqn,
+                MsgSrcAddr,
+                MsgSrcEp,
+                MsgDstEp,
+                MsgClusterId,
+                MsgDirection,
+                MsgManufSpec,
+                MsgManufCode,
+                nbAttribute,
             )
         else:
             self.log.logging(
@@ -644,12 +591,14 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
 
     if MsgProfilID != "0104":
         # Not handle
-        self.log.logging(
+        self.log.debug(
             "inRawAPS",
-            "Debug",
-            "Decode8002 - NwkId: %s Ep: %s Cluster: %s Payload: %s"
-            % (srcnwkid, MsgSourcePoint, MsgClusterID, MsgPayload),
+            "Decode8002 - NwkId: %s Ep: %s Cluster: %s Payload: %s",
             srcnwkid,
+            MsgSourcePoint,
+            MsgClusterID,
+            MsgPayload,
+            nwkid=srcnwkid,
         )
         return
 
@@ -662,54 +611,45 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
     ) = retreive_cmd_payload_from_8002(MsgPayload)
 
     if "SQN" in self.ListOfDevices[srcnwkid] and Sqn == self.ListOfDevices[srcnwkid]["SQN"]:
-        self.log.logging(
+        self.log.debug(
             "inRawAPS",
-            "Debug",
-            "Decode8002 - Duplicate message drop NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s"
-            % (
-                srcnwkid,
-                MsgSourcePoint,
-                MsgClusterID,
-                GlobalCommand,
-                Command,
-                Data,
-            ),
+            "Decode8002 - Duplicate message drop NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s",
             srcnwkid,
+            MsgSourcePoint,
+            MsgClusterID,
+            GlobalCommand,
+            Command,
+            Data,
+            nwkid=srcnwkid,
         )
         return
 
     updSQN(self, srcnwkid, Sqn)
 
     if GlobalCommand and int(Command, 16) in ZIGBEE_COMMAND_IDENTIFIER:
-        self.log.logging(
+        self.log.debug(
             "inRawAPS",
-            "Debug",
-            "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s (%33s) Data: %s"
-            % (
-                srcnwkid,
-                MsgSourcePoint,
-                MsgClusterID,
-                GlobalCommand,
-                Command,
-                ZIGBEE_COMMAND_IDENTIFIER[int(Command, 16)],
-                Data,
-            ),
+            "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s (%33s) Data: %s",
             srcnwkid,
+            MsgSourcePoint,
+            MsgClusterID,
+            GlobalCommand,
+            Command,
+            ZIGBEE_COMMAND_IDENTIFIER[int(Command, 16)],
+            Data,
+            nwkid=srcnwkid,
         )
     else:
-        self.log.logging(
+        self.log.debug(
             "inRawAPS",
-            "Debug",
-            "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s"
-            % (
-                srcnwkid,
-                MsgSourcePoint,
-                MsgClusterID,
-                GlobalCommand,
-                Command,
-                Data,
-            ),
+            "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s",
             srcnwkid,
+            MsgSourcePoint,
+            MsgClusterID,
+            GlobalCommand,
+            Command,
+            Data,
+            nwkid=srcnwkid,
         )
 
     updLQI(self, srcnwkid, MsgLQI)
@@ -722,19 +662,16 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
 
         data = Sqn + MsgSourcePoint + MsgClusterID + cmd + direction + "000000" + srcnwkid
 
-        self.log.logging(
+        self.log.debug(
             "inRawAPS",
-            "Debug",
-            "Decode8002 - Sqn: %s NwkId %s Ep %s Cluster %s Cmd %s Direction %s"
-            % (
-                Sqn,
-                srcnwkid,
-                MsgClusterID,
-                MsgClusterID,
-                cmd,
-                direction,
-            ),
+            "Decode8002 - Sqn: %s NwkId %s Ep %s Cluster %s Cmd %s Direction %s",
+            Sqn,
             srcnwkid,
+            MsgClusterID,
+            MsgClusterID,
+            cmd,
+            direction,
+            nwkid=srcnwkid,
         )
         Decode80A7(self, Devices, data, MsgLQI)
         return
@@ -859,7 +796,7 @@ def Decode8006(self, Devices, MsgData, MsgLQI):  # Non “Factory new” Restart
 
 def Decode8007(self, Devices, MsgData, MsgLQI):  # “Factory new” Restart
 
-    self.log.logging("Input", "Debug", "Decode8007 - MsgData: %s" % (MsgData))
+    self.log.debug("Input", "Decode8007 - MsgData: %s", MsgData)
 
     Status = MsgData[0:2]
     if Status == "00":
@@ -986,7 +923,7 @@ def Decode8010(self, Devices, MsgData, MsgLQI):  # Reception Version list
     self.FirmwareMajorVersion = MsgData[2:4]
     self.FirmwareVersion = MsgData[4:8]
 
-    self.log.logging("Input", "Debug", "Decode8010 - Reception Version list:%s" % MsgData)
+    self.log.debug("Input", "Decode8010 - Reception Version list:%s", MsgData)
     if self.FirmwareMajorVersion == "03":
         self.log.logging("Input", "Status", "ZiGate Classic PDM (legacy)")
         self.ZiGateModel = 1
@@ -1091,6 +1028,9 @@ def set_health_state(self, MsgSrcAddr, ClusterId, Status):
         return
     if self.ListOfDevices[MsgSrcAddr]["Health"] != "Not Reachable":
         self.ListOfDevices[MsgSrcAddr]["Health"] = "Not Reachable"
+        device_updated(self, MsgSrcAddr)
+        # Ping retries are checked at each heartbeat
+        self.heartbeatScheduler.wake(MsgSrcAddr)
 
     if "ZDeviceName" in self.ListOfDevices[MsgSrcAddr]:
         MsgClusterId = ClusterId
@@ -1142,7 +1082,7 @@ def Decode8014(self, Devices, MsgData, MsgLQI):  # "Permit Join" status response
     Status = MsgData[0:2]
     timestamp = int(time.time())
 
-    self.log.logging("Input", "Debug", "Decode8014 - Permit Join status: %s" % (Status == "01"), "ffff")
+    self.log.debug("Input", "Decode8014 - Permit Join status: %s", Status == "01", nwkid="ffff")
 
     if "Permit" not in self.Ping:
         self.Ping["Permit"] = None
@@ -1172,32 +1112,12 @@ def Decode8014(self, Devices, MsgData, MsgLQI):  # "Permit Join" status response
     else:
         Domoticz.Error("Decode8014 - Unexpected value " + str(MsgData))
 
-    self.log.logging(
-        "Input",
-        "Debug",
-        "---> self.permitTojoin['Starttime']: %s" % self.permitTojoin["Starttime"],
-        "ffff",
-    )
-    self.log.logging(
-        "Input",
-        "Debug",
-        "---> self.permitTojoin['Duration']: %s" % self.permitTojoin["Duration"],
-        "ffff",
-    )
-    self.log.logging("Input", "Debug", "---> Current time                  : %s" % timestamp, "ffff")
-    self.log.logging("Input", "Debug", "---> self.Ping['Permit']  (prev)   : %s" % prev, "ffff")
-    self.log.logging(
-        "Input",
-        "Debug",
-        "---> self.Ping['Permit']  (new )   : %s" % self.Ping["Permit"],
-        "ffff",
-    )
-    self.log.logging(
-        "Input",
-        "Debug",
-        "---> _to_notify                    : %s" % _to_notify,
-        "ffff",
-    )
+    self.log.debug("Input", "---> self.permitTojoin['Starttime']: %s", self.permitTojoin["Starttime"], nwkid="ffff")
+    self.log.debug("Input", "---> self.permitTojoin['Duration']: %s", self.permitTojoin["Duration"], nwkid="ffff")
+    self.log.debug("Input", "---> Current time                  : %s", timestamp, nwkid="ffff")
+    self.log.debug("Input", "---> self.Ping['Permit']  (prev)   : %s", prev, nwkid="ffff")
+    self.log.debug("Input", "---> self.Ping['Permit']  (new )   : %s", self.Ping["Permit"], nwkid="ffff")
+    self.log.debug("Input", "---> _to_notify                    : %s", _to_notify, nwkid="ffff")
 
     self.Ping["TimeStamp"] = int(time.time())
     self.Ping["Status"] = "Receive"
@@ -1212,10 +1132,12 @@ def Decode8017(self, Devices, MsgData, MsgLQI):  # Get Time
     EPOCTime = datetime(2000, 1, 1)
     UTCTime = int((datetime.now() - EPOCTime).total_seconds())
     ZigateTime = struct.unpack("I", struct.pack("I", int(ZigateTime, 16)))[0]
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "UTC time is: %s, Zigate Time is: %s with deviation of: %s " % (UTCTime, ZigateTime, UTCTime - ZigateTime),
+        "UTC time is: %s, Zigate Time is: %s with deviation of: %s ",
+        UTCTime,
+        ZigateTime,
+        UTCTime - ZigateTime,
     )
     if abs(UTCTime - ZigateTime) > 5:  # If Deviation is more than 5 sec then reset Time
         setTimeServer(self)
@@ -1258,10 +1180,13 @@ def Decode8015(self, Devices, MsgData, MsgLQI):  # Get device list ( following r
             )
 
             self.ListOfDevices[saddr]["LQI"] = int(rssi, 16) if rssi != "00" else 0
-            self.log.logging(
+            device_updated(self, saddr)
+            self.log.debug(
                 "Input",
-                "Debug",
-                "Decode8015: LQI set to %s / %s for %s" % (self.ListOfDevices[saddr]["LQI"], str(int(rssi, 16)), saddr),
+                "Decode8015: LQI set to %s / %s for %s",
+                self.ListOfDevices[saddr]["LQI"],
+                str(int(rssi, 16)),
+                saddr,
             )
         else:
             self.log.logging(
@@ -1320,11 +1245,12 @@ def Decode8024(self, Devices, MsgData, MsgLQI):  # Network joined / formed
         )
 
     if MsgLen != 24:
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode8024 - uncomplete frame, MsgData: %s, Len: %s out of 24, data received: >%s<"
-            % (MsgData, MsgLen, MsgData),
+            "Decode8024 - uncomplete frame, MsgData: %s, Len: %s out of 24, data received: >%s<",
+            MsgData,
+            MsgLen,
+            MsgData,
         )
         return
 
@@ -1459,7 +1385,7 @@ def Decode802C(self, Devices, MsgData, MsgLQI):  # User Descriptor Response
 def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
 
     MsgLen = len(MsgData)
-    self.log.logging("Input", "Debug", "Decode8030 - Msgdata: %s, MsgLen: %s" % (MsgData, MsgLen))
+    self.log.debug("Input", "Decode8030 - Msgdata: %s, MsgLen: %s", MsgData, MsgLen)
 
     MsgSequenceNumber = MsgData[0:2]
     MsgDataStatus = MsgData[2:4]
@@ -1472,11 +1398,11 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
     if int(MsgSrcAddrMode, 16) == ADDRESS_MODE["short"]:
         MsgSrcAddr = MsgData[6:10]
         nwkid = MsgSrcAddr
-        self.log.logging("Input", "Debug", "Decode8030 - Bind reponse for %s" % (MsgSrcAddr), MsgSrcAddr)
+        self.log.debug("Input", "Decode8030 - Bind reponse for %s", MsgSrcAddr, nwkid=MsgSrcAddr)
 
     elif int(MsgSrcAddrMode, 16) == ADDRESS_MODE["ieee"]:
         MsgSrcAddr = MsgData[6:14]
-        self.log.logging("Input", "Debug", "Decode8030 - Bind reponse for %s" % (MsgSrcAddr))
+        self.log.debug("Input", "Decode8030 - Bind reponse for %s", MsgSrcAddr)
         if MsgSrcAddr not in self.IEEE2NWK:
             Domoticz.Error("Decode8030 - Do no find %s in IEEE2NWK" % MsgSrcAddr)
             return
@@ -1492,21 +1418,19 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
         return
 
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSequenceNumber, TYPE_APP_ZDP)
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8030 - Bind response, Device: %s Status: %s MsgSequenceNumber: 0x%s/%3s i_sqn: %s"
-        % (
-            MsgSrcAddr,
-            MsgDataStatus,
-            MsgSequenceNumber,
-            int(MsgSequenceNumber, 16),
-            i_sqn,
-        ),
+        "Decode8030 - Bind response, Device: %s Status: %s MsgSequenceNumber: 0x%s/%3s i_sqn: %s",
         MsgSrcAddr,
+        MsgDataStatus,
+        MsgSequenceNumber,
+        int(MsgSequenceNumber, 16),
+        i_sqn,
+        nwkid=MsgSrcAddr,
     )
 
     if nwkid in self.ListOfDevices:
+        device_updated(self, nwkid)
         if "Bind" in self.ListOfDevices[nwkid]:
             for Ep in list(self.ListOfDevices[nwkid]["Bind"]):
                 if Ep not in self.ListOfDevices[nwkid]["Ep"]:
@@ -1525,12 +1449,13 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
                         and self.ListOfDevices[nwkid]["Bind"][Ep][cluster]["i_sqn"] == i_sqn
                     ):
 
-                        self.log.logging(
+                        self.log.debug(
                             "Input",
-                            "Debug",
-                            "Decode8030 - Set bind request to binded: nwkid %s ep: %s cluster: %s"
-                            % (nwkid, Ep, cluster),
-                            MsgSrcAddr,
+                            "Decode8030 - Set bind request to binded: nwkid %s ep: %s cluster: %s",
+                            nwkid,
+                            Ep,
+                            cluster,
+                            nwkid=MsgSrcAddr,
                         )
                         self.ListOfDevices[nwkid]["Bind"][Ep][cluster]["Stamp"] = int(time.time())
                         self.ListOfDevices[nwkid]["Bind"][Ep][cluster]["Phase"] = "binded"
@@ -1568,12 +1493,14 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
                             and self.ListOfDevices[nwkid]["WebBind"][Ep][cluster][destNwkid]["i_sqn"] == i_sqn
                         ):
 
-                            self.log.logging(
+                            self.log.debug(
                                 "Input",
-                                "Debug",
-                                "Decode8030 - Set WebBind request to binded: nwkid %s ep: %s cluster: %s destNwkid: %s"
-                                % (nwkid, Ep, cluster, destNwkid),
-                                MsgSrcAddr,
+                                "Decode8030 - Set WebBind request to binded: nwkid %s ep: %s cluster: %s destNwkid: %s",
+                                nwkid,
+                                Ep,
+                                cluster,
+                                destNwkid,
+                                nwkid=MsgSrcAddr,
                             )
                             self.ListOfDevices[nwkid]["WebBind"][Ep][cluster][destNwkid]["Stamp"] = int(time.time())
                             self.ListOfDevices[nwkid]["WebBind"][Ep][cluster][destNwkid]["Phase"] = "binded"
@@ -1583,7 +1510,7 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
 
 def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
     MsgLen = len(MsgData)
-    self.log.logging("Input", "Debug", "Decode8031 - Msgdata: %s" % (MsgData))
+    self.log.debug("Input", "Decode8031 - Msgdata: %s", MsgData)
 
     MsgSequenceNumber = MsgData[0:2]
     MsgDataStatus = MsgData[2:4]
@@ -1595,10 +1522,10 @@ def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
     if int(MsgSrcAddrMode, 16) == ADDRESS_MODE["short"]:
         MsgSrcAddr = MsgData[6:10]
         nwkid = MsgSrcAddr
-        self.log.logging("Input", "Debug", "Decode8031 - UnBind reponse for %s" % nwkid, nwkid)
+        self.log.debug("Input", "Decode8031 - UnBind reponse for %s", nwkid, nwkid=nwkid)
     elif int(MsgSrcAddrMode, 16) == ADDRESS_MODE["ieee"]:
         MsgSrcAddr = MsgData[6:14]
-        self.log.logging("Input", "Debug", "Decode8031 - UnBind reponse for %s" % (MsgSrcAddr))
+        self.log.debug("Input", "Decode8031 - UnBind reponse for %s", MsgSrcAddr)
         if MsgSrcAddr in self.IEEE2NWK:
             nwkid = self.IEEE2NWK[MsgSrcAddr]
             Domoticz.Error("Decode8031 - Do no find %s in IEEE2NWK" % MsgSrcAddr)
@@ -1606,20 +1533,23 @@ def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
         Domoticz.Error("Decode8031 - Unknown addr mode %s in %s" % (MsgSrcAddrMode, MsgData))
         return
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8031 - UnBind response, Device: %s SQN: %s Status: %s" % (MsgSrcAddr, MsgSequenceNumber, MsgDataStatus),
+        "Decode8031 - UnBind response, Device: %s SQN: %s Status: %s",
         MsgSrcAddr,
+        MsgSequenceNumber,
+        MsgDataStatus,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgDataStatus != "00":
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode8031 - Unbind response SQN: %s status [%s] - %s"
-            % (MsgSequenceNumber, MsgDataStatus, DisplayStatusCode(MsgDataStatus)),
-            MsgSrcAddr,
+            "Decode8031 - Unbind response SQN: %s status [%s] - %s",
+            MsgSequenceNumber,
+            MsgDataStatus,
+            DisplayStatusCode(MsgDataStatus),
+            nwkid=MsgSrcAddr,
         )
 
 
@@ -1712,9 +1642,7 @@ def Decode8041(self, Devices, MsgData, MsgLQI):  # IEEE Address response
         return
 
     if MsgShortAddress in self.ListOfDevices:
-        self.log.logging(
-            "Input", "Debug", "Decode 8041 - Receive an IEEE: %s with a NwkId: %s" % (MsgIEEE, MsgShortAddress)
-        )
+        self.log.debug("Input", "Decode 8041 - Receive an IEEE: %s with a NwkId: %s", MsgIEEE, MsgShortAddress)
         return
 
     # We might check if we didn't have a change in the IEEE <-> NwkId
@@ -1991,11 +1919,7 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
                 if MsgDataCluster not in self.ListOfDevices[MsgDataShAddr]["Ep"][MsgDataEp]:
                     self.ListOfDevices[MsgDataShAddr]["Ep"][MsgDataEp][MsgDataCluster] = {}
             else:
-                self.log.logging(
-                    "Pairing",
-                    "Debug",
-                    "[%s]    NEW OBJECT: %s we keep DeviceConf info" % ("-", MsgDataShAddr),
-                )
+                self.log.debug("Pairing", "[%s]    NEW OBJECT: %s we keep DeviceConf info", "-", MsgDataShAddr)
 
             # Endpoint V2
             if MsgDataEp not in self.ListOfDevices[MsgDataShAddr]["Epv2"]:
@@ -2047,11 +1971,12 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
                 if MsgDataCluster not in self.ListOfDevices[MsgDataShAddr]["Ep"][MsgDataEp]:
                     self.ListOfDevices[MsgDataShAddr]["Ep"][MsgDataEp][MsgDataCluster] = {}
             else:
-                self.log.logging(
+                self.log.debug(
                     "Input",
-                    "Debug",
-                    "[%s]    NEW OBJECT: %s we keep DeviceConf info" % ("-", MsgDataShAddr),
+                    "[%s]    NEW OBJECT: %s we keep DeviceConf info",
+                    "-",
                     MsgDataShAddr,
+                    nwkid=MsgDataShAddr,
                 )
 
             # Endpoint V2
@@ -2087,7 +2012,7 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
 
     if self.ListOfDevices[MsgDataShAddr]["Status"] != "inDB":
         self.ListOfDevices[MsgDataShAddr]["Status"] = "8043"
-        self.ListOfDevices[MsgDataShAddr]["Heartbeat"] = "0"
+        reset_heartbeat(self, MsgDataShAddr)
 
     self.log.logging(
         "Pairing",
@@ -2286,7 +2211,7 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
 
     if self.ListOfDevices[sAddr]["Status"] == "inDB":
         self.ListOfDevices[sAddr]["Status"] = "Left"
-        self.ListOfDevices[sAddr]["Heartbeat"] = 0
+        reset_heartbeat(self, sAddr)
         # Domoticz.Status("Calling leaveMgt to request a rejoin of %s/%s " %( sAddr, MsgExtAddress))
         # leaveMgtReJoin( self, sAddr, MsgExtAddress )
 
@@ -2314,7 +2239,7 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
 
         # Will set to Leave in order to protect Domoticz Widget, Just need to make sure that we can reconnect at a point of time
         self.ListOfDevices[sAddr]["Status"] = "Leave"
-        self.ListOfDevices[sAddr]["Heartbeat"] = 0
+        reset_heartbeat(self, sAddr)
         Domoticz.Error(
             "Receiving a leave from %s/%s while device is %s status"
             % (sAddr, MsgExtAddress, self.ListOfDevices[sAddr]["Status"])
@@ -2330,18 +2255,13 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
         % (zdevname, sAddr, MsgExtAddress, int(MsgLQI, 16)),
     )
 
-    self.log.logging(
-        "Input",
-        "Debug",
-        "Leave indication from IEEE: %s , Status: %s " % (MsgExtAddress, MsgDataStatus),
-        sAddr,
-    )
+    self.log.debug("Input", "Leave indication from IEEE: %s , Status: %s ", MsgExtAddress, MsgDataStatus, nwkid=sAddr)
     updLQI(self, sAddr, MsgLQI)
 
 
 def Decode8049(self, Devices, MsgData, MsgLQI):  # E_SL_MSG_PERMIT_JOINING_RESPONSE
 
-    self.log.logging("Input", "Debug", "Decode8049 - MsgData: %s" % MsgData)
+    self.log.debug("Input", "Decode8049 - MsgData: %s", MsgData)
     # SQN = MsgData[0:2]
     Status = MsgData[2:4]
 
@@ -2604,19 +2524,16 @@ def Decode8100(self, Devices, MsgData, MsgLQI):
     # Read Attribute Response (in case there are several Attribute call several time read_report_attributes)
 
     MsgSQN = MsgData[0:2]
-    i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-
     MsgSrcAddr = MsgData[2:6]
-    timeStamped(self, MsgSrcAddr, 0x8100)
-    loggingMessages(self, "8100", MsgSrcAddr, None, MsgLQI, MsgSQN)
-    lastSeenUpdate(self, Devices, NwkId=MsgSrcAddr)
-    updLQI(self, MsgSrcAddr, MsgLQI)
     MsgSrcEp = MsgData[6:8]
     MsgClusterId = MsgData[8:12]
 
-    self.statistics._clusterOK += 1
-    scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgData, "8100")
-    callbackDeviceAwake(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId)
+    attribute_records(self, Devices, "8100", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgLQI, decode_attribute_records(MsgData))
+
+
+def Decode8100_message(self, Devices, message):
+    # Read Attribute Response decoded from a 0x8002 by the Transport
+    attribute_records(self, Devices, "8100", message.Sqn, message.SrcNwkId, message.SrcEp, message.ClusterId, message.LQI, message.Records)
 
 
 def Decode8101(self, Devices, MsgData, MsgLQI):  # Default Response
@@ -2625,18 +2542,15 @@ def Decode8101(self, Devices, MsgData, MsgLQI):  # Default Response
     MsgClusterId = MsgData[4:8]
     MsgDataCommand = MsgData[8:10]
     MsgDataStatus = MsgData[10:12]
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8101 - Default response - SQN: %s, EP: %s, ClusterID: %s , DataCommand: %s, - Status: [%s] %s"
-        % (
-            MsgDataSQN,
-            MsgDataEp,
-            MsgClusterId,
-            MsgDataCommand,
-            MsgDataStatus,
-            DisplayStatusCode(MsgDataStatus),
-        ),
+        "Decode8101 - Default response - SQN: %s, EP: %s, ClusterID: %s , DataCommand: %s, - Status: [%s] %s",
+        MsgDataSQN,
+        MsgDataEp,
+        MsgClusterId,
+        MsgDataCommand,
+        MsgDataStatus,
+        DisplayStatusCode(MsgDataStatus),
     )
 
 
@@ -2652,22 +2566,19 @@ def Decode8102(self, Devices, MsgData, MsgLQI):  # Attribute Reports
     MsgAttSize = MsgData[20:24]
     MsgClusterData = MsgData[24 : len(MsgData)]
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8102 - Attribute Reports: [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
-        % (
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgSQN,
-            MsgClusterId,
-            MsgAttrID,
-            MsgAttStatus,
-            MsgAttType,
-            MsgAttSize,
-            MsgClusterData,
-        ),
+        "Decode8102 - Attribute Reports: [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<",
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgSQN,
+        MsgClusterId,
+        MsgAttrID,
+        MsgAttStatus,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if self.PluzzyFirmware:
@@ -2718,67 +2629,58 @@ def Decode8102(self, Devices, MsgData, MsgLQI):  # Attribute Reports
             MsgLQI,
         )
 
-    timeStamped(self, MsgSrcAddr, 0x8102)
-    loggingMessages(self, "8102", MsgSrcAddr, None, MsgLQI, MsgSQN)
+    attribute_records(self, Devices, "8102", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgLQI, decode_attribute_records(MsgData))
+
+
+def Decode8102_message(self, Devices, message):
+    # Attribute Reports decoded from a 0x8002 by the Transport
+    attribute_records(self, Devices, "8102", message.Sqn, message.SrcNwkId, message.SrcEp, message.ClusterId, message.LQI, message.Records)
+
+
+def attribute_records(self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgLQI, Records):
+    # Common processing of the 0x8100 and 0x8102, Records as provided by decode_attribute_records()
+
+    timeStamped(self, MsgSrcAddr, int(MsgType, 16))
+    loggingMessages(self, MsgType, MsgSrcAddr, None, MsgLQI, MsgSQN)
     lastSeenUpdate(self, Devices, NwkId=MsgSrcAddr)
     updLQI(self, MsgSrcAddr, MsgLQI)
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
 
     self.statistics._clusterOK += 1
-    scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgData, "8102")
+    scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, Records, MsgType)
 
     callbackDeviceAwake(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId)
 
 
-def scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgData, msgtype):
+def scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, Records, msgtype):
 
-    idx = 12
-    while idx < len(MsgData):
-        MsgAttrID = MsgAttStatus = MsgAttType = MsgAttSize = MsgClusterData = ""
-        MsgAttrID = MsgData[idx : idx + 4]
-        idx += 4
-        MsgAttStatus = MsgData[idx : idx + 2]
-        idx += 2
-        if MsgAttStatus == "00":
-            MsgAttType = MsgData[idx : idx + 2]
-            idx += 2
-            MsgAttSize = MsgData[idx : idx + 4]
-            idx += 4
-            size = int(MsgAttSize, 16) * 2
-            MsgClusterData = MsgData[idx : idx + size]
-            idx += size
-        else:
-            self.log.logging(
+    for idx, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, MsgValue in Records:
+        if MsgAttStatus != "00":
+            self.log.debug(
                 "Input",
-                "Debug",
-                "scan_attribute_reponse - %s idx: %s Read Attribute Response: [%s:%s] status: %s -> %s"
-                % (msgtype, idx, MsgSrcAddr, MsgSrcEp, MsgAttStatus, MsgData[idx:]),
-            )
-
-            # If the frame is coming from firmware we get only one attribute at a time, with some dumy datas
-            if len(MsgData[idx:]) == 6:
-                # crap, lets finish it
-                # Domoticz.Log("Crap Data: %s len: %s" %(MsgData[idx:], len(MsgData[idx:])))
-                idx += 6
-        self.log.logging(
-            "Input",
-            "Debug",
-            "scan_attribute_reponse - %s idx: %s Read Attribute Response: [%s:%s] ClusterID: %s MsgSQN: %s, i_sqn: %s, AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
-            % (
+                "scan_attribute_reponse - %s idx: %s Read Attribute Response: [%s:%s] status: %s",
                 msgtype,
                 idx,
                 MsgSrcAddr,
                 MsgSrcEp,
-                MsgClusterId,
-                MsgSQN,
-                i_sqn,
-                MsgAttrID,
                 MsgAttStatus,
-                MsgAttType,
-                MsgAttSize,
-                MsgClusterData,
-            ),
+            )
+        self.log.debug(
+            "Input",
+            "scan_attribute_reponse - %s idx: %s Read Attribute Response: [%s:%s] ClusterID: %s MsgSQN: %s, i_sqn: %s, AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<",
+            msgtype,
+            idx,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterId,
+            MsgSQN,
+            i_sqn,
+            MsgAttrID,
+            MsgAttStatus,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         read_report_attributes(
             self,
@@ -2793,6 +2695,7 @@ def scan_attribute_reponse(self, Devices, MsgSQN, i_sqn, MsgSrcAddr, MsgSrcEp, M
             MsgAttType,
             MsgAttSize,
             MsgClusterData,
+            MsgValue,
         )
 
 
@@ -2809,6 +2712,7 @@ def read_report_attributes(
     MsgAttType,
     MsgAttSize,
     MsgClusterData,
+    MsgValue=None,
 ):
 
     if DeviceExist(self, Devices, MsgSrcAddr):
@@ -2850,6 +2754,7 @@ def read_report_attributes(
             MsgAttSize,
             MsgClusterData,
             Source=MsgType,
+            Value=MsgValue,
         )
         return
 
@@ -2857,7 +2762,7 @@ def read_report_attributes(
     # Will request in the next hearbeat to for a IEEE request
     ieee = lookupForIEEE(self, MsgSrcAddr, True)
     if ieee:
-        self.log.logging("Input", "Debug", "Found IEEE for short address: %s is %s" % (MsgSrcAddr, ieee))
+        self.log.debug("Input", "Found IEEE for short address: %s is %s", MsgSrcAddr, ieee)
         if MsgSrcAddr in self.UnknownDevices:
             self.UnknownDevices.remove(MsgSrcAddr)
     else:
@@ -2924,18 +2829,15 @@ def debug_LQI(self, MsgSrcAddr, MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcE
                 ),
             )
     else:
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)"
-            % (
-                self.ListOfDevices[MsgSrcAddr]["LQI"],
-                MsgClusterId,
-                MsgAttrID,
-                MsgClusterData,
-                MsgSrcAddr,
-                MsgSrcEp,
-            ),
+            "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)",
+            self.ListOfDevices[MsgSrcAddr]["LQI"],
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            MsgSrcAddr,
+            MsgSrcEp,
         )
 
 
@@ -2987,12 +2889,16 @@ def Decode8110_raw(
 ):  # Write Attribute response
 
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8110 - WriteAttributeResponse - MsgSQN: %s,  MsgSrcAddr: %s, MsgSrcEp: %s, MsgClusterId: %s MsgAttrID: %s Status: %s"
-        % (MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus),
+        "Decode8110 - WriteAttributeResponse - MsgSQN: %s,  MsgSrcAddr: %s, MsgSrcEp: %s, MsgClusterId: %s MsgAttrID: %s Status: %s",
+        MsgSQN,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgClusterId,
+        MsgAttrID,
+        MsgAttrStatus,
+        nwkid=MsgSrcAddr,
     )
 
     timeStamped(self, MsgSrcAddr, 0x8110)
@@ -3032,7 +2938,7 @@ def Decode8110_raw(
     # We got a global status for all attributes requested in this command
     # We need to find the Attributes related to the i_sqn
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    self.log.logging("Input", "Debug", "------- - i_sqn: %0s e_sqn: %s" % (i_sqn, MsgSQN))
+    self.log.debug("Input", "------- - i_sqn: %0s e_sqn: %s", i_sqn, MsgSQN)
 
     for matchAttributeId in list(
         get_list_isqn_attr_datastruct(self, "WriteAttributes", MsgSrcAddr, MsgSrcEp, MsgClusterId)
@@ -3050,7 +2956,7 @@ def Decode8110_raw(
         ):
             continue
 
-        self.log.logging("Input", "Debug", "------- - Sqn matches for Attribute: %s" % matchAttributeId)
+        self.log.debug("Input", "------- - Sqn matches for Attribute: %s", matchAttributeId)
         set_status_datastruct(
             self,
             "WriteAttributes",
@@ -3070,12 +2976,15 @@ def Decode8110_raw(
             "fullfilled",
         )
         if MsgAttrStatus != "00":
-            self.log.logging(
+            self.log.debug(
                 "Input",
-                "Debug",
-                "Decode8110 - Write Attribute Response response - ClusterID: %s/%s, MsgSrcAddr: %s, MsgSrcEp:%s , Status: %s"
-                % (MsgClusterId, matchAttributeId, MsgSrcAddr, MsgSrcEp, MsgAttrStatus),
+                "Decode8110 - Write Attribute Response response - ClusterID: %s/%s, MsgSrcAddr: %s, MsgSrcEp:%s , Status: %s",
+                MsgClusterId,
+                matchAttributeId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrStatus,
+                nwkid=MsgSrcAddr,
             )
 
     if MsgClusterId == "0500":
@@ -3084,7 +2993,7 @@ def Decode8110_raw(
 
 def Decode8120(self, Devices, MsgData, MsgLQI):  # Configure Reporting response
 
-    self.log.logging("Input", "Debug", "Decode8120 - Configure reporting response: %s" % MsgData)
+    self.log.debug("Input", "Decode8120 - Configure reporting response: %s", MsgData)
     if len(MsgData) < 14:
         Domoticz.Error("Decode8120 - uncomplet message %s " % MsgData)
         return
@@ -3127,12 +3036,16 @@ def Decode8120(self, Devices, MsgData, MsgLQI):  # Configure Reporting response
 
 def Decode8120_attribute(self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus):
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8120 --> SQN: [%s], SrcAddr: %s, SrcEP: %s, ClusterID: %s, Attribute: %s Status: %s"
-        % (MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus),
+        "Decode8120 --> SQN: [%s], SrcAddr: %s, SrcEP: %s, ClusterID: %s, Attribute: %s Status: %s",
+        MsgSQN,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgClusterId,
+        MsgAttributeId,
+        MsgStatus,
+        nwkid=MsgSrcAddr,
     )
 
     self.configureReporting.read_configure_reporting_response(
@@ -3180,12 +3093,16 @@ def Decode8140(self, Devices, MsgData, MsgLQI):  # Attribute Discovery response
         MsgSrcEp = MsgData[12:14]
         MsgClusterID = MsgData[14:18]
 
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode8140 - Attribute Discovery Response - %s/%s - Cluster: %s - Attribute: %s - Attribute Type: %s Complete: %s"
-            % (MsgSrcAddr, MsgSrcEp, MsgClusterID, MsgAttID, MsgAttType, MsgComplete),
+            "Decode8140 - Attribute Discovery Response - %s/%s - Cluster: %s - Attribute: %s - Attribute Type: %s Complete: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterID,
+            MsgAttID,
+            MsgAttType,
+            MsgComplete,
+            nwkid=MsgSrcAddr,
         )
 
         if MsgSrcAddr not in self.ListOfDevices:
@@ -3208,6 +3125,7 @@ def Decode8140(self, Devices, MsgData, MsgLQI):  # Attribute Discovery response
             return
 
         self.ListOfDevices[MsgSrcAddr]["Attributes List"]["Ep"][MsgSrcEp][MsgClusterID][MsgAttID] = MsgAttType
+        device_updated(self, MsgSrcAddr)
 
         if MsgComplete != "01":
             next_start = "%04x" % (int(MsgAttID, 16) + 1)
@@ -3279,6 +3197,7 @@ def Decode8141(self, Devices, MsgData, MsgLQI):  # Attribute Discovery Extended
         self.ListOfDevices[MsgSrcAddr]["Attributes List Extended"]["Ep"][MsgSrcEp][MsgClusterID][MsgAttID]["Global"] = (
             int(MsgAttFlag, 16) & 0b00010000
         ) >> 4
+        device_updated(self, MsgSrcAddr)
 
 
 # IAS Zone
@@ -3346,21 +3265,18 @@ def Decode8401(self, Devices, MsgData, MsgLQI):  # Reception Zone status change
     if "Model" in self.ListOfDevices[MsgSrcAddr]:
         Model = self.ListOfDevices[MsgSrcAddr]["Model"]
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8401 - MsgSQN: %s MsgSrcAddr: %s MsgEp:%s MsgClusterId: %s MsgZoneStatus: %s MsgExtStatus: %s MsgZoneID: %s MsgDelay: %s"
-        % (
-            MsgSQN,
-            MsgSrcAddr,
-            MsgEp,
-            MsgClusterId,
-            MsgZoneStatus,
-            MsgExtStatus,
-            MsgZoneID,
-            MsgDelay,
-        ),
+        "Decode8401 - MsgSQN: %s MsgSrcAddr: %s MsgEp:%s MsgClusterId: %s MsgZoneStatus: %s MsgExtStatus: %s MsgZoneID: %s MsgDelay: %s",
+        MsgSQN,
         MsgSrcAddr,
+        MsgEp,
+        MsgClusterId,
+        MsgZoneStatus,
+        MsgExtStatus,
+        MsgZoneID,
+        MsgDelay,
+        nwkid=MsgSrcAddr,
     )
     if Model == "PST03A-v2.2.5":
         Decode8401_PST03Av225(self, Devices, MsgSrcAddr, MsgEp, Model, MsgZoneStatus)
@@ -3407,19 +3323,15 @@ def Decode8401(self, Devices, MsgData, MsgLQI):  # Reception Zone status change
         battdef,
     )
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "IAS Zone for device:%s  - %s" % (MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEp]["0500"]["0002"]),
+        "IAS Zone for device:%s  - %s",
         MsgSrcAddr,
+        self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEp]["0500"]["0002"],
+        nwkid=MsgSrcAddr,
     )
 
-    self.log.logging(
-        "Input",
-        "Debug",
-        "Decode8401 MsgZoneStatus: %s " % MsgZoneStatus[2:4],
-        MsgSrcAddr,
-    )
+    self.log.debug("Input", "Decode8401 MsgZoneStatus: %s ", MsgZoneStatus[2:4], nwkid=MsgSrcAddr)
     value = MsgZoneStatus[2:4]
 
     if self.ListOfDevices[MsgSrcAddr]["Model"] in (
@@ -3557,7 +3469,7 @@ def Decode8503(self, Devices, MsgData, MsgLQI):  # OTA image block request
 def Decode8701(self, Devices, MsgData, MsgLQI):  # Reception Router Disovery Confirm Status
 
     MsgLen = len(MsgData)
-    self.log.logging("Input", "Debug", "Decode8701 - MsgData: %s MsgLen: %s" % (MsgData, MsgLen))
+    self.log.debug("Input", "Decode8701 - MsgData: %s MsgLen: %s", MsgData, MsgLen)
 
     if MsgLen < 4:
         return
@@ -3587,11 +3499,13 @@ def Decode8701(self, Devices, MsgData, MsgLQI):  # Reception Router Disovery Con
             ),
         )
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8701 - Route discovery has been performed for %s %s, status: %s Nwk Status: %s "
-        % (MsgSrcAddr, MsgSrcIEEE, Status, NwkStatus),
+        "Decode8701 - Route discovery has been performed for %s %s, status: %s Nwk Status: %s ",
+        MsgSrcAddr,
+        MsgSrcIEEE,
+        Status,
+        NwkStatus,
     )
 
 
@@ -3620,12 +3534,16 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
 
     updLQI(self, MsgSrcAddr, MsgLQI)
     # self.log.logging( "Input", 'Debug', "Decode8085 - MsgData: %s "  %MsgData, MsgSrcAddr)
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s "
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, unknown_),
+        "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s ",
+        MsgSQN,
         MsgSrcAddr,
+        MsgEP,
+        MsgClusterId,
+        MsgCmd,
+        unknown_,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgSrcAddr not in self.ListOfDevices:
@@ -3655,7 +3573,7 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
     elif _ModelName in ("ROM001",):
         # ZigateRead - MsgType: 8095, MsgLength: 000b, MsgCRC: 19, Data: 00010006029b6e400000, LQI: 183
         # Apr 19 14:19:59 rasp domoticz[31994]: 2021-04-19 14:19:59.194  DIN3-Zigate: (DIN3-Zigate) Decode8095 - SQN: 00, Addr: 9b6e, Ep: 01, Cluster: 0006, Cmd: 40, Unknown: 02
-        self.log.logging("Input", "Debug", "Decode8085 - Philips Hue ROM001  MsgCmd: %s" % MsgCmd, MsgSrcAddr)
+        self.log.debug("Input", "Decode8085 - Philips Hue ROM001  MsgCmd: %s", MsgCmd, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, "0008", "move")
 
     elif _ModelName in (
@@ -3716,12 +3634,7 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
         else:
             return
 
-        self.log.logging(
-            "Input",
-            "Debug",
-            "Decode8085 - INNR RC 110 selector: %s" % selector,
-            MsgSrcAddr,
-        )
+        self.log.debug("Input", "Decode8085 - INNR RC 110 selector: %s", selector, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, selector)
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = selector
 
@@ -3846,12 +3759,7 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
                     % (MsgSrcAddr, step_mod, up_down)
                 )
 
-            self.log.logging(
-                "Input",
-                "Debug",
-                "Decode8085 - Profalux remote selector: %s" % selector,
-                MsgSrcAddr,
-            )
+            self.log.debug("Input", "Decode8085 - Profalux remote selector: %s", selector, nwkid=MsgSrcAddr)
             if selector:
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, selector)
 
@@ -3887,12 +3795,17 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
     MsgPayload = MsgData[16 : len(MsgData)] if len(MsgData) > 16 else None
     updLQI(self, MsgSrcAddr, MsgLQI)
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode8095 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Payload: %s Unknown: %s "
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgPayload, unknown_),
+        "Decode8095 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Payload: %s Unknown: %s ",
+        MsgSQN,
         MsgSrcAddr,
+        MsgEP,
+        MsgClusterId,
+        MsgCmd,
+        MsgPayload,
+        unknown_,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgSrcAddr not in self.ListOfDevices:
@@ -3925,7 +3838,7 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
         # Decode8085 - SQN: 0a, Addr: 9b6e, Ep: 01, Cluster: 0008, Cmd: 02, Unknown: 02
         # ZigateRead - MsgType: 8085, MsgLength: 000d, MsgCRC: 64, Data: 0b010008029b6e0201380009, LQI: 171
         # Decode8085 - SQN: 0b, Addr: 9b6e, Ep: 01, Cluster: 0008, Cmd: 02, Unknown: 02
-        self.log.logging("Input", "Debug", "Decode8095 - Philips Hue ROM001  MsgCmd: %s" % MsgCmd, MsgSrcAddr)
+        self.log.debug("Input", "Decode8095 - Philips Hue ROM001  MsgCmd: %s", MsgCmd, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, "0008", "toggle")
 
     elif _ModelName == "TRADFRI motion sensor":
@@ -4036,12 +3949,16 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
             MajDomoDevice(self, Devices, MsgSrcAddr, "01", "0006", "01")
 
     elif _ModelName in ("TS0041", "TS0043", "TS0044", "TS0042", "TS004F", "TS004F-_TZ3000_xabckq1v"):  # Tuya remote
-        self.log.logging(
+        self.log.debug(
             "Input",
-            "Debug",
-            "Decode8095 - Tuya %s  Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, MsgPayload: %s "
-            % (_ModelName, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgPayload),
+            "Decode8095 - Tuya %s  Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, MsgPayload: %s ",
+            _ModelName,
             MsgSrcAddr,
+            MsgEP,
+            MsgClusterId,
+            MsgCmd,
+            MsgPayload,
+            nwkid=MsgSrcAddr,
         )
         if MsgCmd[0:2] == "fd" and MsgPayload:
             if MsgPayload == "00":
@@ -4103,12 +4020,17 @@ def Decode80A7(self, Devices, MsgData, MsgLQI):
     TYPE_DIRECTIONS = {"00": "right", "01": "left", "02": "middle"}
     TYPE_ACTIONS = {"07": "click", "08": "hold", "09": "release"}
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode80A7 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Direction: %s, Unknown_ %s"
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgDirection, unkown_),
+        "Decode80A7 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Direction: %s, Unknown_ %s",
+        MsgSQN,
         MsgSrcAddr,
+        MsgEP,
+        MsgClusterId,
+        MsgCmd,
+        MsgDirection,
+        unkown_,
+        nwkid=MsgSrcAddr,
     )
     if MsgSrcAddr not in self.ListOfDevices:
         return
@@ -4142,7 +4064,7 @@ def Decode80A7(self, Devices, MsgData, MsgLQI):
         selector = TYPE_DIRECTIONS[MsgDirection] + "_" + TYPE_ACTIONS[MsgCmd]
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, "rmt1", selector)
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = selector
-        self.log.logging("Input", "Debug", "Decode80A7 - selector: %s" % selector, MsgSrcAddr)
+        self.log.debug("Input", "Decode80A7 - selector: %s", selector, nwkid=MsgSrcAddr)
 
         if self.groupmgt and TYPE_DIRECTIONS[MsgDirection] in (
             "right",
@@ -4178,7 +4100,7 @@ def Decode8806(self, Devices, MsgData, MsgLQI):
         "JN516x M05": {0: 9.5, 52: -3, 40: -15, 31: -26},
     }
 
-    self.log.logging("Input", "Debug", "Decode8806 - MsgData: %s" % MsgData)
+    self.log.debug("Input", "Decode8806 - MsgData: %s", MsgData)
 
     TxPower = MsgData[0:2]
     self.zigatedata["Tx-Power"] = TxPower
@@ -4242,22 +4164,19 @@ def Decode7000(self, Devices, MsgData, MsgLQI):
     if uSrcAddress not in self.ListOfDevices:
         return
 
-    self.log.logging(
+    self.log.debug(
         "Input",
-        "Debug",
-        "Decode7000 - Default Response Notification [%s] %s/%s Cluster: %s DefaultReponse: %s ManufSpec: %s ManufCode: %s Command: %s Direction: %s FrameType: %s"
-        % (
-            u8TransactionSequenceNumber,
-            uSrcAddress,
-            u8SrcEndpoint,
-            u16ClusterId,
-            bDisableDefaultResponse,
-            bManufacturerSpecific,
-            u16ManufacturerCode,
-            u8CommandIdentifier,
-            bDirection,
-            eFrameType,
-        ),
+        "Decode7000 - Default Response Notification [%s] %s/%s Cluster: %s DefaultReponse: %s ManufSpec: %s ManufCode: %s Command: %s Direction: %s FrameType: %s",
+        u8TransactionSequenceNumber,
+        uSrcAddress,
+        u8SrcEndpoint,
+        u16ClusterId,
+        bDisableDefaultResponse,
+        bManufacturerSpecific,
+        u16ManufacturerCode,
+        u8CommandIdentifier,
+        bDirection,
+        eFrameType,
     )
 
     if bDisableDefaultResponse == "00":  # If Default Response required
@@ -4286,3 +4205,87 @@ def check_duplicate_sqn(self, Nwkid, Ep, Cluster, Sqn):
             self.ListOfDevices[Nwkid]["Ep"][Ep][Cluster]["0000"] = {}
 
     return Sqn != "00" and "SQN" in self.ListOfDevices[Nwkid] and Sqn == self.ListOfDevices[Nwkid]["SQN"]
+
+
+# Inbound decoders, by ZiGate message type.
+# Manufacturer modules can add their decoders with register_input_decoder()
+INPUT_DECODERS = DispatchTable(
+    "Input",
+    {
+        0x004d: Decode004D,
+        0x0100: Decode0100,
+        0x0110: Decode0110,
+        0x0302: Decode0302,
+        0x0400: Decode0400,
+        0x8000: Decode8000_v2,
+        0x8002: Decode8002,
+        0x8003: Decode8003,
+        0x8004: Decode8004,
+        0x8005: Decode8005,
+        0x8006: Decode8006,
+        0x8007: Decode8007,
+        0x8008: Decode8008,
+        0x8009: Decode8009,
+        0x8010: Decode8010,
+        0x8011: Decode8011,
+        0x8014: Decode8014,
+        0x8015: Decode8015,
+        0x8017: Decode8017,
+        0x8024: Decode8024,
+        0x8028: Decode8028,
+        0x802b: Decode802B,
+        0x802c: Decode802C,
+        0x8030: Decode8030,
+        0x8031: Decode8031,
+        0x8034: Decode8034,
+        0x8040: Decode8040,
+        0x8041: Decode8041,
+        0x8042: Decode8042,
+        0x8043: Decode8043,
+        0x8044: Decode8044,
+        0x8045: Decode8045,
+        0x8046: Decode8046,
+        0x8047: Decode8047,
+        0x8048: Decode8048,
+        0x8049: Decode8049,
+        0x804a: Decode804A,
+        0x804b: Decode804B,
+        0x804e: Decode804E,
+        0x8060: Decode8060,
+        0x8061: Decode8061,
+        0x8062: Decode8062,
+        0x8063: Decode8063,
+        0x8085: Decode8085,
+        0x8095: Decode8095,
+        0x80a6: Decode80A6,
+        0x80a7: Decode80A7,
+        0x8100: Decode8100,
+        0x8101: Decode8101,
+        0x8102: Decode8102,
+        0x8110: Decode8110,
+        0x8120: Decode8120,
+        0x8122: Decode8122,
+        0x8139: Decode8140,
+        0x8140: Decode8140,
+        0x8401: Decode8401,
+        0x8501: Decode8501,
+        0x8503: Decode8503,
+        0x8701: Decode8701,
+        0x8806: Decode8806,
+        0x8807: Decode8807,
+        0x7000: Decode7000,
+    },
+)
+
+# Handlers of the DecodedMessage provided by the Transport, by ZiGate message type.
+MESSAGE_DECODERS = DispatchTable(
+    "Messages",
+    {
+        0x8100: Decode8100_message,
+        0x8102: Decode8102_message,
+    },
+)
+
+
+def register_input_decoder(MsgType, decoder, override=False):
+    INPUT_DECODERS.register(MsgType, decoder, override)
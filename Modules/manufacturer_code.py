@@ -44,17 +44,22 @@ TUYA_MANUF_CODE = 1002
 def check_and_update_manufcode(self):
 
     for nwkid in list(self.ListOfDevices):
-        if "Manufacturer Name" in self.ListOfDevices[nwkid]:
-            if str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper() in MANUFACTURER_NAME_TO_CODE:
-                if (
-                    self.ListOfDevices[nwkid]["Manufacturer"]
-                    != MANUFACTURER_NAME_TO_CODE[str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper()]
-                ):
-                    self.ListOfDevices[nwkid]["Manufacturer"] = MANUFACTURER_NAME_TO_CODE[
-                        str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper()
-                    ]
-
-            elif self.ListOfDevices[nwkid]["Manufacturer Name"][0:3] in TUYA_PREFIX:
-                # Tuya
-                if self.ListOfDevices[nwkid]["Manufacturer"] != TUYA_MANUF_CODE:
-                    self.ListOfDevices[nwkid]["Manufacturer"] = TUYA_MANUF_CODE
+        update_manufcode(self, nwkid)
+
+
+def update_manufcode(self, nwkid):
+
+    if "Manufacturer Name" in self.ListOfDevices[nwkid]:
+        if str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper() in MANUFACTURER_NAME_TO_CODE:
+            if (
+                self.ListOfDevices[nwkid]["Manufacturer"]
+                != MANUFACTURER_NAME_TO_CODE[str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper()]
+            ):
+                self.ListOfDevices[nwkid]["Manufacturer"] = MANUFACTURER_NAME_TO_CODE[
+                    str(self.ListOfDevices[nwkid]["Manufacturer Name"]).upper()
+                ]
+
+        elif self.ListOfDevices[nwkid]["Manufacturer Name"][0:3] in TUYA_PREFIX:
+            # Tuya
+            if self.ListOfDevices[nwkid]["Manufacturer"] != TUYA_MANUF_CODE:
+                self.ListOfDevices[nwkid]["Manufacturer"] = TUYA_MANUF_CODE
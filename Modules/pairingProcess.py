@@ -29,7 +29,8 @@ from Modules.schneider_wiser import (PREFIX_MACADDR_WIZER_LEGACY,
                                      schneider_wiser_registration,
                                      wiser_home_lockout_thermostat)
 from Modules.thermostats import thermostat_Calibration
-from Modules.tools import getListOfEpForCluster, is_fake_ep
+from Modules.tools import (getListOfEpForCluster, is_fake_ep,
+                           reset_heartbeat)
 from Modules.tuya import tuya_cmd_ts004F, tuya_registration
 from Modules.tuyaSiren import tuya_sirene_registration
 from Modules.tuyaTools import tuya_TS0121_registration
@@ -132,7 +133,7 @@ def interview_state_004d(self, NWKID, RIA=None, status=None):
     self.log.logging("Pairing", "Status", "[%s] NEW OBJECT: %s %s" % (RIA, NWKID, status))
     if RIA:
         self.ListOfDevices[NWKID]["RIA"] = str(RIA + 1)
-    self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+    reset_heartbeat(self, NWKID)
     self.ListOfDevices[NWKID]["Status"] = "0045"
 
     MsgIEEE = None
@@ -234,7 +235,7 @@ def interview_state_8045(self, NWKID, RIA=None, status=None):
     )
     if RIA:
         self.ListOfDevices[NWKID]["RIA"] = str(RIA + 1)
-    self.ListOfDevices[NWKID]["Heartbeat"] = "0"
+    reset_heartbeat(self, NWKID)
     self.ListOfDevices[NWKID]["Status"] = "0043"
 
     if "Model" in self.ListOfDevices[NWKID] and self.ListOfDevices[NWKID]["Model"] == {}:
@@ -396,7 +397,7 @@ def full_provision_device(self, Devices, NWKID, RIA, status):
     zigbee_provision_device(self, Devices, NWKID, RIA, status)
 
     # Reset HB in order to force Read Attribute Status
-    self.ListOfDevices[NWKID]["Heartbeat"] = 0
+    reset_heartbeat(self, NWKID)
     self.adminWidgets.updateNotificationWidget(Devices, "Successful creation of Widget for :%s DeviceID: %s" % (self.ListOfDevices[NWKID]["Model"], NWKID))
     self.CommiSSionning = False
 
@@ -17,6 +17,7 @@ from time import time
 
 import Domoticz
 
+from Classes.DispatchTable import DispatchTable
 from Modules.domoMaj import MajDomoDevice
 from Modules.domoTools import Update_Battery_Device, timedOutDevice
 from Modules.lumi import (AqaraOppleDecoding0012, cube_decode, decode_vibr,
@@ -32,6 +33,7 @@ from Modules.tuya import (TUYA_2GANGS_SWITCH_MANUFACTURER,
                           TUYA_THERMOSTAT_MANUFACTURER, TUYA_TS0601_MODEL_NAME,
                           TUYA_WATER_TIMER, TUYA_eTRV1_MANUFACTURER,
                           TUYA_eTRV2_MANUFACTURER, TUYA_eTRV3_MANUFACTURER, TUYA_eTRV4_MANUFACTURER)
+from Modules.zclDecoder import ZCL_TYPE_DECODERS
 from Modules.zigateConsts import (LEGRAND_REMOTE_SHUTTER,
                                   LEGRAND_REMOTE_SWITCHS, LEGRAND_REMOTES,
                                   ZONE_TYPE)
@@ -45,55 +47,17 @@ def decodeAttribute(self, AttType, Attribute, handleErrors=False):
         return
     # self.log.logging( "Cluster", 'Debug', "decodeAttribute( %s, %s) " %(AttType, Attribute) )
 
-    if int(AttType, 16) == 0x10:  # Boolean
-        return Attribute[0:2]
+    # Value of the record in process, already decoded with the message ( see ReadCluster )
+    _decoded = self.decodedAttribute
+    if _decoded is not None and _decoded[1] is Attribute and _decoded[0] == AttType:
+        return _decoded[2]
 
-    if int(AttType, 16) == 0x18:  # 8Bit bitmap
-        return int(Attribute[0:8], 16)
+    AttType = int(AttType, 16)
+    _converter = ZCL_TYPE_DECODERS.get(AttType)
+    if _converter is not None:
+        return _converter(Attribute)
 
-    if int(AttType, 16) == 0x19:  # 16BitBitMap
-        return str(int(Attribute[0:4], 16))
-
-    if int(AttType, 16) == 0x20:  # Uint8 / unsigned char
-        return int(Attribute[0:2], 16)
-
-    if int(AttType, 16) == 0x21:  # 16BitUint
-        return str(struct.unpack("H", struct.pack("H", int(Attribute[0:4], 16)))[0])
-
-    if int(AttType, 16) == 0x22:  # ZigBee_24BitUint
-        return str(struct.unpack("I", struct.pack("I", int("0" + Attribute, 16)))[0])
-
-    if int(AttType, 16) == 0x23:  # 32BitUint
-        return str(struct.unpack("I", struct.pack("I", int(Attribute[0:8], 16)))[0])
-
-    if int(AttType, 16) == 0x25:  # ZigBee_48BitUint
-        return str(struct.unpack("Q", struct.pack("Q", int(Attribute, 16)))[0])
-
-    if int(AttType, 16) == 0x28:  # int8
-        return int(Attribute, 16)
-
-    if int(AttType, 16) == 0x29:  # 16Bitint   -> tested on Measurement clusters
-        return str(struct.unpack("h", struct.pack("H", int(Attribute[0:4], 16)))[0])
-
-    if int(AttType, 16) == 0x2A:  # ZigBee_24BitInt
-        return str(struct.unpack("i", struct.pack("I", int("0" + Attribute, 16)))[0])
-
-    if int(AttType, 16) == 0x2B:  # 32Bitint
-        return str(struct.unpack("i", struct.pack("I", int(Attribute[0:8], 16)))[0])
-
-    if int(AttType, 16) == 0x2D:  # ZigBee_48Bitint
-        return str(struct.unpack("q", struct.pack("Q", int(Attribute, 16)))[0])
-
-    if int(AttType, 16) == 0x30:  # 8BitEnum
-        return int(Attribute[0:2], 16)
-
-    if int(AttType, 16) == 0x31:  # 16BitEnum
-        return str(struct.unpack("h", struct.pack("H", int(Attribute[0:4], 16)))[0])
-
-    if int(AttType, 16) == 0x39:  # Xiaomi Float
-        return str(struct.unpack("f", struct.pack("I", int(Attribute, 16)))[0])
-
-    if int(AttType, 16) == 0x42:  # CharacterString
+    if AttType == 0x42:  # CharacterString
         decode = ""
         try:
             decode = binascii.unhexlify(Attribute).decode("utf-8")
@@ -105,10 +69,11 @@ def decodeAttribute(self, AttType, Attribute, handleErrors=False):
                 decode = binascii.unhexlify(Attribute).decode("utf-8", errors="ignore")
                 decode = decode.replace("\x00", "")
                 decode = decode.strip()
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "decodeAttribute - seems errors, returning with errors ignore From: %s to >%s<" % (str(Attribute), str(decode)),
+                    "decodeAttribute - seems errors, returning with errors ignore From: %s to >%s<",
+                    str(Attribute),
+                    str(decode),
                 )
 
         # Cleaning
@@ -147,6 +112,7 @@ def ReadCluster(
     MsgAttSize,
     MsgClusterData,
     Source=None,
+    Value=None,
 ):
 
     if MsgSrcAddr not in self.ListOfDevices:
@@ -177,70 +143,41 @@ def ReadCluster(
     if MsgClusterId not in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp]:
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId] = {}
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgAttrStatus, MsgClusterData),
+        "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgAttrStatus,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     storeReadAttributeStatus(self, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus)
 
     if MsgAttrStatus != "00" and MsgClusterId != "0500":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Status %s for addr: %s/%s on cluster/attribute %s/%s" % (MsgAttrStatus, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID),
+            "ReadCluster - Status %s for addr: %s/%s on cluster/attribute %s/%s",
+            MsgAttrStatus,
+            MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterId,
+            MsgAttrID,
             nwkid=MsgSrcAddr,
         )
         self.statistics._clusterKO += 1
         return
 
-    DECODE_CLUSTER = {
-        "0000": Cluster0000,
-        "0001": Cluster0001,
-        "0002": Cluster0002,
-        "0003": Cluster0003,
-        "0005": Cluster0005,
-        "0006": Cluster0006,
-        "0008": Cluster0008,
-        "0009": Cluster0009,
-        "0012": Cluster0012,
-        "0019": Cluster0019,
-        "000c": Cluster000c,
-        "0100": Cluster0100,
-        "0101": Cluster0101,
-        "0102": Cluster0102,
-        "0201": Cluster0201,
-        "0202": Cluster0202,
-        "0204": Cluster0204,
-        "0300": Cluster0300,
-        "0301": Cluster0301,
-        "0400": Cluster0400,
-        "0402": Cluster0402,
-        "0403": Cluster0403,
-        "0405": Cluster0405,
-        "0406": Cluster0406,
-        "0500": Cluster0500,
-        "0502": Cluster0502,
-        "0702": Cluster0702,
-        "0b01": Cluster0b01,
-        "0b04": Cluster0b04,
-        "0b05": Cluster0b05,
-        "fe03": Clusterfe03,
-        "fc00": Clusterfc00,
-        "000f": Cluster000f,
-        "e000": Clustere000,
-        "e001": Clustere001,
-        "fc01": Clusterfc01,
-        "fc21": Clusterfc21,
-        "fcc0": Clusterfcc0,
-        "fc40": Clusterfc40,
-        "ff66": Clusterff66,
-    }
-
-    if MsgClusterId in DECODE_CLUSTER:
-        _func = DECODE_CLUSTER[MsgClusterId]
+    # Value decoded with the attribute records, returned by decodeAttribute() for MsgClusterData
+    self.decodedAttribute = (MsgAttType, MsgClusterData, Value) if Value is not None else None
+
+    _func = CLUSTER_DECODERS.lookup(int(MsgClusterId, 16))
+    if _func is not None:
         _func(
             self,
             Devices,
@@ -504,11 +441,13 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             self.ListOfDevices[MsgSrcAddr]["Model"] = {}
 
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = AttrModelName  # We store the original one
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s / %s - Recepion Model: >%s<" % (MsgClusterId, MsgAttrID, modelName),
-            MsgSrcAddr,
+            "ReadCluster - %s / %s - Recepion Model: >%s<",
+            MsgClusterId,
+            MsgAttrID,
+            modelName,
+            nwkid=MsgSrcAddr,
         )
         if modelName == "":
             return
@@ -517,27 +456,32 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if "Ep" in self.ListOfDevices[MsgSrcAddr]:
             for iterEp in list(self.ListOfDevices[MsgSrcAddr]["Ep"]):
                 if "ClusterType" in list(self.ListOfDevices[MsgSrcAddr]["Ep"][iterEp]):
-                    self.log.logging(
+                    self.log.debug(
                         "Cluster",
-                        "Debug",
-                        "ReadCluster - %s / %s - %s %s is already provisioned in Domoticz" % (MsgClusterId, MsgAttrID, MsgSrcAddr, modelName),
+                        "ReadCluster - %s / %s - %s %s is already provisioned in Domoticz",
+                        MsgClusterId,
+                        MsgAttrID,
                         MsgSrcAddr,
+                        modelName,
+                        nwkid=MsgSrcAddr,
                     )
 
                     # However if Model is not correctly set, let's take the opportunity to correct
                     if self.ListOfDevices[MsgSrcAddr]["Model"] != modelName:
-                        self.log.logging(
+                        self.log.debug(
                             "Cluster",
-                            "Debug",
-                            "ReadCluster - %s / %s - Update Model Name %s" % (MsgClusterId, MsgAttrID, modelName),
-                            MsgSrcAddr,
+                            "ReadCluster - %s / %s - Update Model Name %s",
+                            MsgClusterId,
+                            MsgAttrID,
+                            modelName,
+                            nwkid=MsgSrcAddr,
                         )
                         self.ListOfDevices[MsgSrcAddr]["Model"] = modelName
                     return
 
         if self.ListOfDevices[MsgSrcAddr]["Model"] == modelName and self.ListOfDevices[MsgSrcAddr]["Model"] in self.DeviceConf:
             # This looks like a Duplicate, just drop
-            self.log.logging("Cluster", "Debug", "ReadCluster - %s / %s - no action" % (MsgClusterId, MsgAttrID), MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster - %s / %s - no action", MsgClusterId, MsgAttrID, nwkid=MsgSrcAddr)
             return
 
         if self.ListOfDevices[MsgSrcAddr]["Model"] != modelName and self.ListOfDevices[MsgSrcAddr]["Model"] in self.DeviceConf:
@@ -564,7 +508,7 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # Let's see if this model is known in DeviceConf. If so then we will retreive already the Eps
         if self.ListOfDevices[MsgSrcAddr]["Model"] in self.DeviceConf:  # If the model exist in DeviceConf.txt
             modelName = self.ListOfDevices[MsgSrcAddr]["Model"]
-            self.log.logging("Cluster", "Debug", "Extract all info from Model : %s" % self.DeviceConf[modelName], MsgSrcAddr)
+            self.log.debug("Cluster", "Extract all info from Model : %s", self.DeviceConf[modelName], nwkid=MsgSrcAddr)
 
             if "ConfigSource" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["ConfigSource"] == "DeviceConf":
                 self.log.logging("Cluster", "Debug", "Not redoing the DeviceConf enrollement", MsgSrcAddr)
@@ -585,16 +529,22 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                     _BackupEp = dict(self.ListOfDevices[MsgSrcAddr]["Ep"])
                     del self.ListOfDevices[MsgSrcAddr]["Ep"]  # It has been prepopulated by some 0x8043 message, let's remove them.
                     self.ListOfDevices[MsgSrcAddr]["Ep"] = {}  # It has been prepopulated by some 0x8043 message, let's remove them.
-                    self.log.logging("Cluster", "Debug", "-- Record removed 'Ep' %s" % (self.ListOfDevices[MsgSrcAddr]), MsgSrcAddr)
+                    self.log.debug(
+                        "Cluster",
+                        "-- Record removed 'Ep' %s",
+                        self.ListOfDevices[MsgSrcAddr],
+                        nwkid=MsgSrcAddr,
+                    )
 
             for Ep in self.DeviceConf[modelName]["Ep"]:  # For each Ep in DeviceConf.txt
                 if Ep not in self.ListOfDevices[MsgSrcAddr]["Ep"]:  # If this EP doesn't exist in database
                     self.ListOfDevices[MsgSrcAddr]["Ep"][Ep] = {}  # create it.
-                    self.log.logging(
+                    self.log.debug(
                         "Cluster",
-                        "Debug",
-                        "-- Create Endpoint %s in record %s" % (Ep, self.ListOfDevices[MsgSrcAddr]["Ep"]),
-                        MsgSrcAddr,
+                        "-- Create Endpoint %s in record %s",
+                        Ep,
+                        self.ListOfDevices[MsgSrcAddr]["Ep"],
+                        nwkid=MsgSrcAddr,
                     )
 
                 for cluster in self.DeviceConf[modelName]["Ep"][Ep]:  # For each cluster discribe in DeviceConf.txt
@@ -602,7 +552,7 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                         # If this cluster doesn't exist in database
                         continue
 
-                    self.log.logging("Cluster", "Debug", "----> Cluster: %s" % cluster, MsgSrcAddr)
+                    self.log.debug("Cluster", "----> Cluster: %s", cluster, nwkid=MsgSrcAddr)
                     self.ListOfDevices[MsgSrcAddr]["Ep"][Ep][cluster] = {}  # create it.
                     if _BackupEp and Ep in _BackupEp:
                         # In case we had data, let's retreive it
@@ -615,11 +565,12 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                             else:
                                 self.ListOfDevices[MsgSrcAddr]["Ep"][Ep][cluster][attr] = _BackupEp[Ep][cluster][attr]
 
-                            self.log.logging(
+                            self.log.debug(
                                 "Cluster",
-                                "Debug",
-                                "------> Cluster %s set with Attribute %s" % (cluster, attr),
-                                MsgSrcAddr,
+                                "------> Cluster %s set with Attribute %s",
+                                cluster,
+                                attr,
+                                nwkid=MsgSrcAddr,
                             )
 
                 if "Type" in self.DeviceConf[modelName]["Ep"][Ep]:  # If type exist at EP level : copy it
@@ -630,11 +581,11 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                     if "ColorMode" in self.DeviceConf[modelName]["Ep"][Ep]:
                         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["ColorMode"] = int(self.DeviceConf[modelName]["Ep"][Ep]["ColorMode"])
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "Result based on DeviceConf is: %s" % str(self.ListOfDevices[MsgSrcAddr]),
-                MsgSrcAddr,
+                "Result based on DeviceConf is: %s",
+                str(self.ListOfDevices[MsgSrcAddr]),
+                nwkid=MsgSrcAddr,
             )
 
     elif MsgAttrID == "0006":  # CLD_BAS_ATTR_DATE_CODE
@@ -643,57 +594,57 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "0007":  # Power Source
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Power Source: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - Power Source: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         # 0x03 stand for Battery
 
     elif MsgAttrID == "0008":  #
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Attribute 0008: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - Attribute 0008: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "0009":  #
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Attribute 0009: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - Attribute 0009: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "000a":  # Product Code
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Product Code: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - Product Code: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "000b":  #
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Attribute 0x000b: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - Attribute 0x000b: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "0010":  # LOCATION_DESCRIPTION
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Location: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Location: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]["Location"] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
@@ -727,70 +678,70 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "0015":  # SW_BUILD_ID
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut 0015: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut 0015: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]["SWBUILD_2"] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "0016":  # Battery
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut 0016 : %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut 0016 : %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]["Battery0016"] = decodeAttribute(self, MsgAttType, MsgClusterData)
         self.ListOfDevices[MsgSrcAddr]["BatteryUpdateTime"] = int(time())
 
     elif MsgAttrID == "4000":  # SW Build
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut 4000: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut 4000: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]["SWBUILD_3"] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "8000":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut 8000: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut 8000: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]["SWBUILD_3"] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "e000":  # Schneider Thermostat
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut e000: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut e000: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "e001":  # Schneider Thermostat
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut e001: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut e001: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "e002":  # Schneider Thermostat
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - Attribut e002: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-            MsgSrcAddr,
+            "ReadCluster - 0x0000 - Attribut e002: %s",
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
@@ -813,20 +764,25 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 MsgSrcAddr,
             )
         else:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - 0x0000 - Attribut f000: %s" % str(decodeAttribute(self, MsgAttType, MsgClusterData)),
-                MsgSrcAddr,
+                "ReadCluster - 0x0000 - Attribut f000: %s",
+                str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+                nwkid=MsgSrcAddr,
             )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID in ("ff0d", "ff22", "ff23"):  # Xiaomi Code
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0x0000 - %s/%s Attribut %s %s %s %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - 0x0000 - %s/%s Attribut %s %s %s %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "ff30":  # Xiaomi Locking status
@@ -834,11 +790,14 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # 1207xx -> Unlock everything to neutral state
         # 1211xx -> Key in the lock
         # xx is the key number
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s %s Saddr: %s ClusterData: %s" % (MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData),
+            "ReadCluster - %s %s Saddr: %s ClusterData: %s",
+            MsgClusterId,
+            MsgAttrID,
             MsgSrcAddr,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         readLumiLock(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)
 
@@ -847,37 +806,38 @@ def Cluster0000(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             # Domoticz.Error("ReadCluster - %s - %s/%s Attribut %s received while device not inDB" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID))
             return
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s %s Saddr: %s ClusterData: %s" % (MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData),
+            "ReadCluster - %s %s Saddr: %s ClusterData: %s",
+            MsgClusterId,
+            MsgAttrID,
             MsgSrcAddr,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = MsgClusterData
         readXiaomiCluster(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)
 
     elif MsgAttrID in ("ffe0", "ffe1", "ffe2", "ffe4", "fffe", "ffdf"):
         # Tuya, Zemismart
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0000 %s/%s attribute Tuya/Zemismat - %s: 0x%s"
-            % (
-                MsgSrcAddr,
-                MsgSrcEp,
-                MsgAttrID,
-                MsgClusterData,
-            ),
+            "ReadCluster - 0000 %s/%s attribute Tuya/Zemismat - %s: 0x%s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
 
     elif MsgAttrID == "fffd":  #
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0000/fffd Addr: %s Cluster Revision:%s" % (MsgSrcAddr, MsgClusterData),
+            "ReadCluster - 0000/fffd Addr: %s Cluster Revision:%s",
             MsgSrcAddr,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute(self, MsgAttType, MsgClusterData))
         # self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]['Cluster Revision'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
@@ -906,21 +866,21 @@ def Cluster0001(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         value = round(int(value) / 10, 1)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value))
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s General Voltage: %s V " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s General Voltage: %s V ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0001":  # MAINS FREQUENCY
         # 0x00 indicates a DC supply, or Freq too low
         # 0xFE indicates AC Freq is too high
         # 0xFF indicates AC Freq cannot be measured
         if int(value) == 0x00:
-            self.log.logging("Cluster", "Debug", "readCluster 0001 %s Freq is DC or too  low" % MsgSrcAddr, MsgSrcAddr)
+            self.log.debug("Cluster", "readCluster 0001 %s Freq is DC or too  low", MsgSrcAddr, nwkid=MsgSrcAddr)
         elif int(value) == 0xFE:
-            self.log.logging("Cluster", "Debug", "readCluster 0001 %s Freq is too high" % MsgSrcAddr, MsgSrcAddr)
+            self.log.debug("Cluster", "readCluster 0001 %s Freq is too high", MsgSrcAddr, nwkid=MsgSrcAddr)
         elif int(value) == 0xFF:
-            self.log.logging("Cluster", "Debug", "readCluster 0001 %s Freq cannot be measured" % MsgSrcAddr, MsgSrcAddr)
+            self.log.debug("Cluster", "readCluster 0001 %s Freq cannot be measured", MsgSrcAddr, nwkid=MsgSrcAddr)
         else:
             value = round(int(value) / 2)  #
-            self.log.logging("Cluster", "Debug", "readCluster 0001 %s Freq %s Hz" % (MsgSrcAddr, value), MsgSrcAddr)
+            self.log.debug("Cluster", "readCluster 0001 %s Freq %s Hz", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -928,11 +888,14 @@ def Cluster0001(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         _undervoltage = (int(value)) & 1
         _overvoltage = (int(value) >> 1) & 1
         _mainpowerlost = (int(value) >> 2) & 1
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster 0001 %s Alarm Mask: UnderVoltage: %s OverVoltage: %s MainPowerLost: %s" % (MsgSrcAddr, _undervoltage, _overvoltage, _mainpowerlost),
+            "readCluster 0001 %s Alarm Mask: UnderVoltage: %s OverVoltage: %s MainPowerLost: %s",
             MsgSrcAddr,
+            _undervoltage,
+            _overvoltage,
+            _mainpowerlost,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -946,12 +909,12 @@ def Cluster0001(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
  
     elif MsgAttrID == "0010":  # Voltage
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Battery Voltage: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Battery Voltage: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value))
 
     elif MsgAttrID == "0020":  # Battery Voltage
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Battery: %s V" % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Battery: %s V", MsgSrcAddr, value, nwkid=MsgSrcAddr)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] in (
             "MOSZB-140",
             "HMSZB-110",
@@ -973,48 +936,55 @@ def Cluster0001(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             return
         if value == 0xFF:
             # Invalid measure
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster 0001 - %s invalid Battery Percentage: %s " % (MsgSrcAddr, value),
+                "readCluster 0001 - %s invalid Battery Percentage: %s ",
                 MsgSrcAddr,
+                value,
+                nwkid=MsgSrcAddr,
             )
             value = 0
 
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Battery Percentage: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Battery Percentage: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0031":  # Battery Size
         # 0x03 stand for AA
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Battery size: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Battery size: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0033":  # Battery Quantity
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Battery Quantity: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Battery Quantity: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0035":  # Battery Alarm Mask
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Attribut 0035: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Attribut 0035: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0036":  # Minimum Threshold
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Minimum Threshold: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Minimum Threshold: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "003e":  # BatteryAlarmState
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "fffd":  # Cluster Version
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging("Cluster", "Debug", "readCluster 0001 - %s Cluster Version: %s " % (MsgSrcAddr, value), MsgSrcAddr)
+        self.log.debug("Cluster", "readCluster 0001 - %s Cluster Version: %s ", MsgSrcAddr, value, nwkid=MsgSrcAddr)
 
     else:
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     UpdateBatteryAttribute(self, Devices, MsgSrcAddr, MsgSrcEp)
@@ -1127,11 +1097,16 @@ def UpdateBatteryAttribute(self, Devices, MsgSrcAddr, MsgSrcEp):
     if "0021" in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp]["0001"] and self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp]["0001"]["0021"] != {}:
         battRemainPer = float(self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp]["0001"]["0021"])
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "readCluster 0001 - Device: %s Model: %s mainVolt:%s , battVolt:%s, battRemainingVolt: %s, battRemainPer:%s " % (MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]["Model"], mainVolt, battVolt, battRemainingVolt, battRemainPer),
+        "readCluster 0001 - Device: %s Model: %s mainVolt:%s , battVolt:%s, battRemainingVolt: %s, battRemainPer:%s ",
         MsgSrcAddr,
+        self.ListOfDevices[MsgSrcAddr]["Model"],
+        mainVolt,
+        battVolt,
+        battRemainingVolt,
+        battRemainPer,
+        nwkid=MsgSrcAddr,
     )
 
     value = None
@@ -1184,21 +1159,26 @@ def UpdateBatteryAttribute(self, Devices, MsgSrcAddr, MsgSrcEp):
     #    battRemainingVolt, type(battRemainingVolt) ))
 
     if value:
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster 0001 - Device: %s Model: %s Updating battery %s to %s" % (MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]["Model"], self.ListOfDevices[MsgSrcAddr]["Battery"], value),
+            "readCluster 0001 - Device: %s Model: %s Updating battery %s to %s",
             MsgSrcAddr,
+            self.ListOfDevices[MsgSrcAddr]["Model"],
+            self.ListOfDevices[MsgSrcAddr]["Battery"],
+            value,
+            nwkid=MsgSrcAddr,
         )
         if value != self.ListOfDevices[MsgSrcAddr]["Battery"]:
             self.ListOfDevices[MsgSrcAddr]["Battery"] = value
             Update_Battery_Device(self, Devices, MsgSrcAddr, value)
             self.ListOfDevices[MsgSrcAddr]["BatteryUpdateTime"] = int(time())
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster 0001 - Device: %s Model: %s Updating battery to %s" % (MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]["Model"], value),
+                "readCluster 0001 - Device: %s Model: %s Updating battery to %s",
                 MsgSrcAddr,
+                self.ListOfDevices[MsgSrcAddr]["Model"],
+                value,
+                nwkid=MsgSrcAddr,
             )
 
 
@@ -1215,20 +1195,29 @@ def Cluster0002(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     
 def Cluster0003(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     if MsgAttrID == "0000":  # IdentifyTime Attribute
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Remaining time to identify itself %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, int(MsgClusterData, 16)),
+            "ReadCluster %s - %s/%s Remaining time to identify itself %s",
+            MsgClusterId,
+            MsgSrcAddr,
+            MsgSrcEp,
+            int(MsgClusterData, 16),
         )
 
 
@@ -1237,59 +1226,101 @@ def Cluster0005(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     if MsgAttrID == "0000":  # SceneCount
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene Count: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene Count: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0001":  # CurrentScene
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene Cuurent Scene: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene Cuurent Scene: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0002":  # CurrentGroup
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene Current Group: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene Current Group: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0003":  # SceneVal id
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene Valid : %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene Valid : %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0004":  # NameSupport
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene NameSupport: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene NameSupport: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0005":  # LastConfiguredBy
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Scene Last Configured By : %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Scene Last Configured By : %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
 
@@ -1312,11 +1343,17 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
             # endpoint 02 is for controlling the L1 output
             # Blacklist all EPs other than '02'
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=%s - Unexpected EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+                "ReadCluster - ClusterId=%s - Unexpected EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgAttType,
+                MsgAttSize,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             return
 
@@ -1326,11 +1363,17 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             # EP 04 EVENT LEFT
             # EP 05 EVENT RIGHT
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=%s - not processed EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+                "ReadCluster - ClusterId=%s - not processed EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgAttType,
+                MsgAttSize,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             return
 
@@ -1357,11 +1400,11 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             else:
                 # Domoticz.Log("Konke Multi Purpose Switch - Unknown Value: %s" %MsgClusterData)
                 return
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=0006 - Konke Multi Purpose Switch reception General: On/Off: %s" % value,
-                MsgSrcAddr,
+                "ReadCluster - ClusterId=0006 - Konke Multi Purpose Switch reception General: On/Off: %s",
+                value,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value)
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
@@ -1380,57 +1423,66 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
         if self.ListOfDevices[MsgSrcAddr]["Model"] == "TI0001":
             # Livolo / Might get something else than On/Off
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=0006 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+                "ReadCluster - ClusterId=0006 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s",
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgAttType,
+                MsgAttSize,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
 
 
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - reception General: On/Off: %s" % str(MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - reception General: On/Off: %s",
+            str(MsgClusterData),
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "4000":  # Global Scene Control
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - Global Scene Control Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - Global Scene Control Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     elif MsgAttrID == "4001":  # On Time
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - On Time Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - On Time Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     elif MsgAttrID == "4002":  # Off Wait Time
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - Off Wait Time Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - Off Wait Time Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     elif MsgAttrID == "4003":  # Power On On Off
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
@@ -1438,11 +1490,11 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - reception General: On/Off: %s for Mija Button" % str(MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - reception General: On/Off: %s for Mija Button",
+            str(MsgClusterData),
+            nwkid=MsgSrcAddr,
         )       
         
     elif MsgAttrID == "8000":
@@ -1466,20 +1518,22 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     elif MsgAttrID == "8002":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     elif MsgAttrID == "8003":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
@@ -1487,11 +1541,14 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - Feedback from device %s/%s Attribute 0xf000 value: %s-%s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData, value),
+            "ReadCluster - Feedback from device %s/%s Attribute 0xf000 value: %s-%s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
         _Xiaomi_code = MsgClusterData[0:2]
         # _Xiaomi_sAddr = MsgClusterData[2:6]
@@ -1512,40 +1569,44 @@ def Cluster0006(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
         if _Xiaomi_code in XIAOMI_CODE:
             if "ZDeviceName" in self.ListOfDevices[MsgSrcAddr]:
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "ReadCluster - Xiaomi 0006/f000 - %s %s/%s %s: %s"
-                    % (
-                        self.ListOfDevices[MsgSrcAddr]["ZDeviceName"],
-                        MsgSrcAddr,
-                        MsgSrcEp,
-                        XIAOMI_CODE[_Xiaomi_code],
-                        int(_Xiaomi_Value, 16),
-                    ),
+                    "ReadCluster - Xiaomi 0006/f000 - %s %s/%s %s: %s",
+                    self.ListOfDevices[MsgSrcAddr]["ZDeviceName"],
                     MsgSrcAddr,
+                    MsgSrcEp,
+                    XIAOMI_CODE[_Xiaomi_code],
+                    int(_Xiaomi_Value, 16),
+                    nwkid=MsgSrcAddr,
                 )
             else:
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "ReadCluster - Xiaomi 0006/f000 - %s/%s %s: %s" % (MsgSrcAddr, MsgSrcEp, XIAOMI_CODE[_Xiaomi_code], int(_Xiaomi_Value, 16)),
+                    "ReadCluster - Xiaomi 0006/f000 - %s/%s %s: %s",
                     MsgSrcAddr,
+                    MsgSrcEp,
+                    XIAOMI_CODE[_Xiaomi_code],
+                    int(_Xiaomi_Value, 16),
+                    nwkid=MsgSrcAddr,
                 )
 
         else:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - Xiaomi 0006/f000 - - %s/%s Unknown Xiaomi Code %s raw data: %s (please report to @pipiche)" % (MsgSrcAddr, MsgSrcEp, _Xiaomi_code, MsgClusterData),
+                "ReadCluster - Xiaomi 0006/f000 - - %s/%s Unknown Xiaomi Code %s raw data: %s (please report to @pipiche)",
                 MsgSrcAddr,
+                MsgSrcEp,
+                _Xiaomi_code,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
 
     elif MsgAttrID == "fffd":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0006 - unknown Attr: %s Value: %s" % (MsgAttrID, MsgClusterData),
+            "ReadCluster - ClusterId=0006 - unknown Attr: %s Value: %s",
+            MsgAttrID,
+            MsgClusterData,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
@@ -1564,76 +1625,100 @@ def Cluster0008(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - ClusterID: %s Addr: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s" % (MsgClusterId, MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster - ClusterID: %s Addr: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID == "0000":  # Current Level
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "TI0001" and MsgSrcEp == "06":  # Livolo switch
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=0008 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+                "ReadCluster - ClusterId=0008 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s",
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgAttType,
+                MsgAttSize,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             # Do nothing as the Livolo state is given by 0x0100
             return
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s Level Control: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s Level Control: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
 
     elif MsgAttrID == "0001":  # Remaining Time
         # The RemainingTime attribute represents the time remaining until the current
         # command is complete - it is specified in 1/10ths of a second.
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s Remaining Time: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s Remaining Time: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0010":  # OnOffTransitionTime
         # The OnOffTransitionTime attribute represents the time taken to move to or from the target level
         # when On of Off commands are received by an On/Off cluster on the same endpoint. It is specified in 1/10ths of a second.
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s OnOff Transition Time: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s OnOff Transition Time: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0011":  # OnLevel
         # The OnLevel attribute determines the value that the CurrentLevel attribute is
         # set to when the OnOff attribute of an On/Off cluster on the same endpoint is set to On.
         # If the OnLevel attribute is not implemented, or is set to 0xff, it has no effect.
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s On Level : %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s On Level : %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "4000":  #
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "f000":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData),
+            "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -1660,19 +1745,22 @@ def Cluster0009(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 def Cluster000c(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
     # Analog Binary
     # Magic Cube Xiaomi rotation and Power Meter
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - ClusterID=000C - MsgSrcEp: %s MsgAttrID: %s MsgAttType: %s MsgClusterData: %s " % (MsgSrcEp, MsgAttrID, MsgAttType, MsgClusterData),
-        MsgSrcAddr,
+        "ReadCluster - ClusterID=000C - MsgSrcEp: %s MsgAttrID: %s MsgAttType: %s MsgClusterData: %s ",
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     if MsgAttrID == "001c":  # Description
-        self.log.logging("Cluster", "Debug", "%s/%s Description: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.debug("Cluster", "%s/%s Description: %s", MsgSrcAddr, MsgSrcEp, MsgClusterData, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0051":  #
-        self.log.logging("Cluster", "Debug", "%s/%s Out of service: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.debug("Cluster", "%s/%s Out of service: %s", MsgSrcAddr, MsgSrcEp, MsgClusterData, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0055":  # The PresentValueattribute  indicates the current value  of the  input,  output or value
         # Are we receiving Power or is that XCube or something else
@@ -1697,17 +1785,24 @@ def Cluster000c(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         EPforPower = getEPforClusterType(self, MsgSrcAddr, "Power")
         EPforMeter = getEPforClusterType(self, MsgSrcAddr, "Meter")
         EPforPowerMeter = getEPforClusterType(self, MsgSrcAddr, "PowerMeter")
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "EPforPower: %s, EPforMeter: %s, EPforPowerMeter: %s" % (EPforPower, EPforMeter, EPforPowerMeter),
-            MsgSrcAddr,
+            "EPforPower: %s, EPforMeter: %s, EPforPowerMeter: %s",
+            EPforPower,
+            EPforMeter,
+            EPforPowerMeter,
+            nwkid=MsgSrcAddr,
         )
 
         if len(EPforPower) == len(EPforMeter) == len(EPforPowerMeter) == 0:
             # Magic Cub
             rotation_angle = struct.unpack("f", struct.pack("I", int(MsgClusterData, 16)))[0]
-            self.log.logging("Cluster", "Debug", "ReadCluster - ClusterId=000c - Magic Cube angle: %s" % rotation_angle, MsgSrcAddr)
+            self.log.debug(
+                "Cluster",
+                "ReadCluster - ClusterId=000c - Magic Cube angle: %s",
+                rotation_angle,
+                nwkid=MsgSrcAddr,
+            )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(int(rotation_angle)), Attribute_="0055")
             if rotation_angle < 0:
                 # anti-clokc
@@ -1825,11 +1920,14 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     if MsgAttrID == "0051":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Out of Service: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster %s - %s/%s Out of Service: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         if MsgClusterData == "00":
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["Out of Service"] = False
@@ -1838,11 +1936,14 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["Out of Service"] = True
 
     elif MsgAttrID == "0055":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Present Value: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster %s - %s/%s Present Value: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
         if MsgClusterData == "00":
@@ -1859,15 +1960,18 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             )
             return
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Model: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]["Model"]),
+            "ReadCluster %s - %s/%s Model: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            self.ListOfDevices[MsgSrcAddr]["Model"],
+            nwkid=MsgSrcAddr,
         )
         if self.ListOfDevices[MsgSrcAddr]["Model"] != {}:
             if self.ListOfDevices[MsgSrcAddr]["Model"] in LEGRAND_REMOTE_SWITCHS:
-                self.log.logging("Cluster", "Debug", "Legrand remote Switch Present Value: %s" % MsgClusterData, MsgSrcAddr)
+                self.log.debug("Cluster", "Legrand remote Switch Present Value: %s", MsgClusterData, nwkid=MsgSrcAddr)
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0006", MsgClusterData)
 
             elif self.ListOfDevices[MsgSrcAddr]["Model"] in LEGRAND_REMOTE_SHUTTER:
@@ -1881,11 +1985,11 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 # The Shutter should have the Led on its right
                 # Present Value: 0x01 -> Open
                 # Present Value: 0x00 -> Closed
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "---->Legrand Shutter switch with neutral Present Value: %s" % MsgClusterData,
-                    MsgSrcAddr,
+                    "---->Legrand Shutter switch with neutral Present Value: %s",
+                    MsgClusterData,
+                    nwkid=MsgSrcAddr,
                 )
                 if MsgClusterData == "01":
                     value = "%02x" % 100
@@ -1895,18 +1999,15 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 if "SWBUILD_3" in self.ListOfDevices[MsgSrcAddr]:
                     if int(self.ListOfDevices[MsgSrcAddr]["SWBUILD_3"], 16) >= 0x01A:
                         # Do not use Present Value anymore
-                        self.log.logging(
+                        self.log.debug(
                             "Cluster",
-                            "Debug",
-                            "ReadCluster - %s - %s/%s - SWBUILD_3: %0X do not report present value %s"
-                            % (
-                                MsgAttrID,
-                                MsgSrcAddr,
-                                MsgSrcEp,
-                                int(self.ListOfDevices[MsgSrcAddr]["SWBUILD_3"], 16),
-                                value,
-                            ),
+                            "ReadCluster - %s - %s/%s - SWBUILD_3: %0X do not report present value %s",
+                            MsgAttrID,
                             MsgSrcAddr,
+                            MsgSrcEp,
+                            int(self.ListOfDevices[MsgSrcAddr]["SWBUILD_3"], 16),
+                            value,
+                            nwkid=MsgSrcAddr,
                         )
                         return
 
@@ -1960,32 +2061,44 @@ def Cluster000f(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "006f":
         STATUS_FLAGS = {"00": "In Alarm", "01": "Fault", "02": "Overridden", "03": "Out Of service"}
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Status Flag: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster %s - %s/%s Status Flag: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         if MsgClusterData in STATUS_FLAGS:
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["Status"] = STATUS_FLAGS[MsgClusterData]
             if MsgClusterData != "00":
                 Domoticz.Status("Device %s/%s Status flag: %s %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData, STATUS_FLAGS[MsgClusterData]))
             else:
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "Device %s/%s Status flag: %s %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData, STATUS_FLAGS[MsgClusterData]),
+                    "Device %s/%s Status flag: %s %s",
+                    MsgSrcAddr,
+                    MsgSrcEp,
+                    MsgClusterData,
+                    STATUS_FLAGS[MsgClusterData],
                 )
 
         else:
             Domoticz.Status("Device %s/%s Status flag: %s" % (MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
     elif MsgAttrID == "fffd":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -2003,11 +2116,18 @@ def Cluster0012(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         return
     _modelName = self.ListOfDevices[MsgSrcAddr]["Model"]
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "readCluster - %s - %s/%s - MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s Model: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, _modelName),
+        "readCluster - %s - %s/%s - MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s Model: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        _modelName,
+        nwkid=MsgSrcAddr,
     )
 
     # Hanlding Message from the Aqara Opple Switch 2,4,6 buttons
@@ -2027,11 +2147,12 @@ def Cluster0012(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # 2 -> Double press
         # 255 -> Long Release
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0012 - Switch Aqara: EP: %s Value: %s " % (MsgSrcEp, value),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0012 - Switch Aqara: EP: %s Value: %s ",
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         if value == 0:
             value = 3
@@ -2043,11 +2164,12 @@ def Cluster0012(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif _modelName in ("lumi.sensor_switch.aq3", "lumi.sensor_switch.aq3"):
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0012 - Switch Aqara (AQ2): EP: %s Value: %s " % (MsgSrcEp, value),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0012 - Switch Aqara (AQ2): EP: %s Value: %s ",
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
         # Store the value in Cluster 0x0006 (as well)
@@ -2057,11 +2179,13 @@ def Cluster0012(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif _modelName in ("lumi.ctrl_ln2.aq1",):
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - ClusterId=0012 - Switch Aqara lumi.ctrl_ln2.aq1: EP: %s Attr: %s Value: %s " % (MsgSrcEp, MsgAttrID, value),
-            MsgSrcAddr,
+            "ReadCluster - ClusterId=0012 - Switch Aqara lumi.ctrl_ln2.aq1: EP: %s Attr: %s Value: %s ",
+            MsgSrcEp,
+            MsgAttrID,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -2135,32 +2259,54 @@ def Cluster0100(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     if MsgAttrID == "0000":
-        self.log.logging("Cluster", "Debug", "ReadCluster 0100 - Shade Config: PhysicalClosedLimit: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "ReadCluster 0100 - Shade Config: PhysicalClosedLimit: %s",
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
+        )
     elif MsgAttrID == "0001":
-        self.log.logging("Cluster", "Debug", "ReadCluster 0100 - Shade Config: MotorStepSize: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "ReadCluster 0100 - Shade Config: MotorStepSize: %s",
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
+        )
     elif MsgAttrID == "0002":
-        self.log.logging("Cluster", "Debug", "ReadCluster 0100 - Shade Config: Status: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster 0100 - Shade Config: Status: %s", MsgClusterData, nwkid=MsgSrcAddr)
     elif MsgAttrID == "0010":
-        self.log.logging("Cluster", "Debug", "ReadCluster 0100 - Shade Config: ClosedLimit: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster 0100 - Shade Config: ClosedLimit: %s", MsgClusterData, nwkid=MsgSrcAddr)
     elif MsgAttrID == "0011":
-        self.log.logging("Cluster", "Debug", "ReadCluster 0100 - Shade Config: Mode: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster 0100 - Shade Config: Mode: %s", MsgClusterData, nwkid=MsgSrcAddr)
     else:
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
 
 def Cluster0101(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
     # Door Lock Cluster
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster 0101 - Dev: %s, EP:%s AttrID: %s, AttrType: %s, AttrSize: %s Attribute: %s Len: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, len(MsgClusterData)),
+        "ReadCluster 0101 - Dev: %s, EP:%s AttrID: %s, AttrType: %s, AttrSize: %s Attribute: %s Len: %s",
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        len(MsgClusterData),
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID == "0000":  # Lockstate
@@ -2224,22 +2370,26 @@ def Cluster0101(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     # Aqara related
     elif MsgAttrID == "0055":  # Aqara Vibration: Vibration, Tilt, Drop
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s/%s - Aqara Vibration - Event: %s" % (MsgClusterId, MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster %s/%s - Aqara Vibration - Event: %s",
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         state = decode_vibr(MsgClusterData)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, state)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, state)
 
     elif MsgAttrID == "0503":  # Bed activties: Tilt angle
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s/%s -  Vibration Angle: %s" % (MsgClusterId, MsgAttrID, MsgClusterData),
-            MsgSrcAddr,
+            "ReadCluster %s/%s -  Vibration Angle: %s",
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
@@ -2253,11 +2403,15 @@ def Cluster0101(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # with which I get a graph where I can see the value of "Strenght" as a function of time
         value = int(MsgClusterData, 16)
         strenght = (value >> 16) & 0xFFFF
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s/%s -  Vibration Strenght: %s %s %s" % (MsgClusterId, MsgAttrID, MsgClusterData, value, strenght),
-            MsgSrcAddr,
+            "ReadCluster %s/%s -  Vibration Strenght: %s %s %s",
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            value,
+            strenght,
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "Strenght", str(strenght), Attribute_=MsgAttrID)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, strenght)
@@ -2270,11 +2424,18 @@ def Cluster0101(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
         angleX, angleY, angleZ = decode_vibrAngle(MsgClusterData)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            " ReadCluster %s/%s - AttrType: %s AttrLenght: %s AttrData: %s Vibration ==> angleX: %s angleY: %s angleZ: %s" % (MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, angleX, angleY, angleZ),
-            MsgSrcAddr,
+            " ReadCluster %s/%s - AttrType: %s AttrLenght: %s AttrData: %s Vibration ==> angleX: %s angleY: %s angleZ: %s",
+            MsgClusterId,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            angleX,
+            angleY,
+            angleZ,
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(
             self,
@@ -2311,19 +2472,33 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     value = decodeAttribute(self, MsgAttType, MsgClusterData)
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - %s - %s/%s - Attribute: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+        "ReadCluster - %s - %s/%s - Attribute: %s, Type: %s, Size: %s Data: %s-%s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        value,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID == "0000":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Window Covering Type: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Window Covering Type: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
         # NOT USED
@@ -2341,51 +2516,93 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # }
 
     elif MsgAttrID == "0001":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Physical close limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Physical close limit lift cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0002":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Physical close limit Tilt cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Physical close limit Tilt cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0003":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Curent position Lift in cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Curent position Lift in cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0004":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Curent position Tilt in cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Curent position Tilt in cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0005":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Number of Actuations – Lift: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Number of Actuations – Lift: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0006":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Number of Actuations – Tilt: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Number of Actuations – Tilt: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0007":
@@ -2406,20 +2623,31 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         )
 
     elif MsgAttrID == "0008":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster 0x%s - %s - %s/%s - Current position lift in %%: %s, Type: %s, Size: %s Data: %s-%s" % (Source, MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster 0x%s - %s - %s/%s - Current position lift in %%: %s, Type: %s, Size: %s Data: %s-%s",
+            Source,
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] != {}:
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - Model: %s" % (MsgAttrID, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]["Model"]),
+                "ReadCluster - %s - %s/%s - Model: %s",
+                MsgAttrID,
                 MsgSrcAddr,
+                MsgSrcEp,
+                self.ListOfDevices[MsgSrcAddr]["Model"],
+                nwkid=MsgSrcAddr,
             )
 
             if self.ListOfDevices[MsgSrcAddr]["Model"] == "TS0302" and value == 50:
@@ -2436,62 +2664,103 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 # Value: 0   -> Open
                 # Value: 50  -> Stopped
                 if "Param" in self.ListOfDevices[MsgSrcAddr] and "netatmoInvertShutter" in self.ListOfDevices[MsgSrcAddr]["Param"] and self.ListOfDevices[MsgSrcAddr]["Param"]["netatmoInvertShutter"]:
-                    self.log.logging(
+                    self.log.debug(
                         "Cluster",
-                        "Debug",
-                        "ReadCluster - %s - %s/%s - Model: %s ==>INVERSE===" % (MsgAttrID, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]["Model"]),
+                        "ReadCluster - %s - %s/%s - Model: %s ==>INVERSE===",
+                        MsgAttrID,
                         MsgSrcAddr,
+                        MsgSrcEp,
+                        self.ListOfDevices[MsgSrcAddr]["Model"],
+                        nwkid=MsgSrcAddr,
                     )
                     value = 100 - value
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Shutter switch with neutral After correction value: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "ReadCluster - %s - %s/%s - Shutter switch with neutral After correction value: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, "%02x" % value)
 
     elif MsgAttrID == "0009":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Curent position Tilte in %%: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Curent position Tilte in %%: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0010":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Open limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Open limit lift cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0011":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Closed limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Closed limit lift cm: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0014":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Velocity lift: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Velocity lift: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
         self.log.logging("Cluster", "Debug", "Velocity", MsgSrcAddr)
 
     elif MsgAttrID == "0017":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Windows Covering mode: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - Windows Covering mode: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "f000":
@@ -2507,11 +2776,18 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         )
 
     elif MsgAttrID == "fffd":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - AttributeID: %s, Type: %s, Size: %s Data: %s-%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+            "ReadCluster - %s - %s/%s - AttributeID: %s, Type: %s, Size: %s Data: %s-%s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -2526,11 +2802,16 @@ def Cluster0102(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
     # Thermostat cluster
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - 0201 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster - 0201 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s",
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     eurotronics = danfoss = False
@@ -2560,77 +2841,101 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0402", ValueTemp)
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, ValueTemp)
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, "0402", "0000", int(value))
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Local Temp: %s" % ValueTemp, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Local Temp: %s", ValueTemp, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0001":  # Outdoor Temperature
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Outdoor Temp: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Outdoor Temp: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0002":  # Occupancy
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Occupancy: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Occupancy: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0003":  # Min Heat Setpoint Limit
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Min Heat Setpoint Limit: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Min Heat Setpoint Limit: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0004":  # Max Heat Setpoint Limit
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Max Heat Setpoint Limit: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Max Heat Setpoint Limit: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0005":  # Min Cool Setpoint Limit
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Min Cool Setpoint Limit: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Min Cool Setpoint Limit: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0006":  # Max Cool Setpoint Limit
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Max Cool Setpoint Limit: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Max Cool Setpoint Limit: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0007":  # Pi Cooling Demand  (valve position %)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Pi Cooling Demand: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Pi Cooling Demand: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0008":  # Pi Heating Demand  (valve position %)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Pi Heating Demand: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Pi Heating Demand: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         # Per standard the demand is expressed in % between 0x00 to 0x64
         if eurotronics:
@@ -2639,21 +2944,24 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", value, Attribute_="0008")
 
     elif MsgAttrID == "0009":  # HVAC System Type Config
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s HVAC System Type Config: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s HVAC System Type Config: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "0010":  # Calibration / Adjustement
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Calibration: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Calibration: %s", value, nwkid=MsgSrcAddr)
         if value not in range(0x00, 0x19):
             # We are in Negative value. 0xE7 = -25 0xff = -01 )
             value = -(0xFF + 1 - value)
         value = round(value / 10, 2)
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Calibration: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Calibration: %s", value, nwkid=MsgSrcAddr)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "EH-ZB-VACT":
             if "Schneider" not in self.ListOfDevices[MsgSrcAddr]:
                 self.ListOfDevices[MsgSrcAddr]["Schneider"] = {}
@@ -2665,7 +2973,7 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0011":  # Cooling Setpoint (Zinte16)
         ValueTemp = round(int(value) / 100, 1)
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Cooling Setpoint: %s" % ValueTemp, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Cooling Setpoint: %s", ValueTemp, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, ValueTemp)
 
         if self.ListOfDevices[MsgSrcAddr]["Model"] in ("AC211", "AC221", "CAC221"):
@@ -2677,7 +2985,13 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0012":  # Heat Setpoint (Zinte16)
         ValueTemp = round(int(value) / 100, 2)
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Heating Setpoint: %s ==> %s" % (value, ValueTemp), MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "ReadCluster - 0201 - Heating Setpoint: %s ==> %s",
+            value,
+            ValueTemp,
+            nwkid=MsgSrcAddr,
+        )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, int(value))
 
         if "Model" in self.ListOfDevices[MsgSrcAddr]:
@@ -2693,11 +3007,11 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
             elif self.ListOfDevices[MsgSrcAddr]["Model"] in ("EH-ZB-VACT", 'iTRV'):
                 # In case of Schneider Wiser Valve, we have to
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "ReadCluster - 0201 - ValueTemp: %s" % int(((ValueTemp * 100) * 2) / 2),
-                    MsgSrcAddr,
+                    "ReadCluster - 0201 - ValueTemp: %s",
+                    int(((ValueTemp * 100) * 2) / 2),
+                    nwkid=MsgSrcAddr,
                 )
                 if "Schneider" in self.ListOfDevices[MsgSrcAddr]:
                     if "Target SetPoint" in self.ListOfDevices[MsgSrcAddr]["Schneider"]:
@@ -2725,50 +3039,53 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             elif self.ListOfDevices[MsgSrcAddr]["Model"] != "SPZB0001":
                 # In case it is not a Eurotronic, let's Update heatPoint
                 # As Eurotronics will rely on 0x4003 attributes
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "ReadCluster - 0201 - Request update on Domoticz %s not a Schneider, not a Eurotronics" % MsgSrcAddr,
+                    "ReadCluster - 0201 - Request update on Domoticz %s not a Schneider, not a Eurotronics",
                     MsgSrcAddr,
+                    nwkid=MsgSrcAddr,
                 )
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, ValueTemp, Attribute_=MsgAttrID)
 
     elif MsgAttrID == "0014":  # Unoccupied Heating
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Unoccupied Heating:  %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Unoccupied Heating:  %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0015":  # MIN_HEAT_SETPOINT_LIMIT
         ValueTemp = round(int(value) / 100, 1)
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Min SetPoint: %s" % ValueTemp, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Min SetPoint: %s", ValueTemp, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, ValueTemp)
 
     elif MsgAttrID == "0016":  # MAX_HEAT_SETPOINT_LIMIT
         ValueTemp = round(int(value) / 100, 1)
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Max SetPoint: %s" % ValueTemp, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Max SetPoint: %s", ValueTemp, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, ValueTemp)
 
     elif MsgAttrID == "001a":  # Remote Sensing
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Remote Sensing: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Remote Sensing: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0025":  # Scheduler state
         # Bit #0 => disable/enable Scheduler
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Scheduler state:  %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Scheduler state:  %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0029":  # Heating operation state
         # bit #0 heat On/Off state
         # bit #1 cool on/off state
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Heating operation state:  %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Heating operation state:  %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0045":  # ACLouverPosition
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - ACLouverPosition:  %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - ACLouverPosition:  %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "001b":  # Control Sequence Operation
@@ -2782,16 +3099,19 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         #     "04": "Cooling and heating",
         #     "05": "Cooling and heating with reheat",
         # }
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Control Sequence Operation: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster %s - %s/%s Control Sequence Operation: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "001c":
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - System Mode: %s" % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - System Mode: %s", value, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value, Attribute_=MsgAttrID)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -2802,50 +3122,52 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, "%02x" % 0x0, Attribute_="fd00")
 
     elif MsgAttrID == "001d":
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Alarm Mask: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Alarm Mask: %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0403":
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Attribute 403: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Attribute 403: %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0405":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0201 - Attribute 405 ( thermostat mode ?=regulator mode For Elko) : %s" % value,
-            MsgSrcAddr,
+            "ReadCluster - 0201 - Attribute 405 ( thermostat mode ?=regulator mode For Elko) : %s",
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0406":
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Attribute 406 : %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Attribute 406 : %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0408":
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0201 - Attribute 408 ( Elko power consumption in last 10 minutes): %s" % value,
-            MsgSrcAddr,
+            "ReadCluster - 0201 - Attribute 408 ( Elko power consumption in last 10 minutes): %s",
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0409":
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Attribute 409: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Attribute 409: %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID in ("4000", "4001", "4002", "4003", "4008") and eurotronics:
 
         # Eurotronic SPZB Specifics
         if MsgAttrID == "4000":  # TRV Mode for EUROTRONICS
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - 0201 - %s/%s TRV Mode: %s" % (MsgSrcAddr, MsgSrcEp, value),
+                "ReadCluster - 0201 - %s/%s TRV Mode: %s",
                 MsgSrcAddr,
+                MsgSrcEp,
+                value,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -2860,11 +3182,13 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", int(value, 16), Attribute_="4001")
 
         elif MsgAttrID == "4002":  # Erreors for EUROTRONICS
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - 0201 - %s/%s Status: %s" % (MsgSrcAddr, MsgSrcEp, value),
+                "ReadCluster - 0201 - %s/%s Status: %s",
                 MsgSrcAddr,
+                MsgSrcEp,
+                value,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -2872,11 +3196,14 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             setPoint = ValueTemp = round(int(value) / 100, 2)
             if "0012" in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]:
                 setPoint = self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["0012"]
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - 0201 - %s/%s Current Temp Set point: %s versus %s " % (MsgSrcAddr, MsgSrcEp, ValueTemp, setPoint),
+                "ReadCluster - 0201 - %s/%s Current Temp Set point: %s versus %s ",
                 MsgSrcAddr,
+                MsgSrcEp,
+                ValueTemp,
+                setPoint,
+                nwkid=MsgSrcAddr,
             )
             if ValueTemp != float(setPoint):
                 # Seems that there is a local setpoint
@@ -2900,11 +3227,13 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             #     0x000080: "child lock",
             # }
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - 0201 - %s/%s Host Flags: %s" % (MsgSrcAddr, MsgSrcEp, value),
+                "ReadCluster - 0201 - %s/%s Host Flags: %s",
                 MsgSrcAddr,
+                MsgSrcEp,
+                value,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -2935,102 +3264,135 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             }
 
             if MsgClusterData in THERMOSTAT_MODE:
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "readCluster - %s - %s/%s Schneider Thermostat Mode %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, THERMOSTAT_MODE[MsgClusterData]),
+                    "readCluster - %s - %s/%s Schneider Thermostat Mode %s ",
+                    MsgClusterId,
                     MsgSrcAddr,
+                    MsgSrcEp,
+                    THERMOSTAT_MODE[MsgClusterData],
+                    nwkid=MsgSrcAddr,
                 )
             else:
-                self.log.logging(
+                self.log.debug(
                     "Cluster",
-                    "Debug",
-                    "readCluster - %s - %s/%s Schneider Thermostat Mode 0xe010 %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                    "readCluster - %s - %s/%s Schneider Thermostat Mode 0xe010 %s ",
+                    MsgClusterId,
                     MsgSrcAddr,
+                    MsgSrcEp,
+                    MsgClusterData,
+                    nwkid=MsgSrcAddr,
                 )
 
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", MsgClusterData, Attribute_=MsgAttrID)
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
         elif MsgAttrID == "e011":  # hact mode : fip or conventional and heating mode : fip or setpoint
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_HACT_CONFIG  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_HACT_CONFIG  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", MsgClusterData, Attribute_=MsgAttrID)
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
         elif MsgAttrID == "e012":  # 57362, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0500", MsgClusterData)
 
         elif MsgAttrID == "e013":  # 57363, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
         elif MsgAttrID == "e014":  # 57364, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
         elif MsgAttrID == "e020":  # fip mode
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider FIP mode  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider FIP mode  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", MsgClusterData, Attribute_=MsgAttrID)
 
         elif MsgAttrID == "e030":
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider Valve Position  %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider Valve Position  %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0201", value, Attribute_="0008")
 
         elif MsgAttrID == "e031":
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider Valve Calibration Status %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "readCluster - %s - %s/%s Schneider Valve Calibration Status %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
     elif MsgAttrID == "fd00":
         # Casia.IA / Wing On/off
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0201 - Attribute fd00 (Wing): %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0201 - Attribute fd00 (Wing): %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value, Attribute_=MsgAttrID)
 
     else:
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
@@ -3038,36 +3400,49 @@ def Cluster0201(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 def Cluster0202(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
     # Thermostat cluster
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - 0202 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster - 0202 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s",
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     value = decodeAttribute(self, MsgAttType, MsgClusterData)
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     if MsgAttrID == "0000":  # Fan Mode
-        self.log.logging("Cluster", "Debug", "ReadCluster - 0202 - Fan Mode: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster - 0202 - Fan Mode: %s", value, nwkid=MsgSrcAddr)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, "%02x" % value)
 
     elif MsgAttrID == "0001":  # Fan Mode Sequence
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s Fan Mode Sequenec: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "ReadCluster - %s - %s/%s Fan Mode Sequenec: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
 
 def Cluster0204(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster 0204 - Addr: %s Ep: %s AttrId: %s AttrType: %s AttSize: %s Data: %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster 0204 - Addr: %s Ep: %s AttrId: %s AttrType: %s AttSize: %s Data: %s",
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
@@ -3075,31 +3450,41 @@ def Cluster0204(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     if MsgAttrID == "0000":
         # TemperatureDisplayMode
         if MsgClusterData == "00":
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster %s/%s 0204 - Temperature Display Mode : %s --> °C" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "ReadCluster %s/%s 0204 - Temperature Display Mode : %s --> °C",
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
         elif MsgClusterData == "01":
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster %s/%s 0204 - Temperature Display Mode : %s -->  °F" % (MsgSrcAddr, MsgSrcEp, MsgClusterData),
+                "ReadCluster %s/%s 0204 - Temperature Display Mode : %s -->  °F",
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
 
     elif MsgAttrID == "0001":
         # Keypad Lock Mode
         # KEYPAD_LOCK = {"00": "no lockout"}
         value = decodeAttribute(self, MsgAttType, MsgClusterData)
-        self.log.logging("Cluster", "Debug", "ReadCluster 0204 - Lock Mode: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster 0204 - Lock Mode: %s", value, nwkid=MsgSrcAddr)
     else:
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
 
@@ -3114,26 +3499,33 @@ def Cluster0300(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     value = decodeAttribute(self, MsgAttType, MsgClusterData)
     if MsgAttrID == "0000":  # CurrentHue
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["Hue"] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - CurrentHue: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - CurrentHue: %s", value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0001":  # CurrentSaturation
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["Saturation"] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - CurrentSaturation: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - CurrentSaturation: %s", value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0002":
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - %s/%s RemainingTime: %s" % (MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "ReadCluster0300 - %s/%s RemainingTime: %s",
+            MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
+        )
 
     elif MsgAttrID == "0003":  # CurrentX
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["X"] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - CurrentX: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - CurrentX: %s", value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0004":  # CurrentY
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["Y"] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - CurrentY: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - CurrentY: %s", value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0007":  # ColorTemperatureMireds
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["ColorTemperatureMireds"] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - ColorTemperatureMireds: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - ColorTemperatureMireds: %s", value, nwkid=MsgSrcAddr)
 
     elif MsgAttrID == "0008":  # Color Mode
         # NOT USED
@@ -3143,132 +3535,222 @@ def Cluster0300(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         #     "02": "Color temperature",
         # }
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Color Mode: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Color Mode: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["ColorMode"] = value
 
     elif MsgAttrID == "400a":  # ColorCapabilities
         if value == 0:  # Hue/Saturation supported
-            self.log.logging("Cluster", "Debug", "ReadCluster0300 - Hue/Saturation supported: %s" % value, MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster0300 - Hue/Saturation supported: %s", value, nwkid=MsgSrcAddr)
         elif value == 1:  # Enhanced hue supported
-            self.log.logging("Cluster", "Debug", "ReadCluster0300 - Enhanced hue supported: %s" % value, MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster0300 - Enhanced hue supported: %s", value, nwkid=MsgSrcAddr)
         elif value == 2:  # Color loop supported
-            self.log.logging("Cluster", "Debug", "ReadCluster0300 - Color loop supported: %s" % value, MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster0300 - Color loop supported: %s", value, nwkid=MsgSrcAddr)
         elif value == 3:  # XY attributes supported
-            self.log.logging("Cluster", "Debug", "ReadCluster0300 - XY attributes supported: %s" % value, MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster0300 - XY attributes supported: %s", value, nwkid=MsgSrcAddr)
         elif value == 4:  # Color temp supported
-            self.log.logging("Cluster", "Debug", "ReadCluster0300 - Color temp supported: %s" % value, MsgSrcAddr)
+            self.log.debug("Cluster", "ReadCluster0300 - Color temp supported: %s", value, nwkid=MsgSrcAddr)
         self.ListOfDevices[MsgSrcAddr]["ColorInfos"]["ColorCapabilities"] = value
 
     elif MsgAttrID == "000f":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "f000":
         # 070000df
         # 00800900
         # self.ListOfDevices[MsgSrcAddr]['ColorInfos']['ColorMode'] = value
-        self.log.logging("Cluster", "Debug", "ReadCluster0300 - Color Mode: %s" % value, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0300 - Color Mode: %s", value, nwkid=MsgSrcAddr)
 
     # Seems to be Hue related
     elif MsgAttrID == "0010":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "001a":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "0032":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "0033":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "0034":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "0036":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "0037":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "4001":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "400a":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "400b":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "400c":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "400d":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
     elif MsgAttrID == "4010":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s Attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -3285,19 +3767,25 @@ def Cluster0301(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     if MsgAttrID == "0010":  # Min
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s  Ballast Configuration Min Level %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "readCluster - %s - %s/%s  Ballast Configuration Min Level %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0011":  # Max
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s  Ballast Configuration Max Level %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData),
+            "readCluster - %s - %s/%s  Ballast Configuration Max Level %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -3313,11 +3801,17 @@ def Cluster0400(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     # (Measurement: LUX)
     #  Lux=10^((y-1)/10000)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "readCluster - %s - %s/%s  Attr: %s Type: %s Size: %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "readCluster - %s - %s/%s  Attr: %s Type: %s Size: %s %s ",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
     value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
     if value < 0 or value > 0xFFFF:
@@ -3327,11 +3821,15 @@ def Cluster0400(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         lux = value
     else:
         lux = int(10 ** ((value - 1) / 10000))
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - %s - %s/%s - LUX Sensor: %s/%s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value, lux),
+        "ReadCluster - %s - %s/%s - LUX Sensor: %s/%s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        value,
+        lux,
+        nwkid=MsgSrcAddr,
     )
 
     MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(lux))
@@ -3358,30 +3856,39 @@ def Cluster0402(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
         if value > 0x7FFF and value < 0x954D:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Invalid Temperature Measurement: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+                "readCluster - %s - %s/%s Invalid Temperature Measurement: %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                value,
+                nwkid=MsgSrcAddr,
             )
             return
 
         value = round(value / 100, 1)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Temperature Measurement: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "readCluster - %s - %s/%s Temperature Measurement: %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value)
 
     elif MsgAttrID == "0001":
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute 0x0001: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "readCluster - %s - %s/%s Attribute 0x0001: %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "VOC_Sensor":
@@ -3391,11 +3898,14 @@ def Cluster0402(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0002":
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute 0x0002: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "readCluster - %s - %s/%s Attribute 0x0002: %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "VOC_Sensor":
@@ -3405,11 +3915,14 @@ def Cluster0402(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0003":
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s Attribute 0x0003: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "readCluster - %s - %s/%s Attribute 0x0003: %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "VOC_Sensor":
@@ -3419,11 +3932,17 @@ def Cluster0402(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     else:
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
 
@@ -3435,7 +3954,7 @@ def Cluster0403(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         return
 
     value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-    self.log.logging("Cluster", "Debug", "Cluster0403 - decoded value: from:%s to %s" % (MsgClusterData, value), MsgSrcAddr)
+    self.log.debug("Cluster", "Cluster0403 - decoded value: from:%s to %s", MsgClusterData, value, nwkid=MsgSrcAddr)
 
     if MsgAttrID == "0000":  # Atmo in mb
         # value = round((value/100),1)
@@ -3447,20 +3966,28 @@ def Cluster0403(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         value = round((value / 10), 1)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s/%s ClusterId=%s - Scaled value %s: %s " % (MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData),
+            "ReadCluster - %s/%s ClusterId=%s - Scaled value %s: %s ",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID == "0014":  # Scale
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s/%s ClusterId=%s - Scale %s: %s " % (MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData),
+            "ReadCluster - %s/%s ClusterId=%s - Scale %s: %s ",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterId,
+            MsgAttrID,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -3495,11 +4022,12 @@ def Cluster0405(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             )
         else:
             value = round(value / 100, 1)
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - ClusterId=0405 - reception hum: %s - %s" % (int(MsgClusterData, 16), value),
-                MsgSrcAddr,
+                "ReadCluster - ClusterId=0405 - reception hum: %s - %s",
+                int(MsgClusterData, 16),
+                value,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value)
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = value
@@ -3528,20 +4056,32 @@ def Cluster0406(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
 
     elif MsgAttrID == "0001":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.log.logging("Cluster", "Debug", "ReadCluster - ClusterId=0406 - Sensor Type: " + str(MsgClusterData), MsgSrcAddr)
 
     elif MsgAttrID == "0010":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.log.logging(
             "Cluster",
@@ -3551,11 +4091,17 @@ def Cluster0406(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         )
 
     elif MsgAttrID == "0011":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.log.logging(
             "Cluster",
@@ -3565,11 +4111,17 @@ def Cluster0406(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         )
 
     elif MsgAttrID == "0012":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
         self.log.logging(
             "Cluster",
@@ -3599,11 +4151,15 @@ def Cluster0500(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     if MsgClusterData == "":
         return
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster0500 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s" % (MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster0500 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s",
         MsgSrcAddr,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
@@ -3623,40 +4179,44 @@ def Cluster0500(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     if MsgAttrID == "0000":  # ZoneState ( 0x00 Not Enrolled / 0x01 Enrolled )
         if int(MsgClusterData, 16) == 0x00:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster0500 - Device: %s NOT ENROLLED (0x%02d)" % (MsgSrcAddr, int(MsgClusterData, 16)),
+                "ReadCluster0500 - Device: %s NOT ENROLLED (0x%02d)",
                 MsgSrcAddr,
+                int(MsgClusterData, 16),
+                nwkid=MsgSrcAddr,
             )
             self.ListOfDevices[MsgSrcAddr]["IAS"][MsgSrcEp]["EnrolledStatus"] = int(MsgClusterData, 16)
         elif int(MsgClusterData, 16) == 0x01:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster0500 - Device: %s ENROLLED (0x%02d)" % (MsgSrcAddr, int(MsgClusterData, 16)),
+                "ReadCluster0500 - Device: %s ENROLLED (0x%02d)",
                 MsgSrcAddr,
+                int(MsgClusterData, 16),
+                nwkid=MsgSrcAddr,
             )
             self.ListOfDevices[MsgSrcAddr]["IAS"][MsgSrcEp]["EnrolledStatus"] = int(MsgClusterData, 16)
         self.iaszonemgt.receiveIASmessages(MsgSrcAddr, MsgSrcEp, 5, MsgClusterData)
 
     elif MsgAttrID == "0001":  # ZoneType
         if int(MsgClusterData, 16) in ZONE_TYPE:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster0500 - Device: %s - ZoneType: %s" % (MsgSrcAddr, ZONE_TYPE[int(MsgClusterData, 16)]),
+                "ReadCluster0500 - Device: %s - ZoneType: %s",
                 MsgSrcAddr,
+                ZONE_TYPE[int(MsgClusterData, 16)],
+                nwkid=MsgSrcAddr,
             )
             self.ListOfDevices[MsgSrcAddr]["IAS"][MsgSrcEp]["ZoneType"] = int(MsgClusterData, 16)
             self.ListOfDevices[MsgSrcAddr]["IAS"][MsgSrcEp]["ZoneTypeName"] = ZONE_TYPE[int(MsgClusterData, 16)]
         else:
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster0500 - Device: %s - Unknown ZoneType: %s" % (MsgSrcAddr, MsgClusterData),
+                "ReadCluster0500 - Device: %s - Unknown ZoneType: %s",
                 MsgSrcAddr,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
         self.iaszonemgt.receiveIASmessages(MsgSrcAddr, MsgSrcEp, 5, MsgClusterData)
 
@@ -3686,12 +4246,21 @@ def Cluster0500(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 test,
                 batdef,
             )
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster 0500/0002 - IAS Zone - Device:%s status alarm1: %s, alarm2: %s, tamper: %s, batter: %s, srepor: %s, rrepor: %s, troubl: %s, acmain: %s, test: %s, batdef: %s"
-                % (MsgSrcAddr, alarm1, alarm2, tamper, batter, srepor, rrepor, troubl, acmain, test, batdef),
+                "ReadCluster 0500/0002 - IAS Zone - Device:%s status alarm1: %s, alarm2: %s, tamper: %s, batter: %s, srepor: %s, rrepor: %s, troubl: %s, acmain: %s, test: %s, batdef: %s",
                 MsgSrcAddr,
+                alarm1,
+                alarm2,
+                tamper,
+                batter,
+                srepor,
+                rrepor,
+                troubl,
+                acmain,
+                test,
+                batdef,
+                nwkid=MsgSrcAddr,
             )
 
             if "IAS" in self.ListOfDevices[MsgSrcAddr] and MsgSrcEp in self.ListOfDevices[MsgSrcAddr]["IAS"] and "ZoneStatus" in self.ListOfDevices[MsgSrcAddr]["IAS"][MsgSrcEp]:
@@ -3724,19 +4293,20 @@ def Cluster0500(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, "%02d" % (alarm1 or alarm2))
 
         else:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster0500 - Device: %s empty data: %s" % (MsgSrcAddr, MsgClusterData),
+                "ReadCluster0500 - Device: %s empty data: %s",
                 MsgSrcAddr,
+                MsgClusterData,
+                nwkid=MsgSrcAddr,
             )
 
     elif MsgAttrID == "0010":  # IAS CIE Address
-        self.log.logging("Cluster", "Debug", "ReadCluster0500 - IAS CIE Address: %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0500 - IAS CIE Address: %s", MsgClusterData, nwkid=MsgSrcAddr)
         self.iaszonemgt.receiveIASmessages(MsgSrcAddr, MsgSrcEp, 7, MsgClusterData)
 
     elif MsgAttrID == "0011":  # Zone ID
-        self.log.logging("Cluster", "Debug", "ReadCluster0500 - ZoneID : %s" % MsgClusterData, MsgSrcAddr)
+        self.log.debug("Cluster", "ReadCluster0500 - ZoneID : %s", MsgClusterData, nwkid=MsgSrcAddr)
 
     else:
         self.log.logging(
@@ -3746,37 +4316,48 @@ def Cluster0500(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             MsgSrcAddr,
         )
 
-    self.log.logging("Cluster", "Debug", "ReadCluster0500 - Device: %s Data: %s" % (MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+    self.log.debug("Cluster", "ReadCluster0500 - Device: %s Data: %s", MsgSrcAddr, MsgClusterData, nwkid=MsgSrcAddr)
 
 
 def Cluster0502(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster0502 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s" % (MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster0502 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s",
         MsgSrcAddr,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(decodeAttribute(self, MsgAttType, MsgClusterData)))
 
     if MsgAttrID == "0000":  # Max Duration
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0502 - %s/%s Max Duration: %s" % (MsgSrcAddr, MsgSrcEp, str(decodeAttribute(self, MsgAttType, MsgClusterData))),
+            "ReadCluster - 0502 - %s/%s Max Duration: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            str(decodeAttribute(self, MsgAttType, MsgClusterData)),
+            nwkid=MsgSrcAddr,
         )
         if "IAS WD" not in self.ListOfDevices[MsgSrcAddr]:
             self.ListOfDevices[MsgSrcAddr]["IAS WD"] = {}
         self.ListOfDevices[MsgSrcAddr]["IAS WD"]["MaxDuration"] = decodeAttribute(self, MsgAttType, MsgClusterData)
 
     elif MsgAttrID == "fffd":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - 0502 - %s/%s unknown attribute: %s %s %s %s" % (MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+            "ReadCluster - 0502 - %s/%s unknown attribute: %s %s %s %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            MsgAttType,
+            MsgAttSize,
+            MsgClusterData,
+            nwkid=MsgSrcAddr,
         )
 
     else:
@@ -3794,14 +4375,17 @@ def compute_conso(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, raw_value
     if MsgSrcEp in self.ListOfDevices[MsgSrcAddr]["Ep"] and MsgClusterId in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp] and "0302" in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]:
         diviser = self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["0302"]
         value = round(conso / (diviser / 1000), 3)
-        self.log.logging("Cluster", "Debug", "compute_conso - %s Power %s, div: %s --> %s Watts" % (MsgAttrID, conso, diviser, value))
+        self.log.debug("Cluster", "compute_conso - %s Power %s, div: %s --> %s Watts", MsgAttrID, conso, diviser, value)
     elif MsgSrcEp in self.ListOfDevices[MsgSrcAddr]["Ep"] and MsgClusterId in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp] and "0301" in self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]:
         multiplier = self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId]["0301"]
         value = round(conso * multiplier, 3)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "compute_conso - %s Power %s, multiply: %s --> %s Watts" % (MsgAttrID, conso, multiplier, value),
+            "compute_conso - %s Power %s, multiply: %s --> %s Watts",
+            MsgAttrID,
+            conso,
+            multiplier,
+            value,
         )
     else:
         # Old fashion
@@ -3833,11 +4417,15 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # Convert to int
         value = int(value)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "Cluster0702 - MsgAttrID: %s MsgAttType: %s DataLen: %s Data: %s decodedValue: %s" % (MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
-        MsgSrcAddr,
+        "Cluster0702 - MsgAttrID: %s MsgAttType: %s DataLen: %s Data: %s decodedValue: %s",
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        value,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID == "0000":  # CurrentSummationDelivered
@@ -3846,11 +4434,12 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             # if '0000' in self.ListOfDevices[MsgSrcAddr]['Ep']['01']['0702']:
             #     value = self.ListOfDevices[MsgSrcAddr]['Ep']['01']['0702']['0000'] + randrange( 0, 100)
             # HP or Base
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "Cluster0702 - 0x0000 ZLinky_TIC Value: %s Conso: %s " % (MsgClusterData, value),
-                MsgSrcAddr,
+                "Cluster0702 - 0x0000 ZLinky_TIC Value: %s Conso: %s ",
+                MsgClusterData,
+                value,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value), Attribute_=MsgAttrID)
@@ -3870,34 +4459,37 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                     MsgSrcAddr,
                 )
                 return
-            self.log.logging(
-                "Cluster",
-                "Debug",
-                "Cluster0702 - 0x0000 CURRENT_SUMMATION_DELIVERED Value: %s Conso: %s " % (MsgClusterData, conso),
-                MsgSrcAddr,
+            self.log.debug(
+                "Cluster",
+                "Cluster0702 - 0x0000 CURRENT_SUMMATION_DELIVERED Value: %s Conso: %s ",
+                MsgClusterData,
+                conso,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, conso)
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(conso), Attribute_="0000")
 
     elif MsgAttrID == "0001":  # CURRENT_SUMMATION_RECEIVED
-        self.log.logging("Cluster", "Debug", "Cluster0702 - CURRENT_SUMMATION_RECEIVED %s " % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - CURRENT_SUMMATION_RECEIVED %s ", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0002":  # Current Max Demand Delivered
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - %s/%s Max Demand Delivered %s " % (MsgSrcAddr, MsgSrcEp, value),
+            "Cluster0702 - %s/%s Max Demand Delivered %s ",
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "000a":  # ATTR_DEFAULT_UPDATE_PERIOD
-        self.log.logging("Cluster", "Debug", "Cluster0702 - ATTR_DEFAULT_UPDATE_PERIOD %s " % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - ATTR_DEFAULT_UPDATE_PERIOD %s ", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "000b":  # FAST_POLL_UPDATE_PERIOD
-        self.log.logging("Cluster", "Debug", "Cluster0702 - FAST_POLL_UPDATE_PERIOD %s " % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - FAST_POLL_UPDATE_PERIOD %s ", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0017":  # Inlet Temperature
@@ -3926,7 +4518,7 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if value in METERING_STATUS:
             value = METERING_STATUS[value]
 
-        self.log.logging("Cluster", "Debug", "Cluster0702 - Status: %s" % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - Status: %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0100" and "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "ZLinky_TIC":
@@ -3935,11 +4527,12 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if value == "":
             return
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - 0x0100 ZLinky_TIC Value: %s Conso: %s " % (MsgClusterData, value),
-            MsgSrcAddr,
+            "Cluster0702 - 0x0100 ZLinky_TIC Value: %s Conso: %s ",
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value), Attribute_=MsgAttrID)
@@ -3950,11 +4543,12 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         # value = fake_index_zlinky( self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID)
         if value == 0:
             return
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - 0x0100 ZLinky_TIC Value: %s Conso: %s " % (MsgClusterData, value),
-            MsgSrcAddr,
+            "Cluster0702 - 0x0100 ZLinky_TIC Value: %s Conso: %s ",
+            MsgClusterData,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value), Attribute_=MsgAttrID)
@@ -3999,28 +4593,44 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if value in MEASURE_UNITS:
             value = MEASURE_UNITS[value]
 
-        self.log.logging("Cluster", "Debug", "Cluster0702 - %s/%s Unit of Measure: %s" % (MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "Cluster0702 - %s/%s Unit of Measure: %s",
+            MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
+        )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0301":  # Multiplier
-        self.log.logging("Cluster", "Debug", "Cluster0702 - %s/%s Multiplier: %s" % (MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - %s/%s Multiplier: %s", MsgSrcAddr, MsgSrcEp, value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0302":  # Divisor
-        self.log.logging("Cluster", "Debug", "Cluster0702 - %s/%s Divisor: %s" % (MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - %s/%s Divisor: %s", MsgSrcAddr, MsgSrcEp, value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0303":  # "Summation Formatting
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - %s/%s Summation Formatting: %s" % (MsgSrcAddr, MsgSrcEp, value),
+            "Cluster0702 - %s/%s Summation Formatting: %s",
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0304":  # TotalActivePower
-        self.log.logging("Cluster", "Debug", "Cluster0702 - %s/%s TotalActivePower: %s" % (MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.debug(
+            "Cluster",
+            "Cluster0702 - %s/%s TotalActivePower: %s",
+            MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
+        )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0306":  # Device Type
@@ -4037,16 +4647,11 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if value in MEASURE_DEVICE_TYPE:
             value = MEASURE_DEVICE_TYPE[value]
 
-        self.log.logging("Cluster", "Debug", "Cluster0702 - Divisor: %s" % (value), MsgSrcAddr)
+        self.log.debug("Cluster", "Cluster0702 - Divisor: %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0308":  # Serial Number
-        self.log.logging(
-            "Cluster",
-            "Debug",
-            "Cluster0702 - 0x0308 - Serial Number %s" % (value),
-            MsgSrcAddr,
-        )
+        self.log.debug("Cluster", "Cluster0702 - 0x0308 - Serial Number %s", value, nwkid=MsgSrcAddr)
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
     elif MsgAttrID == "0400":
@@ -4054,20 +4659,21 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         if value < 0:
             return
         if value > 0x7FFFFFFFFFFFFFFF:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "Cluster0702 - 0x0400 Instant demand raw_value: %s (Overflow)" % (value,),
-                MsgSrcAddr,
+                "Cluster0702 - 0x0400 Instant demand raw_value: %s (Overflow)",
+                value,
+                nwkid=MsgSrcAddr,
             )
             return
         conso = compute_conso(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - 0x0400 Instant demand raw_value: %s Conso: %s" % (value, conso),
-            MsgSrcAddr,
+            "Cluster0702 - 0x0400 Instant demand raw_value: %s Conso: %s",
+            value,
+            conso,
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(conso))
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, str(conso))
@@ -4079,11 +4685,13 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = str(value)
 
     elif MsgAttrID == "0801":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "Cluster0702 - %s/%s Electricty Alarm Mask: %s " % (MsgSrcAddr, MsgSrcEp, value),
+            "Cluster0702 - %s/%s Electricty Alarm Mask: %s ",
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
 
@@ -4112,19 +4720,27 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
         }
 
         if MsgAttrID in ELECTRICAL_MEASURES:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "Cluster0702 - %s/%s Schneider %s : %s " % (MsgSrcAddr, MsgSrcEp, ELECTRICAL_MEASURES[MsgAttrID], value),
+                "Cluster0702 - %s/%s Schneider %s : %s ",
                 MsgSrcAddr,
+                MsgSrcEp,
+                ELECTRICAL_MEASURES[MsgAttrID],
+                value,
+                nwkid=MsgSrcAddr,
             )
             checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
         else:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s Schneider Attribute: %s  Raw Data: %s Decoded Data: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData, value),
+                "readCluster - %s - %s/%s Schneider Attribute: %s  Raw Data: %s Decoded Data: %s ",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgClusterData,
+                value,
+                nwkid=MsgSrcAddr,
             )
 
     elif MsgAttrID in (
@@ -4166,10 +4782,14 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             checkAndStoreAttributeValue(self, MsgSrcAddr, fake_ep, MsgClusterId, MsgAttrID, str(conso))
             self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep][MsgClusterId]["0400"] = str(conso)
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Power %s" % (MsgClusterId, MsgSrcAddr, fake_ep, line, conso),
+                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Power %s",
+                MsgClusterId,
+                MsgSrcAddr,
+                fake_ep,
+                line,
+                conso,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, MsgClusterId, str(conso))
 
@@ -4189,10 +4809,14 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep]["0001"] = {}
             self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep]["0001"]["0000"] = str(value)
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Voltage %s" % (MsgClusterId, MsgSrcAddr, fake_ep, line, value),
+                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Voltage %s",
+                MsgClusterId,
+                MsgSrcAddr,
+                fake_ep,
+                line,
+                value,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, "0001", str(value))
 
@@ -4206,10 +4830,14 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep]["0b04"] = {}
             self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep]["0b04"]["0508"] = str(value)
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Current %s" % (MsgClusterId, MsgSrcAddr, fake_ep, line, value),
+                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Current %s",
+                MsgClusterId,
+                MsgSrcAddr,
+                fake_ep,
+                line,
+                value,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, "0b04", str(value), Attribute_="0508")
 
@@ -4221,10 +4849,14 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             checkAndStoreAttributeValue(self, MsgSrcAddr, fake_ep, MsgClusterId, MsgAttrID, str(value))
             self.ListOfDevices[MsgSrcAddr]["Ep"][fake_ep][MsgClusterId]["0000"] = str(conso)
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Summation Power %s" % (MsgClusterId, MsgSrcAddr, fake_ep, line, conso),
+                "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Summation Power %s",
+                MsgClusterId,
+                MsgSrcAddr,
+                fake_ep,
+                line,
+                conso,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, "0702", str(conso), Attribute_="0000")
 
@@ -4236,11 +4868,18 @@ def Cluster0702(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
         else:
 
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "readCluster - %s - %s/%s CASAIA PC321 phase Power Clamp: %s %s %s %s (value: %s)" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+                "readCluster - %s - %s/%s CASAIA PC321 phase Power Clamp: %s %s %s %s (value: %s)",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                MsgAttrID,
+                MsgAttType,
+                MsgAttSize,
+                MsgClusterData,
+                value,
+                nwkid=MsgSrcAddr,
             )
 
     else:
@@ -4260,11 +4899,17 @@ def zlinky_color_tarif(self, MsgSrcAddr, color):
 
 
 def Cluster0b01(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
     value = int(
         decodeAttribute(
@@ -4307,26 +4952,23 @@ def Cluster0b01(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
 def Cluster0b04(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s"
-        % (
-            MsgClusterId,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgAttrID,
-            MsgAttType,
-            MsgAttSize,
-            decodeAttribute(self, MsgAttType, MsgClusterData),
-        ),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        decodeAttribute(self, MsgAttType, MsgClusterData),
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID in "050b":  # Active Power
         if -32768 <= int(MsgClusterData[0:4], 16) <= 32767:
             value = int(decodeAttribute(self, MsgAttType, MsgClusterData[0:4]))
-            self.log.logging("Cluster", "Debug", "ReadCluster %s - %s/%s Power %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
+            self.log.debug("Cluster", "ReadCluster %s - %s/%s Power %s", MsgClusterId, MsgSrcAddr, MsgSrcEp, value)
             if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] in (
                 "outletv4",
                 "lumi.plug.maeu01",
@@ -4344,7 +4986,7 @@ def Cluster0b04(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0505":  # RMS Voltage
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging("Cluster", "Debug", "ReadCluster %s - %s/%s Voltage %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
+        self.log.debug("Cluster", "ReadCluster %s - %s/%s Voltage %s", MsgClusterId, MsgSrcAddr, MsgSrcEp, value)
         if value == 0xFFFF:
             return
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "outletv4":
@@ -4356,11 +4998,15 @@ def Cluster0b04(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     elif MsgAttrID == "0508":  # RMSCurrent
         value = int(decodeAttribute(self, MsgAttType, MsgClusterData))
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s %s Current L1 %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, value),
+            "ReadCluster %s - %s/%s %s Current L1 %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgAttrID,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "TS0121":
@@ -4421,11 +5067,14 @@ def Cluster0b04(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             )
             return
         checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, value)
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "=====> ReadCluster %s - %s/%s Apparent Power %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "=====> ReadCluster %s - %s/%s Apparent Power %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
         # ApparentPower (Represents  the  single  phase  or  Phase  A,  current  demand  of  apparent  (Square  root  of  active  and  reactive power) power, in VA.)
         if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "ZLinky_TIC":
@@ -4450,11 +5099,14 @@ def Cluster0b04(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             else:
                 MajDomoDevice(self, Devices, MsgSrcAddr, "01", MsgClusterId, str(value), Attribute_=MsgAttrID)
 
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Apparent Power %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, value),
+            "ReadCluster %s - %s/%s Apparent Power %s",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            value,
+            nwkid=MsgSrcAddr,
         )
 
     elif MsgAttrID in ("0908", "0a08"):  # Current Phase 2 and Current Phase 3
@@ -4560,11 +5212,17 @@ def zlinky_check_alarm(self, Devices, MsgSrcAddr, MsgSrcEp, value):
 
 
 def Cluster0b05(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
     checkAndStoreAttributeValue(
         self,
@@ -4668,24 +5326,21 @@ def Clusterfe03(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     #  - UI,ButtonPressCenterDown
     #  - UI,ButtonPressPlusDown
     #  - ENV,-32768,2637,4777
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s"
-        % (
-            MsgClusterId,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgAttrID,
-            MsgAttType,
-            MsgAttSize,
-            decodeAttribute(
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
+        MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        decodeAttribute(
                 self,
                 MsgAttType,
                 MsgClusterData,
             ),
-        ),
-        MsgSrcAddr,
+        nwkid=MsgSrcAddr,
     )
     checkAndStoreAttributeValue(
         self,
@@ -4703,11 +5358,17 @@ def Clusterfe03(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
 def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - %s - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster - %s - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID not in ("0001", "0002", "0003", "0004"):
@@ -4730,54 +5391,59 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     if "Model" in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]["Model"] == "ROM001":
         if MsgAttrID == "0001":  # On button
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - ON Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+                "ReadCluster - %s - %s/%s - ON Button detected",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0008", "on")
         elif MsgAttrID == "0004":  # Off  Button
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - Off Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+                "ReadCluster - %s - %s/%s - Off Button detected",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0008", "off")
         elif MsgAttrID == "0002":  # Dim+
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - Dim+ Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+                "ReadCluster - %s - %s/%s - Dim+ Button detected",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0008", "moveup")
         elif MsgAttrID == "0003":  # Dim-
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - Dim- Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+                "ReadCluster - %s - %s/%s - Dim- Button detected",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                nwkid=MsgSrcAddr,
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0008", "movedown")
         return
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s - reading self.ListOfDevices[%s]['Ep'][%s][%s][%s] = %s"
-        % (
-            MsgClusterId,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgClusterId,
-            MsgAttrID,
-            self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId],
-        ),
+        "ReadCluster %s - %s/%s - reading self.ListOfDevices[%s]['Ep'][%s][%s][%s] = %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgSrcAddr,
+        MsgSrcEp,
+        MsgClusterId,
+        MsgAttrID,
+        self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId],
+        nwkid=MsgSrcAddr,
     )
 
     DIMMER_STEP = 1
@@ -4797,47 +5463,60 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     prev_lvlValue = lvlValue = int(prev_Value[1], 16)
     prev_duration = duration = int(prev_Value[2], 16)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster - %s - %s/%s - past OnOff: %s, Lvl: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, onoffValue, lvlValue),
+        "ReadCluster - %s - %s/%s - past OnOff: %s, Lvl: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        onoffValue,
+        lvlValue,
+        nwkid=MsgSrcAddr,
     )
     if MsgAttrID == "0001":  # On button
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - ON Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+            "ReadCluster - %s - %s/%s - ON Button detected",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            nwkid=MsgSrcAddr,
         )
         onoffValue = 1
 
     elif MsgAttrID == "0004":  # Off  Button
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - OFF Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+            "ReadCluster - %s - %s/%s - OFF Button detected",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            nwkid=MsgSrcAddr,
         )
         onoffValue = 0
 
     elif MsgAttrID in ("0002", "0003"):  # Dim+ / 0002 is +, 0003 is -
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - DIM Button detected" % (MsgClusterId, MsgSrcAddr, MsgSrcEp),
+            "ReadCluster - %s - %s/%s - DIM Button detected",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            nwkid=MsgSrcAddr,
         )
         action = MsgClusterData[2:4]
         duration = MsgClusterData[6:10]
         duration = struct.unpack("H", struct.pack(">H", int(duration, 16)))[0]
 
         if action in ("00"):  # Short press
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - DIM Action: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, action),
+                "ReadCluster - %s - %s/%s - DIM Action: %s",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                action,
+                nwkid=MsgSrcAddr,
             )
             onoffValue = 1
             # Short press/Release - Make one step   , we just report the press
@@ -4855,19 +5534,25 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
                 lvlValue -= round(delta * DIMMER_STEP)
 
         elif action in ("03"):  # Release after Long Press
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - DIM Release after %s seconds" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, round(duration / 10)),
+                "ReadCluster - %s - %s/%s - DIM Release after %s seconds",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                round(duration / 10),
+                nwkid=MsgSrcAddr,
             )
 
         else:
-            self.log.logging(
+            self.log.debug(
                 "Cluster",
-                "Debug",
-                "ReadCluster - %s - %s/%s - DIM Action: %s not processed" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, action),
+                "ReadCluster - %s - %s/%s - DIM Action: %s not processed",
+                MsgClusterId,
                 MsgSrcAddr,
+                MsgSrcEp,
+                action,
+                nwkid=MsgSrcAddr,
             )
             return  # No need to update
 
@@ -4876,11 +5561,14 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
             lvlValue = 255
         if lvlValue <= 0:
             lvlValue = 0
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster - %s - %s/%s - Level: %s " % (MsgClusterId, MsgSrcAddr, MsgSrcEp, lvlValue),
+            "ReadCluster - %s - %s/%s - Level: %s ",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            lvlValue,
+            nwkid=MsgSrcAddr,
         )
     else:
         self.log.logging(
@@ -4896,20 +5584,17 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
     sduration = "%02x" % duration
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, "0000", "%s;%s;%s" % (sonoffValue, slvlValue, sduration))
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s - updating self.ListOfDevices[%s]['Ep'][%s][%s] = %s"
-        % (
-            MsgClusterId,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgSrcAddr,
-            MsgSrcEp,
-            MsgClusterId,
-            self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId],
-        ),
+        "ReadCluster %s - %s/%s - updating self.ListOfDevices[%s]['Ep'][%s][%s] = %s",
+        MsgClusterId,
+        MsgSrcAddr,
+        MsgSrcEp,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgClusterId,
+        self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId],
+        nwkid=MsgSrcAddr,
     )
 
     if prev_onoffvalue != onoffValue:
@@ -4920,19 +5605,31 @@ def Clusterfc00(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
 def Clusterfc01(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if "Model" not in self.ListOfDevices[MsgSrcAddr]:
@@ -4980,19 +5677,31 @@ def Clusterfc01(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
 def Clusterfc40(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if "Model" not in self.ListOfDevices[MsgSrcAddr]:
@@ -5019,30 +5728,46 @@ def Clusterfc21(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
 
     if MsgAttrID == "0001":
-        self.log.logging(
+        self.log.debug(
             "Cluster",
-            "Debug",
-            "ReadCluster %s - %s/%s Orientation BSO: %s - %s °" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData, int(MsgClusterData, 16)),
+            "ReadCluster %s - %s/%s Orientation BSO: %s - %s °",
+            MsgClusterId,
             MsgSrcAddr,
+            MsgSrcEp,
+            MsgClusterData,
+            int(MsgClusterData, 16),
+            nwkid=MsgSrcAddr,
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
 
 
 def Clusterfcc0(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source):
 
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        nwkid=MsgSrcAddr,
     )
     checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData)
 
@@ -5061,11 +5786,18 @@ def Clusterff66(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
     # ZLinky
     value = decodeAttribute(self, MsgAttType, MsgClusterData)
-    self.log.logging(
+    self.log.debug(
         "Cluster",
-        "Debug",
-        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s / Value: %s" % (MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value),
+        "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s / Value: %s",
+        MsgClusterId,
         MsgSrcAddr,
+        MsgSrcEp,
+        MsgAttrID,
+        MsgAttType,
+        MsgAttSize,
+        MsgClusterData,
+        value,
+        nwkid=MsgSrcAddr,
     )
 
     if 'ZLinky' not in self.ListOfDevices[ MsgSrcAddr ]:
@@ -5158,3 +5890,56 @@ def Clusterff66(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAt
 
         # Isse Current on the corresponding Ampere
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0b04", str(value), Attribute_=_tmpattr)
+
+
+# Attribute decoders, by Cluster Id.
+# Manufacturer modules can add their decoders with register_cluster_decoder()
+CLUSTER_DECODERS = DispatchTable(
+    "Clusters",
+    {
+        0x0000: Cluster0000,
+        0x0001: Cluster0001,
+        0x0002: Cluster0002,
+        0x0003: Cluster0003,
+        0x0005: Cluster0005,
+        0x0006: Cluster0006,
+        0x0008: Cluster0008,
+        0x0009: Cluster0009,
+        0x0012: Cluster0012,
+        0x0019: Cluster0019,
+        0x000c: Cluster000c,
+        0x0100: Cluster0100,
+        0x0101: Cluster0101,
+        0x0102: Cluster0102,
+        0x0201: Cluster0201,
+        0x0202: Cluster0202,
+        0x0204: Cluster0204,
+        0x0300: Cluster0300,
+        0x0301: Cluster0301,
+        0x0400: Cluster0400,
+        0x0402: Cluster0402,
+        0x0403: Cluster0403,
+        0x0405: Cluster0405,
+        0x0406: Cluster0406,
+        0x0500: Cluster0500,
+        0x0502: Cluster0502,
+        0x0702: Cluster0702,
+        0x0b01: Cluster0b01,
+        0x0b04: Cluster0b04,
+        0x0b05: Cluster0b05,
+        0xfe03: Clusterfe03,
+        0xfc00: Clusterfc00,
+        0x000f: Cluster000f,
+        0xe000: Clustere000,
+        0xe001: Clustere001,
+        0xfc01: Clusterfc01,
+        0xfc21: Clusterfc21,
+        0xfcc0: Clusterfcc0,
+        0xfc40: Clusterfc40,
+        0xff66: Clusterff66,
+    },
+)
+
+
+def register_cluster_decoder(ClusterId, decoder, override=False):
+    CLUSTER_DECODERS.register(ClusterId, decoder, override)
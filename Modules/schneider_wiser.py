@@ -23,7 +23,7 @@ from Modules.domoMaj import MajDomoDevice
 from Modules.readAttributes import ReadAttributeRequest_0001
 from Modules.sendZigateCommand import raw_APS_request
 from Modules.tools import (get_and_inc_SQN, getAttributeValue,
-                           is_ack_tobe_disabled,
+                           is_ack_tobe_disabled, reset_heartbeat,
                            retreive_cmd_payload_from_8002)
 from Modules.writeAttributes import write_attribute_when_awake
 from Modules.zclCommands import zcl_onoff_off_noeffect, zcl_onoff_on
@@ -298,7 +298,7 @@ def schneider_wiser_registration(self, Devices, key):
     # Redo Temp
     if self.ListOfDevices[key]["Model"] in ("EH-ZB-VACT"):  # Actuator, Valve
         wiser_set_calibration(self, key, EPout)
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
 
     # Close the Network
     # ZigatePermitToJoin( self, 0 )
@@ -622,7 +622,7 @@ def schneider_hact_heating_mode(self, key, mode):
         ackIsDisabled=is_ack_tobe_disabled(self, key),
     )
     # Reset Heartbeat in order to force a ReadAttribute when possible
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
     # ReadAttributeRequest_0201(self,key)
     if EPout in self.ListOfDevices[key]["Ep"]:
         if "0201" in self.ListOfDevices[key]["Ep"][EPout]:
@@ -676,7 +676,7 @@ def schneider_hact_fip_mode(self, key, mode):
         self, key, EPout, "0201", "0104", payload, zigate_ep=ZIGATE_EP, ackIsDisabled=is_ack_tobe_disabled(self, key)
     )
     # Reset Heartbeat in order to force a ReadAttribute when possible
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
 
 
 def schneider_thermostat_check_and_bind(self, key, forceRebind=False):
@@ -797,7 +797,7 @@ def schneider_setpoint_thermostat(self, key, setpoint):
                     self.log.logging("Schneider", "Debug", "schneider_setpoint - found hact %s " % hact, NWKID)
                     schneider_setpoint_actuator(self, hact, setpoint)
                     # Reset Heartbeat in order to force a ReadAttribute when possible
-                    self.ListOfDevices[key]["Heartbeat"] = "0"
+                    reset_heartbeat(self, key)
                     schneider_actuator_check_and_bind(self, hact)
                     # ReadAttributeRequest_0201(self,key)
 
@@ -856,7 +856,7 @@ def schneider_setpoint_actuator(self, key, setpoint):
         self, key, EPout, "0201", "0104", payload, zigate_ep=ZIGATE_EP, ackIsDisabled=is_ack_tobe_disabled(self, key)
     )
     # Reset Heartbeat in order to force a ReadAttribute when possible
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
     # ReadAttributeRequest_0201(self,key)
 
 
@@ -928,7 +928,7 @@ def schneider_temp_Setcurrent(self, key, setpoint):
     raw_APS_request(
         self, key, EPout, "0402", "0104", payload, zigate_ep=ZIGATE_EP, ackIsDisabled=is_ack_tobe_disabled(self, key)
     )
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
 
 
 def schneider_EHZBRTS_thermoMode(self, key, mode):
@@ -1000,7 +1000,7 @@ def schneider_EHZBRTS_thermoMode(self, key, mode):
         ackIsDisabled=is_ack_tobe_disabled(self, key),
     )
 
-    self.ListOfDevices[key]["Heartbeat"] = "0"
+    reset_heartbeat(self, key)
 
 
 def schneiderRenforceent(self, NWKID):
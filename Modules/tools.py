@@ -15,6 +15,7 @@ import time
 
 import Domoticz
 
+from Classes.DeviceRecord import DeviceRecord, DeviceStamp
 from Modules.database import WriteDeviceList
 
 
@@ -271,8 +272,10 @@ def reconnectNWkDevice(self, new_NwkId, IEEE, old_NwkId):
     if old_NwkId == new_NwkId:
         return
 
-    self.ListOfDevices[new_NwkId] = dict(self.ListOfDevices[old_NwkId])
+    self.ListOfDevices[new_NwkId] = self.ListOfDevices[old_NwkId].copy()
     self.IEEE2NWK[IEEE] = new_NwkId
+    device_updated(self, new_NwkId)
+    wake_device(self, new_NwkId)
 
     if "ZDeviceName" in self.ListOfDevices[new_NwkId]:
         devName = self.ListOfDevices[new_NwkId]["ZDeviceName"]
@@ -294,7 +297,7 @@ def reconnectNWkDevice(self, new_NwkId, IEEE, old_NwkId):
             % (self.ListOfDevices[new_NwkId]["Status"], new_NwkId)
         )
         self.ListOfDevices[new_NwkId]["Status"] = "inDB"
-        self.ListOfDevices[new_NwkId]["Heartbeat"] = "0"
+        reset_heartbeat(self, new_NwkId)
 
     # We will also reset ReadAttributes
     if self.pluginconf.pluginConf["enableReadAttributes"]:
@@ -302,7 +305,7 @@ def reconnectNWkDevice(self, new_NwkId, IEEE, old_NwkId):
             del self.ListOfDevices[new_NwkId]["ReadAttributes"]
         if "ConfigureReporting" in self.ListOfDevices[new_NwkId]:
             del self.ListOfDevices[new_NwkId]["ConfigureReporting"]
-        self.ListOfDevices[new_NwkId]["Heartbeat"] = "0"
+        reset_heartbeat(self, new_NwkId)
 
     WriteDeviceList(self, 0)
     Domoticz.Status("NetworkID: %s is replacing %s for object: %s" % (new_NwkId, old_NwkId, IEEE))
@@ -322,6 +325,7 @@ def removeNwkInList(self, NWKID):
 
     if safe:
         del self.ListOfDevices[NWKID]
+        device_updated(self, NWKID)
         Domoticz.Status("self.ListOfDevices[%s] removed! substitued by self.ListOfDevices[%s]" % (NWKID, safe))
     else:
         Domoticz.Error("self.ListOfDevices[%s] removed! but no substitution !!!" % (NWKID))
@@ -375,6 +379,9 @@ def removeDeviceInList(self, Devices, IEEE, Unit):
                 emptyCT = False
 
     if emptyCT:
+        if self.ZigateComm:
+            # Nothing left to talk to, drop what is still waiting for this device
+            self.ZigateComm.cancel_commands(key)
         del self.ListOfDevices[key]
         del self.IEEE2NWK[IEEE]
 
@@ -386,11 +393,30 @@ def removeDeviceInList(self, Devices, IEEE, Unit):
     return False
 
 
+def wake_device(self, NwkId):
+    # Have the device processed by the next heartbeat
+    if getattr(self, "heartbeatScheduler", None):
+        self.heartbeatScheduler.wake(NwkId)
+
+
+def reset_heartbeat(self, NwkId):
+    # Restart the Heartbeat counter of the device, so it is processed by the next heartbeat ( intHB == 1 )
+    self.ListOfDevices[NwkId]["Heartbeat"] = "0"
+    device_updated(self, NwkId)
+    wake_device(self, NwkId)
+
+
+def device_updated(self, NwkId):
+    # The entry of NwkId in ListOfDevices has been updated
+    if getattr(self, "deviceChanges", None):
+        self.deviceChanges.updated(NwkId)
+
+
 def initDeviceInList(self, Nwkid):
     if Nwkid in self.ListOfDevices or Nwkid == "":
         return
 
-    self.ListOfDevices[Nwkid] = {
+    self.ListOfDevices[Nwkid] = DeviceRecord({
         "Version": "3",
         "ZDeviceName": "",
         "Status": "004d",
@@ -423,14 +449,21 @@ def initDeviceInList(self, Nwkid):
         "Stamp": {},
         "ZCL Version": "",
         "Health": "",
-    }
+    })
+    device_updated(self, Nwkid)
+    # Provisioning is driven by the heartbeat
+    wake_device(self, Nwkid)
 
 
 def timeStamped(self, key, Type):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if "Stamp" not in self.ListOfDevices[key]:
         self.ListOfDevices[key]["Stamp"] = {"LasteSeen": {}, "Time": {}, "MsgType": {}}
+    if isinstance(self.ListOfDevices[key]["Stamp"], DeviceStamp):
+        self.ListOfDevices[key]["Stamp"].stamp(time.time(), Type)
+        return
     self.ListOfDevices[key]["Stamp"]["time"] = time.time()
     self.ListOfDevices[key]["Stamp"]["Time"] = datetime.datetime.fromtimestamp(time.time()).strftime(
         "%Y-%m-%d %H:%M:%S"
@@ -486,6 +519,7 @@ def updSQN(self, key, newSQN):
 
     # Domoticz.Log("-->SQN updated %s from %s to %s" %(key, self.ListOfDevices[key]['SQN'], newSQN))
     self.ListOfDevices[key]["SQN"] = newSQN
+    device_updated(self, key)
     return
 
 
@@ -493,6 +527,7 @@ def updLQI(self, key, LQI):
 
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
 
     if "LQI" not in self.ListOfDevices[key]:
         self.ListOfDevices[key]["LQI"] = {}
@@ -955,6 +990,7 @@ def checkAndStoreAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAtt
     checkAttribute(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID)
 
     self.ListOfDevices[MsgSrcAddr]["Ep"][MsgSrcEp][MsgClusterId][MsgAttrID] = Value
+    device_updated(self, MsgSrcAddr)
 
 
 def getAttributeValue(self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID):
@@ -1060,6 +1096,7 @@ def is_time_to_perform_work(self, DeviceAttribute, key, endpoint, clusterId, now
 def set_timestamp_datastruct(self, DeviceAttribute, key, endpoint, clusterId, now):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint][clusterId]["TimeStamp"] = now
@@ -1091,6 +1128,7 @@ def set_request_datastruct(
 ):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     if AttributeId not in self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint][clusterId]["ZigateRequest"]:
@@ -1144,6 +1182,7 @@ def get_request_datastruct(self, DeviceAttribute, key, endpoint, clusterId, Attr
 def set_request_phase_datastruct(self, DeviceAttribute, key, endpoint, clusterId, AttributeId, phase):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     if AttributeId in self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint][clusterId]["ZigateRequest"]:
@@ -1169,6 +1208,7 @@ def get_list_waiting_request_datastruct(self, DeviceAttribute, key, endpoint, cl
 def set_isqn_datastruct(self, DeviceAttribute, key, endpoint, clusterId, AttributeId, isqn):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     if isqn is not None:
@@ -1188,6 +1228,7 @@ def get_isqn_datastruct(self, DeviceAttribute, key, endpoint, clusterId, Attribu
 def set_status_datastruct(self, DeviceAttribute, key, endpoint, clusterId, AttributeId, status):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint][clusterId]["Attributes"][AttributeId] = status
@@ -1216,6 +1257,7 @@ def is_attr_unvalid_datastruct(self, DeviceAttribute, key, endpoint, clusterId,
 def reset_attr_datastruct(self, DeviceAttribute, key, endpoint, clusterId, AttributeId):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     if AttributeId in self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint][clusterId]["Attributes"]:
@@ -1229,6 +1271,7 @@ def reset_attr_datastruct(self, DeviceAttribute, key, endpoint, clusterId, Attri
 def reset_cluster_datastruct(self, DeviceAttribute, key, endpoint, clusterId):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if check_datastruct(self, DeviceAttribute, key, endpoint, clusterId) is None:
         return
     if clusterId in self.ListOfDevices[key][DeviceAttribute]["Ep"][endpoint]:
@@ -1238,6 +1281,7 @@ def reset_cluster_datastruct(self, DeviceAttribute, key, endpoint, clusterId):
 def reset_datastruct(self, DeviceAttribute, key):
     if key not in self.ListOfDevices:
         return
+    device_updated(self, key)
     if DeviceAttribute in self.ListOfDevices[key]:
         del self.ListOfDevices[key][DeviceAttribute]
     self.ListOfDevices[key][DeviceAttribute] = {}
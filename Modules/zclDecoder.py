@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Module: zclDecoder.py
+
+    Description: Table driven decoding of the ZCL attribute values, by ZCL data type.
+                 - ZCL_TYPE_DECODERS: data type -> converter of the hex string value (as received from ZiGate),
+                   giving exactly the result of the historical decodeAttribute if-chain
+                 - ZCL_TYPE_STRUCTS: data type -> precompiled struct, to decode the same values from bytes
+                 - split_attribute_records / decode_attribute_records: walk the attribute records of a
+                   0x8100 / 0x8102 payload in one pass, the latter decoding the values on the way
+
+    CharacterString (0x42) is not in the tables, as the error handling needs the plugin logging (see decodeAttribute).
+"""
+
+import struct
+
+_FLOAT = struct.Struct(">f")
+
+
+def _check_range(value, max_value):
+    # Same failure as the struct.pack() done by the historical decoder
+    if not 0 <= value <= max_value:
+        raise struct.error("argument out of range")
+    return value
+
+
+def _signed(value, bits):
+    return value - (1 << bits) if value & (1 << (bits - 1)) else value
+
+
+def _float(value):
+    return _FLOAT.unpack(_check_range(value, 0xFFFFFFFF).to_bytes(4, "big"))[0]
+
+
+# ZCL data type -> converter( hex string ) -> value
+ZCL_TYPE_DECODERS = {
+    0x10: lambda x: x[0:2],  # Boolean
+    0x18: lambda x: int(x[0:8], 16),  # 8Bit bitmap
+    0x19: lambda x: str(int(x[0:4], 16)),  # 16Bit bitmap
+    0x20: lambda x: int(x[0:2], 16),  # Uint8
+    0x21: lambda x: str(int(x[0:4], 16)),  # Uint16
+    0x22: lambda x: str(_check_range(int("0" + x, 16), 0xFFFFFFFF)),  # Uint24
+    0x23: lambda x: str(int(x[0:8], 16)),  # Uint32
+    0x25: lambda x: str(_check_range(int(x, 16), 0xFFFFFFFFFFFFFFFF)),  # Uint48
+    0x28: lambda x: int(x, 16),  # Int8, returned unsigned
+    0x29: lambda x: str(_signed(int(x[0:4], 16), 16)),  # Int16
+    0x2A: lambda x: str(_signed(_check_range(int("0" + x, 16), 0xFFFFFFFF), 32)),  # Int24
+    0x2B: lambda x: str(_signed(int(x[0:8], 16), 32)),  # Int32
+    0x2D: lambda x: str(_signed(_check_range(int(x, 16), 0xFFFFFFFFFFFFFFFF), 64)),  # Int48
+    0x30: lambda x: int(x[0:2], 16),  # 8Bit enum
+    0x31: lambda x: str(_signed(int(x[0:4], 16), 16)),  # 16Bit enum
+    0x39: lambda x: str(_float(int(x, 16))),  # Single precision ( Xiaomi )
+}
+
+# ZCL data type -> ( struct of the leading bytes or None for the whole value, converter ) for the bytes path
+ZCL_TYPE_STRUCTS = {
+    0x10: (None, lambda x: x[0:1].hex()),
+    0x18: (None, lambda x: int.from_bytes(x[0:4], "big")),
+    0x19: (struct.Struct(">H"), str),
+    0x20: (struct.Struct(">B"), int),
+    0x21: (struct.Struct(">H"), str),
+    0x22: (None, lambda x: str(_check_range(int.from_bytes(x, "big"), 0xFFFFFFFF))),
+    0x23: (struct.Struct(">I"), str),
+    0x25: (None, lambda x: str(_check_range(int.from_bytes(x, "big"), 0xFFFFFFFFFFFFFFFF))),
+    0x28: (None, lambda x: int.from_bytes(x, "big")),
+    0x29: (struct.Struct(">h"), str),
+    0x2A: (None, lambda x: str(_signed(_check_range(int.from_bytes(x, "big"), 0xFFFFFFFF), 32))),
+    0x2B: (struct.Struct(">i"), str),
+    0x2D: (None, lambda x: str(_signed(_check_range(int.from_bytes(x, "big"), 0xFFFFFFFFFFFFFFFF), 64))),
+    0x30: (struct.Struct(">B"), int),
+    0x31: (struct.Struct(">h"), str),
+    0x39: (None, lambda x: str(_float(int.from_bytes(x, "big")))),
+}
+
+
+def decode_attribute_value(AttType, Attribute):
+    """ decode the hex string Attribute of ZCL data type AttType (int). Unknown types are returned unchanged """
+    if not Attribute:
+        return None
+    converter = ZCL_TYPE_DECODERS.get(AttType)
+    if converter is None:
+        return Attribute
+    return converter(Attribute)
+
+
+def decode_attribute_bytes(AttType, data):
+    """ same as decode_attribute_value, from the bytes of the value. Unknown types are returned as an hex string """
+    if not data:
+        return None
+    entry = ZCL_TYPE_STRUCTS.get(AttType)
+    if entry is None:
+        return data.hex()
+    _struct, converter = entry
+    if _struct is None:
+        return converter(data)
+    if len(data) < _struct.size:
+        # Shorter than expected: like the hex path, decode what is there (the sign bit can't be set)
+        return converter(int.from_bytes(data, "big"))
+    return converter(_struct.unpack_from(data)[0])
+
+
+def split_attribute_records(MsgData, idx=12):
+    """
+    iterate over the attribute records of a 0x8100/0x8102 payload, from idx (after SQN, Addr, Ep, Cluster).
+    yield ( idx after the record, AttrID, Status, AttType, AttSize, Data ), all as hex strings.
+    A record with a non 0x00 status has no type, size nor data.
+    """
+    msg_len = len(MsgData)
+    while idx < msg_len:
+        MsgAttrID = MsgData[idx : idx + 4]
+        MsgAttStatus = MsgData[idx + 4 : idx + 6]
+        idx += 6
+        if MsgAttStatus == "00":
+            MsgAttType = MsgData[idx : idx + 2]
+            MsgAttSize = MsgData[idx + 2 : idx + 6]
+            idx += 6
+            size = int(MsgAttSize, 16) * 2
+            MsgClusterData = MsgData[idx : idx + size]
+            idx += size
+        else:
+            MsgAttType = MsgAttSize = MsgClusterData = ""
+            # If the frame is coming from firmware we get only one attribute at a time, with some dummy datas
+            if msg_len - idx == 6:
+                idx += 6
+        yield idx, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData
+
+
+def decode_attribute_records(MsgData, idx=12):
+    """
+    split_attribute_records() with the value of each record decoded in the same pass:
+    yield ( idx, AttrID, Status, AttType, AttSize, Data, Value ). Value is None when the record has no table
+    driven decoding (status, 0x42 and unknown types, invalid value): decodeAttribute() then decodes Data as before.
+    """
+    for record in split_attribute_records(MsgData, idx):
+        value = None
+        if record[2] == "00" and record[3]:
+            value = _decode_record_value(int(record[3], 16), record[5])
+        yield record + (value,)
+
+
+def _decode_record_value(AttType, Attribute):
+    converter = ZCL_TYPE_DECODERS.get(AttType)
+    if converter is None or not Attribute:
+        return None
+    try:
+        return converter(Attribute)
+    except (ValueError, struct.error):
+        # decodeAttribute() raises, where the cluster handler decodes the value
+        return None
@@ -0,0 +1,155 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Compare the processing of the 0x8002 (raw APS data indication) attribute reports, when the Transport rebuilds a
+    ZiGate 0x8102/0x8100 frame (parsed again by the plugin), and when it hands over a DecodedMessage.
+
+    usage: python3 benchmark-decode8002.py [--capture FILE] [--devicelist FILE] [--scale N] [--count N]
+
+    - transport: decode8002_and_process only
+    - plugin   : decode8002_and_process + BasePlugin.processFrame, with the ListOfDevices of the population
+    The capture file holds ZiGate frames (one hex frame per line, or raw bytes), only the 0x8002 are used.
+    Before the timings, the records of each DecodedMessage are checked against the records Decode8100 / Decode8102
+    get from the frame built by the historical path. Read attribute responses with failed attributes (the firmware
+    padding) are added to the check.
+"""
+
+import argparse
+import shutil
+import sys
+import time
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.Transport.decode8002 import decode8002_and_process  # noqa: E402
+from Classes.Transport.decodedMessage import DecodedMessage  # noqa: E402
+from Classes.Transport.frameDecoder import unescape_frame  # noqa: E402
+from Classes.Transport.sqnMgmt import sqn_init_stack  # noqa: E402
+from Modules.zclDecoder import decode_attribute_records  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, build_frame,  # noqa: E402
+                             generate_traffic, load_capture, load_population,
+                             report_sources, write_population)
+
+HARDWARE_ID = 99
+
+
+class BenchZigateComm:
+    # What decode8002_and_process and the 0x8100/0x8102 handlers expect from the Transport
+
+    def __init__(self, pluginconf):
+        self.pluginconf = pluginconf
+        sqn_init_stack(self)
+
+    def logging_8002(self, logType, message, NwkId=None, _context=None):
+        pass
+
+    def loadTransmit(self):
+        # Busy, so nothing is sent to the devices waking up
+        return 1000
+
+
+def raw_frames(frames):
+    """ 0x8002 frames, as hex strings given by the reader to process_frame """
+    decoded = [unescape_frame(frame).hex() for frame in frames]
+    return [frame for frame in decoded if frame[2:6] == "8002"]
+
+
+def read_responses(population):
+    """ 0x8002 read attribute responses with 1 to 3 failed attributes, after a successful one or not """
+    frames = []
+    for sqn, (nwkid, ep, cluster) in enumerate(report_sources(population)[:50]):
+        for records in ("00000020%02x" % sqn, "", "00000020%02x0500860600c3" % sqn):
+            for failed in range(1, 4):
+                zcl_frame = "18%02x01%s" % (sqn, records + "".join("ff%02x86" % x for x in range(failed)))
+                frames.append(build_frame("8002", "000104%s%s0102%s020000%s" % (cluster, ep, nwkid, zcl_frame)))
+    return raw_frames(frames)
+
+
+def handler_records(transport, frame, rawDecodedMessages):
+    # Attribute records as given to scan_attribute_reponse, without the decoded values
+    transport.pluginconf.pluginConf["rawDecodedMessages"] = rawDecodedMessages
+    message = decode8002_and_process(transport, frame)
+    if isinstance(message, DecodedMessage):
+        return [record[:6] for record in message.Records]
+    if message[2:6] in ("8100", "8102"):
+        return [record[:6] for record in decode_attribute_records(message[12 : len(message) - 4])]
+    return message
+
+
+def check_compatibility(transport, frames):
+    errors = 0
+    for frame in frames:
+        legacy = handler_records(transport, frame, 0)
+        result = handler_records(transport, frame, 1)
+        if result != legacy:
+            errors += 1
+            print("Mismatch %s: %s vs %s" % (frame, result, legacy))
+    return errors
+
+
+def measure(label, transport, frames, rawDecodedMessages, F_out=None):
+    transport.pluginconf.pluginConf["rawDecodedMessages"] = rawDecodedMessages
+    t_start = time.perf_counter()
+    for frame in frames:
+        message = decode8002_and_process(transport, frame)
+        if F_out:
+            F_out(message)
+    t_elapse = time.perf_counter() - t_start
+    print("%-40s %10.0f frames/s %8.2f us/frame" % (label, len(frames) / t_elapse, 1e6 * t_elapse / len(frames)))
+    return t_elapse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="0x8002 frame rebuild vs DecodedMessage")
+    parser.add_argument("--capture", help="capture file with 0x8002 frames instead of generated reports")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    if args.capture:
+        frames = raw_frames(load_capture(args.capture))
+    else:
+        frames = raw_frames(
+            [build_frame(msg_type, payload) for msg_type, payload in generate_traffic(population, args.count, raw=True)]
+        )
+    if not frames:
+        print("No 0x8002 frame to process")
+        return 1
+
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID)
+    try:
+        transport = BenchZigateComm(_plugin.pluginconf)
+        _plugin.ZigateComm = transport
+
+        errors = check_compatibility(transport, frames)
+        print("%s devices, %s 0x8002 frames, %s compatibility errors" % (len(population), len(frames), errors))
+        padding = read_responses(population)
+        padding_errors = check_compatibility(transport, padding)
+        print("%s read attribute responses with failed attributes, %s compatibility errors" % (len(padding), padding_errors))
+        errors += padding_errors
+
+        t_legacy = measure("transport - rebuilt frame", transport, frames, 0)
+        t_message = measure("transport - DecodedMessage", transport, frames, 1)
+        print("%-40s %10.1f x" % ("speed-up", t_legacy / t_message))
+
+        t_legacy = measure("plugin - rebuilt frame", transport, frames, 0, _plugin.processFrame)
+        t_message = measure("plugin - DecodedMessage", transport, frames, 1, _plugin.processFrame)
+        print("%-40s %10.1f x" % ("speed-up", t_legacy / t_message))
+    finally:
+        _plugin.log.closeLogFile()
+        shutil.rmtree(home, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
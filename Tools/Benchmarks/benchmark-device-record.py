@@ -0,0 +1,130 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Memory and access time of the ListOfDevices entries: plain dict vs DeviceRecord.
+
+    usage: python3 benchmark-device-record.py [DeviceList-xx.txt ...] [--scale N]
+
+    The entries of the User-Tests DeviceList fixtures are loaded, then brought to their runtime state
+    (Heartbeat counter, RollingLQI, Stamp of the last message), as plain dicts (historical) and as DeviceRecord
+    (interned strings, DeviceStamp).
+    - check: str() ( persistence ) and json.dumps() of both are identical
+    - memory: allocated size per device, measured with tracemalloc
+    - access time: the ListOfDevices reads done on each message and heartbeat
+    - timeStamped + updLQI: done for each message received
+"""
+
+import argparse
+import ast
+import datetime
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarkTools import PLUGIN_HOME, setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.DeviceRecord import DeviceRecord, DeviceStamp  # noqa: E402
+
+NB_ACCESS = 200000
+
+
+def load_fixtures(filenames, scale):
+    lines = []
+    for filename in filenames:
+        with open(filename, "r") as handle:
+            for line in handle:
+                if ":" not in line:
+                    continue
+                key, val = line.split(":", 1)
+                try:
+                    device = ast.literal_eval(val.strip())
+                except (SyntaxError, ValueError):
+                    continue
+                if isinstance(device, dict) and key.strip().replace("'", "") not in ("0000", "ffff"):
+                    lines.append(repr(device))
+    return lines * scale
+
+
+def runtime_state(device, now):
+    # As left by the heartbeat, timeStamped and updLQI
+    device["Heartbeat"] = str(int(device.get("Heartbeat", 0) or 0) + 1)
+    device["RIA"] = "10"
+    if not isinstance(device.get("Stamp"), dict):
+        device["Stamp"] = DeviceStamp() if isinstance(device, DeviceRecord) else {}
+    if isinstance(device["Stamp"], DeviceStamp):
+        device["Stamp"].stamp(now, 0x8102)
+    else:
+        device["Stamp"]["time"] = now
+        device["Stamp"]["Time"] = datetime.datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        device["Stamp"]["MsgType"] = "%4x" % 0x8102
+    for lqi in range(100, 115):
+        device["LQI"] = lqi
+        device.setdefault("RollingLQI", [])
+        if len(device["RollingLQI"]) > 10:
+            del device["RollingLQI"][0]
+        device["RollingLQI"].append(lqi)
+    return device
+
+
+def build(lines, factory, now):
+    return [runtime_state(factory(ast.literal_eval(line)), now) for line in lines]
+
+
+def allocated_per_device(lines, factory, now):
+    tracemalloc.start()
+    devices = build(lines, factory, now)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(devices), devices
+
+
+def access(devices):
+    for device in devices:
+        int(device["Heartbeat"])
+        device["LQI"]
+        device["Stamp"]["time"]
+        device.get("Model")
+        device["Ep"]
+        "Param" in device
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ListOfDevices entries: dict vs DeviceRecord")
+    parser.add_argument("devicelist", nargs="*", default=sorted(glob.glob(os.path.join(PLUGIN_HOME, "User-Tests", "DeviceList-*.txt"))))
+    parser.add_argument("--scale", type=int, default=10)
+    args = parser.parse_args()
+
+    lines = load_fixtures(args.devicelist, args.scale)
+    now = time.time()
+    size_dict, legacy = allocated_per_device(lines, dict, now)
+    size_record, records = allocated_per_device(lines, DeviceRecord, now)
+
+    errors = sum(1 for x, y in zip(legacy, records) if str(x) != str(y) or json.dumps(x) != json.dumps(y))
+    print("%s devices from %s DeviceList files, %s persistence mismatch" % (len(lines), len(args.devicelist), errors))
+    print("%-40s %10.0f bytes / device" % ("dict", size_dict))
+    print("%-40s %10.0f bytes / device (%.1f %%)" % ("DeviceRecord", size_record, 100 * (size_record - size_dict) / size_dict))
+
+    loops = max(1, NB_ACCESS // len(lines))
+    t_dict, _ = timeit("dict - %s accesses" % (6 * loops * len(lines)), lambda: [access(legacy) for _ in range(loops)])
+    t_record, _ = timeit("DeviceRecord - %s accesses" % (6 * loops * len(lines)), lambda: [access(records) for _ in range(loops)])
+    print("%-40s %10.0f ns / access" % ("extra cost", 1e9 * (t_record - t_dict) / (6 * loops * len(lines))))
+    timeit("dict - timeStamped + updLQI", lambda: [runtime_state(x, now) for x in legacy])
+    timeit("DeviceRecord - timeStamped + updLQI", lambda: [runtime_state(x, now) for x in records])
+    # str() of a device stamped since its previous str() ( DeviceList flush ), then of a device not stamped since
+    timeit("dict - str() of stamped devices", lambda: [str(runtime_state(x, now)) for x in legacy], 3)
+    timeit("DeviceRecord - str() of stamped devices", lambda: [str(runtime_state(x, now)) for x in records], 3)
+    timeit("dict - str() of all devices", lambda: [str(x) for x in legacy], 3)
+    timeit("DeviceRecord - str() of all devices", lambda: [str(x) for x in records], 3)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Last seen and battery updates of the widgets: one Touch/Update per message (deviceTouchWindow = 0, historical)
+    vs coalesced per device (TouchAggregator).
+
+    usage: python3 benchmark-device-touches.py [--devicelist FILE] [--scale N] [--count N] [--window S]
+
+    Attribute reports are given to BasePlugin.processFrame, and the Touch() / Update() calls done on the Domoticz
+    widgets are counted. At the end, the pending requests are flushed and the widgets Battery levels are checked
+    against the ones of the historical processing.
+"""
+
+import argparse
+import shutil
+import sys
+import time
+
+import benchmarkTools
+from benchmarkTools import StubDevice, setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.TouchAggregator import TouchAggregator  # noqa: E402
+from Classes.Transport.frameDecoder import unescape_frame  # noqa: E402
+from Classes.Transport.sqnMgmt import sqn_init_stack  # noqa: E402
+from Modules.domoTools import flush_device_touches  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, build_frame,  # noqa: E402
+                             generate_traffic, load_population,
+                             write_population)
+
+HARDWARE_ID = 99
+
+
+class BenchZigateComm:
+    # What the 0x8102 handlers expect from the Transport
+
+    def __init__(self):
+        sqn_init_stack(self)
+
+    def loadTransmit(self):
+        # Busy, so nothing is sent to the devices waking up
+        return 1000
+
+
+def count_touches(device):
+    device.touches = getattr(device, "touches", 0) + 1
+
+
+def measure(label, _plugin, Devices, frames, window):
+    _plugin.pluginconf.pluginConf["deviceTouchWindow"] = window
+    _plugin.deviceTouches = TouchAggregator()
+    for device in Devices.values():
+        device.touches = device.updates = 0
+        device.BatteryLevel = 255
+
+    t_start = time.perf_counter()
+    for frame in frames:
+        _plugin.processFrame(frame)
+    t_elapse = time.perf_counter() - t_start
+
+    # Flush what is still pending, as the next heartbeat would do
+    _plugin.pluginconf.pluginConf["deviceTouchWindow"] = 0
+    flush_device_touches(_plugin, Devices)
+
+    calls = sum(device.touches + device.updates for device in Devices.values())
+    print("%-30s %8.2f us/frame %8s Domoticz calls   %s" % (label, 1e6 * t_elapse / len(frames), calls, _plugin.deviceTouches.statistics()))
+    return {unit: device.BatteryLevel for unit, device in Devices.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coalesced last seen and battery updates")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--window", type=int, default=10)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    frames = [unescape_frame(build_frame(msg_type, payload)).hex() for msg_type, payload in generate_traffic(population, args.count)]
+
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID)
+    StubDevice.Touch = count_touches
+    try:
+        import plugin
+        _plugin.ZigateComm = BenchZigateComm()
+        print("%s devices, %s units, %s reports" % (len(population), len(plugin.Devices), len(frames)))
+        legacy = measure("1 touch per message", _plugin, plugin.Devices, frames, 0)
+        coalesced = measure("window of %s s" % args.window, _plugin, plugin.Devices, frames, args.window)
+        errors = sum(1 for unit in legacy if legacy[unit] != coalesced[unit])
+        print("%-30s %8s Battery mismatch" % ("check", errors))
+    finally:
+        _plugin.log.closeLogFile()
+        shutil.rmtree(home, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
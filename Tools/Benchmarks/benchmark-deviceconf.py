@@ -0,0 +1,127 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Compare the load of the DeviceConf from Conf/ (DeviceConf.txt + Certified json files) with the
+    compiled cache.
+
+    usage: python3 benchmark-deviceconf.py [DeviceList-xx.txt]
+
+    - cold   : the json files are loaded and the compiled cache is written
+    - cached : the compiled cache is loaded, nothing expanded
+    - cached + network : the cache is loaded and the models of the DeviceList (default User-Tests/DeviceList-46.txt)
+                         are accessed, like the plugin does when it starts
+    The memory is the peak traced by tracemalloc during the load, and what is still allocated after it.
+"""
+
+import ast
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarkTools import PLUGIN_HOME, setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.DeviceConfCache import LazyDeviceConf  # noqa: E402
+from Classes.LoggingManagement import LoggingManagement  # noqa: E402
+from Classes.PluginConf import PluginConf  # noqa: E402
+from Modules.database import importDeviceConfV2  # noqa: E402
+
+HARDWARE_ID = 99
+NB_LOOPS = 10
+
+
+class BenchPlugin:
+    def __init__(self, home):
+        self.pluginconf = PluginConf(True, 2022, 1, home + os.sep, HARDWARE_ID)
+        self.pluginconf.pluginConf["pluginConfig"] = os.path.join(PLUGIN_HOME, "Conf") + os.sep
+        self.pluginconf.pluginConf["pluginData"] = os.path.join(home, "Data") + os.sep
+        self.log = LoggingManagement(self.pluginconf, {}, HARDWARE_ID, {}, {})
+        self.DeviceConf = {}
+
+
+def network_models(devicelist):
+    models = set()
+    with open(devicelist, "r") as handle:
+        for line in handle:
+            if ":" not in line:
+                continue
+            try:
+                device = ast.literal_eval(line.split(":", 1)[1].strip())
+            except (SyntaxError, ValueError):
+                continue
+            if isinstance(device, dict) and device.get("Model"):
+                models.add(device["Model"])
+    return models
+
+
+def measure(label, func):
+    gc.collect()
+    timings = []
+    for _ in range(NB_LOOPS):
+        t_start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t_start)
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("%-24s %10.2f %12.0f %12.0f" % (label, 1000 * min(timings), peak / 1024, current / 1024))
+    return min(timings), result
+
+
+def main():
+    devicelist = sys.argv[1] if len(sys.argv) > 1 else os.path.join(PLUGIN_HOME, "User-Tests", "DeviceList-46.txt")
+    models = network_models(devicelist)
+
+    home = tempfile.mkdtemp(prefix="zigate-bench-")
+    for folder in ("Conf", "Data", "Logs"):
+        os.makedirs(os.path.join(home, folder))
+    _plugin = BenchPlugin(home)
+    cache_file = os.path.join(home, "Data", "DeviceConf-compiled.pck")
+
+    def cold():
+        if os.path.isfile(cache_file):
+            os.remove(cache_file)
+        importDeviceConfV2(_plugin)
+        return _plugin.DeviceConf
+
+    def cached():
+        importDeviceConfV2(_plugin)
+        return _plugin.DeviceConf
+
+    def cached_network():
+        importDeviceConfV2(_plugin)
+        for model in models:
+            if model in _plugin.DeviceConf:
+                _plugin.DeviceConf[model]
+        return _plugin.DeviceConf
+
+    try:
+        print("%s models in the network" % len(models))
+        print("%-24s %10s %12s %12s" % ("load", "ms", "peak KiB", "kept KiB"))
+        t_cold, cold_conf = measure("cold (json files)", cold)
+        t_cached, cached_conf = measure("cached", cached)
+        measure("cached + network", cached_network)
+
+        assert isinstance(cached_conf, LazyDeviceConf)
+        assert cached_conf.copy() == cold_conf
+        print("%-24s %10s" % ("models", len(cold_conf)))
+        print("%-24s %10s" % ("cache size", os.path.getsize(cache_file)))
+        print("%-24s %10.1f x" % ("speed-up", t_cold / t_cached))
+    finally:
+        _plugin.log.closeLogFile()
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    WriteDeviceList: all entries written to every backend (historical) vs only the entries marked as updated.
+
+    usage: python3 benchmark-devicelist-flush.py [--devicelist FILE] [--scale N] [--updated N] [--flushes N]
+
+    Before each flush, N devices receive a message (timeStamped + updLQI). The historical flush is str() of all
+    entries, the DeviceList-xx.txt, the json.dump() of ListOfDevices and the Domoticz configuration item built
+    from plain dicts. The journal flush str() and encodes only the updated entries.
+    - check: DeviceList-xx.txt ( snapshot + journal ), DeviceList-xx.json and the Domoticz item are the same as the
+      historical ones
+"""
+
+import argparse
+import ast
+import io
+import json
+import shutil
+import sys
+import time
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.DeviceRecord import plain_dict  # noqa: E402
+from Modules.tools import timeStamped, updLQI  # noqa: E402  ( before Modules.database, circular import )
+from Modules.database import (DeviceList_Domoticz_item,  # noqa: E402
+                              WriteDeviceList, _read_DeviceList_txt)
+from zigateSimulator import (DEFAULT_DEVICELIST, load_population,  # noqa: E402
+                             write_population)
+
+HARDWARE_ID = 99
+
+
+def legacy_flush(self, filename):
+    # Historical WriteDeviceList: every entry to every backend
+    with open(filename, "wt") as file:
+        for key in self.ListOfDevices:
+            file.write(key + " : " + str(self.ListOfDevices[key]) + "\n")
+    with open(filename[:-3] + "json", "wt") as file:
+        json.dump(self.ListOfDevices, file, sort_keys=True, indent=2)
+    return str({key: plain_dict(value) for key, value in self.ListOfDevices.items()})
+
+
+def run(label, home, args, journal):
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID, {"journalDeviceList": 1, "expJsonDatabase": 1})
+    filename = _plugin.pluginconf.pluginConf["pluginData"] + _plugin.DeviceListName
+    nwkids = sorted(x for x in _plugin.ListOfDevices if x not in ("0000", "ffff"))
+    elapse = 0
+    try:
+        WriteDeviceList(_plugin, 0)
+        for flush in range(args.flushes):
+            for idx in range(args.updated):
+                nwkid = nwkids[(flush * args.updated + idx) % len(nwkids)]
+                timeStamped(_plugin, nwkid, 0x8102)
+                updLQI(_plugin, nwkid, "%02x" % (flush % 255 + 1))
+            t_start = time.perf_counter()
+            if journal:
+                WriteDeviceList(_plugin, 0)
+                # Domoticz item, as written when the Domoticz database is used
+                dz_item = DeviceList_Domoticz_item(_plugin, _plugin.DeviceListPersisted)
+            else:
+                dz_item = legacy_flush(_plugin, filename)
+            elapse += time.perf_counter() - t_start
+        txt = _read_DeviceList_txt(_plugin, filename)
+        with open(filename[:-3] + "json", "rt") as handle:
+            json_content = handle.read()
+    finally:
+        _plugin.log.closeLogFile()
+    print("%-36s %10.3f ms / flush" % (label, 1000 * elapse / args.flushes))
+
+    expected = io.StringIO()
+    json.dump(_plugin.ListOfDevices, expected, sort_keys=True, indent=2)
+    errors = sum(1 for key in _plugin.ListOfDevices if txt.get(key, "").strip() != str(_plugin.ListOfDevices[key]))
+    errors += len(set(txt) ^ set(_plugin.ListOfDevices))
+    errors += json_content != expected.getvalue()
+    errors += ast.literal_eval(dz_item) != {key: plain_dict(value) for key, value in _plugin.ListOfDevices.items()}
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeviceList flush, all entries vs updated entries")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--updated", type=int, default=5)
+    parser.add_argument("--flushes", type=int, default=50)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    try:
+        print("%s devices, %s updated between 2 flushes" % (len(population), args.updated))
+        errors = run("all entries (historical)", home, args, False)
+        write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+        errors += run("updated entries (journal)", home, args, True)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    print("%-36s %10s backends different from the live ListOfDevices" % ("check", errors))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
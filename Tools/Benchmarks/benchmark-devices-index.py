@@ -0,0 +1,88 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Compare the scan of the Domoticz Devices with the DevicesIndex lookups.
+
+    usage: python3 benchmark-devices-index.py [nb_units]
+
+    A synthetic Devices dictionary is built with nb_units widgets (default 1000), 4 widgets per device.
+"""
+
+import random
+import sys
+
+from benchmarkTools import StubDevice, setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.DevicesIndex import DevicesIndex  # noqa: E402
+
+WIDGETS_PER_DEVICE = 4
+NB_LOOKUPS = 10000
+
+
+def build_devices(nb_units):
+    return {
+        unit: StubDevice(unit, "00158d0000%06x" % (unit // WIDGETS_PER_DEVICE), 1000 + unit)
+        for unit in range(1, nb_units + 1)
+    }
+
+
+def scan_widgetid(Devices, WidgetId):
+    for x in Devices:
+        if Devices[x].ID == int(WidgetId):
+            return x
+    return None
+
+
+def scan_deviceid(Devices, DeviceID):
+    return tuple(x for x in list(Devices) if Devices[x].DeviceID == DeviceID)
+
+
+def main():
+    nb_units = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    Devices = build_devices(nb_units)
+    index = DevicesIndex()
+
+    units = list(Devices)
+    random.seed(0)
+    samples = [Devices[random.choice(units)] for _ in range(NB_LOOKUPS)]
+    widget_ids = [str(device.ID) for device in samples]
+    device_ids = [device.DeviceID for device in samples]
+
+    print("%s units, %s lookups" % (nb_units, NB_LOOKUPS))
+    t_build, _ = timeit("DevicesIndex rebuild", lambda: index.rebuild(Devices))
+
+    t_scan, scan_units = timeit("scan by Widget ID", lambda: [scan_widgetid(Devices, x) for x in widget_ids])
+    t_index, index_units = timeit(
+        "index by Widget ID", lambda: [index.unit_for_widgetid(Devices, x) for x in widget_ids]
+    )
+    assert scan_units == index_units
+    print("%-40s %10.1f x" % ("speed-up", t_scan / t_index))
+
+    t_scan, scan_units = timeit("scan by DeviceID", lambda: [scan_deviceid(Devices, x) for x in device_ids])
+    t_index, index_units = timeit("index by DeviceID", lambda: [index.units_for_deviceid(Devices, x) for x in device_ids])
+    assert scan_units == index_units
+    print("%-40s %10.1f x" % ("speed-up", t_scan / t_index))
+
+    # Stale Widget IDs ( ClusterType entries of removed widgets ): 1 rebuild, not 1 per lookup
+    rebuilds = index.rebuilds
+    stale_ids = [str(900000 + x % 10) for x in range(NB_LOOKUPS)]
+    t_scan, scan_units = timeit("scan by stale Widget ID", lambda: [scan_widgetid(Devices, x) for x in stale_ids])
+    t_index, index_units = timeit("index by stale Widget ID", lambda: [index.unit_for_widgetid(Devices, x) for x in stale_ids])
+    assert scan_units == index_units
+    assert index.rebuilds - rebuilds <= len(set(stale_ids)), "%s rebuilds" % (index.rebuilds - rebuilds)
+    print("%-40s %10.1f x" % ("speed-up", t_scan / t_index))
+
+    # A widget removed without notification must not be returned
+    del Devices[units[0]]
+    assert index.units_for_deviceid(Devices, samples[0].DeviceID) == scan_deviceid(Devices, samples[0].DeviceID)
+    assert index.unit_for_widgetid(Devices, 1000 + units[0]) is None
+    print("%-40s %10s" % ("index rebuilds", index.rebuilds))
+
+
+if __name__ == "__main__":
+    main()
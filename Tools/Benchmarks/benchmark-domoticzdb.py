@@ -0,0 +1,131 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    DomoticzDB_DeviceStatus against a local sqlite file with the Domoticz DeviceStatus schema.
+
+    usage: python3 benchmark-domoticzdb.py [nb_devices] [--database FILE]
+
+    - check: the values given by retreiveAddjValue_temp / retreiveAddjValue_baro / retreiveTimeOut_Motion are the
+      ones of the DeviceStatus table, including after an update of the table ( load_adjustments ).
+    - benchmark: filling the cache of all Devices, one connection and one query per Device (historical) vs the bulk
+      load, then the lookups done by domoMaj / domoTools.
+    A copy of a real domoticz.db can be given with --database (it is opened read-only).
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.DomoticzDB import DomoticzDB_DeviceStatus  # noqa: E402
+
+HARDWARE_ID = 99
+
+# Subset of the Domoticz DeviceStatus table used by the plugin
+DEVICESTATUS_SCHEMA = """CREATE TABLE DeviceStatus (
+    [ID] INTEGER PRIMARY KEY,
+    [HardwareID] INTEGER NOT NULL,
+    [DeviceID] VARCHAR(25) NOT NULL,
+    [Unit] INTEGER DEFAULT 0,
+    [Name] VARCHAR(100) DEFAULT Unknown,
+    [Used] INTEGER DEFAULT 0,
+    [Type] INTEGER NOT NULL,
+    [SubType] INTEGER NOT NULL,
+    [nValue] INTEGER DEFAULT 0,
+    [sValue] VARCHAR(200) DEFAULT null,
+    [LastUpdate] DATETIME DEFAULT (datetime('now','localtime')),
+    [AddjValue] FLOAT DEFAULT 0,
+    [AddjMulti] FLOAT DEFAULT 1,
+    [AddjValue2] FLOAT DEFAULT 0,
+    [AddjMulti2] FLOAT DEFAULT 1)"""
+
+
+class _Log:
+    def logging(self, module, logType, message, nwkid=None, context=None):
+        if logType == "Error":
+            print(message)
+
+
+def build_database(filename, nb_devices):
+    conn = sqlite3.connect(filename)
+    conn.execute(DEVICESTATUS_SCHEMA)
+    rows = []
+    for x in range(1, nb_devices + 1):
+        hardware = HARDWARE_ID if x % 5 else HARDWARE_ID + 1  # some Devices of an other Hardware
+        rows.append((x, hardware, "%016x" % x, 1, 80, 5, round(random.uniform(-2, 2), 1), round(random.uniform(-5, 5), 1)))
+    conn.executemany(
+        "INSERT INTO DeviceStatus (ID, HardwareID, DeviceID, Unit, Type, SubType, AddjValue, AddjValue2) VALUES (?,?,?,?,?,?,?,?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def legacy_retreive(database, ID, column):
+    # One connection per Device, as the historical retreiveAddj* did on a cache miss
+    conn = sqlite3.connect(database)
+    value = conn.execute("SELECT %s FROM DeviceStatus WHERE ID = '%s' and HardwareID = '%s'" % (column, ID, HARDWARE_ID)).fetchone()
+    conn.close()
+    return value[0] if value else 0
+
+
+def check(dzdb, database, ids):
+    errors = 0
+    for ID in ids:
+        for column, value in (("AddjValue", dzdb.retreiveAddjValue_temp(ID)), ("AddjValue", dzdb.retreiveTimeOut_Motion(ID)), ("AddjValue2", dzdb.retreiveAddjValue_baro(ID))):
+            if value != legacy_retreive(database, ID, column):
+                errors += 1
+                print("Mismatch Device %s %s: %s" % (ID, column, value))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DomoticzDB DeviceStatus adjustment cache")
+    parser.add_argument("nb_devices", type=int, nargs="?", default=500)
+    parser.add_argument("--database", help="copy of a domoticz.db")
+    args = parser.parse_args()
+    random.seed(0)
+
+    home = tempfile.mkdtemp(prefix="zigate-bench-")
+    database = os.path.join(home, "domoticz.db")
+    if args.database:
+        shutil.copy(args.database, database)
+    else:
+        build_database(database, args.nb_devices)
+    ids = [row[0] for row in sqlite3.connect(database).execute("SELECT ID FROM DeviceStatus")]
+
+    dzdb = DomoticzDB_DeviceStatus(database, None, HARDWARE_ID, _Log())
+    try:
+        errors = check(dzdb, database, ids)
+
+        # Adjustments changed by the user in Domoticz, picked up by the next refresh
+        conn = sqlite3.connect(database)
+        conn.execute("UPDATE DeviceStatus SET AddjValue = AddjValue + 1 WHERE ID % 7 = 0")
+        conn.commit()
+        conn.close()
+        changed = dzdb.load_adjustments()
+        errors += check(dzdb, database, ids)
+        print("%-40s %10s Devices %5s changed %5s errors" % ("check", len(dzdb.AdjValue), changed, errors))
+
+        timeit("fill, 1 query per Device", lambda: [legacy_retreive(database, ID, "AddjValue") for ID in ids])
+        timeit("fill, bulk load", dzdb.load_adjustments)
+        lookups = [random.choice(ids) for _ in range(100000)]
+        timeit("100000 lookups", lambda: [dzdb.retreiveAddjValue_temp(ID) for ID in lookups])
+    finally:
+        dzdb.closeDB()
+        shutil.rmtree(home, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Forwarder thread: one frame per wake-up vs batched delivery, with and without coalescing of the reports.
+
+    usage: python3 benchmark-forwarder.py [--devicelist FILE] [--scale N] [--count N] [--batch N]
+
+    A report storm (every device reporting at once, as after a power cut) is queued in the forwarder queue, then
+    the forwarder thread delivers it:
+    - transport: to a no-op F_out, with ZiGateReactTime enabled (overhead of the forwarder itself)
+    - plugin   : to BasePlugin.processFrame, with the ListOfDevices of the population
+"""
+
+import argparse
+import queue
+import shutil
+import sys
+import time
+from threading import Thread
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.Transport.forwarderThread import forwarder_thread  # noqa: E402
+from Classes.Transport.frameDecoder import unescape_frame  # noqa: E402
+from Classes.Transport.sqnMgmt import sqn_init_stack  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, build_frame,  # noqa: E402
+                             generate_traffic, load_population,
+                             write_population)
+
+HARDWARE_ID = 99
+
+
+class BenchForwarder:
+    # What the forwarder thread and the plugin handlers expect from the Transport
+
+    def __init__(self, pluginconf, statistics, F_out):
+        self.pluginconf = pluginconf
+        self.statistics = statistics
+        self.F_out = F_out
+        self.forwarder_queue = queue.Queue()
+        self.running = True
+        self.hardwareid = HARDWARE_ID
+        sqn_init_stack(self)
+
+    def logging_forwarded(self, logType, message, NwkId=None, _context=None):
+        if logType == "Error":
+            print(message, _context)
+
+    logging_transport = logging_forwarded
+
+    def loadTransmit(self):
+        # Busy, so nothing is sent to the devices waking up
+        return 1000
+
+
+def measure(label, _plugin, frames, batch_size, coalescing, F_out=None):
+    _plugin.pluginconf.pluginConf["forwarderBatchSize"] = batch_size
+    _plugin.pluginconf.pluginConf["forwarderCoalescing"] = coalescing
+    _plugin.pluginconf.pluginConf["ZiGateReactTime"] = 1 if F_out else 0
+    statistics = _plugin.statistics.__class__(_plugin.pluginconf)
+    transport = BenchForwarder(_plugin.pluginconf, statistics, F_out or _plugin.processFrame)
+    _plugin.ZigateComm = transport
+    now = time.time()
+    for frame in frames:
+        transport.forwarder_queue.put((now, frame))
+    transport.forwarder_queue.put("STOP")
+
+    t_start = time.perf_counter()
+    thread = Thread(target=forwarder_thread, args=(transport,))
+    thread.start()
+    thread.join()
+    t_elapse = time.perf_counter() - t_start
+    stats = statistics.forwarder()
+    print(
+        "%-35s %10.0f frames/s %8s processed %8s coalesced %6s avg batch"
+        % (label, len(frames) / t_elapse, stats["Frames"] - stats["Coalesced"], stats["Coalesced"], stats["AvgBatch"])
+    )
+    return t_elapse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Forwarder batched delivery")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=32)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    frames = [unescape_frame(build_frame(msg_type, payload)).hex() for msg_type, payload in generate_traffic(population, args.count)]
+
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID)
+    try:
+        print("%s devices, %s reports" % (len(population), len(frames)))
+        t_single = measure("transport - 1 frame per wake-up", _plugin, frames, 1, 0, lambda message: None)
+        t_batch = measure("transport - batch of %s" % args.batch, _plugin, frames, args.batch, 0, lambda message: None)
+        print("%-35s %10.1f x" % ("speed-up", t_single / t_batch))
+
+        t_single = measure("plugin - 1 frame per wake-up", _plugin, frames, 1, 0)
+        t_batch = measure("plugin - batch of %s" % args.batch, _plugin, frames, args.batch, 0)
+        t_coalesced = measure("plugin - batch of %s + coalescing" % args.batch, _plugin, frames, args.batch, 1)
+        print("%-35s %10.1f x / %.1f x" % ("speed-up", t_single / t_batch, t_single / t_coalesced))
+    finally:
+        _plugin.log.closeLogFile()
+        shutil.rmtree(home, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
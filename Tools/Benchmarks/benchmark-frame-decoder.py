@@ -0,0 +1,100 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Compare the legacy byte per byte ZiGate decoder with the ZiGateFrameDecoder.
+
+    usage: python3 benchmark-frame-decoder.py [capture_file]
+
+    capture_file is either a raw binary capture of the serial line, or a text file with one
+    ZiGate frame (hex string, as found in the plugin logs) per line.
+    Without capture, a synthetic report storm is generated.
+"""
+
+import os
+import sys
+
+from benchmarkTools import BenchTransport, setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+import Classes.Transport.readDecoder as readDecoder  # noqa: E402
+from Classes.Transport.frameDecoder import ZiGateFrameDecoder  # noqa: E402
+from Classes.Transport.writerThread import encode_message  # noqa: E402
+import legacyDecoder  # noqa: E402
+
+SAMPLE_FRAMES = (
+    ("8102", "01a3b2010006000000100001012a"),
+    ("8102", "0250c7010402000000290002086aba"),
+    ("8000", "00af0100000301e010"),
+    ("8011", "00a3b201000600af"),
+    ("8002", "0000010402010201029d3302a3b20218e60a0000290809e0"),
+    ("8012", "0002a3b2a30201"),
+    ("8401", "00010500a3b20100000000000000000000"),
+    ("804e", "b30002000200a3b2e0798dfffe04b20a00158d00045d3bf20100a4f1bc0000158d000102b2c3d40145ff"),
+    ("8002", "00010406010102a3b2020000184c0a050044000000000000000000e5a3b20100000000000000000000ab"),
+)
+CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", 64))  # Typical size returned by serial in_waiting during a report storm
+
+
+def load_capture(filename):
+    with open(filename, "rb") as capture:
+        data = capture.read()
+    try:
+        lines = data.decode("ascii").split()
+        return b"".join(bytes.fromhex(line) for line in lines if line)
+    except ValueError:
+        return data
+
+
+def synthetic_stream(nb_frames):
+    frames = [bytes.fromhex(encode_message(cmd, datas)) for cmd, datas in SAMPLE_FRAMES]
+    return b"".join(frames[x % len(frames)] for x in range(nb_frames))
+
+
+def chunks(stream):
+    return [stream[x : x + CHUNK_SIZE] for x in range(0, len(stream), CHUNK_SIZE)]
+
+
+def run_legacy(stream_chunks):
+    self = BenchTransport()
+    legacyDecoder.process_frame = lambda transport, frame: transport.frames.append(frame)
+    for chunk in stream_chunks:
+        legacyDecoder.legacy_decode_and_split_message(self, chunk)
+    return self.frames
+
+
+def run_new(stream_chunks):
+    self = BenchTransport()
+    self._frame_decoder = ZiGateFrameDecoder()
+    readDecoder.process_frame = lambda transport, frame: transport.frames.append(frame)
+    for chunk in stream_chunks:
+        readDecoder.decode_and_split_message(self, chunk)
+    return self.frames
+
+
+def main():
+    stream = load_capture(sys.argv[1]) if len(sys.argv) > 1 else synthetic_stream(20000)
+    stream_chunks = chunks(stream)
+    print("Stream: %s bytes in %s chunks" % (len(stream), len(stream_chunks)))
+
+    legacy_time, legacy_frames = timeit("legacy decoder", lambda: run_legacy(stream_chunks), loops=3)
+    new_time, new_frames = timeit("ZiGateFrameDecoder", lambda: run_new(stream_chunks), loops=3)
+
+    print("Frames decoded: legacy %s / new %s - identical: %s" % (len(legacy_frames), len(new_frames), legacy_frames == new_frames))
+    print("Throughput: legacy %d frames/s - new %d frames/s - speedup x%.1f" % (
+        len(legacy_frames) / legacy_time,
+        len(new_frames) / new_time,
+        legacy_time / new_time,
+    ))
+    if legacy_frames != new_frames:
+        for old, new in zip(legacy_frames, new_frames):
+            if old != new:
+                print("First difference: %s vs %s" % (old, new))
+                break
+
+
+if __name__ == "__main__":
+    main()
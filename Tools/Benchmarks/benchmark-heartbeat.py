@@ -0,0 +1,130 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    processListOfDevices: all devices visited at each heartbeat (historical) vs only the devices with some work
+    due, woken by the HeartbeatScheduler.
+
+    usage: python3 benchmark-heartbeat.py [--devicelist FILE] [--scale N] [--hours N]
+
+    The heartbeats are run on a virtual clock, and the commands sent to the devices are recorded. Half of the
+    devices have sent a message at the start, and a command is sent to one device every COMMAND_EVERY heartbeats.
+    - cost: time of a heartbeat, and devices visited per heartbeat
+    - check: commands sent per device and command, over the run. As the visits are planned on the heartbeat
+      count, the same requests are expected, sent at the same heartbeat.
+"""
+
+import argparse
+from collections import Counter
+import shutil
+import sys
+import time
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.HeartbeatScheduler import HeartbeatScheduler  # noqa: E402
+from Modules.heartbeat import processListOfDevices  # noqa: E402
+from Modules.tools import reset_heartbeat  # noqa: E402
+from Modules.zigateConsts import HEARTBEAT  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, load_population,  # noqa: E402
+                             write_population)
+
+HARDWARE_ID = 99
+COMMAND_EVERY = 60  # heartbeats, a command sent to one of the devices ( Heartbeat reset )
+REAL_TIME = time.time
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def time(self):
+        return self.now
+
+
+class BenchZigateComm:
+    # Records the commands sent by the heartbeat
+
+    def __init__(self, clock, HeartbeatCount):
+        self.clock = clock
+        self.HeartbeatCount = HeartbeatCount
+        self.sent = []
+
+    def loadTransmit(self):
+        return 0
+
+    def sendData(self, cmd, datas, ackIsDisabled=False, waitForResponseIn=False, highpriority=False, NwkId=None):
+        self.sent.append((self.HeartbeatCount(), cmd, datas))
+        return len(self.sent)
+
+
+class LegacyScheduler(HeartbeatScheduler):
+    # Historical loop: every device is visited at each heartbeat
+    def start_tick(self, now, alive_keys, sweep=False):
+        HeartbeatScheduler.start_tick(self, now, alive_keys, sweep)
+        self.tick_visits = len(alive_keys)
+        return list(alive_keys)
+
+
+def run(label, home, scheduler, heartbeats):
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID, {"pingDevices": 1, "enableReadAttributes": 1})
+    clock = VirtualClock()
+    time.time = clock.time
+    _plugin.ZigateComm = BenchZigateComm(clock, lambda: _plugin.HeartbeatCount)
+    _plugin.heartbeatScheduler = scheduler
+    _plugin.busy = _plugin.CommiSSionning = False
+    nwkids = sorted(x for x in _plugin.ListOfDevices if x not in ("0000", "ffff"))
+    for nwkid in nwkids[::2]:
+        # Half of the devices have sent a message recently
+        _plugin.ListOfDevices[nwkid]["Health"] = "Live"
+        _plugin.ListOfDevices[nwkid]["Stamp"].update({"LastSeen": int(clock.now), "time": clock.now})
+
+    elapse = visits = 0
+    try:
+        import plugin
+        for tick in range(heartbeats):
+            clock.now += HEARTBEAT
+            _plugin.HeartbeatCount += 1
+            if tick % COMMAND_EVERY == 0:
+                reset_heartbeat(_plugin, nwkids[(tick // COMMAND_EVERY) % len(nwkids)])
+            t_start = time.perf_counter()
+            processListOfDevices(_plugin, plugin.Devices)
+            elapse += time.perf_counter() - t_start
+            visits += scheduler.tick_visits
+    finally:
+        time.time = REAL_TIME
+        _plugin.log.closeLogFile()
+    print("%-36s %8.3f ms %10.1f %10s" % (label, 1000 * elapse / heartbeats, visits / heartbeats, len(_plugin.ZigateComm.sent)))
+    return _plugin.ZigateComm.sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Devices visited by the heartbeat")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--hours", type=float, default=2)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    heartbeats = int(args.hours * 3600 // HEARTBEAT)
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    try:
+        print("%s devices, %s heartbeats" % (len(population), heartbeats))
+        print("%-36s %11s %10s %10s" % ("", "heartbeat", "visited", "commands"))
+        legacy = run("all devices (historical)", home, LegacyScheduler(), heartbeats)
+        woken = run("devices woken by the scheduler", home, HeartbeatScheduler(), heartbeats)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    errors = sum(((Counter(legacy) - Counter(woken)) + (Counter(woken) - Counter(legacy))).values())
+    print("%-36s %11s commands not sent at the same heartbeat" % ("check", errors))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
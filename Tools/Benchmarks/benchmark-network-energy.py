@@ -0,0 +1,196 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Network Energy scan: one Mgmt_NWK_Update_req per heartbeat (historical) vs a window of routers in flight,
+    and the nwk-stat REST requests: report file parsed for each request (historical) vs EnergyReportStore.
+
+    usage: python3 benchmark-network-energy.py [--routers N] [--window N] [--loss P] [--requests N]
+
+    The simulated routers answer the 0x004A requests after the energy scan of the 16 channels (virtual clock), with
+    the source NwkId (firmware 3.1a and above). A fraction of the requests is lost and times out.
+    - scan: duration, and results already available from the store after PARTIAL_AFTER seconds
+    - check: the report served from memory is the one read back from the file, during and after the scan
+    - REST: time of the GET of a report, with numEnergyReports reports in the file
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+import Classes.NetworkEnergy  # noqa: E402
+from Classes.EnergyReportStore import EnergyReportStore  # noqa: E402
+from Classes.NetworkEnergy import NetworkEnergy  # noqa: E402
+
+HEARTBEAT = 5  # s
+SCAN_TIME = 16 * 0.138  # s, 16 channels scanned with a duration of 3
+ROUTING = (0.1, 0.8)  # s
+PARTIAL_AFTER = 30  # s
+NUM_REPORTS = 4
+HARDWARE_ID = 99
+
+
+class VirtualClock:
+    # Replaces time() of NetworkEnergy
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def time(self):
+        return self.now
+
+
+class BenchLog:
+    def logging(self, module, logType, message, NwkId=None, context=None):
+        pass
+
+
+class BenchConf:
+    def __init__(self, reports, window):
+        self.pluginConf = {
+            "pluginReports": reports,
+            "numEnergyReports": NUM_REPORTS,
+            "networkEnergyWindow": window,
+            "debugzigateCmd": 0,
+        }
+
+
+def build_routers(nb_routers):
+    ListOfDevices = {"0000": {}}
+    for x in range(nb_routers):
+        ListOfDevices["%04x" % (0x1000 + x)] = {"LogicalType": "Router", "ZDeviceName": "Router %s" % x, "Health": "Live"}
+    return ListOfDevices
+
+
+def build_804A(rnd, nwkid):
+    levels = "".join("%02X" % rnd.randint(0, 0xFF) for _ in range(16))
+    return "0100%04X%04X%08X%02X%s%s" % (rnd.randint(100, 5000), rnd.randint(0, 50), 0x07FFF800, 16, levels, nwkid)
+
+
+class EnergyScanResponder:
+    # What NetworkEnergy expects from the Transport, answering the 0x004A on the virtual clock
+
+    def __init__(self, clock, loss, seed=1):
+        self.clock = clock
+        self.loss = loss
+        self.rnd = random.Random(seed)
+        self.events = []  # ( time, order, MsgData )
+        self.sent = 0
+
+    def loadTransmit(self):
+        return 0
+
+    def sendData(self, cmd, datas, highpriority=False, ackIsDisabled=False, NwkId=None):
+        self.sent += 1
+        if self.rnd.random() < self.loss:
+            return self.sent
+        response_time = self.clock.now + SCAN_TIME + self.rnd.uniform(*ROUTING)
+        heapq.heappush(self.events, (response_time, self.sent, build_804A(self.rnd, datas[:4])))
+        return self.sent
+
+
+def scan(ListOfDevices, reports, window, loss, on_response):
+    clock = VirtualClock()
+    Classes.NetworkEnergy.time = clock.time
+    responder = EnergyScanResponder(clock, loss)
+    networkenergy = NetworkEnergy(BenchConf(reports, window), responder, ListOfDevices, {}, HARDWARE_ID, BenchLog())
+    # The window is used once a response with the source has been received, as with a 3.1a firmware
+    networkenergy.SourceInResponse = True
+    start = clock.now
+    networkenergy.start_scan()
+    next_heartbeat = start + HEARTBEAT
+    partial = streamed = None
+    while networkenergy.ScanInProgress:
+        if responder.events and responder.events[0][0] < next_heartbeat:
+            clock.now, _, MsgData = heapq.heappop(responder.events)
+            if on_response:
+                networkenergy.NwkScanResponse(MsgData)
+            else:
+                # Historical: the next request is only sent by the heartbeat
+                networkenergy._NwkScanResponse(MsgData)
+            continue
+        clock.now = next_heartbeat
+        next_heartbeat += HEARTBEAT
+        networkenergy.do_scan()
+        if partial is None and clock.now - start >= PARTIAL_AFTER:
+            partial = len(networkenergy.reports.mesh_routers(networkenergy.reports.latest()) or [])
+            # What would be found after a restart, from the results appended to the file
+            store = EnergyReportStore(networkenergy.reports.filename)
+            streamed = len(store.mesh_routers(store.latest()) or [])
+    return clock.now - start, networkenergy, partial, streamed
+
+
+def legacy_nwk_stat(filename, timestamp):
+    # Historical rest_nwk_stat: the report file is parsed for each request
+    _scan = {}
+    with open(filename, "rt") as handle:
+        for line in handle:
+            if line[0] != "{" and line[-1] != "}":
+                continue
+            entry = json.loads(line)
+            for _ts in entry:
+                _scan[_ts] = entry[_ts]
+    for r in _scan[timestamp]:
+        if r["_NwkId"] == "0000":
+            return json.dumps(r["MeshRouters"], sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Network Energy scan and reports")
+    parser.add_argument("--routers", type=int, default=40)
+    parser.add_argument("--window", type=int, default=3)
+    parser.add_argument("--loss", type=float, default=0.03)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    ListOfDevices = build_routers(args.routers)
+    reports = tempfile.mkdtemp(prefix="zigate-bench-") + "/"
+    errors = 0
+    try:
+        print("%s routers, %.0f %% requests lost" % (args.routers, 100 * args.loss))
+        print("%-40s %10s %9s %9s %14s" % ("", "duration s", "requests", "timedout", "after %s s" % PARTIAL_AFTER))
+        for label, window, on_response in (
+            ("1 request per heartbeat (historical)", 1, False),
+            ("response driven, 1 in flight", 1, True),
+            ("response driven, %s in flight" % args.window, args.window, True),
+        ):
+            duration, networkenergy, partial, streamed = scan(ListOfDevices, reports, window, args.loss, on_response)
+            errors += partial != streamed
+            print("%-40s %10.0f %9s %9s %14s" % (label, duration, networkenergy.requests, networkenergy.timeouts, partial))
+
+        # The last scans are in the file, as in memory
+        filename = networkenergy.reports.filename
+        store = EnergyReportStore(filename)
+        errors += networkenergy.reports.timestamps() != store.timestamps()
+        errors += sum(1 for x in store.timestamps() if networkenergy.reports.report(x) != store.report(x))
+
+        # REST, on a history of NUM_REPORTS reports
+        while len(store.timestamps()) < NUM_REPORTS:
+            timestamp = str(int(store.latest()) + 1)
+            store.begin(timestamp)
+            store.end(networkenergy.reports.report(networkenergy.reports.latest()), NUM_REPORTS)
+        timestamp = store.latest()
+        store = EnergyReportStore(filename)
+        errors += legacy_nwk_stat(filename, timestamp) != json.dumps(store.mesh_routers(timestamp), sort_keys=True)
+        print("%s reports in %s, %s bytes" % (len(store.timestamps()), os.path.basename(filename), os.path.getsize(filename)))
+        timeit("GET nwk-stat - file parsed (historical)", lambda: legacy_nwk_stat(filename, timestamp), args.requests)
+        timeit("GET nwk-stat - EnergyReportStore", lambda: json.dumps(store.mesh_routers(timestamp), sort_keys=True), args.requests)
+        print("EnergyReportStore: %s" % store.statistics())
+    finally:
+        shutil.rmtree(reports, ignore_errors=True)
+    print("%-40s %10s mismatch between memory and file" % ("check", errors))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Network Topology scan: one Mgmt_Lqi_req per heartbeat (historical) vs a window of routers in flight,
+    advancing on the responses, on a simulated mesh.
+
+    usage: python3 benchmark-network-map.py [--routers N] [--enddevices N] [--window N] [--loss P]
+
+    The simulated neighbour-table responder answers the 0x004E requests after a random delay (virtual clock),
+    3 entries per page from the requested start index, with the source NwkId (firmware 3.1a and above) or not.
+    A fraction of the requests is lost, and must be retried after the time out.
+    The relations found by each scan are checked against the simulated mesh, and the relations already available
+    from snapshot() after PARTIAL_AFTER seconds are given.
+"""
+
+import argparse
+import heapq
+import random
+import shutil
+import sys
+import tempfile
+
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+import Classes.NetworkMap  # noqa: E402
+from Classes.NetworkMap import LQIresp_decoding, NetworkMap  # noqa: E402
+
+HEARTBEAT = 5  # s
+PAGE_SIZE = 3  # Neighbour table entries per 0x804E
+LATENCY = (0.2, 2.5)  # s, response time of a router
+EXT_PANID = "00158d0000000001"
+PARTIAL_AFTER = 60  # s, relations available from snapshot() after that time
+
+
+class VirtualClock:
+    # Replaces the time module of NetworkMap
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def time(self):
+        return self.now
+
+
+class BenchLog:
+    def logging(self, module, logType, message, NwkId=None, context=None):
+        pass
+
+
+class BenchConf:
+    def __init__(self, reports, window):
+        self.pluginConf = {"pluginReports": reports, "numTopologyReports": 4, "networkMapWindow": window, "Sibling": 1}
+
+
+def build_mesh(nb_routers, nb_enddevices, seed=0):
+    """ ListOfDevices, and the Neighbour table of each router: list of ( nwkid, devicetype, relationship ) """
+    rnd = random.Random(seed)
+    routers = ["%04x" % (0x1000 + x) for x in range(nb_routers)]
+    enddevices = ["%04x" % (0x8000 + x) for x in range(nb_enddevices)]
+    ListOfDevices = {"0000": {"IEEE": EXT_PANID}}
+    tables = {"0000": []}
+    for x, nwkid in enumerate(routers):
+        ListOfDevices[nwkid] = {"LogicalType": "Router", "IEEE": "00158d%010x" % x, "Health": "Live"}
+        tables[nwkid] = []
+        parent = rnd.choice(["0000"] + routers[:x])
+        tables[nwkid].append((parent, 0 if parent == "0000" else 1, 0))
+        tables[parent].append((nwkid, 1, 1))
+    for x, nwkid in enumerate(enddevices):
+        ListOfDevices[nwkid] = {"LogicalType": "End Device", "IEEE": "00158d01%08x" % x}
+        tables[rnd.choice(["0000"] + routers)].append((nwkid, 2, 1))
+    for nwkid in routers:
+        for sibling in rnd.sample(routers, min(3, len(routers))):
+            if sibling != nwkid and sibling not in [x[0] for x in tables[nwkid]]:
+                tables[nwkid].append((sibling, 1, 2))
+    return ListOfDevices, tables
+
+
+def build_804E(tables, nwkid, start, with_source):
+    table = tables[nwkid]
+    page = table[start : start + PAGE_SIZE]
+    entries = ""
+    for x, (neighbour, devicetype, relationship) in enumerate(page):
+        bitmap = devicetype | (relationship << 4) | ((0 if devicetype == 2 else 1) << 6)
+        entries += "%s%s%016x%02X%02X%02X" % (neighbour, EXT_PANID, start + x, 1, 0x80 + x, bitmap)
+    MsgData = "0100%02X%02X%02X%s" % (len(table), len(page), start, entries)
+    return MsgData + nwkid if with_source else MsgData
+
+
+class NeighbourTableResponder:
+    # What NetworkMap expects from the Transport, answering the 0x004E on the virtual clock
+
+    def __init__(self, clock, tables, loss, with_source, seed=1):
+        self.clock = clock
+        self.tables = tables
+        self.loss = loss
+        self.with_source = with_source
+        self.rnd = random.Random(seed)
+        self.events = []  # ( time, order, MsgData )
+        self.sent = 0
+
+    def loadTransmit(self):
+        return 0
+
+    def sendData(self, cmd, datas, ackIsDisabled=False):
+        self.sent += 1
+        nwkid, start = datas[:4], int(datas[4:6], 16)
+        if self.rnd.random() < self.loss:
+            return
+        response_time = self.clock.now + self.rnd.uniform(*LATENCY)
+        heapq.heappush(self.events, (response_time, self.sent, build_804E(self.tables, nwkid, start, self.with_source)))
+
+
+def relations(Neighbours):
+    return {(router, x) for router in Neighbours for x in Neighbours[router]["Neighbours"]}
+
+
+def scan(tables, ListOfDevices, reports, window, loss, with_source, on_response):
+    clock = VirtualClock()
+    Classes.NetworkMap.time = clock
+    responder = NeighbourTableResponder(clock, tables, loss, with_source)
+    networkmap = NetworkMap(BenchConf(reports, window), responder, ListOfDevices, {}, 99, BenchLog())
+    start = clock.now
+    networkmap.start_scan()
+    next_heartbeat = start + HEARTBEAT
+    partial_relations = None
+    while networkmap.NetworkMapPhase():
+        if responder.events and responder.events[0][0] < next_heartbeat:
+            clock.now, _, MsgData = heapq.heappop(responder.events)
+            if on_response:
+                networkmap.LQIresp(MsgData)
+            else:
+                # Historical: the next request is only sent by the heartbeat
+                LQIresp_decoding(networkmap, MsgData)
+            continue
+        clock.now = next_heartbeat
+        next_heartbeat += HEARTBEAT
+        networkmap.continue_scan()
+        if partial_relations is None and clock.now - start >= PARTIAL_AFTER:
+            # Partial results, while the scan is running
+            partial_relations = len(relations(networkmap.snapshot()))
+    return clock.now - start, networkmap, partial_relations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Network Topology scan on a simulated mesh")
+    parser.add_argument("--routers", type=int, default=40)
+    parser.add_argument("--enddevices", type=int, default=120)
+    parser.add_argument("--window", type=int, default=4)
+    parser.add_argument("--loss", type=float, default=0.05)
+    args = parser.parse_args()
+
+    ListOfDevices, tables = build_mesh(args.routers, args.enddevices)
+    expected = {(router, x[0]) for router in tables for x in tables[router]}
+    reports = tempfile.mkdtemp(prefix="zigate-bench-") + "/"
+    errors = 0
+    try:
+        print("%s routers, %s end devices, %s relations, %.0f %% requests lost" % (args.routers, args.enddevices, len(expected), 100 * args.loss))
+        print("%-42s %10s %9s %9s %9s %14s" % ("", "duration s", "requests", "timedout", "missing", "after %s s" % PARTIAL_AFTER))
+        for label, window, with_source, on_response in (
+            ("1 request per heartbeat (historical)", 1, True, False),
+            ("response driven, firmware without source", args.window, False, True),
+            ("response driven, 1 in flight", 1, True, True),
+            ("response driven, %s in flight" % args.window, args.window, True, True),
+        ):
+            duration, networkmap, partial = scan(tables, ListOfDevices, reports, window, args.loss, with_source, on_response)
+            found = relations(networkmap.Neighbours)
+            missing = len(expected - found)
+            timedout = [x for x in networkmap.Neighbours if networkmap.Neighbours[x]["Status"] == "TimedOut"]
+            # Relations of timed out routers can't be found
+            errors += len({x for x in expected - found if x[0] not in timedout})
+            print("%-42s %10.0f %9s %9s %9s %14s" % (label, duration, networkmap.requests, len(timedout), missing, partial))
+    finally:
+        shutil.rmtree(reports, ignore_errors=True)
+    print("%-42s %10s relations missing from routers not timed out" % ("check", errors))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
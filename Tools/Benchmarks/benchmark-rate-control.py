@@ -0,0 +1,91 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Pace of the writer: fixed delay (historical limit_throuput) vs AIMD RateController, on a simulated ZiGate.
+
+    usage: python3 benchmark-rate-control.py [nb_commands]
+
+    The simulated ZiGate (virtual clock) processes one command at a time, with a buffer of ZIGATE_BUFFER commands.
+    A command arriving on a full buffer is answered with a 0x8000 Busy (status 04) and must be sent again, and each
+    command waiting in the buffer reports an nPDU above the threshold, as the 0x8011 / 0x8012 of a loaded ZiGate.
+    The processing time changes over time: idle coordinator, then a loaded period (routing, retries), then idle again.
+    - AIMD per signal: one decrease per congestion signal, as before
+    - AIMD: at most one decrease per round trip
+"""
+
+import random
+import sys
+
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.Transport.rateControl import (CONGESTION_FACTOR,  # noqa: E402
+                                           RATE_PROFILES, RateController)
+
+ZIGATE_BUFFER = 3
+# ( up to command #, average processing time in s )
+LOAD_PHASES = ((0.4, 0.030), (0.7, 0.180), (1.0, 0.030))
+
+
+class PerSignalRateController(RateController):
+    # Historical congestion(): every signal divides the rate
+    def congestion(self, reason, now=None):
+        with self._lock:
+            self._congestions[reason] = self._congestions.get(reason, 0) + 1
+            if self.adaptive:
+                self._delay = min(self._max, self._delay / CONGESTION_FACTOR)
+                self._decreases += 1
+
+
+def processing_time(x, nb_commands):
+    for limit, average in LOAD_PHASES:
+        if x < limit * nb_commands:
+            return random.expovariate(1 / average)
+    return LOAD_PHASES[-1][1]
+
+
+def simulate(rate_control, nb_commands):
+    random.seed(0)
+    now = 0.0
+    busy = 0
+    completions = []  # completion time of the commands in the ZiGate buffer
+    zigate_free_at = 0.0
+    sent = 0
+    while sent < nb_commands:
+        now += rate_control.delay
+        completions = [t for t in completions if t > now]
+        rate_control.command_sent(now)
+        if len(completions) >= ZIGATE_BUFFER:
+            busy += 1
+            for _ in completions:
+                rate_control.congestion("PDU", now)
+            rate_control.congestion("Status04", now)
+            continue
+        zigate_free_at = max(zigate_free_at, now) + processing_time(sent, nb_commands)
+        completions.append(zigate_free_at)
+        rate_control.ack_status("00")
+        sent += 1
+    return max(now, zigate_free_at), busy
+
+
+def main():
+    nb_commands = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print("%-30s %10s %10s %10s %10s" % ("", "duration s", "cmd/s", "busy", "decreases"))
+    for label, controller, adaptive in (
+        ("fixed delay", RateController, False),
+        ("AIMD per signal", PerSignalRateController, True),
+        ("AIMD", RateController, True),
+    ):
+        rate_control = controller(adaptive=adaptive, profile="31e")
+        duration, busy = simulate(rate_control, nb_commands)
+        print("%-30s %10.1f %10.1f %10s %10s" % (label, duration, nb_commands / duration, busy, rate_control.statistics()["Decreases"]))
+    print("31e profile (min, initial, max, step): %s" % (RATE_PROFILES["31e"],))
+
+
+if __name__ == "__main__":
+    main()
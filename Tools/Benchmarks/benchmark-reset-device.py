@@ -0,0 +1,150 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    ResetDevice: sweep of all units at each heartbeat (historical) vs the ResetScheduler deadlines.
+
+    usage: python3 benchmark-reset-device.py [--devicelist FILE] [--scale N] [--heartbeats N]
+
+    - check: with half of the Motion / Vibration / push button widgets On for a long time and the other half
+      just triggered, both implementations reset the same units.
+    - check: a Motion widget triggered, then temperature and illuminance reports on the same endpoint before its
+      deadline, is still reset at its deadline.
+    - benchmark: cost of one heartbeat when nothing is to be reset (the usual case).
+"""
+
+import argparse
+import shutil
+import sys
+import time
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Modules.domoMaj import MajDomoDevice  # noqa: E402
+from Modules.domoTools import (ResetDevice, RetreiveSignalLvlBattery,  # noqa: E402
+                               WidgetForDeviceId, reset_timeout,
+                               resetMotion, resetSwitchSelectorPushButton)
+from Modules.widgets import SWITCH_LVL_MATRIX  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, load_population,  # noqa: E402
+                             write_population)
+
+HARDWARE_ID = 99
+MOTION_TIMEOUT = 2
+
+
+def legacy_reset_device(self, Devices):
+    # Historical ResetDevice, with the per device Param override
+    now = time.time()
+    for unit in list(Devices):
+        if unit not in Devices:
+            continue
+        Ieee = Devices[unit].DeviceID
+        if Ieee not in self.IEEE2NWK:
+            continue
+        LUpdate = time.mktime(time.strptime(Devices[unit].LastUpdate, "%Y-%m-%d %H:%M:%S"))
+        NWKID = self.IEEE2NWK[Ieee]
+        if NWKID not in self.ListOfDevices:
+            continue
+        TimedOutMotion = self.ListOfDevices[NWKID].get("Param", {}).get("resetMotiondelay", self.pluginconf.pluginConf["resetMotiondelay"])
+        TimedOutSwitchButton = self.ListOfDevices[NWKID].get("Param", {}).get("resetSwitchSelectorPushButton", self.pluginconf.pluginConf["resetSwitchSelectorPushButton"])
+        WidgetType = WidgetForDeviceId(self, NWKID, Devices[unit].ID)
+        if WidgetType == "":
+            continue
+        SignalLevel, BatteryLvl = RetreiveSignalLvlBattery(self, NWKID)
+        if TimedOutMotion and WidgetType in ("Motion", "Vibration"):
+            resetMotion(self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate, TimedOutMotion)
+        elif TimedOutSwitchButton and WidgetType in SWITCH_LVL_MATRIX and SWITCH_LVL_MATRIX[WidgetType].get("ForceUpdate"):
+            resetSwitchSelectorPushButton(self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate, TimedOutSwitchButton)
+
+
+def trigger(_plugin, Devices, candidates):
+    # Half of the widgets On for one hour, the other half just triggered
+    for x, unit in enumerate(candidates):
+        Devices[unit].nValue, Devices[unit].sValue = 1, "On"
+        Devices[unit].Options = {"LevelOffHidden": "true"}
+        Devices[unit].LastUpdate = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() - (3600 if x % 2 else 0)))
+
+
+def reset_units(Devices, candidates):
+    return {unit for unit in candidates if Devices[unit].nValue == 0}
+
+
+def motion_widgets(_plugin, Devices, candidates):
+    # (unit, NwkId, Ep) of the Motion widgets
+    widgets = []
+    for unit in candidates:
+        NwkId = _plugin.IEEE2NWK[Devices[unit].DeviceID]
+        for Ep, ep in _plugin.ListOfDevices[NwkId]["Ep"].items():
+            if ep.get("ClusterType", {}).get(str(Devices[unit].ID)) == "Motion":
+                widgets.append((unit, NwkId, Ep))
+    return widgets
+
+
+def interleaved_reports(_plugin, Devices, widgets, reset_device):
+    # Motion triggered, temperature and illuminance reported on the same endpoint one second later
+    for unit, NwkId, Ep in widgets:
+        _plugin.ListOfDevices[NwkId].setdefault("Param", {})["resetMotiondelay"] = MOTION_TIMEOUT
+        Devices[unit].nValue, Devices[unit].sValue = 0, "Off"
+        MajDomoDevice(_plugin, Devices, NwkId, Ep, "0406", "01")
+    time.sleep(1)
+    for unit, NwkId, Ep in widgets:
+        MajDomoDevice(_plugin, Devices, NwkId, Ep, "0402", 21.5)
+        MajDomoDevice(_plugin, Devices, NwkId, Ep, "0400", 120)
+    time.sleep(MOTION_TIMEOUT - 0.5)
+    reset_device(_plugin, Devices)
+    return reset_units(Devices, [x[0] for x in widgets])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Motion and push button reset")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--heartbeats", type=int, default=100)
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    home = benchmarkTools.setup_home()
+    write_population(population, "%s/Data/DeviceList-%s.txt" % (home, HARDWARE_ID))
+    _plugin = benchmarkTools.build_plugin(home, HARDWARE_ID)
+    try:
+        import plugin
+        Devices = plugin.Devices
+        candidates = []
+        for unit in Devices:
+            NwkId = _plugin.IEEE2NWK.get(Devices[unit].DeviceID)
+            if NwkId and reset_timeout(_plugin, NwkId, WidgetForDeviceId(_plugin, NwkId, Devices[unit].ID)):
+                candidates.append(unit)
+        print("%s devices, %s units, %s Motion / Vibration / push button widgets" % (len(_plugin.ListOfDevices), len(Devices), len(candidates)))
+
+        trigger(_plugin, Devices, candidates)
+        legacy_reset_device(_plugin, Devices)
+        legacy = reset_units(Devices, candidates)
+        trigger(_plugin, Devices, candidates)
+        ResetDevice(_plugin, Devices, "Motion", 5)
+        scheduled = reset_units(Devices, candidates)
+        errors = len(legacy ^ scheduled)
+        print("%-40s %10s reset %5s errors" % ("check", len(scheduled), errors))
+
+        widgets = motion_widgets(_plugin, Devices, candidates)
+        legacy = interleaved_reports(_plugin, Devices, widgets, legacy_reset_device)
+        scheduled = interleaved_reports(_plugin, Devices, widgets, lambda self, Devices: ResetDevice(self, Devices, "Motion", 5))
+        interleaved_errors = len(legacy ^ scheduled) + len(widgets) - len(scheduled)
+        print("%-40s %10s reset %5s errors" % ("check, interleaved reports", len(scheduled), interleaved_errors))
+        errors += interleaved_errors
+
+        timeit("heartbeat, sweep of all units", lambda: legacy_reset_device(_plugin, Devices), args.heartbeats)
+        timeit("heartbeat, ResetScheduler", lambda: ResetDevice(_plugin, Devices, "Motion", 5), args.heartbeats)
+        print("%-40s %s" % ("ResetScheduler", _plugin.resetScheduler.statistics()))
+    finally:
+        _plugin.log.closeLogFile()
+        shutil.rmtree(home, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
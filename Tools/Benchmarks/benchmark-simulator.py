@@ -0,0 +1,184 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    End to end benchmark: a simulated ZiGate replays attribute reports to a ZigateTransport,
+    and we measure the frames/second and the latency (write on the simulator side -> end of F_out).
+
+    usage: python3 benchmark-simulator.py [--plugin] [--pty] [--event-driven] [--devicelist FILE]
+                                          [--scale N] [--count N] [--rate FRAMES/S] [--chunk N] [--capture FILE]
+
+    - by default F_out only records the reception time (Transport cost only)
+    - with --plugin, F_out is BasePlugin.processFrame, with a ListOfDevices loaded from the generated
+      population and Domoticz widgets stubbed (full decoding path)
+
+    Each run is done with the legacy byte per byte decoder and with the ZiGateFrameDecoder.
+    The forwarded 0x8102 are matched with the replayed frames on their content (SQN, source, attribute value),
+    and the forwarder coalescing is disabled, so each replayed report is expected.
+    The simulator runs in the same process: the polling reader (no --event-driven) keeps the GIL busy and
+    slows down the replay as well, as it does with the other plugin threads.
+"""
+
+import argparse
+import os
+import shutil
+import time
+from collections import deque
+
+import benchmarkTools
+from benchmarkTools import setup_plugin_environment
+
+Domoticz = setup_plugin_environment()
+
+import Classes.Transport.readDecoder as readDecoder  # noqa: E402
+import Classes.Transport.readSerial as readSerial  # noqa: E402
+import Classes.Transport.readwriteTcp as readwriteTcp  # noqa: E402
+import Classes.Transport.selectorIO as selectorIO  # noqa: E402
+from Classes.Transport.frameDecoder import unescape_frame  # noqa: E402
+from legacyDecoder import legacy_decode_and_split_message  # noqa: E402
+from zigateSimulator import (DEFAULT_DEVICELIST, ZiGateSimulator, build_frame,  # noqa: E402
+                             generate_traffic, load_capture, load_population,
+                             write_population)
+
+DECODERS = {
+    "legacy": legacy_decode_and_split_message,
+    "buffer": readDecoder.decode_and_split_message,
+}
+HARDWARE_ID = 99
+DRAIN_TIMEOUT = 30
+
+
+def select_decoder(name):
+    for module in (readwriteTcp, selectorIO, readSerial):
+        module.decode_and_split_message = DECODERS[name]
+
+
+def setup_home(population):
+    home = benchmarkTools.setup_home()
+    write_population(population, os.path.join(home, "Data", "DeviceList-%s.txt" % HARDWARE_ID))
+    return home
+
+
+def build_plugin(home, args):
+    return benchmarkTools.build_plugin(home, HARDWARE_ID, transport_options(args))
+
+
+def transport_options(args):
+    return {"byPassDzConnection": 1, "eventDrivenIO": 1 if args.event_driven else 0, "forwarderCoalescing": 0}
+
+
+def run(decoder, frames, args, home):
+    from Classes.LoggingManagement import LoggingManagement
+    from Classes.PluginConf import PluginConf
+    from Classes.Transport.Transport import ZigateTransport
+    from Classes.TransportStats import TransportStatistics
+
+    select_decoder(decoder)
+    received = []  # ( Data, time )
+    replayed = [unescape_frame(frame).hex() for frame in frames]
+    expected = sum(1 for Data in replayed if Data[2:6] == "8102")
+
+    def record(Data):
+        if isinstance(Data, str) and Data[2:6] == "8102":
+            received.append((Data, time.perf_counter()))
+
+    if args.plugin:
+        _plugin = build_plugin(home, args)
+        pluginconf, log, statistics = _plugin.pluginconf, _plugin.log, _plugin.statistics
+
+        def F_out(Data):
+            _plugin.processFrame(Data)
+            record(Data)
+
+    else:
+        pluginconf = PluginConf(True, 2022, 1, home + os.sep, HARDWARE_ID)
+        pluginconf.pluginConf.update(transport_options(args))
+        log = LoggingManagement(pluginconf, {}, HARDWARE_ID, {}, {})
+        statistics = TransportStatistics(pluginconf)
+        F_out = record
+
+    simulator = ZiGateSimulator("pty" if args.pty else "tcp")
+    endpoint = simulator.start()
+    if args.pty:
+        transport = ZigateTransport(HARDWARE_ID, 0, 2022, 1, "USB", statistics, pluginconf, F_out, log, serialPort=endpoint)
+    else:
+        transport = ZigateTransport(HARDWARE_ID, 0, 2022, 1, "Wifi", statistics, pluginconf, F_out, log, wifiAddress=endpoint[0], wifiPort=endpoint[1])
+    transport._ReqRcv = bytearray()  # Receive buffer of the legacy decoder
+    if args.plugin:
+        _plugin.ZigateComm = transport
+
+    transport.open_zigate_connection()
+    simulator.wait_for_connection()
+    time.sleep(0.5)
+
+    t_start = time.perf_counter()
+    simulator.replay(frames, rate=args.rate or None, chunk=args.chunk)
+    deadline = time.time() + DRAIN_TIMEOUT
+    while len(received) < expected and time.time() < deadline:
+        time.sleep(0.01)
+    t_elapse = (received[-1][1] if received else time.perf_counter()) - t_start
+
+    transport.close_zigate_connection()
+    simulator.stop()
+    log.closeLogFile()
+
+    # Same frame replayed more than once: first sent, first received
+    sent = {}
+    for Data, timestamp in zip(replayed, simulator.send_timestamps):
+        sent.setdefault(Data, deque()).append(timestamp)
+    latencies = sorted(r - sent[Data].popleft() for Data, r in received if sent.get(Data))
+    return len(received), t_elapse, latencies
+
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(ratio * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End to end benchmark with a simulated ZiGate")
+    parser.add_argument("--plugin", action="store_true", help="forward to BasePlugin.processFrame")
+    parser.add_argument("--pty", action="store_true", help="USB transport on a pseudo-terminal instead of TCP")
+    parser.add_argument("--event-driven", action="store_true", help="enable eventDrivenIO")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=0, help="frames per second (0 for no limit)")
+    parser.add_argument("--chunk", type=int, default=4, help="frames written at once")
+    parser.add_argument("--capture", help="capture file to replay instead of generated reports")
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    if args.capture:
+        frames = load_capture(args.capture)
+    else:
+        frames = [build_frame(msg_type, payload) for msg_type, payload in generate_traffic(population, args.count)]
+
+    print("%s devices, %s frames, %s transport, %s" % (
+        len(population),
+        len(frames),
+        "pty/USB" if args.pty else "TCP/Wifi",
+        "plugin processFrame" if args.plugin else "transport only",
+    ))
+    print("%-10s %10s %12s %10s %10s %10s" % ("decoder", "frames", "frames/s", "p50 ms", "p95 ms", "p99 ms"))
+    for decoder in DECODERS:
+        home = setup_home(population)
+        try:
+            nb_received, t_elapse, latencies = run(decoder, frames, args, home)
+        finally:
+            shutil.rmtree(home, ignore_errors=True)
+        print("%-10s %10s %12.0f %10.2f %10.2f %10.2f" % (
+            decoder,
+            nb_received,
+            nb_received / t_elapse if t_elapse else 0,
+            1000 * percentile(latencies, 0.50),
+            1000 * percentile(latencies, 0.95),
+            1000 * percentile(latencies, 0.99),
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    SQN correlation: plain dicts and linear scans vs the SqnCorrelation stores and the awaiting_8000 index.
+
+    usage: python3 benchmark-sqn-store.py [nb_commands] [window]
+
+    nb_commands are sent with window commands in flight (writerWindowSize), each one gets its 0x8000 (correlated
+    on the command type), then its 0x8011 (correlated on the APS SQN), as the Transport does.
+"""
+
+import random
+import sys
+import time
+from collections import deque
+
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.Transport.sqnMgmt import (TYPE_APP_ZCL, TYPE_APP_ZDP,  # noqa: E402
+                                       TYPE_APP_ZIGATE,
+                                       sqn_add_external_sqn,
+                                       sqn_get_internal_sqn_from_aps_sqn,
+                                       sqn_init_stack, sqn_statistics)
+from Classes.Transport.tools import (add_awaiting_8000,  # noqa: E402
+                                     get_command_from_msgtype,
+                                     get_isqn_from_ListOfCommands,
+                                     initialize_command_protocol_parameters)
+
+COMMANDS = ("0100", "0110", "0120", "0092", "0093", "0094", "00e1", "0530")
+
+
+class BenchSqn:
+    def __init__(self, window):
+        sqn_init_stack(self)
+        self.max_in_flight = window
+        self.ListOfCommands = {}
+        self.awaiting_8000 = {}
+
+    def logging_proto(self, logType, message, NwkId=None, _context=None):
+        pass
+
+
+def legacy_get_isqn(self, PacketType):
+    first_sent = None
+    for x in list(self.ListOfCommands):
+        if self.ListOfCommands[x]["Status"] != "SENT":
+            continue
+        if first_sent is None:
+            first_sent = x
+        if self.max_in_flight == 1 or int(self.ListOfCommands[x]["cmd"], 16) == int(PacketType, 16):
+            self.logging_proto(
+                "Debug",
+                "get_isqn_from_ListOfCommands - Found isqn: %s with Sem: %s" % (x, self.ListOfCommands[x]["Semaphore"]),
+            )
+            self.ListOfCommands[x]["Status"] = "8000"
+            return x
+    return first_sent
+
+
+def legacy_sqn_add_external_sqn(self, i_sqn, e_sqnAPP, sqnAPP_type, e_sqnAPS):
+    # Historical sqnMgmt: plain dicts, never purged
+    if sqnAPP_type == TYPE_APP_ZIGATE:
+        return
+    self.legacy_sqn_aps[e_sqnAPS] = i_sqn
+    if sqnAPP_type == TYPE_APP_ZCL:
+        self.legacy_sqn_zcl[e_sqnAPP] = i_sqn
+    elif sqnAPP_type == TYPE_APP_ZDP:
+        self.legacy_sqn_zdp[e_sqnAPP] = i_sqn
+
+
+def legacy_sqn_get_internal_sqn_from_aps_sqn(self, e_sqn):
+    if e_sqn in self.legacy_sqn_aps:
+        return self.legacy_sqn_aps[e_sqn]
+    return None
+
+
+def run(nb_commands, window, indexed):
+    random.seed(0)
+    self = BenchSqn(window)
+    self.legacy_sqn_zcl, self.legacy_sqn_zdp, self.legacy_sqn_aps = {}, {}, {}
+    in_flight = deque()
+    errors = 0
+    for isqn in range(nb_commands):
+        cmd = random.choice(COMMANDS)
+        self.ListOfCommands[isqn] = {"cmd": cmd, "Status": "SENT", "TimeStamp": time.time(), "Semaphore": 0}
+        if indexed:
+            add_awaiting_8000(self, isqn, cmd)
+        in_flight.append(isqn)
+        if len(in_flight) < window:
+            continue
+
+        # 0x8000 of the oldest command, then its 0x8011
+        oldest = in_flight.popleft()
+        PacketType = self.ListOfCommands[oldest]["cmd"]
+        found = get_isqn_from_ListOfCommands(self, PacketType) if indexed else legacy_get_isqn(self, PacketType)
+        sqn_aps = "%02x" % (found & 0xFF)
+        if indexed:
+            sqn_add_external_sqn(self, found, sqn_aps, TYPE_APP_ZCL, sqn_aps)
+            isqn_8011 = sqn_get_internal_sqn_from_aps_sqn(self, sqn_aps)
+        else:
+            legacy_sqn_add_external_sqn(self, found, sqn_aps, TYPE_APP_ZCL, sqn_aps)
+            isqn_8011 = legacy_sqn_get_internal_sqn_from_aps_sqn(self, sqn_aps)
+        if isqn_8011 != found:
+            errors += 1
+        del self.ListOfCommands[isqn_8011]
+        if isqn_8011 != oldest:
+            in_flight.remove(isqn_8011)
+            in_flight.appendleft(oldest)
+    return errors, self
+
+
+def main():
+    nb_commands = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    windows = [int(sys.argv[2])] if len(sys.argv) > 2 else [1, 8]
+    initialize_command_protocol_parameters()
+
+    errors = 0
+    for window in windows:
+        print("window of %s command(s) in flight" % window)
+        t_legacy, (errors_legacy, _) = timeit("linear scan + plain dicts", lambda: run(nb_commands, window, False))
+        t_index, (errors_index, indexed) = timeit("awaiting_8000 + SqnCorrelation", lambda: run(nb_commands, window, True))
+        print("%-40s %10.2f us/command" % ("extra cost", 1e6 * (t_index - t_legacy) / nb_commands))
+        print("%-40s %s / %s" % ("correlation errors", errors_legacy, errors_index))
+        print("%-40s %s" % ("SQN stores", sqn_statistics(indexed)))
+        errors += errors_legacy + errors_index
+
+    responses = [int(x, 16) for x in ("8009", "8010", "8024", "8043", "8045")] * 20000
+    timeit("get_command_from_msgtype", lambda: [get_command_from_msgtype("%04x" % x) for x in responses])
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Writer queue: JSON encoded commands with a list based dedup vs OutboundCommand records with a dict based dedup.
+
+    usage: python3 benchmark-writer-queue.py [nb_commands] [nb_devices]
+
+    A burst of nb_commands (as a group off or a configure reporting sweep) is queued by sendData() then consumed by
+    the writer thread, 1 out of 10 is a duplicate of a command already waiting in the queue.
+"""
+
+import itertools
+import json
+import random
+import sys
+import time
+from queue import PriorityQueue
+
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.Transport.outboundCommand import (PRIORITY_NORMAL,  # noqa: E402
+                                               OutboundCommand)
+
+
+def burst(nb_commands, nb_devices):
+    commands = []
+    for x in range(nb_commands):
+        if commands and x % 10 == 0:
+            commands.append(random.choice(commands))
+            continue
+        nwkid = "%04x" % random.randrange(nb_devices)
+        commands.append(("0120", "02" + nwkid + "0101" + "0006" + "%04x" % x, nwkid))
+    return commands
+
+
+def legacy_queue(commands):
+    # sendData / writer_thread before the OutboundCommand records
+    writer_queue = PriorityQueue()
+    writer_list_in_queue = []
+    isqn = 0
+    for cmd, datas, nwkid in commands:
+        if (cmd, datas) in writer_list_in_queue:
+            continue
+        writer_list_in_queue.append((cmd, datas))
+        isqn += 1
+        message = {"cmd": cmd, "datas": datas, "ackIsDisabled": False, "waitForResponseIn": False, "InternalSqn": isqn, "NwkId": nwkid, "TimeStamp": time.time()}
+        writer_queue.put((isqn, str(json.dumps(message))))
+
+    sent = 0
+    while writer_queue.qsize():
+        _, command_str = writer_queue.get()
+        command = json.loads(command_str)
+        if (command["cmd"], command["datas"]) in writer_list_in_queue:
+            writer_list_in_queue.remove((command["cmd"], command["datas"]))
+        sent += 1
+    return sent
+
+
+def record_queue(commands):
+    writer_queue = PriorityQueue()
+    writer_list_in_queue = {}
+    order = itertools.count(1)
+    isqn = 0
+    for cmd, datas, nwkid in commands:
+        if (cmd, datas) in writer_list_in_queue:
+            continue
+        isqn += 1
+        command = OutboundCommand(cmd, datas, False, False, isqn, nwkid, time.time(), PRIORITY_NORMAL)
+        writer_list_in_queue[command.key] = command
+        writer_queue.put((isqn, next(order), command))
+
+    sent = 0
+    while writer_queue.qsize():
+        _, _, command = writer_queue.get()
+        pending = writer_list_in_queue.pop(command.key, None)
+        if pending is not None and pending is not command:
+            writer_list_in_queue[command.key] = pending
+        if not command.cancelled:
+            sent += 1
+    return sent
+
+
+def main():
+    nb_commands = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    nb_devices = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    random.seed(0)
+
+    commands = burst(nb_commands, nb_devices)
+    t_legacy, legacy = timeit("json + list dedup", lambda: legacy_queue(commands), 3)
+    t_record, record = timeit("OutboundCommand + dict dedup", lambda: record_queue(commands), 3)
+    assert legacy == record, "%s vs %s commands sent" % (legacy, record)
+    print("%-40s %10s commands sent" % ("", record))
+    print("%-40s %10.1f x" % ("speed-up", t_legacy / t_record))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Writer window: busy-poll of the semaphore (historical) vs wait on the window condition signalled by release_command.
+
+    usage: python3 benchmark-writer-window.py [nb_commands] [turnaround_ms]
+
+    The firmware handles 1 command at a time (no SQN), and acknowledges each command after turnaround_ms.
+    The writer sends nb_commands in a row; we report the mean time from one send to the next.
+"""
+
+import sys
+import threading
+import time
+from queue import Queue
+
+from benchmarkTools import setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.Transport.tools import release_command  # noqa: E402
+from Classes.Transport.writerThread import (WINDOW_CHECK_PERIOD,  # noqa: E402
+                                            check_commands_timeout,
+                                            in_flight_limit,
+                                            wait_for_window_slot)
+
+
+class WindowTransport:
+    # Minimal object providing what the writer window expects from "self"
+
+    class _Statistics:
+        _TOstatus = _TOdata = _reTx = 0
+
+        def add_command_completed(self):
+            pass
+
+    class _RateControl:
+        def congestion(self, reason):
+            pass
+
+    class _PluginConf:
+        pluginConf = {"writerCommandTimeOut": 8, "writerCommandRetry": 0, "ZiGateReactTime": 0, "showTimeOutMsg": 0}
+
+    def __init__(self, window_size):
+        self.max_in_flight = window_size
+        self.semaphore_gate = threading.Semaphore(value=window_size)
+        self.window_condition = threading.Condition()
+        self.firmware_compatibility_mode = False
+        self.firmware_nosqn = True
+        self.force_dz_communication = False
+        self.running = True
+        self.ListOfCommands = {}
+        self.awaiting_8000 = {}
+        self.writer_queue = Queue()
+        self.statistics = self._Statistics()
+        self.rate_control = self._RateControl()
+        self.pluginconf = self._PluginConf()
+
+    def logging_writer(self, logType, message, NwkId=None, _context=None):
+        pass
+
+    def logging_proto(self, logType, message, NwkId=None, _context=None):
+        pass
+
+
+def legacy_wait_for_window_slot(self, command):
+    while self.running:
+        check_commands_timeout(self)
+        if self.semaphore_gate.acquire(blocking=True, timeout=WINDOW_CHECK_PERIOD):
+            if len(self.ListOfCommands) < in_flight_limit(self):
+                return True
+            self.semaphore_gate.release()
+            time.sleep(WINDOW_CHECK_PERIOD)
+    return False
+
+
+def run(wait, nb_commands, turnaround):
+    self = WindowTransport(4)
+    t_start = time.perf_counter()
+    for isqn in range(nb_commands):
+        if not wait(self, None):
+            break
+        self.ListOfCommands[isqn] = {"cmd": "0100", "datas": "", "Status": "SENT", "TimeStamp": time.time()}
+        # Firmware acknowledgement
+        threading.Timer(turnaround, release_command, (self, isqn)).start()
+    t_elapse = time.perf_counter() - t_start
+    self.running = False
+    return 1000 * t_elapse / nb_commands
+
+
+def shutdown(self):
+    # As close_zigate_connection() then waiting_for_end_thread()
+    self.running = False
+    with self.window_condition:
+        self.window_condition.notify_all()
+
+
+def main():
+    nb_commands = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    turnaround = (int(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+
+    legacy = run(legacy_wait_for_window_slot, nb_commands, turnaround)
+    condition = run(wait_for_window_slot, nb_commands, turnaround)
+    print("%s commands, firmware turnaround %s ms, window of 1 command" % (nb_commands, int(1000 * turnaround)))
+    print("%-40s %10.3f ms" % ("semaphore busy-poll, per command", legacy))
+    print("%-40s %10.3f ms" % ("window condition, per command", condition))
+
+    # Shutdown 50 ms after the start of the wait: it returns at once, and the command is not sent
+    self = WindowTransport(4)
+    self.ListOfCommands[0] = {"cmd": "0100", "datas": "", "Status": "SENT", "TimeStamp": time.time()}
+    threading.Timer(0.05, shutdown, (self,)).start()
+    t_start = time.perf_counter()
+    status = wait_for_window_slot(self, None)
+    print("%-40s %10.3f ms status %s" % ("shutdown while waiting", 1000 * (time.perf_counter() - t_start), status))
+    return 1 if status else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
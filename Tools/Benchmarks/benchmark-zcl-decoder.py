@@ -0,0 +1,283 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Conformance check and benchmark of the table driven ZCL attribute decoder.
+
+    usage: python3 benchmark-zcl-decoder.py [nb_samples]
+
+    - conformance: for every ZCL data type (0x00 - 0xff) and a set of values (short, long, odd length, boundaries),
+      decodeAttribute, the bytes path ( decode_attribute_bytes ) and the batch path ( decode_attribute_records )
+      must give the same result, or raise the same exception, as the historical if-chain ( legacy_decodeAttribute ).
+      A value left undecoded by the batch path must be one the historical decoder rejects.
+    - 0x8002 path: the value decoded from the little endian data ( decode_endian_value ) must be the one the
+      historical decoder gives from decode_endian_data().
+    - benchmark: decoding of a mix of attribute reports, legacy vs table driven.
+
+    Exit code is 1 if a conformance check fails.
+"""
+
+import binascii
+import random
+import struct
+import sys
+
+from benchmarkTools import setup_plugin_environment, timeit
+
+setup_plugin_environment()
+
+from Classes.Transport.zclDecoders import (ENDIAN_DECODED_TYPES,  # noqa: E402
+                                           decode_endian_data,
+                                           decode_endian_value)
+from Modules.readClusters import decodeAttribute  # noqa: E402
+from Modules.zclDecoder import (ZCL_TYPE_DECODERS, decode_attribute_bytes,  # noqa: E402
+                                decode_attribute_records,
+                                split_attribute_records)
+
+BOUNDARIES = ("00", "01", "7f", "80", "ff", "7fff", "8000", "ffff", "7fffff", "800000", "ffffff", "7fffffff",
+              "80000000", "ffffffff", "0100000000", "7fffffffffff", "800000000000", "ffffffffffff",
+              "ffffffffffffffff", "010000000000000000", "3f800000", "41c80000", "c1c80000", "7fc00000",
+              "4c756d69", "4c756d6900", "00ff00", "ffe0")
+
+# Traffic mix of the benchmark: ( data type, value )
+TRAFFIC = (("29", "0898"), ("21", "1388"), ("10", "01"), ("20", "1e"), ("25", "000000001234"),
+           ("39", "41c80000"), ("30", "02"), ("18", "03"), ("42", "6c756d692e73656e736f72"))
+
+
+class _Log:
+    def logging(self, *args, **kwargs):
+        pass
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+class _Plugin:
+    log = _Log()
+    decodedAttribute = None
+
+
+def legacy_decodeAttribute(self, AttType, Attribute, handleErrors=False):
+    # Historical decodeAttribute if-chain, the reference of the conformance check
+
+    if len(Attribute) == 0:
+        return
+    # self.log.logging( "Cluster", 'Debug', "decodeAttribute( %s, %s) " %(AttType, Attribute) )
+
+    if int(AttType, 16) == 0x10:  # Boolean
+        return Attribute[0:2]
+
+    if int(AttType, 16) == 0x18:  # 8Bit bitmap
+        return int(Attribute[0:8], 16)
+
+    if int(AttType, 16) == 0x19:  # 16BitBitMap
+        return str(int(Attribute[0:4], 16))
+
+    if int(AttType, 16) == 0x20:  # Uint8 / unsigned char
+        return int(Attribute[0:2], 16)
+
+    if int(AttType, 16) == 0x21:  # 16BitUint
+        return str(struct.unpack("H", struct.pack("H", int(Attribute[0:4], 16)))[0])
+
+    if int(AttType, 16) == 0x22:  # ZigBee_24BitUint
+        return str(struct.unpack("I", struct.pack("I", int("0" + Attribute, 16)))[0])
+
+    if int(AttType, 16) == 0x23:  # 32BitUint
+        return str(struct.unpack("I", struct.pack("I", int(Attribute[0:8], 16)))[0])
+
+    if int(AttType, 16) == 0x25:  # ZigBee_48BitUint
+        return str(struct.unpack("Q", struct.pack("Q", int(Attribute, 16)))[0])
+
+    if int(AttType, 16) == 0x28:  # int8
+        return int(Attribute, 16)
+
+    if int(AttType, 16) == 0x29:  # 16Bitint   -> tested on Measurement clusters
+        return str(struct.unpack("h", struct.pack("H", int(Attribute[0:4], 16)))[0])
+
+    if int(AttType, 16) == 0x2A:  # ZigBee_24BitInt
+        return str(struct.unpack("i", struct.pack("I", int("0" + Attribute, 16)))[0])
+
+    if int(AttType, 16) == 0x2B:  # 32Bitint
+        return str(struct.unpack("i", struct.pack("I", int(Attribute[0:8], 16)))[0])
+
+    if int(AttType, 16) == 0x2D:  # ZigBee_48Bitint
+        return str(struct.unpack("q", struct.pack("Q", int(Attribute, 16)))[0])
+
+    if int(AttType, 16) == 0x30:  # 8BitEnum
+        return int(Attribute[0:2], 16)
+
+    if int(AttType, 16) == 0x31:  # 16BitEnum
+        return str(struct.unpack("h", struct.pack("H", int(Attribute[0:4], 16)))[0])
+
+    if int(AttType, 16) == 0x39:  # Xiaomi Float
+        return str(struct.unpack("f", struct.pack("I", int(Attribute, 16)))[0])
+
+    if int(AttType, 16) == 0x42:  # CharacterString
+        decode = ""
+        try:
+            decode = binascii.unhexlify(Attribute).decode("utf-8")
+        except:
+            if handleErrors:  # If there is an error we force the result to '' This is used for 0x0000/0x0005
+                self.log.logging("Cluster", "Log", "decodeAttribute - seems errors decoding %s, so returning empty" % str(Attribute))
+                decode = ""
+            else:
+                decode = binascii.unhexlify(Attribute).decode("utf-8", errors="ignore")
+                decode = decode.replace("\x00", "")
+                decode = decode.strip()
+                self.log.debug(
+                    "Cluster",
+                    "decodeAttribute - seems errors, returning with errors ignore From: %s to >%s<",
+                    str(Attribute),
+                    str(decode),
+                )
+
+        # Cleaning
+        decode = decode.strip("\x00")
+        decode = decode.strip()
+        return decode
+
+    # self.log.logging( "Cluster", 'Debug', "decodeAttribut(%s, %s) unknown, returning %s unchanged" %(AttType, Attribute, Attribute) )
+    return Attribute
+
+
+def outcome(func, *args):
+    try:
+        value = func(*args)
+    except Exception as e:
+        return ("raise", type(e).__name__)
+    return (type(value).__name__, value)
+
+
+def samples(nb_samples):
+    values = list(BOUNDARIES)
+    for _ in range(nb_samples):
+        length = random.randint(1, 18)
+        values.append("".join(random.choice("0123456789abcdef") for _ in range(length)))
+    return values
+
+
+def check_conformance(nb_samples):
+    _plugin = _Plugin()
+    errors = checks = 0
+    values = samples(nb_samples)
+    for att_type in range(0x100):
+        str_type = "%02x" % att_type
+        for value in values:
+            for handleErrors in (False, True) if att_type == 0x42 else (False,):
+                reference = outcome(legacy_decodeAttribute, _plugin, str_type, value, handleErrors)
+                checks += 1
+                if outcome(decodeAttribute, _plugin, str_type, value, handleErrors) != reference:
+                    errors += 1
+                    print("decodeAttribute mismatch type 0x%02x value %s: %s" % (att_type, value, reference))
+
+            if att_type not in ZCL_TYPE_DECODERS or len(value) % 2:
+                continue
+
+            reference = outcome(legacy_decodeAttribute, _plugin, str_type, value)
+            checks += 2
+            if outcome(decode_attribute_bytes, att_type, bytes.fromhex(value)) != reference:
+                errors += 1
+                print("decode_attribute_bytes mismatch type 0x%02x value %s: %s" % (att_type, value, reference))
+
+            payload = "01" + "1234" + "01" + "0402" + "0000" + "00" + str_type + "%04x" % (len(value) // 2) + value
+            batch = outcome(lambda: list(decode_attribute_records(payload))[0][6])
+            if batch != reference and not (batch == ("NoneType", None) and reference[0] == "raise"):
+                errors += 1
+                print("decode_attribute_records mismatch type 0x%02x value %s: %s" % (att_type, value, reference))
+    return checks, errors
+
+
+def check_endian(nb_samples):
+    _plugin = _Plugin()
+    errors = checks = 0
+    for str_type, size in ENDIAN_DECODED_TYPES.items():
+        values = ["00" * size, "ff" * size, "80" * size, "7f" * size, "0000803f", "000080bf", "00"]
+        values += ["".join(random.choice("0123456789abcdef") for _ in range(2 * size)) for _ in range(nb_samples)]
+        for data in values:
+            value = decode_endian_value(data, str_type)
+            if value is None:
+                continue
+            checks += 1
+            if value != legacy_decodeAttribute(_plugin, str_type, decode_endian_data(data, str_type)):
+                errors += 1
+                print("decode_endian_value mismatch type %s data %s: %s" % (str_type, data, value))
+    return checks, errors
+
+
+def predecoded(_plugin, record):
+    _plugin.decodedAttribute = record
+    return decodeAttribute(_plugin, record[0], record[1])
+
+
+def legacy_split(MsgData):
+    # Reference: the loop of scan_attribute_reponse before split_attribute_records
+    records = []
+    idx = 12
+    while idx < len(MsgData):
+        MsgAttrID = MsgAttStatus = MsgAttType = MsgAttSize = MsgClusterData = ""
+        MsgAttrID = MsgData[idx : idx + 4]
+        idx += 4
+        MsgAttStatus = MsgData[idx : idx + 2]
+        idx += 2
+        if MsgAttStatus == "00":
+            MsgAttType = MsgData[idx : idx + 2]
+            idx += 2
+            MsgAttSize = MsgData[idx : idx + 4]
+            idx += 4
+            size = int(MsgAttSize, 16) * 2
+            MsgClusterData = MsgData[idx : idx + size]
+            idx += size
+        elif len(MsgData[idx:]) == 6:
+            idx += 6
+        records.append((idx, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData))
+    return records
+
+
+def check_split():
+    header = "01" + "1234" + "01" + "0000"
+    payloads = [
+        header + "0004" + "00" + "42" + "0004" + "4c756d69" + "0005" + "00" + "42" + "0002" + "5a47" + "0007" + "00" + "30" + "0001" + "03",
+        header + "0004" + "86" + "000000",  # Firmware status with dummy datas
+        header + "0004" + "86" + "0005" + "00" + "20" + "0001" + "01",
+        header + "0004" + "00" + "29" + "0002" + "08",  # Truncated
+    ]
+    errors = 0
+    for payload in payloads:
+        if outcome(lambda: list(split_attribute_records(payload))) != outcome(legacy_split, payload):
+            errors += 1
+            print("split_attribute_records mismatch on %s" % payload)
+    return len(payloads), errors
+
+
+def main():
+    nb_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    random.seed(0)
+
+    checks, errors = check_conformance(nb_samples)
+    split_checks, split_errors = check_split()
+    endian_checks, endian_errors = check_endian(nb_samples)
+    checks += split_checks + endian_checks
+    errors += split_errors + endian_errors
+    print("%-40s %10s checks %5s errors" % ("conformance", checks, errors))
+
+    _plugin = _Plugin()
+    traffic = [random.choice(TRAFFIC) for _ in range(100000)]
+    t_legacy, legacy = timeit("legacy decodeAttribute", lambda: [legacy_decodeAttribute(_plugin, x, y) for x, y in traffic])
+    t_table, table = timeit("table driven decodeAttribute", lambda: [decodeAttribute(_plugin, x, y) for x, y in traffic])
+    assert legacy == table
+    print("%-40s %10.1f x" % ("speed-up", t_legacy / t_table))
+    raw = [(int(x, 16), bytes.fromhex(y)) for x, y in traffic if x != "42"]
+    timeit("decode_attribute_bytes", lambda: [decode_attribute_bytes(x, y) for x, y in raw])
+
+    # Cluster handler decoding the value of the record in process, already decoded with the message
+    records = [(x, y, value) for (x, y), value in zip(traffic, table)]
+    timeit("decodeAttribute of a decoded record", lambda: [predecoded(_plugin, record) for record in records])
+    _plugin.decodedAttribute = None
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
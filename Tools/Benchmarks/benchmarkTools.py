@@ -0,0 +1,162 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Module: benchmarkTools
+
+    Description: helpers shared by the benchmark scripts.
+                 The benchmarks run outside of Domoticz, so we provide an empty Domoticz module and
+                 make the plugin home directory importable.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import types
+
+PLUGIN_HOME = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def setup_plugin_environment():
+    if PLUGIN_HOME not in sys.path:
+        sys.path.insert(0, PLUGIN_HOME)
+
+    if "Domoticz" not in sys.modules:
+        domoticz = types.ModuleType("Domoticz")
+        for name in ("Log", "Status", "Error", "Debug", "Heartbeat", "Debugging"):
+            setattr(domoticz, name, lambda *args, **kwargs: None)
+        domoticz.Configuration = lambda *args, **kwargs: {}
+        domoticz.Device = StubDevice
+        domoticz.Devices = {}
+        domoticz.Images = {}
+        domoticz.Parameters = {}
+        domoticz.Settings = {}
+        sys.modules["Domoticz"] = domoticz
+    return sys.modules["Domoticz"]
+
+
+class StubDevice:
+    # Minimal Domoticz Device (widget)
+
+    def __init__(self, Unit=None, DeviceID="", ID=None, Name="", Type=0, Subtype=0, Switchtype=0, Options=None, **kwargs):
+        self.Unit = Unit
+        self.DeviceID = DeviceID
+        self.ID = ID
+        self.Name = Name or "%s-%s" % (DeviceID, Unit)
+        self.Type = Type
+        self.SubType = Subtype
+        self.SwitchType = Switchtype
+        self.Options = Options or {}
+        self.nValue = 0
+        self.sValue = ""
+        self.Color = ""
+        self.BatteryLevel = 255
+        self.SignalLevel = 12
+        self.TimedOut = 0
+        self.LastUpdate = "2022-01-01 00:00:00"
+        self.updates = 0
+
+    def Update(self, nValue=None, sValue=None, TimedOut=None, BatteryLevel=None, SignalLevel=None, Color=None, **kwargs):
+        if nValue is not None:
+            self.nValue = nValue
+        if sValue is not None:
+            self.sValue = sValue
+        if TimedOut is not None:
+            self.TimedOut = TimedOut
+        if BatteryLevel is not None:
+            self.BatteryLevel = BatteryLevel
+        if SignalLevel is not None:
+            self.SignalLevel = SignalLevel
+        if Color is not None:
+            self.Color = Color
+        self.LastUpdate = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.updates += 1
+
+    def Touch(self):
+        pass
+
+    def Create(self):
+        pass
+
+
+class BenchTransport:
+    # Minimal object providing what the Transport functions expect from "self"
+
+    class _Statistics:
+        def __init__(self):
+            self._received = self._crcErrors = self._frameErrors = self._droppedBytes = 0
+
+    def __init__(self):
+        self.statistics = self._Statistics()
+        self._ReqRcv = bytearray()
+        self._last_raw_message = bytearray()
+        self.frames = []
+
+    def logging_reader(self, logType, message, NwkId=None, _context=None):
+        pass
+
+    def logging_proto(self, logType, message, NwkId=None, _context=None):
+        pass
+
+
+def setup_home():
+    """ temporary plugin home directory, to be removed by the caller """
+    home = tempfile.mkdtemp(prefix="zigate-bench-")
+    for folder in ("Conf", "Data", "Logs", "Reports", "OTAFirmware"):
+        os.makedirs(os.path.join(home, folder))
+    return home
+
+
+def build_plugin(home, hardware_id, options=None):
+    """
+    BasePlugin with its configuration in home, the ListOfDevices loaded from Data/DeviceList-<hardware_id>.txt,
+    and a Domoticz widget for each ClusterType. options are set in the PluginConf.
+    """
+    # Import late, the plugin module reads Parameters from the Domoticz stub at import
+    import plugin
+    from Classes.LoggingManagement import LoggingManagement
+    from Classes.PluginConf import PluginConf
+    from Classes.TransportStats import TransportStatistics
+    from Modules.database import LoadDeviceList, importDeviceConfV2
+
+    _plugin = plugin.BasePlugin()
+    _plugin.VersionNewFashion = True
+    _plugin.DomoticzBuild, _plugin.DomoticzMajor, _plugin.DomoticzMinor = 0, 2022, 1
+    _plugin.HardwareID = hardware_id
+    _plugin.homedirectory = home + os.sep
+    _plugin.pluginconf = PluginConf(True, 2022, 1, home + os.sep, hardware_id)
+    _plugin.pluginconf.pluginConf.update(options or {})
+    _plugin.log = LoggingManagement(
+        _plugin.pluginconf, _plugin.PluginHealth, hardware_id, _plugin.ListOfDevices, _plugin.permitTojoin
+    )
+    _plugin.DeviceListName = "DeviceList-%s.txt" % hardware_id
+    importDeviceConfV2(_plugin)
+    LoadDeviceList(_plugin)
+
+    # Domoticz widgets of the population
+    plugin.Devices.clear()
+    for device in _plugin.ListOfDevices.values():
+        for ep in device.get("Ep", {}).values():
+            if not isinstance(ep, dict) or not isinstance(ep.get("ClusterType"), dict):
+                continue
+            for widget_id in ep["ClusterType"]:
+                unit = len(plugin.Devices) + 1
+                plugin.Devices[unit] = StubDevice(unit, device.get("IEEE", ""), int(widget_id))
+    for widget_id in [x for device in _plugin.ListOfDevices.values() for x in device.get("ClusterType", {})]:
+        unit = len(plugin.Devices) + 1
+        plugin.Devices[unit] = StubDevice(unit, "", int(widget_id))
+
+    _plugin.statistics = TransportStatistics(_plugin.pluginconf)
+    return _plugin
+
+
+def timeit(label, func, loops=1):
+    t_start = time.perf_counter()
+    for _ in range(loops):
+        result = func()
+    t_elapse = time.perf_counter() - t_start
+    print("%-40s %10.3f ms" % (label, 1000 * t_elapse / loops))
+    return t_elapse / loops, result
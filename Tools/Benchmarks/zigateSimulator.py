@@ -0,0 +1,337 @@
+# !/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: pipiche38
+#
+"""
+    Module: zigateSimulator
+
+    Description: Simulated ZiGate, speaking the 0x01/0x03 escaped protocol over TCP/IP or a pseudo-terminal.
+
+    - Each command received is acknowledged with a 0x8000 (firmware 3.1a format), and some commands get
+      their response: 0x0009 -> 0x8009, 0x0010 -> 0x8010, 0x0024 -> 0x8024, 0x0014 -> 0x8014
+    - Inbound traffic (attribute reports) is generated from a DeviceList-xx.txt population (User-Tests fixtures),
+      or replayed from a capture file (one hex frame per line, or raw bytes).
+
+    usage: python3 zigateSimulator.py [--tcp PORT | --pty] [--devicelist FILE] [--scale N] [--rate FRAMES/S]
+                                      [--count N] [--raw] [--capture FILE]
+
+    The plugin can then be configured in Wifi mode on 127.0.0.1:PORT, or USB mode on the /dev/pts/x printed.
+"""
+
+import argparse
+import ast
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+from benchmarkTools import PLUGIN_HOME, setup_plugin_environment
+
+setup_plugin_environment()
+
+from Classes.Transport.frameDecoder import ZiGateFrameDecoder, check_frame  # noqa: E402
+from Classes.Transport.writerThread import encode_message  # noqa: E402
+
+DEFAULT_DEVICELIST = os.path.join(PLUGIN_HOME, "User-Tests", "DeviceList-46.txt")
+
+ZIGATE_NWKID = "0000"
+ZIGATE_IEEE = "00158d0000000001"
+ZIGATE_PANID = "1a62"
+ZIGATE_EXT_PANID = "00158d0000000001"
+ZIGATE_CHANNEL = "0b"
+FIRMWARE_VERSION = "0003031a"  # Branch, Major, Installer version
+
+# Cluster -> ( Attribute, Data Type, generator of the value as an hex string )
+REPORTS = {
+    "0006": ("0000", "10", lambda: "%02x" % random.randint(0, 1)),
+    "0008": ("0000", "20", lambda: "%02x" % random.randint(0, 254)),
+    "0402": ("0000", "29", lambda: "%04x" % random.randint(1500, 2800)),
+    "0405": ("0000", "21", lambda: "%04x" % random.randint(3000, 7000)),
+    "0403": ("0000", "29", lambda: "%04x" % random.randint(980, 1030)),
+    "0400": ("0000", "21", lambda: "%04x" % random.randint(0, 20000)),
+    "0001": ("0020", "20", lambda: "%02x" % random.randint(25, 31)),
+    "0702": ("0000", "25", lambda: "%012x" % random.randint(0, 100000)),
+    "0b04": ("050b", "29", lambda: "%04x" % random.randint(0, 3000)),
+}
+
+# Responses to commands, beyond the 0x8000
+RESPONSES = {
+    "0009": lambda: ("8009", ZIGATE_NWKID + ZIGATE_IEEE + ZIGATE_PANID + ZIGATE_EXT_PANID + ZIGATE_CHANNEL),
+    "0010": lambda: ("8010", FIRMWARE_VERSION),
+    "0014": lambda: ("8014", "01"),
+    "0024": lambda: ("8024", "00" + ZIGATE_NWKID + ZIGATE_IEEE + ZIGATE_CHANNEL),
+}
+
+
+def load_population(devicelist, scale=1):
+    """ return { NwkId: device } from a DeviceList-xx.txt, duplicated scale times with new NwkId/IEEE """
+    population = {}
+    with open(devicelist, "r") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            key, val = line.split(":", 1)
+            key = key.strip().replace("'", "")
+            if key in ("0000", "ffff"):
+                continue
+            try:
+                device = ast.literal_eval(val.strip())
+            except (SyntaxError, ValueError):
+                continue
+            if device.get("Status") != "inDB" or "IEEE" not in device:
+                continue
+            population[key] = device
+
+    if scale <= 1:
+        return population
+
+    scaled = dict(population)
+    for copy in range(1, scale):
+        for device in population.values():
+            new_nwkid = "%04x" % random.randint(1, 0xFFF0)
+            while new_nwkid in scaled:
+                new_nwkid = "%04x" % random.randint(1, 0xFFF0)
+            new_device = ast.literal_eval(repr(device))
+            new_device["IEEE"] = "%02x%s" % (copy & 0xFF, device["IEEE"][2:])
+            scaled[new_nwkid] = new_device
+    return scaled
+
+
+def write_population(population, filename):
+    """ write the population in the DeviceList-xx.txt format, so the plugin can load the same devices """
+    with open(filename, "wt") as handle:
+        for nwkid, device in population.items():
+            handle.write(nwkid + " : " + str(device) + "\n")
+
+
+def report_sources(population):
+    """ list of (NwkId, Ep, Cluster) which can be reported """
+    sources = []
+    for nwkid, device in population.items():
+        for ep, clusters in device.get("Ep", {}).items():
+            if not isinstance(clusters, dict):
+                continue
+            sources.extend((nwkid, ep, cluster) for cluster in clusters if cluster in REPORTS)
+    return sources
+
+
+def build_report(sqn, nwkid, ep, cluster):
+    """ 0x8102 payload: SQN, SrcAddr, SrcEp, Cluster, Attribute, Status, DataType, Size, Data """
+    attribute, data_type, value = REPORTS[cluster]
+    data = value()
+    return "%02x%s%s%s%s00%s%04x%s" % (sqn & 0xFF, nwkid, ep, cluster, attribute, data_type, len(data) // 2, data)
+
+
+def build_raw_report(sqn, nwkid, ep, cluster):
+    """
+    0x8002 payload of the same attribute report, as received in raw mode:
+    Status, ProfileId, Cluster, SrcEp, DstEp, SrcAddrMode, SrcAddr, DstAddrMode, DstAddr, ZCL frame (little endian)
+    """
+    attribute, data_type, value = REPORTS[cluster]
+    zcl_frame = "18%02x0a%s%s%s" % (sqn & 0xFF, _swap(attribute), data_type, _swap(value()))
+    return "000104%s%s0102%s020000%s" % (cluster, ep, nwkid, zcl_frame)
+
+
+def _swap(hex_value):
+    return bytes.fromhex(hex_value)[::-1].hex()
+
+
+def build_frame(msg_type, payload, lqi=0xB4):
+    """ escaped inbound frame (the payload is followed by the LQI byte) """
+    return bytes.fromhex(encode_message(msg_type, payload + "%02x" % lqi))
+
+
+def generate_traffic(population, count, raw=False):
+    """ list of (MsgType, payload) attribute reports, as 0x8102 or as 0x8002 with raw """
+    sources = report_sources(population)
+    if not sources:
+        raise ValueError("No reportable cluster in the population")
+    if raw:
+        return [("8002", build_raw_report(sqn, *random.choice(sources))) for sqn in range(count)]
+    return [("8102", build_report(sqn, *random.choice(sources))) for sqn in range(count)]
+
+
+def load_capture(filename):
+    """ list of escaped frames (bytes) from a capture file """
+    with open(filename, "rb") as capture:
+        data = capture.read()
+    try:
+        stream = b"".join(bytes.fromhex(line) for line in data.decode("ascii").split() if line)
+    except ValueError:
+        stream = data
+    decoder = ZiGateFrameDecoder()
+    decoder.feed(stream)
+    frames = []
+    while True:
+        frame = decoder.next_frame()
+        if frame is None:
+            return frames
+        frames.append(bytes(frame))
+
+
+class ZiGateSimulator:
+    def __init__(self, mode="tcp", port=0):
+        self.mode = mode
+        self.port = port
+        self.endpoint = None  # ( host, port ) or pty slave name
+        self.running = False
+
+        self._listen_socket = None
+        self._connection = None  # socket (tcp) or master fd (pty)
+        self._connected = threading.Event()
+        self._write_lock = threading.Lock()
+        self._decoder = ZiGateFrameDecoder()
+        self._thread = None
+        self._sqn = 0
+
+        # Statistics
+        self.commands = {}
+        self.frames_sent = 0
+        self.send_timestamps = []  # time of each replayed frame
+
+    # Connection management
+    def start(self):
+        self.running = True
+        if self.mode == "pty":
+            master, slave = os.openpty()
+            self._connection = master
+            self.endpoint = os.ttyname(slave)
+            self._slave = slave
+            self._connected.set()
+        else:
+            self._listen_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._listen_socket.bind(("127.0.0.1", self.port))
+            self._listen_socket.listen(1)
+            self.endpoint = self._listen_socket.getsockname()
+        self._thread = threading.Thread(name="ZiGateSimulator", target=self._run, daemon=True)
+        self._thread.start()
+        return self.endpoint
+
+    def wait_for_connection(self, timeout=10):
+        return self._connected.wait(timeout)
+
+    def stop(self):
+        self.running = False
+        if self._listen_socket:
+            self._listen_socket.close()
+        if self.mode == "pty":
+            os.close(self._connection)
+            os.close(self._slave)
+        elif self._connection:
+            self._connection.close()
+
+    def _read(self):
+        if self.mode == "pty":
+            return os.read(self._connection, 4096)
+        return self._connection.recv(4096)
+
+    def _write(self, data):
+        with self._write_lock:
+            if self.mode == "pty":
+                os.write(self._connection, data)
+            else:
+                self._connection.sendall(data)
+
+    def _run(self):
+        if self.mode == "tcp":
+            try:
+                self._connection, _ = self._listen_socket.accept()
+            except OSError:
+                return
+            self._connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._connected.set()
+
+        while self.running:
+            try:
+                data = self._read()
+            except OSError:
+                break
+            if not data:
+                break
+            self._decoder.feed(data)
+            for frame in self._decoder.frames():
+                self._handle_command(frame)
+
+    # Protocol
+    def _handle_command(self, frame):
+        status, msg_type, length, _ = check_frame(frame)
+        if status:
+            return
+        cmd = "%04x" % msg_type
+        self.commands[cmd] = self.commands.get(cmd, 0) + 1
+        self._sqn = (self._sqn + 1) & 0xFF
+        # 0x8000: Status, SQN, PacketType
+        self.send(build_frame("8000", "00%02x%s" % (self._sqn, cmd)))
+        if cmd in RESPONSES:
+            msg_type, payload = RESPONSES[cmd]()
+            self.send(build_frame(msg_type, payload))
+
+    def send(self, frame):
+        self._write(frame)
+        self.frames_sent += 1
+
+    def replay(self, frames, rate=None, chunk=1):
+        """
+        send the frames (bytes), at rate frames per second ( None for as fast as possible ).
+        chunk frames are written at once, like a ZiGate in a report storm.
+        """
+        self.send_timestamps = []
+        interval = chunk / rate if rate else 0
+        next_time = time.perf_counter()
+        for idx in range(0, len(frames), chunk):
+            if interval:
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_time += interval
+            block = frames[idx : idx + chunk]
+            timestamp = time.perf_counter()
+            self._write(b"".join(block))
+            self.frames_sent += len(block)
+            self.send_timestamps.extend([timestamp] * len(block))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated ZiGate")
+    parser.add_argument("--tcp", type=int, default=9999, help="TCP port (default 9999)")
+    parser.add_argument("--pty", action="store_true", help="use a pseudo-terminal instead of TCP")
+    parser.add_argument("--devicelist", default=DEFAULT_DEVICELIST, help="DeviceList-xx.txt used to generate reports")
+    parser.add_argument("--scale", type=int, default=1, help="duplicate the population N times")
+    parser.add_argument("--capture", help="capture file to replay instead of generated reports")
+    parser.add_argument("--rate", type=float, default=20, help="inbound frames per second (0 for no limit)")
+    parser.add_argument("--count", type=int, default=10000, help="number of generated reports")
+    parser.add_argument("--export", help="write the (scaled) population as a DeviceList file")
+    parser.add_argument("--raw", action="store_true", help="send the reports as 0x8002 (raw mode)")
+    args = parser.parse_args()
+
+    population = load_population(args.devicelist, args.scale)
+    if args.export:
+        write_population(population, args.export)
+        print("Population of %s devices written to %s" % (len(population), args.export))
+
+    if args.capture:
+        frames = load_capture(args.capture)
+    else:
+        frames = [build_frame(msg_type, payload) for msg_type, payload in generate_traffic(population, args.count, args.raw)]
+
+    simulator = ZiGateSimulator("pty" if args.pty else "tcp", args.tcp)
+    print("ZiGate simulator listening on %s" % (simulator.start(),))
+    simulator.wait_for_connection(timeout=None)
+    print("Plugin connected, replaying %s frames from %s devices" % (len(frames), len(population)))
+    try:
+        time.sleep(2)
+        simulator.replay(frames, rate=args.rate or None)
+        print("Replay completed, commands received: %s" % simulator.commands)
+        while simulator.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    simulator.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
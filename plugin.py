@@ -82,9 +82,14 @@ import time
 from Classes.AdminWidgets import AdminWidgets
 # from Classes.APS import APSManagement
 from Classes.ConfigureReporting import ConfigureReporting
+from Classes.DeviceChanges import DeviceChanges
+from Classes.DevicesIndex import DevicesIndex
 from Classes.DomoticzDB import (DomoticzDB_DeviceStatus, DomoticzDB_Hardware,
                                 DomoticzDB_Preferences)
 from Classes.GroupMgtv2.GroupManagement import GroupsManagement
+from Classes.HeartbeatScheduler import HeartbeatScheduler
+from Classes.ResetScheduler import ResetScheduler
+from Classes.TouchAggregator import TouchAggregator
 from Classes.IAS import IAS_Zone_Management
 from Classes.LoggingManagement import LoggingManagement
 from Classes.NetworkEnergy import NetworkEnergy
@@ -104,8 +109,8 @@ from Modules.checkingUpdate import (checkFirmwareUpdate, checkPluginUpdate,
 from Modules.command import mgtCommand
 from Modules.database import (LoadDeviceList, WriteDeviceList,
                               checkDevices2LOD, checkListOfDevice2Devices,
-                              importDeviceConfV2)
-from Modules.domoTools import ResetDevice
+                              importDeviceConfV2, startup_phase_timing)
+from Modules.domoTools import ResetDevice, flush_device_touches
 from Modules.heartbeat import processListOfDevices
 from Modules.input import ZigateRead
 from Modules.piZigate import switchPiZigate_mode
@@ -143,6 +148,12 @@ class BasePlugin:
         self.IEEE2NWK = {}
         self.zigatedata = {}
         self.DeviceConf = {}  # Store DeviceConf.txt, all known devices configuration
+        self.DeviceListSize = 0  # Size of the DeviceList snapshot
+        self.DeviceListPersisted = {}  # Entries of ListOfDevices as persisted at the last flush
+        self.DeviceListJournalSize = 0  # Size of the DeviceList journal since the last snapshot
+        self.DeviceListJson = {}  # JSON of the entries of ListOfDevices, for the JSON DeviceList
+        self.StartupTimings = {}  # Duration (ms) of each startup phase
+        self.decodedAttribute = None  # ( AttType, Data, value ) of the attribute record in process ( ReadCluster )
 
         # Objects from Classe
         self.configureReporting = None
@@ -154,6 +165,11 @@ class BasePlugin:
         self.domoticzdb_Hardware = None  # Object allowing direct access to Domoticz DB Hardware
         self.domoticzdb_Preferences = None  # Object allowing direct access to Domoticz DB Preferences
         self.adminWidgets = None  # Manage AdminWidgets object
+        self.devicesIndex = DevicesIndex()  # Index of Domoticz Devices by DeviceID and Widget ID
+        self.heartbeatScheduler = HeartbeatScheduler()  # Due time of periodic per device work
+        self.resetScheduler = ResetScheduler()  # Reset deadline of Motion and push button widgets
+        self.deviceTouches = TouchAggregator()  # Coalesced last seen and battery updates of the widgets
+        self.deviceChanges = DeviceChanges()  # Updates of the ListOfDevices entries
         self.pluginconf = None  # PlugConf object / all configuration parameters
         self.OTA = None
         self.statistics = None
@@ -239,6 +255,7 @@ class BasePlugin:
     def onStart(self):
         Domoticz.Log("ZiGate plugin started!")
         assert sys.version_info >= (3, 4) # nosec
+        t_start = t_phase = time.time()
 
         if Parameters["Mode1"] == "V1" and Parameters["Mode2"] in (
             "USB",
@@ -332,6 +349,7 @@ class BasePlugin:
         self.pluginconf = PluginConf(
             self.VersionNewFashion, self.DomoticzMajor, self.DomoticzMinor, Parameters["HomeFolder"], self.HardwareID
         )
+        t_phase = startup_phase_timing(self, "PluginConf", t_phase)
 
         # Create the adminStatusWidget if needed
         self.PluginHealth["Flag"] = 1
@@ -350,6 +368,7 @@ class BasePlugin:
                 str(self.pluginParameters["PluginBranch"] + "-" + self.pluginParameters["PluginVersion"])
             )
             self.log.openLogFile()
+        t_phase = startup_phase_timing(self, "LoggingManagement", t_phase)
 
         # We can use from now the self.log.logging()
         self.log.logging(
@@ -395,6 +414,7 @@ class BasePlugin:
         self.log.logging("Plugin", "Debug", "   - Preferences table")
         self.domoticzdb_Preferences = DomoticzDB_Preferences(Parameters["Database"], self.pluginconf, self.log)
         self.WebUsername, self.WebPassword = self.domoticzdb_Preferences.retreiveWebUserNamePassword()
+        t_phase = startup_phase_timing(self, "DomoticzDB", t_phase)
         # Domoticz.Status("Domoticz Website credentials %s/%s" %(self.WebUsername, self.WebPassword))
 
         self.adminWidgets = AdminWidgets(self.pluginconf, Devices, self.ListOfDevices, self.HardwareID)
@@ -406,6 +426,7 @@ class BasePlugin:
 
         # Import Certified Device Configuration
         importDeviceConfV2(self)
+        t_phase = startup_phase_timing(self, "DeviceConf", t_phase)
 
         # if type(self.DeviceConf) is not dict:
         if not isinstance(self.DeviceConf, dict):
@@ -432,8 +453,10 @@ class BasePlugin:
             self.log.logging("Plugin", "Debug", "  " + str(e))
 
         # Check proper match against Domoticz Devices
+        t_phase = time.time()
         checkListOfDevice2Devices(self, Devices)
         checkDevices2LOD(self, Devices)
+        t_phase = startup_phase_timing(self, "Devices check", t_phase)
 
         self.log.logging("Plugin", "Debug", "ListOfDevices after checkListOfDevice2Devices: " + str(self.ListOfDevices))
         self.log.logging("Plugin", "Debug", "IEEE2NWK after checkListOfDevice2Devices     : " + str(self.IEEE2NWK))
@@ -498,6 +521,7 @@ class BasePlugin:
 
         self.log.logging("Plugin", "Debug", "Establish Zigate connection")
         self.ZigateComm.open_zigate_connection()
+        t_phase = startup_phase_timing(self, "Transport", t_phase)
 
         # IAS Zone Management
         if self.iaszonemgt is None:
@@ -513,7 +537,17 @@ class BasePlugin:
                 self.log.logging(
                     "Plugin", "Error", "WebServer disabled du to Parameter Mode4 set to %s" % Parameters["Mode4"]
                 )
+        startup_phase_timing(self, "WebServer", t_phase)
 
+        self.log.logging(
+            "Plugin",
+            "Status",
+            "Startup completed in %s ms (%s)"
+            % (
+                int(1000 * (time.time() - t_start)),
+                ", ".join("%s: %s ms" % (phase, timing) for phase, timing in self.StartupTimings.items()),
+            ),
+        )
         self.busy = False
 
     def onStop(self):
@@ -546,7 +580,7 @@ class BasePlugin:
 
         if self.log:
             self.log.logging("Plugin", "Log", "onStop calling (5) Plugin Database saved")
-        WriteDeviceList(self, 0)
+        WriteDeviceList(self, 0, compact=True)
         if self.log:
             self.log.logging("Plugin", "Log", "onStop called (5) Plugin Database saved")
 
@@ -573,6 +607,9 @@ class BasePlugin:
 
     def onDeviceRemoved(self, Unit):
         self.log.logging("Plugin", "Debug", "onDeviceRemoved called")
+        self.devicesIndex.invalidate()
+        if self.webserver:
+            self.webserver.invalidate_cache()
 
         # Let's check if this is End Node, or Group related.
         if Devices[Unit].DeviceID in self.IEEE2NWK:
@@ -891,6 +928,9 @@ class BasePlugin:
             self.log.logging("Plugin", "Debug", "Devices size has changed , let's write ListOfDevices on disk")
             WriteDeviceList(self, 0)  # write immediatly
 
+        # Last seen and battery updates coalesced during the frame processing
+        flush_device_touches(self, Devices)
+
         if self.CommiSSionning:
             self.PluginHealth["Flag"] = 2
             self.PluginHealth["Txt"] = "Enrollment in Progress"
@@ -1190,6 +1230,7 @@ def start_GrpManagement(self, homefolder):
         self.DeviceConf, 
         self.log,
     )
+    self.groupmgt.heartbeatScheduler = self.heartbeatScheduler
     if self.groupmgt and self.ZigateIEEE:
         self.groupmgt.updateZigateIEEE(self.ZigateIEEE)
     if self.groupmgt:
@@ -1237,6 +1278,11 @@ def start_web_server(self, webserver_port, webserver_homefolder):
         webserver_port,
         self.log,
     )
+    self.webserver.update_devicesIndex(self.devicesIndex)
+    self.webserver.update_heartbeatScheduler(self.heartbeatScheduler)
+    self.webserver.update_resetScheduler(self.resetScheduler)
+    self.webserver.update_deviceTouches(self.deviceTouches)
+    self.webserver.update_deviceChanges(self.deviceChanges)
     if self.FirmwareVersion:
         self.webserver.update_firmware(self.FirmwareVersion)
 